@@ -327,6 +327,23 @@ async def core_lifespan(server):
     # Cleanup
     logger.info("🧹 Nettoyage du core_lifespan...")
 
+    # Pool d'instances d'outils : nettoyer les instances inactives.
+    try:
+        from collegue.core.tool_pool import reset_tool_pool
+
+        reset_tool_pool()
+    except Exception as e:
+        logger.debug(f"Erreur lors du nettoyage du pool d'outils: {e}")
+
+    # Métriques write-behind : persister ce qui n'a pas encore été écrit.
+    try:
+        from collegue.monitoring.metrics import get_metrics_collector
+
+        get_metrics_collector().close()
+        logger.info("🛑 Métriques persistées.")
+    except Exception as e:
+        logger.debug(f"Erreur lors de la persistance finale des métriques: {e}")
+
     # Cleanup des pools de connexions
     try:
         from kubernetes import client
@@ -121,6 +121,21 @@ class Settings(BaseSettings):
     # paquets pré-installés de l'image sandbox (réseau PyPI requis).
     GATE_REQUIRE_DEPS_INSTALL: bool = False
     GATE_CHECK_INSTALLABILITY: bool = False
+    # Dépendances pré-construites du gate (opt-in) : site pip --user, venv
+    # d'installabilité et node_modules construits une fois par contenu de
+    # requirements.txt/pyproject.toml/package-lock.json et par image sandbox, puis
+    # montés en lecture seule (éviction LRU). Vide : $COLLEGUE_HOME/cache/deps_envs.
+    GATE_DEPS_ENV_CACHE: bool = False
+    GATE_DEPS_ENV_DIR: str = ""
+    GATE_DEPS_ENV_MAX_ENTRIES: int = 32
+    GATE_DEPS_ENV_MAX_BYTES: int = 10 * 1024 * 1024 * 1024
+    # Passe rapide (opt-in) : les tests qui importent les fichiers du diff (graphe
+    # d'imports AST, en cache par commit de base) tournent en tête, ``-x`` ; la
+    # suite complète seulement s'ils sont verts. Pas de passe rapide quand la
+    # sélection dépasse MAX_RATIO de la suite. Vide : $COLLEGUE_HOME/cache/test_impact.
+    GATE_TEST_IMPACT: bool = False
+    GATE_TEST_IMPACT_DIR: str = ""
+    GATE_TEST_IMPACT_MAX_RATIO: float = 0.5
     # #481 : remédiation déterministe des dépendances manquantes pendant le gate
     # (table module→paquet + relance bornée, sans LLM). Défaut ON — opt-out.
     GATE_FIX_REQUIREMENTS: bool = True
@@ -143,6 +158,12 @@ class Settings(BaseSettings):
     # « livraison fantôme » (feature fermée par +1 ligne de requirements) ne
     # passe plus. Opt-in : un appel LLM par PR candidate.
     GATE_ADEQUACY: bool = False
+    # La revue tourne pendant les tests ; GATE_CONCURRENT_ADEQUACY y ajoute le
+    # contrôle d'adéquation (spéculatif : un appel LLM aussi sur les gates rouges,
+    # sauf annulation). GATE_LLM_CANCEL_ON_RED : passes LLM annulées dès que les
+    # tests sont rouges — none, adequacy (défaut) ou all (revue comprise).
+    GATE_CONCURRENT_ADEQUACY: bool = False
+    GATE_LLM_CANCEL_ON_RED: str = "adequacy"
     # §4.7 : tests d'acceptation EXÉCUTABLES générés au PLAN-TIME par le rôle QA,
     # persistés avec SHA-256/provenance et inclus dans l'empreinte approuvée. Le
     # gate rejoue exactement cet oracle en sandbox, sans voir le diff et sans
@@ -203,12 +224,85 @@ class Settings(BaseSettings):
     SANDBOX_MEMORY: str = "6g"
     SANDBOX_CPUS: str = "2.0"
     SANDBOX_TIMEOUT: float = 2400.0
+    # Conteneurs sandbox lancés en même temps par l'API async (gate, mesures) ;
+    # les suivants attendent un créneau. 0 = pas de plafond.
+    SANDBOX_MAX_CONTAINERS: int = 4
+    # Pool de conteneurs chauds du gate (opt-in) : passes lancées par `docker exec`
+    # dans des conteneurs pré-démarrés (même argv durci, même workspace), remis à
+    # zéro entre deux passes et recyclés après SANDBOX_POOL_MAX_USES passes.
+    SANDBOX_POOL_ENABLED: bool = False
+    SANDBOX_POOL_MAX_CONTAINERS: int = 4
+    SANDBOX_POOL_MAX_USES: int = 20
+    SANDBOX_POOL_IDLE_TTL: float = 300.0
 
     ENGINE_INIT_TIMEOUT: float = 10.0
     ENGINE_WAIT_TIMEOUT: float = 30.0
     MAX_HISTORY_LENGTH: int = 20
     CACHE_ENABLED: bool = True
     CACHE_TTL: int = 3600
+    # Persistance write-behind des métriques (MetricsCollector) : metrics.json est
+    # réécrit par un thread de fond après METRICS_FLUSH_INTERVAL_SECONDS sans
+    # nouvelle exécution, et au plus tard METRICS_MAX_STALENESS_SECONDS après la
+    # première modification non persistée (trafic continu). 0 = écriture
+    # synchrone à chaque exécution (comportement historique).
+    METRICS_FLUSH_INTERVAL_SECONDS: float = 2.0
+    METRICS_MAX_STALENESS_SECONDS: float = 10.0
+    # Index plein texte de ProjectMemory.search : "bm25" (index inversé en mémoire,
+    # défaut) ou "sqlite" (SQLite FTS5, pour les mémoires de très grande taille).
+    MEMORY_SEARCH_BACKEND: str = "bm25"
+    # Cache disque des réponses LLM (collegue.core.llm.response_cache), opt-in.
+    # Clé = empreinte (modèle, messages, température, max_tokens) ; éviction LRU
+    # au-delà de MAX_ENTRIES entrées ou MAX_BYTES octets ; contourné quand la
+    # température dépasse MAX_TEMPERATURE (réponses volontairement variées).
+    LLM_RESPONSE_CACHE_ENABLED: bool = False
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = 10000
+    LLM_RESPONSE_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    LLM_RESPONSE_CACHE_MAX_TEMPERATURE: float = 0.2
+    # Cache persistant des résultats d'outils déterministes (collegue.core.tool_cache),
+    # opt-in. Clé = requête normalisée + contenu des fichiers lus + version des règles.
+    TOOL_RESULT_CACHE_ENABLED: bool = False
+    TOOL_RESULT_CACHE_MAX_ENTRIES: int = 5000
+    TOOL_RESULT_CACHE_MAX_BYTES: int = 128 * 1024 * 1024
+    # Faits AST Python partagés par les experts (collegue.core.code_facts) : nombre
+    # de sources analysés gardés en mémoire, par empreinte du contenu (0 = pas de cache).
+    CODE_FACTS_CACHE_SIZE: int = 256
+    # Résultats de CodeParser.parse mémoïsés par (empreinte du contenu, langage),
+    # partagés via le parser du lifespan. 0 entrée = pas de cache.
+    PARSER_CACHE_MAX_ENTRIES: int = 512
+    PARSER_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    # Tokenizer de collegue.parsing.JSParser : "regex" (défaut) ou "tree_sitter"
+    # (extra [treesitter] ; repli sur "regex" si les paquets sont absents).
+    JS_TOKENIZER_BACKEND: str = "regex"
+    # Exécution en DAG des plans de smart_orchestrator : nombre max d'étapes
+    # simultanées et timeout par étape en secondes (<= 0 = pas de timeout).
+    ORCHESTRATOR_MAX_CONCURRENCY: int = 4
+    ORCHESTRATOR_STEP_TIMEOUT: float = 600.0
+    # Pool d'instances d'outils (collegue.core.tool_pool) partagé par l'orchestrateur
+    # et la délégation : instances inactives gardées par outil. 0 = une instance
+    # neuve par appel (comportement historique).
+    TOOL_POOL_MAX_IDLE: int = 4
+    # Scan de répertoire de secret_scan : process parallèles opt-in (1 = séquentiel,
+    # 0 = un par cœur ; chaque scan démarre son pool) et cache disque opt-in des
+    # findings par fichier (collegue.tools.secret_scan.cache), repris tant que le
+    # fichier est inchangé.
+    SECRET_SCAN_WORKERS: int = 1
+    SECRET_SCAN_FILE_CACHE_ENABLED: bool = False
+    SECRET_SCAN_FILE_CACHE_MAX_ENTRIES: int = 200000
+    SECRET_SCAN_FILE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # dependency_guard : requêtes simultanées vers les registres et OSV (connexions
+    # keep-alive partagées par lot, HTTP/2 si h2 est installé) et cache disque opt-in
+    # (collegue.tools.dependency_guard.cache) des métadonnées de registre
+    # (existence, dernière version, ETag ; TTL en secondes, une heure au plus pour un
+    # package introuvable) et des résultats OSV par (écosystème, package, version).
+    DEPENDENCY_GUARD_MAX_CONCURRENCY: int = 16
+    DEPENDENCY_GUARD_CACHE_ENABLED: bool = False
+    DEPENDENCY_GUARD_CACHE_TTL: int = 86400
+    DEPENDENCY_GUARD_OSV_CACHE_TTL: int = 21600
+    DEPENDENCY_GUARD_CACHE_MAX_ENTRIES: int = 100000
+    DEPENDENCY_GUARD_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    # iac_guardrails_scan : process parallèles opt-in pour les lots d'au moins 64
+    # fichiers (1 = séquentiel, 0 = un par cœur ; chaque scan démarre son pool).
+    IAC_SCAN_WORKERS: int = 1
 
     # --- LLM rate limiting (per-client identity) ---
     # Protects the shared LLM quota from being exhausted by a single abusive
@@ -0,0 +1,441 @@
+"""Faits d'analyse Python partagés entre experts (une analyse par contenu).
+
+``performance_analysis``, ``code_review``, ``refactoring`` et ``test_generation``
+re-parsaient chacun le même source (plusieurs ``ast.parse`` + ``ast.walk`` par
+requête, davantage dans un plan de ``smart_orchestrator`` ou une chaîne de
+délégation). Ici le code est parsé une fois et parcouru par un seul
+``ast.NodeVisitor`` qui relève :
+
+- par fonction : paramètres, profondeur de boucles, complexité cyclomatique,
+  première recherche ``in`` dans une boucle, annotations, docstring ;
+- par classe : méthodes, docstring ;
+- les imports, les handlers ``except`` et la profondeur d'imbrication des
+  instructions.
+
+Le résultat (:class:`CodeFacts`, en lecture seule pour les consommateurs) est
+gardé dans un cache LRU en mémoire indexé par l'empreinte SHA-256 du contenu
+(``CODE_FACTS_CACHE_SIZE``). Le temps de parsing dépensé et économisé est
+cumulé par requête dans :class:`ParseStats` (:func:`capture_parse_stats`,
+ouvert par ``BaseTool`` et remonté au ``MetricsCollector``).
+"""
+
+from __future__ import annotations
+
+import ast
+import contextvars
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_CACHE_SIZE = 256
+
+_BROAD_EXCEPTIONS = ("Exception", "BaseException")
+
+
+@dataclass
+class FunctionFacts:
+    """Fonction ou méthode (``def`` / ``async def``)."""
+
+    name: str
+    line: int
+    end_line: int
+    # Arguments positionnels, hors ``self``.
+    params: List[str]
+    is_async: bool = False
+    is_method: bool = False
+    # Nombre de def/class englobants (0 = niveau module).
+    scope_depth: int = 0
+    # Profondeur max de boucles imbriquées, fonctions internes comprises.
+    max_loop_depth: int = 0
+    # 1 + if/for/while/except + opérandes booléens supplémentaires.
+    complexity: int = 1
+    # Ligne de la première comparaison ``x in y`` située dans une boucle.
+    loop_membership_line: Optional[int] = None
+    annotated: bool = False
+    has_docstring: bool = False
+
+
+@dataclass
+class ClassFacts:
+    name: str
+    line: int
+    end_line: int
+    scope_depth: int = 0
+    methods: List[str] = field(default_factory=list)
+    has_docstring: bool = False
+
+
+@dataclass
+class ImportFacts:
+    """Nom lié par un import (alias, ou premier composant du module)."""
+
+    name: str
+    module: str
+    line: int
+
+
+@dataclass
+class ExceptHandlerFacts:
+    line: int
+    # Type attrapé tel qu'écrit (``None`` pour un ``except:`` nu).
+    exception: Optional[str] = None
+    bound: bool = False
+    # Ligne du ``pass`` quand le handler ne fait rien d'autre.
+    silent_line: Optional[int] = None
+
+    @property
+    def is_broad(self) -> bool:
+        """``except:`` ou ``except Exception:`` sans variable liée."""
+        return self.exception is None or (self.exception in _BROAD_EXCEPTIONS and not self.bound)
+
+
+@dataclass
+class CodeFacts:
+    """Faits extraits d'un source Python ; ``syntax_error`` renseigné s'il ne parse pas."""
+
+    digest: str
+    line_count: int
+    syntax_error: Optional[str] = None
+    syntax_error_line: Optional[int] = None
+    module_docstring: bool = False
+    functions: List[FunctionFacts] = field(default_factory=list)
+    classes: List[ClassFacts] = field(default_factory=list)
+    imports: List[ImportFacts] = field(default_factory=list)
+    except_handlers: List[ExceptHandlerFacts] = field(default_factory=list)
+    # Ligne → profondeur d'imbrication (blocs englobants) des instructions qui y commencent.
+    statement_depths: Dict[int, int] = field(default_factory=dict)
+    max_nesting: int = 0
+    # Durée du parsing + parcours (ms).
+    parse_ms: float = 0.0
+
+    @property
+    def valid(self) -> bool:
+        return self.syntax_error is None
+
+
+class _FactsVisitor(ast.NodeVisitor):
+    """Parcours unique de l'arbre ; remplit un :class:`CodeFacts`."""
+
+    def __init__(self, facts: CodeFacts):
+        self.facts = facts
+        self._depth = 0
+        self._loop_depth = 0
+        # (fonction, profondeur de boucle à son entrée) : les boucles et décisions
+        # comptent pour toutes les fonctions englobantes, comme un ast.walk de chacune.
+        self._functions: List[Tuple[FunctionFacts, int]] = []
+        self._scopes: List[ast.AST] = []
+        # Indices (dans facts.classes) des classes englobantes.
+        self._class_stack: List[int] = []
+
+    # -- Instructions et imbrication ---------------------------------------
+
+    def _record_statement(self, node: ast.stmt) -> None:
+        depths = self.facts.statement_depths
+        if depths.get(node.lineno, -1) < self._depth:
+            depths[node.lineno] = self._depth
+        if self._depth > self.facts.max_nesting:
+            self.facts.max_nesting = self._depth
+
+    def _visit_block(self, statements: List[ast.stmt]) -> None:
+        self._depth += 1
+        for stmt in statements:
+            self.visit(stmt)
+        self._depth -= 1
+
+    def _scan_expression(self, node: Optional[ast.AST]) -> None:
+        """Relève opérateurs booléens et recherches ``in`` d'une expression (sans instruction).
+
+        Parcours à plat (``ast.walk``) plutôt que par le visiteur : les expressions
+        forment l'essentiel de l'arbre et ne changent ni l'imbrication ni les boucles.
+        """
+        if node is None or not self._functions:
+            return
+        searching = [f for f, base in self._functions if self._loop_depth > base and f.loop_membership_line is None]
+        for sub in ast.walk(node):
+            if isinstance(sub, ast.BoolOp):
+                self._add_complexity(len(sub.values) - 1)
+            elif searching and isinstance(sub, ast.Compare) and any(isinstance(op, ast.In) for op in sub.ops):
+                for function in searching:
+                    function.loop_membership_line = sub.lineno
+                searching = []
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Instruction sans traitement dédié : expressions au niveau courant, blocs un niveau plus bas."""
+        self._record_statement(node)
+        blocks = []
+        for value in ast.iter_fields(node):
+            value = value[1]
+            if isinstance(value, list):
+                if value and isinstance(value[0], ast.stmt):
+                    blocks.append(value)
+                    continue
+                for item in value:
+                    if isinstance(item, ast.match_case):
+                        self._scan_expression(item.pattern)
+                        self._scan_expression(item.guard)
+                        blocks.append(item.body)
+                    elif isinstance(item, ast.AST):
+                        self._scan_expression(item)
+            elif isinstance(value, ast.AST):
+                self._scan_expression(value)
+        for block in blocks:
+            self._visit_block(block)
+
+    def visit_Module(self, node: ast.Module) -> None:
+        self.facts.module_docstring = ast.get_docstring(node, clean=False) is not None
+        for stmt in node.body:
+            self.visit(stmt)
+
+    def visit_If(self, node: ast.If) -> None:
+        self._record_statement(node)
+        self._add_complexity(1)
+        self._scan_expression(node.test)
+        self._visit_block(node.body)
+        orelse = node.orelse
+        # ``elif`` : If unique du ``else``, aligné sur le ``if`` → même niveau d'imbrication.
+        if len(orelse) == 1 and isinstance(orelse[0], ast.If) and orelse[0].col_offset == node.col_offset:
+            self.visit(orelse[0])
+        else:
+            self._visit_block(orelse)
+
+    def visit_Try(self, node: ast.Try) -> None:
+        self._record_statement(node)
+        self._visit_block(node.body)
+        for handler in node.handlers:
+            self._visit_handler(handler)
+        self._visit_block(node.orelse)
+        self._visit_block(node.finalbody)
+
+    visit_TryStar = visit_Try
+
+    def _visit_handler(self, node: ast.ExceptHandler) -> None:
+        self._add_complexity(1)
+        body = node.body
+        self.facts.except_handlers.append(
+            ExceptHandlerFacts(
+                line=node.lineno,
+                exception=ast.unparse(node.type) if node.type is not None else None,
+                bound=node.name is not None,
+                silent_line=body[0].lineno if len(body) == 1 and isinstance(body[0], ast.Pass) else None,
+            )
+        )
+        self._scan_expression(node.type)
+        self._visit_block(body)
+
+    # -- Boucles et complexité ---------------------------------------------
+
+    def _add_complexity(self, amount: int) -> None:
+        for function, _ in self._functions:
+            function.complexity += amount
+
+    def _visit_loop(self, node: ast.stmt) -> None:
+        self._add_complexity(1)
+        self._loop_depth += 1
+        for function, base in self._functions:
+            function.max_loop_depth = max(function.max_loop_depth, self._loop_depth - base)
+        self.generic_visit(node)
+        self._loop_depth -= 1
+
+    visit_For = visit_AsyncFor = visit_While = _visit_loop
+
+    # -- Définitions ---------------------------------------------------------
+
+    def _visit_function(self, node: ast.AST) -> None:
+        self._record_statement(node)
+        args = node.args
+        parent = self._scopes[-1] if self._scopes else None
+        function = FunctionFacts(
+            name=node.name,
+            line=node.lineno,
+            end_line=getattr(node, "end_lineno", None) or node.lineno,
+            params=[arg.arg for arg in args.args if arg.arg != "self"],
+            is_async=isinstance(node, ast.AsyncFunctionDef),
+            is_method=isinstance(parent, ast.ClassDef),
+            scope_depth=len(self._scopes),
+            annotated=node.returns is not None
+            or any(arg.annotation is not None for arg in args.posonlyargs + args.args + args.kwonlyargs),
+            has_docstring=ast.get_docstring(node, clean=False) is not None,
+        )
+        self.facts.functions.append(function)
+        if isinstance(parent, ast.ClassDef):
+            self.facts.classes[self._class_stack[-1]].methods.append(node.name)
+
+        for decorator in node.decorator_list:
+            self._scan_expression(decorator)
+        self._scan_expression(args)
+        self._scan_expression(node.returns)
+        self._functions.append((function, self._loop_depth))
+        self._scopes.append(node)
+        self._visit_block(node.body)
+        self._scopes.pop()
+        self._functions.pop()
+
+    visit_FunctionDef = visit_AsyncFunctionDef = _visit_function
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._record_statement(node)
+        self.facts.classes.append(
+            ClassFacts(
+                name=node.name,
+                line=node.lineno,
+                end_line=getattr(node, "end_lineno", None) or node.lineno,
+                scope_depth=len(self._scopes),
+                has_docstring=ast.get_docstring(node, clean=False) is not None,
+            )
+        )
+        for expr in node.decorator_list + node.bases + node.keywords:
+            self._scan_expression(expr)
+        self._class_stack.append(len(self.facts.classes) - 1)
+        self._scopes.append(node)
+        self._visit_block(node.body)
+        self._scopes.pop()
+        self._class_stack.pop()
+
+    # -- Imports -------------------------------------------------------------
+
+    def visit_Import(self, node: ast.Import) -> None:
+        self._record_statement(node)
+        for alias in node.names:
+            self.facts.imports.append(
+                ImportFacts(name=alias.asname or alias.name.split(".")[0], module=alias.name, line=node.lineno)
+            )
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self._record_statement(node)
+        module = "." * node.level + (node.module or "")
+        for alias in node.names:
+            self.facts.imports.append(ImportFacts(name=alias.asname or alias.name, module=module, line=node.lineno))
+
+
+def content_digest(code: str) -> str:
+    return hashlib.sha256(code.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def extract_code_facts(code: str, digest: Optional[str] = None) -> CodeFacts:
+    """Parse ``code`` et le parcourt une fois (sans cache)."""
+    start = time.perf_counter()
+    facts = CodeFacts(digest=digest or content_digest(code), line_count=code.count("\n") + 1)
+    try:
+        tree = ast.parse(code)
+        _FactsVisitor(facts).visit(tree)
+    except (SyntaxError, ValueError, RecursionError) as e:
+        facts = CodeFacts(
+            digest=facts.digest,
+            line_count=facts.line_count,
+            syntax_error=getattr(e, "msg", None) or str(e) or type(e).__name__,
+            syntax_error_line=getattr(e, "lineno", None),
+        )
+    facts.parse_ms = (time.perf_counter() - start) * 1000
+    return facts
+
+
+@dataclass
+class ParseStats:
+    """Parsings d'une requête : effectués, évités par le cache, et leur coût (ms)."""
+
+    parses: int = 0
+    reuses: int = 0
+    parse_ms: float = 0.0
+    saved_ms: float = 0.0
+
+
+_request_stats: contextvars.ContextVar[Optional[ParseStats]] = contextvars.ContextVar(
+    "collegue_code_facts_stats", default=None
+)
+
+
+@contextmanager
+def capture_parse_stats() -> Iterator[ParseStats]:
+    """Cumule dans un :class:`ParseStats` neuf les parsings faits dans ce contexte.
+
+    L'objet est partagé (pas copié) avec les threads lancés via ``asyncio.to_thread`` :
+    les parsings faits dans ``_execute_core_logic`` y sont bien comptés.
+    """
+    stats = ParseStats()
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+
+class CodeFactsCache:
+    """LRU en mémoire ``empreinte du contenu → CodeFacts`` (thread-safe)."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max(0, int(max_entries))
+        self._entries: "OrderedDict[str, CodeFacts]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, code: str) -> CodeFacts:
+        digest = content_digest(code)
+        with self._lock:
+            facts = self._entries.get(digest)
+            if facts is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+        stats = _request_stats.get()
+        if facts is not None:
+            if stats is not None:
+                stats.reuses += 1
+                stats.saved_ms += facts.parse_ms
+            return facts
+
+        facts = extract_code_facts(code, digest)
+        with self._lock:
+            self.misses += 1
+            if self.max_entries:
+                self._entries[digest] = facts
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        if stats is not None:
+            stats.parses += 1
+            stats.parse_ms += facts.parse_ms
+        return facts
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_cache: Optional[CodeFactsCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_code_facts_cache(settings_obj: Optional[object] = None) -> CodeFactsCache:
+    """Singleton du cache, dimensionné par ``CODE_FACTS_CACHE_SIZE`` (0 = sans mémoïsation)."""
+    global _cache
+    if _cache is not None:
+        return _cache
+    if settings_obj is None:
+        try:
+            from collegue.config import settings as settings_obj
+        except Exception:
+            settings_obj = None
+    with _cache_lock:
+        if _cache is None:
+            _cache = CodeFactsCache(int(getattr(settings_obj, "CODE_FACTS_CACHE_SIZE", DEFAULT_CACHE_SIZE)))
+        return _cache
+
+
+def reset_code_facts_cache() -> None:
+    """Oublie le singleton (pour les tests)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def get_code_facts(code: str) -> CodeFacts:
+    """Faits du source Python ``code``, parsé au plus une fois tant qu'il reste en cache."""
+    return get_code_facts_cache().get(code)
@@ -0,0 +1,159 @@
+"""Magasin clé → texte sur disque, borné en entrées et en octets (éviction LRU).
+
+Socle commun des caches persistants de Collègue (réponses LLM, résultats
+d'outils déterministes). Une base SQLite par cache sous ``$COLLEGUE_HOME/cache`` :
+écritures atomiques, lecture concurrente (WAL) et partage possible entre
+process/réplicas montant le même volume.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from collegue.core import paths
+
+logger = logging.getLogger(__name__)
+
+# Borne du nombre de paramètres par requête SQLite (SQLITE_MAX_VARIABLE_NUMBER).
+_BATCH = 500
+
+
+class SqliteLRUCache:
+    """Cache SQLite ``key → (text, tag)`` avec éviction des entrées les moins récemment lues."""
+
+    def __init__(self, filename: str, cache_dir: Optional[str] = None, *, max_entries: int, max_bytes: int):
+        self._path = Path(cache_dir) if cache_dir else paths.cache_dir()
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._filename = filename
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path / filename), check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, tag TEXT NOT NULL, text TEXT NOT NULL,"
+            " size INTEGER NOT NULL, created REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries(last_access)")
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path / self._filename
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """``{"text", "tag"}`` de l'entrée (et la marque récente), ou ``None``."""
+        with self._lock:
+            try:
+                row = self._conn.execute("SELECT text, tag FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+                self._conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning("Cache %s illisible (%s) : entrée ignorée", self._filename, exc)
+                return None
+            self.hits += 1
+        return {"text": row[0], "tag": row[1]}
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """Comme :meth:`get` pour plusieurs clés, en une transaction : ``{clé: {"text", "tag"}}``."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Dict[str, str]] = {}
+        with self._lock:
+            try:
+                for i in range(0, len(keys), _BATCH):
+                    batch = keys[i : i + _BATCH]
+                    rows = self._conn.execute(
+                        f"SELECT key, text, tag FROM entries WHERE key IN ({','.join('?' * len(batch))})", batch
+                    ).fetchall()
+                    for key, text, tag in rows:
+                        found[key] = {"text": text, "tag": tag}
+                if found:
+                    now = time.time()
+                    self._conn.executemany(
+                        "UPDATE entries SET last_access = ? WHERE key = ?", [(now, key) for key in found]
+                    )
+                    self._conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning("Cache %s illisible (%s) : entrées ignorées", self._filename, exc)
+                return {}
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put(self, key: str, text: str, tag: str = "") -> None:
+        """Enregistre une entrée puis évince les moins récemment lues au-delà des bornes."""
+        size = len(text.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries(key, tag, text, size, created, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, tag or "", text, size, now, now),
+                )
+                self._evict_locked()
+                self._conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning("Cache %s non écrit (%s)", self._filename, exc)
+
+    def put_many(self, items: Iterable[Tuple[str, str, str]]) -> None:
+        """Comme :meth:`put` pour plusieurs ``(clé, texte, tag)``, en une transaction."""
+        now = time.time()
+        rows: List[Tuple[str, str, str, int, float, float]] = []
+        for key, text, tag in items:
+            size = len(text.encode("utf-8"))
+            if size <= self.max_bytes:
+                rows.append((key, tag or "", text, size, now, now))
+        if not rows:
+            return
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries(key, tag, text, size, created, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._evict_locked()
+                self._conn.commit()
+            except sqlite3.Error as exc:
+                logger.warning("Cache %s non écrit (%s)", self._filename, exc)
+
+    def _evict_locked(self) -> None:
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_access ASC"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"entries": count, "bytes": total, "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -11,16 +11,25 @@ Architecture :
 
 Sécurité :
     - max_chain_depth pour éviter les boucles infinies
-    - timeout global pour les chaînes longues
+    - timeout global pour les chaînes longues (délégations en cours annulées)
     - logging structuré de chaque délégation
+
+Concurrence :
+    Les délégations sœurs (même source, même profondeur) sont indépendantes et
+    s'exécutent en parallèle, bornées par ``max_concurrency``. L'ordre des
+    résultats reste celui des tâches ; chaque résultat porte son instant de
+    départ et la durée murale de sa branche pour exposer le chemin critique.
 """
 
+import asyncio
 import logging
 import time
 from typing import Any, Callable, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from .tool_pool import get_tool_pool
+
 logger = logging.getLogger("expert_delegation")
 
 
@@ -62,6 +71,8 @@ class DelegationResult(BaseModel):
     error: Optional[str] = Field(None, description="Erreur si échec")
     execution_time: float = Field(default=0.0, description="Temps d'exécution en secondes")
     depth: int = Field(default=1, description="Profondeur dans la chaîne")
+    started_at: float = Field(default=0.0, description="Début de la branche, en secondes depuis le début de la chaîne")
+    branch_time: float = Field(default=0.0, description="Durée murale de la branche, sous-délégations comprises")
     sub_delegations: List["DelegationResult"] = Field(
         default_factory=list,
         description="Sous-délégations déclenchées par ce résultat",
@@ -75,7 +86,11 @@ class DelegationChainReport(BaseModel):
     total_experts_activated: int = Field(default=0, description="Nombre total d'experts activés")
     max_depth_reached: int = Field(default=0, description="Profondeur maximale atteinte")
     results: List[DelegationResult] = Field(default_factory=list, description="Résultats de la chaîne")
-    total_time: float = Field(default=0.0, description="Temps total de la chaîne")
+    total_time: float = Field(default=0.0, description="Temps cumulé des experts de la chaîne")
+    wall_time: float = Field(default=0.0, description="Durée murale de la chaîne (branches parallèles)")
+    critical_path: List[str] = Field(
+        default_factory=list, description="Délégations 'source → cible' de la branche la plus longue"
+    )
     chain_completed: bool = Field(default=True, description="True si la chaîne s'est terminée normalement")
     abort_reason: Optional[str] = Field(None, description="Raison de l'arrêt si non complétée")
 
@@ -95,12 +110,14 @@ class ExpertDelegationEngine:
         self,
         max_chain_depth: int = 5,
         chain_timeout: float = 300.0,
+        max_concurrency: int = 4,
     ):
         self._rules: List[DelegationRule] = []
         self._conditions: Dict[str, ConditionFn] = {}
         self._params_builders: Dict[str, ParamsBuilderFn] = {}
         self.max_chain_depth = max_chain_depth
         self.chain_timeout = chain_timeout
+        self.max_concurrency = max(1, int(max_concurrency))
         self._chain_history: List[DelegationResult] = []
 
     def register_rule(
@@ -241,77 +258,130 @@ class ExpertDelegationEngine:
             chain_start_time = time.time()
             self._chain_history = []
 
-        results: List[DelegationResult] = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await self._execute_level(
+            tasks, tool_registry, ctx, current_depth, chain_start_time, tool_kwargs, semaphore
+        )
+        # Historique en post-ordre (sous-délégations puis parent), stable quel
+        # que soit l'ordre d'achèvement des branches parallèles.
+        self._chain_history.extend(_post_order(results))
+        return results
 
-        for task in tasks:
-            # Anti-boucle infinie
-            if current_depth > self.max_chain_depth:
-                logger.warning(
-                    "Profondeur max atteinte (%d), arrêt de la chaîne",
-                    self.max_chain_depth,
-                )
-                results.append(
-                    DelegationResult(
-                        source_tool=task.rule.source_tool,
-                        target_tool=task.target_tool,
-                        success=False,
-                        error=f"Profondeur maximale atteinte ({self.max_chain_depth})",
-                        depth=current_depth,
+    async def _execute_level(
+        self,
+        tasks: List[DelegationTask],
+        tool_registry: Dict[str, Any],
+        ctx: Any,
+        current_depth: int,
+        chain_start_time: float,
+        tool_kwargs: Optional[Dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+    ) -> List[DelegationResult]:
+        """Exécute des tâches sœurs en parallèle ; résultats dans l'ordre des tâches."""
+        return list(
+            await asyncio.gather(
+                *(
+                    self._execute_branch(
+                        task, tool_registry, ctx, current_depth, chain_start_time, tool_kwargs, semaphore
                     )
+                    for task in tasks
                 )
-                continue
+            )
+        )
 
-            # Timeout global
-            elapsed = time.time() - chain_start_time
-            if elapsed > self.chain_timeout:
-                logger.warning(
-                    "Timeout chaîne atteint (%.1fs > %.1fs)",
-                    elapsed,
-                    self.chain_timeout,
+    async def _execute_branch(
+        self,
+        task: DelegationTask,
+        tool_registry: Dict[str, Any],
+        ctx: Any,
+        current_depth: int,
+        chain_start_time: float,
+        tool_kwargs: Optional[Dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+    ) -> DelegationResult:
+        """Exécute une délégation puis, si elle réussit, ses sous-délégations."""
+        branch_start = time.time()
+        started_at = branch_start - chain_start_time
+
+        # Anti-boucle infinie
+        if current_depth > self.max_chain_depth:
+            logger.warning(
+                "Profondeur max atteinte (%d), arrêt de la chaîne",
+                self.max_chain_depth,
+            )
+            return DelegationResult(
+                source_tool=task.rule.source_tool,
+                target_tool=task.target_tool,
+                success=False,
+                error=f"Profondeur maximale atteinte ({self.max_chain_depth})",
+                depth=current_depth,
+                started_at=started_at,
+            )
+
+        # Le sémaphore ne couvre que l'exécution du tool : une branche qui attend
+        # ses sous-délégations ne bloque pas de créneau (pas d'interblocage).
+        async with semaphore:
+            remaining = self.chain_timeout - (time.time() - chain_start_time)
+            if remaining <= 0:
+                return self._timeout_result(task, current_depth, started_at, time.time() - chain_start_time, 0.0)
+            exec_start = time.time()
+            try:
+                # Timeout global avec annulation réelle de la délégation en cours.
+                delegation_result = await asyncio.wait_for(
+                    self._execute_single_delegation(task, tool_registry, ctx, tool_kwargs), remaining
                 )
-                results.append(
-                    DelegationResult(
-                        source_tool=task.rule.source_tool,
-                        target_tool=task.target_tool,
-                        success=False,
-                        error=f"Timeout chaîne ({self.chain_timeout}s)",
-                        depth=current_depth,
-                    )
+            except asyncio.TimeoutError:
+                return self._timeout_result(
+                    task, current_depth, started_at, time.time() - chain_start_time, time.time() - exec_start
                 )
-                continue
+        delegation_result.depth = current_depth
+        delegation_result.started_at = started_at
 
-            # Exécution du tool cible
-            delegation_result = await self._execute_single_delegation(task, tool_registry, ctx, tool_kwargs)
-            delegation_result.depth = current_depth
-
-            # Évaluer les sous-délégations si l'exécution a réussi
-            if delegation_result.success and delegation_result.result:
-                sub_tasks = await self.evaluate_delegations(
-                    task.target_tool,
-                    delegation_result.result,
+        # Évaluer les sous-délégations si l'exécution a réussi
+        if delegation_result.success and delegation_result.result:
+            sub_tasks = await self.evaluate_delegations(
+                task.target_tool,
+                delegation_result.result,
+            )
+            if sub_tasks:
+                delegation_result.sub_delegations = await self._execute_level(
+                    sub_tasks,
+                    tool_registry,
+                    ctx,
+                    current_depth + 1,
+                    chain_start_time,
+                    tool_kwargs,
+                    semaphore,
                 )
-                if sub_tasks:
-                    sub_results = await self.execute_delegation_chain(
-                        sub_tasks,
-                        tool_registry,
-                        ctx,
-                        current_depth + 1,
-                        chain_start_time,
-                        tool_kwargs,
-                    )
-                    delegation_result.sub_delegations = sub_results
+        delegation_result.branch_time = time.time() - branch_start
 
-            results.append(delegation_result)
-            self._chain_history.append(delegation_result)
+        if ctx and hasattr(ctx, "info"):
+            status = "✅" if delegation_result.success else "❌"
+            await ctx.info(
+                f"{status} Délégation {task.rule.source_tool} → {task.target_tool} "
+                f"(profondeur: {current_depth}, temps: {delegation_result.execution_time:.1f}s)"
+            )
 
-            if ctx and hasattr(ctx, "info"):
-                status = "✅" if delegation_result.success else "❌"
-                await ctx.info(
-                    f"{status} Délégation {task.rule.source_tool} → {task.target_tool} "
-                    f"(profondeur: {current_depth}, temps: {delegation_result.execution_time:.1f}s)"
-                )
+        return delegation_result
 
-        return results
+    def _timeout_result(
+        self, task: DelegationTask, depth: int, started_at: float, elapsed: float, execution_time: float
+    ) -> DelegationResult:
+        logger.warning(
+            "Timeout chaîne atteint (%.1fs > %.1fs)",
+            elapsed,
+            self.chain_timeout,
+        )
+        return DelegationResult(
+            source_tool=task.rule.source_tool,
+            target_tool=task.target_tool,
+            success=False,
+            error=f"Timeout chaîne ({self.chain_timeout}s)",
+            execution_time=execution_time,
+            depth=depth,
+            started_at=started_at,
+            branch_time=execution_time,
+        )
 
     async def _execute_single_delegation(
         self,
@@ -332,10 +402,12 @@ class ExpertDelegationEngine:
                 execution_time=time.time() - start_time,
             )
 
+        tool_class = tool_registry[task.target_tool]["class"]
+        tool_pool = get_tool_pool()
+        tool_instance = None
+        succeeded = False
         try:
-            tool_entry = tool_registry[task.target_tool]
-            tool_class = tool_entry["class"]
-            tool_instance = tool_class({})
+            tool_instance = tool_pool.acquire(task.target_tool, tool_class)
 
             req_model = tool_instance.get_request_model()
             req_obj = req_model(**task.params)
@@ -361,6 +433,7 @@ class ExpertDelegationEngine:
                 execution_time,
             )
 
+            succeeded = True
             return DelegationResult(
                 source_tool=task.rule.source_tool,
                 target_tool=task.target_tool,
@@ -386,11 +459,9 @@ class ExpertDelegationEngine:
                 execution_time=execution_time,
             )
         finally:
-            if "tool_instance" in locals() and hasattr(tool_instance, "cleanup"):
-                try:
-                    tool_instance.cleanup()
-                except Exception:
-                    pass
+            # Instance rendue au pool (nettoyée après un échec ou une annulation).
+            if tool_instance is not None:
+                tool_pool.release(task.target_tool, tool_class, tool_instance, reusable=succeeded)
 
     def get_chain_history(self) -> List[DelegationResult]:
         """Retourne l'historique de la chaîne en cours."""
@@ -428,6 +499,16 @@ class ExpertDelegationEngine:
 
         total_time = sum(r.execution_time for r in chain_results)
 
+        # Chemin critique : depuis la racine qui finit le plus tard, on descend
+        # dans la sous-délégation la plus longue.
+        roots = [r for r in chain_results if r.depth == min((x.depth for x in chain_results), default=0)]
+        wall_time = max((r.started_at + r.branch_time for r in chain_results), default=0.0) or total_time
+        critical_path: List[str] = []
+        branch = max(roots, key=lambda r: r.started_at + r.branch_time, default=None)
+        while branch is not None:
+            critical_path.append(f"{branch.source_tool} → {branch.target_tool}")
+            branch = max(branch.sub_delegations, key=lambda r: r.started_at + r.branch_time, default=None)
+
         abort_reason: Optional[str] = None
         chain_completed = True
         for r in chain_results:
@@ -443,6 +524,8 @@ class ExpertDelegationEngine:
             max_depth_reached=_max_depth(chain_results),
             results=list(chain_results),
             total_time=total_time,
+            wall_time=wall_time,
+            critical_path=critical_path,
             chain_completed=chain_completed,
             abort_reason=abort_reason,
         )
@@ -456,6 +539,15 @@ class ExpertDelegationEngine:
         self._chain_history = []
 
 
+def _post_order(results: List[DelegationResult]) -> List[DelegationResult]:
+    """Aplatit des résultats : sous-délégations avant leur parent, dans l'ordre des tâches."""
+    flat: List[DelegationResult] = []
+    for result in results:
+        flat.extend(_post_order(result.sub_delegations))
+        flat.append(result)
+    return flat
+
+
 def _refactoring_has_changes(result: Dict[str, Any]) -> bool:
     """Condition: le refactoring a effectué des changements."""
     changes = result.get("changes") or []
@@ -813,6 +905,7 @@ def _build_test_params_from_performance(source_tool: str, result: Dict[str, Any]
 def create_default_delegation_engine(
     max_chain_depth: int = 5,
     chain_timeout: float = 300.0,
+    max_concurrency: int = 4,
 ) -> ExpertDelegationEngine:
     """Crée un ExpertDelegationEngine avec les règles par défaut.
 
@@ -835,6 +928,7 @@ def create_default_delegation_engine(
     engine = ExpertDelegationEngine(
         max_chain_depth=max_chain_depth,
         chain_timeout=chain_timeout,
+        max_concurrency=max_concurrency,
     )
 
     engine.register_rule(
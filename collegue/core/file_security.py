@@ -6,9 +6,10 @@ protégées contre les attaques TOCTOU, les symlinks et les traversées de chemi
 """
 
 import fcntl
+import mmap
 import os
 import stat
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 
 
 class FileSecurityError(Exception):
@@ -17,28 +18,25 @@ class FileSecurityError(Exception):
     pass
 
 
-def safe_read_file(filepath: str, max_size: int, base_dir: Optional[str] = None) -> str:
-    """
-    Lit un fichier de manière sécurisée en préservant contre les attaques TOCTOU.
+class FileTooLargeError(FileSecurityError):
+    """Exception levée quand un fichier dépasse la taille maximale autorisée."""
 
-    Protection implémentée:
-    - Vérifie que le fichier est dans le répertoire de base autorisé (si spécifié)
-    - Bloque les symlinks (O_NOFOLLOW)
-    - Vérifie que c'est un fichier régulier (pas un device, fifo, etc.)
-    - Vérifie la taille via le file descriptor (pas de race condition)
-    - Utilise un verrou partagé pendant la lecture
+    pass
 
-    Args:
-        filepath: Chemin du fichier à lire
-        max_size: Taille maximale autorisée en octets
-        base_dir: Répertoire de base autorisé (pour éviter la traversée de chemin)
+
+def _open_regular_file(filepath: str, base_dir: Optional[str] = None) -> Tuple[int, os.stat_result]:
+    """
+    Ouvre un fichier régulier sans suivre les symlinks.
+
+    Applique les vérifications communes (traversée de chemin, O_NOFOLLOW,
+    fichier régulier via le file descriptor, double vérification du symlink).
 
     Returns:
-        Contenu du fichier en tant que chaîne
+        Le file descriptor ouvert et ses stats
 
     Raises:
         FileSecurityError: Si une violation de sécurité est détectée
-        OSError: Si le fichier ne peut pas être ouvert ou lu
+        OSError: Si le fichier ne peut pas être ouvert
     """
     # Vérification du chemin canonique si un répertoire de base est spécifié
     if base_dir is not None:
@@ -65,10 +63,6 @@ def safe_read_file(filepath: str, max_size: int, base_dir: Optional[str] = None)
         if not stat.S_ISREG(stat_info.st_mode):
             raise FileSecurityError(f"Not a regular file: {filepath}")
 
-        # Vérifier la taille via le file descriptor (TOCTOU-safe)
-        if stat_info.st_size > max_size:
-            raise FileSecurityError(f"File too large: {stat_info.st_size} bytes (max: {max_size})")
-
         # Vérifier que le fichier n'est pas un symlink (double vérification)
         # os.O_NOFOLLOW devrait déjà bloquer, mais on vérifie quand même
         try:
@@ -76,13 +70,61 @@ def safe_read_file(filepath: str, max_size: int, base_dir: Optional[str] = None)
                 raise FileSecurityError(f"Symlink detected: {filepath}")
         except OSError:
             pass  # Si le fichier a été supprimé entre-temps, on continuera avec le fd
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd, stat_info
+
+
+def safe_read_file(
+    filepath: str, max_size: int, base_dir: Optional[str] = None, mmap_threshold: Optional[int] = None
+) -> str:
+    """
+    Lit un fichier de manière sécurisée en préservant contre les attaques TOCTOU.
+
+    Protection implémentée:
+    - Vérifie que le fichier est dans le répertoire de base autorisé (si spécifié)
+    - Bloque les symlinks (O_NOFOLLOW)
+    - Vérifie que c'est un fichier régulier (pas un device, fifo, etc.)
+    - Vérifie la taille via le file descriptor (pas de race condition)
+    - Utilise un verrou partagé pendant la lecture
+
+    Args:
+        filepath: Chemin du fichier à lire
+        max_size: Taille maximale autorisée en octets
+        base_dir: Répertoire de base autorisé (pour éviter la traversée de chemin)
+        mmap_threshold: À partir de cette taille, le fichier est projeté en mémoire
+            (``mmap``) et décodé d'un bloc au lieu d'être lu par tampons ; le
+            résultat est identique (mêmes fins de ligne normalisées)
+
+    Returns:
+        Contenu du fichier en tant que chaîne
+
+    Raises:
+        FileTooLargeError: Si le fichier dépasse ``max_size``
+        FileSecurityError: Si une autre violation de sécurité est détectée
+        OSError: Si le fichier ne peut pas être ouvert ou lu
+    """
+    fd, stat_info = _open_regular_file(filepath, base_dir)
+
+    try:
+        # Vérifier la taille via le file descriptor (TOCTOU-safe)
+        if stat_info.st_size > max_size:
+            raise FileTooLargeError(f"File too large: {stat_info.st_size} bytes (max: {max_size})")
 
         # Lire le contenu avec verrouillage partagé
         with os.fdopen(fd, "r", encoding="utf-8", errors="ignore") as f:
             # Verrouiller le fichier pendant la lecture (optionnel, mais plus sûr)
             try:
                 fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                content = f.read(max_size + 1)  # Lire un octet de plus pour vérifier
+                if mmap_threshold is not None and stat_info.st_size >= max(1, mmap_threshold):
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        content = str(mapped, "utf-8", "ignore")
+                    # Même normalisation que le mode texte (newline=None)
+                    if "\r" in content:
+                        content = content.replace("\r\n", "\n").replace("\r", "\n")
+                else:
+                    content = f.read(max_size + 1)  # Lire un octet de plus pour vérifier
 
                 # Vérifier si le fichier a été modifié pendant la lecture
                 current_stat = os.fstat(f.fileno())
@@ -97,6 +139,49 @@ def safe_read_file(filepath: str, max_size: int, base_dir: Optional[str] = None)
         raise
 
 
+def safe_iter_file_chunks(filepath: str, chunk_size: int, base_dir: Optional[str] = None) -> Iterator[str]:
+    """
+    Lit un fichier texte par blocs, avec les protections de :func:`safe_read_file`.
+
+    Sans limite de taille : la mémoire reste bornée à un bloc quelle que soit la
+    taille du fichier. Le verrou partagé est tenu pendant toute l'itération.
+
+    Args:
+        filepath: Chemin du fichier à lire
+        chunk_size: Nombre de caractères par bloc
+        base_dir: Répertoire de base autorisé (pour éviter la traversée de chemin)
+
+    Yields:
+        Blocs de texte successifs (fins de ligne normalisées comme en mode texte)
+
+    Raises:
+        FileSecurityError: Si une violation de sécurité est détectée, ou si la
+            taille du fichier a changé pendant la lecture (après le dernier bloc)
+        OSError: Si le fichier ne peut pas être ouvert ou lu
+    """
+    fd, stat_info = _open_regular_file(filepath, base_dir)
+    try:
+        f = os.fdopen(fd, "r", encoding="utf-8", errors="ignore")
+    except BaseException:
+        os.close(fd)
+        raise
+
+    with f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+        try:
+            while True:
+                chunk = f.read(max(1, chunk_size))
+                if not chunk:
+                    break
+                yield chunk
+
+            # Vérifier si le fichier a été modifié pendant la lecture
+            if os.fstat(f.fileno()).st_size != stat_info.st_size:
+                raise FileSecurityError(f"File size changed during read: {filepath}")
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def safe_getsize(filepath: str, base_dir: Optional[str] = None) -> int:
     """
     Obtient la taille d'un fichier de manière sécurisée.
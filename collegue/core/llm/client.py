@@ -72,7 +72,33 @@ async def sample_with_timeout(
     En cas de dépassement, la coroutine sous-jacente est **annulée proprement**
     (``asyncio.wait_for`` propage ``CancelledError`` dans ``ctx.sample``) et on lève
     :class:`LLMCallTimeout` — l'appelant gère, pas de hang.
+
+    Si le cache de réponses est actif (``LLM_RESPONSE_CACHE_ENABLED``) et que la
+    température ne dépasse pas son seuil, une requête identique déjà servie est
+    rendue depuis le disque sans appeler le provider (ni attendre de timeout). Un
+    ctx qui porte son propre cache (``ctx.response_cache``, ex.
+    ``LocalSamplingContext``) le gère lui-même à son chokepoint.
     """
+    cache, key, model = _response_cache_lookup(ctx, settings_obj, sample_kwargs)
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            from collegue.monitoring.sampling_usage import record_cache_hit
+
+            record_cache_hit(cached["model"] or model)
+            return _cached_result(cached["text"], sample_kwargs.get("result_type"))
+
+    result = await _sample_with_timeout(ctx, timeout, settings_obj, sample_kwargs)
+    if key is not None:
+        text = getattr(result, "text", None)
+        if isinstance(text, str) and text:
+            cache.put(key, text, model)
+    return result
+
+
+async def _sample_with_timeout(
+    ctx: Any, timeout: Optional[float], settings_obj: Optional[object], sample_kwargs: dict
+) -> Any:
     if timeout is None:
         try:
             from collegue.config import settings as _settings
@@ -96,6 +122,39 @@ async def sample_with_timeout(
         raise LLMCallTimeout(f"Appel LLM interrompu après {timeout:g}s (LLM_CALL_TIMEOUT)") from exc
 
 
+def _response_cache_lookup(ctx: Any, settings_obj: Optional[object], sample_kwargs: dict):
+    """``(cache, clé, modèle)`` si l'appel est cachable ici, sinon ``(None, None, "")``."""
+    if getattr(ctx, "response_cache", None) is not None:
+        return None, None, ""
+    from collegue.core.llm.response_cache import get_response_cache, request_key
+    from collegue.core.llm.sampling_ctx import _pick_model, to_openai_messages
+
+    cache = get_response_cache(settings_obj)
+    if cache is None or not cache.accepts(sample_kwargs.get("temperature")):
+        return None, None, ""
+    # Sans préférence, le handler serveur retombe sur le modèle global.
+    model = _pick_model(sample_kwargs.get("model_preferences"), resolved_model_for(LLMRole.DEFAULT, settings_obj))
+    result_type = sample_kwargs.get("result_type")
+    key = request_key(
+        model,
+        to_openai_messages(sample_kwargs.get("messages", ""), sample_kwargs.get("system_prompt")),
+        sample_kwargs.get("temperature"),
+        sample_kwargs.get("max_tokens"),
+        result_type=f"{result_type.__module__}.{result_type.__qualname__}" if result_type is not None else None,
+    )
+    return cache, key, model
+
+
+def _cached_result(text: str, result_type: Any) -> Any:
+    """Réponse en cache sous la forme lue par les appelants (``.text`` / ``.result``)."""
+    from collegue.core.llm.sampling_ctx import SampleResult, _coerce
+
+    res = SampleResult(text=text)
+    if result_type is not None:
+        res.result = _coerce(text, result_type)
+    return res
+
+
 async def accounted_sample(
     ctx: Any,
     *,
@@ -156,6 +215,7 @@ async def accounted_sample(
             output_tokens=completion_tokens,
             metadata={"role": str(getattr(role, "value", role)), "model": actual_model or requested_model},
             cost_usd=cost,
+            cache_hit=True if captured.cache_hits > 0 and prompt_tokens + completion_tokens == 0 else None,
         )
     if error is not None:
         raise error.with_traceback(error_traceback)
@@ -165,7 +225,8 @@ async def accounted_sample(
     subscription = bool(getattr(settings_obj, "CODER_SUBSCRIPTION", False)) and not str(
         requested_model
     ).lower().startswith(("gemma", "gemini"))
-    usage_proven = usage is not None and int(usage[0]) + int(usage[1]) > 0
+    # Un hit du cache de réponses est un appel prouvé gratuit (0 token).
+    usage_proven = usage is not None and (int(usage[0]) + int(usage[1]) > 0 or captured.cache_hits > 0)
     if succeeded and not usage_proven and (max_tokens > 0 or (max_cost > 0 and not subscription)):
         raise UsageAccountingError(
             f"Usage LLM absent pour {operation} : impossible de garantir le plafond dur configuré."
@@ -0,0 +1,136 @@
+"""Cache disque des réponses LLM, adressé par le contenu de la requête.
+
+L'eval runner, les plans répétés de ``smart_orchestrator`` ou les retries de la
+boucle agentique renvoient souvent un tuple (modèle, messages, température,
+max_tokens) identique à l'octet près. Ce cache (opt-in, ``LLM_RESPONSE_CACHE_ENABLED``)
+intercepte ces appels aux deux chokepoints de sampling :
+``sample_with_timeout`` (ctx FastMCP) et ``LocalSamplingContext._create`` (CLI).
+
+- clé : SHA-256 d'une sérialisation JSON canonique de la requête
+  (:func:`request_key`) ;
+- stockage : :class:`~collegue.core.disk_cache.SqliteLRUCache` sous
+  ``$COLLEGUE_HOME/cache`` (partagé entre process, éviction LRU dès que le
+  nombre d'entrées ou la taille totale des réponses dépasse sa borne) ;
+- contournement automatique au-delà de ``max_temperature`` : une requête
+  « créative » ne doit pas rejouer toujours la même réponse.
+
+Un hit est signalé à ``record_usage`` comme un appel à 0 token
+(:func:`~collegue.monitoring.sampling_usage.record_cache_hit`) : les budgets
+restent exacts et ``accounted_sample`` le remonte au ``MetricsCollector``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+from collegue.core.disk_cache import SqliteLRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_TEMPERATURE = 0.2
+CACHE_FILE = "llm_responses.sqlite3"
+# Version du format de clé : l'incrémenter invalide tout le cache existant.
+KEY_VERSION = 1
+
+
+def request_key(
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: Optional[float],
+    max_tokens: Optional[int],
+    **extra: Any,
+) -> str:
+    """Empreinte canonique d'une requête LLM (messages déjà normalisés OpenAI).
+
+    ``extra`` porte ce qui change la réponse sans figurer dans le tuple de base
+    (ex. ``result_type`` d'une sortie structurée).
+    """
+    payload = {
+        "v": KEY_VERSION,
+        "model": model or "",
+        "messages": messages,
+        "temperature": None if temperature is None else float(temperature),
+        "max_tokens": None if max_tokens is None else int(max_tokens),
+    }
+    if extra:
+        payload["extra"] = {k: v for k, v in sorted(extra.items()) if v is not None}
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache(SqliteLRUCache):
+    """Cache des réponses texte, contourné au-delà de ``max_temperature``."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_temperature: float = DEFAULT_MAX_TEMPERATURE,
+    ):
+        super().__init__(CACHE_FILE, cache_dir, max_entries=max_entries, max_bytes=max_bytes)
+        self.max_temperature = float(max_temperature)
+
+    def accepts(self, temperature: Optional[float]) -> bool:
+        """Vrai si une requête à cette température peut être servie/stockée.
+
+        Température inconnue (``None`` → défaut du provider) : contournée.
+        """
+        return temperature is not None and float(temperature) <= self.max_temperature
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """``{"text", "model"}`` de la réponse en cache, ou ``None``."""
+        entry = super().get(key)
+        if entry is None:
+            return None
+        return {"text": entry["text"], "model": entry["tag"]}
+
+    def put(self, key: str, text: str, model: str = "") -> None:
+        super().put(key, text, model)
+
+
+_response_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache(settings_obj: Optional[object] = None) -> Optional[LLMResponseCache]:
+    """Singleton du cache si ``LLM_RESPONSE_CACHE_ENABLED``, sinon ``None``."""
+    global _response_cache
+    if settings_obj is None:
+        try:
+            from collegue.config import settings as settings_obj
+        except Exception:
+            return None
+    if not bool(getattr(settings_obj, "LLM_RESPONSE_CACHE_ENABLED", False)):
+        return None
+    with _cache_lock:
+        if _response_cache is None:
+            try:
+                _response_cache = LLMResponseCache(
+                    max_entries=int(getattr(settings_obj, "LLM_RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                    max_bytes=int(getattr(settings_obj, "LLM_RESPONSE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+                    max_temperature=float(
+                        getattr(settings_obj, "LLM_RESPONSE_CACHE_MAX_TEMPERATURE", DEFAULT_MAX_TEMPERATURE)
+                    ),
+                )
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("Cache LLM indisponible (%s) : désactivé", exc)
+                return None
+        return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Ferme et oublie le singleton (pour les tests)."""
+    global _response_cache
+    with _cache_lock:
+        if _response_cache is not None:
+            _response_cache.close()
+        _response_cache = None
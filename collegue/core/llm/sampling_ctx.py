@@ -22,7 +22,10 @@ Contrat reproduit fidèlement (lu dans le code) :
   et le planner ;
 - ``model_preferences=[modèle]`` route vers ce modèle (rôle → modèle, C1/C2) ;
 - stubs ``info/debug/warning/error/report_progress`` no-op attendus par les outils ;
-- ``max_output_tokens`` généreux par défaut (quirk gemma : trop bas ⇒ contenu vide).
+- ``max_output_tokens`` généreux par défaut (quirk gemma : trop bas ⇒ contenu vide) ;
+- cache de réponses optionnel (``response_cache``, voir
+  ``collegue.core.llm.response_cache``) consulté dans ``_create`` : un hit ne
+  contacte pas le provider et est signalé comme un appel à 0 token.
 
 Le client ``AsyncOpenAI`` est construit **paresseusement** (au 1er ``sample``) : la
 seule construction du ctx n'ouvre aucune connexion ni n'exige de clé (les tests qui
@@ -178,6 +181,7 @@ class LocalSamplingContext:
         sampler_script: Optional[str] = None,
         sampler_timeout: float = 240.0,
         runner: Any = None,
+        response_cache: Any = None,
     ):
         self._default_model = default_model or ""
         self._api_key = api_key
@@ -194,6 +198,8 @@ class LocalSamplingContext:
         self._sampler_script = sampler_script
         self._sampler_timeout = float(sampler_timeout)
         self._runner = runner  # injection de test : callable(argv, input) -> (rc, stdout, stderr)
+        # Lu par sample_with_timeout : ce ctx gère lui-même le cache à son chokepoint.
+        self.response_cache = response_cache
         # Stubs ctx attendus par les outils (no-op async).
         self.info = self._noop
         self.debug = self._noop
@@ -212,6 +218,7 @@ class LocalSamplingContext:
         ``enforce_budget`` (C4). Un ``PerModelRateLimiter`` reste **injectable** au
         constructeur pour qui veut cadencer un quota free-tier.
         """
+        from collegue.core.llm.response_cache import get_response_cache
         from collegue.core.llm.sampling_handler import resolve_openai_endpoint
 
         default_model, api_key, base_url = resolve_openai_endpoint(settings_obj)
@@ -239,6 +246,7 @@ class LocalSamplingContext:
             sampler_image=str(
                 getattr(settings_obj, "SANDBOX_IMAGE", "collegue-sandbox:latest") or "collegue-sandbox:latest"
             ),
+            response_cache=get_response_cache(settings_obj),
         )
 
     async def _noop(self, *args: Any, **kwargs: Any) -> None:  # ctx.info/debug/...
@@ -376,9 +384,18 @@ class LocalSamplingContext:
         # ``BudgetExceeded`` (BaseException) si le plafond cumulé est atteint — on NE la
         # capture pas (auto-pause volontaire). No-op si plafonds désactivés.
         from collegue.monitoring.metrics import enforce_budget
-        from collegue.monitoring.sampling_usage import record_usage
+        from collegue.monitoring.sampling_usage import record_cache_hit, record_usage
 
         enforce_budget()
+        cache_key = None
+        if self.response_cache is not None and self.response_cache.accepts(temperature):
+            from collegue.core.llm.response_cache import request_key
+
+            cache_key = request_key(model, messages, temperature, max_tokens)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                record_cache_hit(cached["model"] or model)
+                return cached["text"]
         resp = await self._client_obj().chat.completions.create(
             model=model, messages=messages, temperature=temperature, max_tokens=max_tokens
         )
@@ -389,7 +406,10 @@ class LocalSamplingContext:
                 getattr(usage, "completion_tokens", 0) or 0,
                 getattr(resp, "model", model) or model,
             )
-        return _extract_text(resp)
+        text = _extract_text(resp)
+        if cache_key is not None and text:
+            self.response_cache.put(cache_key, text, getattr(resp, "model", model) or model)
+        return text
 
     async def aclose(self) -> None:
         if self._client is not None:
@@ -0,0 +1,249 @@
+"""
+Index plein texte de ProjectMemory.
+
+Deux backends interchangeables, tenus à jour incrémentalement par
+``ProjectMemory`` (ajout/suppression d'entrée) :
+
+- ``bm25`` (défaut) : index inversé en mémoire, classement BM25F (titre,
+  catégorie, expert et données pondérés différemment) ;
+- ``sqlite`` : table virtuelle SQLite FTS5 (``bm25()`` natif), pour les
+  mémoires de plusieurs dizaines de milliers d'entrées. Repli sur ``bm25`` si
+  le SQLite embarqué n'a pas FTS5.
+
+Une requête est conjonctive : chaque terme doit apparaître dans l'entrée, soit
+tel quel, soit comme préfixe d'un mot indexé (≥ ``MIN_PREFIX_LENGTH`` car.),
+ce qui conserve l'esprit de l'ancienne recherche par sous-chaîne.
+"""
+
+import bisect
+import heapq
+import json
+import logging
+import math
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+# Poids BM25F par champ : le titre porte l'essentiel du sens d'une entrée.
+FIELD_WEIGHTS = {"title": 3.0, "category": 2.0, "expert": 1.0, "data": 1.0}
+BM25_K1 = 1.2
+BM25_B = 0.75
+MIN_PREFIX_LENGTH = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """Mots en minuscules (``snake_case`` découpé)."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def entry_fields(entry: Any) -> Dict[str, str]:
+    """Texte indexable d'une ``MemoryEntry`` par champ (données sérialisées une seule fois)."""
+    return {
+        "title": entry.title or "",
+        "category": entry.category or "",
+        "expert": entry.expert or "",
+        "data": json.dumps(entry.data, default=str, ensure_ascii=False) if entry.data else "",
+    }
+
+
+class MemorySearchIndex:
+    """Index inversé en mémoire avec classement BM25F, mis à jour incrémentalement."""
+
+    backend = "bm25"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # terme -> {doc_id: tf pondéré}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._vocabulary: List[str] = []  # trié, pour l'expansion par préfixe
+        self._doc_terms: Dict[int, Dict[str, float]] = {}
+        self._doc_len: Dict[int, float] = {}
+        self._total_len = 0.0
+
+    def add(self, doc_id: int, fields: Dict[str, str]) -> None:
+        terms: Dict[str, float] = {}
+        length = 0.0
+        for name, text in fields.items():
+            weight = FIELD_WEIGHTS.get(name, 1.0)
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + weight
+                length += weight
+        with self._lock:
+            if doc_id in self._doc_terms:
+                self._remove_locked(doc_id)
+            for term, tf in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    bisect.insort(self._vocabulary, term)
+                postings[doc_id] = tf
+            self._doc_terms[doc_id] = terms
+            self._doc_len[doc_id] = length
+            self._total_len += length
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            self._remove_locked(doc_id)
+
+    def _remove_locked(self, doc_id: int) -> None:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                i = bisect.bisect_left(self._vocabulary, term)
+                if i < len(self._vocabulary) and self._vocabulary[i] == term:
+                    del self._vocabulary[i]
+        self._total_len -= self._doc_len.pop(doc_id, 0.0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings = {}
+            self._vocabulary = []
+            self._doc_terms = {}
+            self._doc_len = {}
+            self._total_len = 0.0
+
+    def _expand_locked(self, token: str) -> List[str]:
+        """Le terme exact et, s'il est assez long, les mots indexés qu'il préfixe."""
+        if len(token) < MIN_PREFIX_LENGTH:
+            return [token] if token in self._postings else []
+        i = bisect.bisect_left(self._vocabulary, token)
+        matches = []
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(token):
+            matches.append(self._vocabulary[i])
+            i += 1
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """``(doc_id, score)`` des documents contenant tous les termes, meilleur score d'abord.
+
+        Avec ``limit``, seuls les ``limit`` meilleurs sont extraits (tas, sans tri complet).
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        with self._lock:
+            n_docs = len(self._doc_terms)
+            if n_docs == 0:
+                return []
+            avg_len = self._total_len / n_docs or 1.0
+            expansions = [self._expand_locked(token) for token in tokens]
+            if not all(expansions):
+                return []
+            # Intersection : on part de l'ensemble de candidats le plus petit.
+            candidate_sets = [set().union(*(self._postings[t].keys() for t in terms)) for terms in expansions]
+            candidate_sets.sort(key=len)
+            candidates = set.intersection(*candidate_sets)
+            scores: Dict[int, float] = {doc_id: 0.0 for doc_id in candidates}
+            for terms in expansions:
+                for term in terms:
+                    postings = self._postings[term]
+                    idf = math.log(1.0 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for doc_id in candidates.intersection(postings):
+                        tf = postings[doc_id]
+                        norm = BM25_K1 * (1.0 - BM25_B + BM25_B * self._doc_len[doc_id] / avg_len)
+                        scores[doc_id] += idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+        # À score égal, le document le plus récemment indexé passe devant.
+        if limit is None:
+            return sorted(scores.items(), key=lambda item: (item[1], item[0]), reverse=True)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+
+class SqliteMemorySearchIndex:
+    """Index SQLite FTS5 (``bm25()`` natif, colonnes pondérées comme FIELD_WEIGHTS)."""
+
+    backend = "sqlite"
+
+    def __init__(self, database: str = ":memory:"):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(database, check_same_thread=False)
+        self._conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(title, category, expert, data)")
+        self._count = 0
+
+    @staticmethod
+    def is_available() -> bool:
+        try:
+            conn = sqlite3.connect(":memory:")
+            try:
+                conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+            finally:
+                conn.close()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def add(self, doc_id: int, fields: Dict[str, str]) -> None:
+        # Même découpage que le backend mémoire (snake_case scindé).
+        values = [" ".join(tokenize(fields.get(name, ""))) for name in FIELD_WEIGHTS]
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM memory_fts WHERE rowid = ?", (doc_id,)).rowcount
+            self._conn.execute(
+                "INSERT INTO memory_fts(rowid, title, category, expert, data) VALUES (?, ?, ?, ?, ?)",
+                (doc_id, *values),
+            )
+            self._count += 1 - max(deleted, 0)
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM memory_fts WHERE rowid = ?", (doc_id,)).rowcount
+            self._count -= max(deleted, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM memory_fts")
+            self._count = 0
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        match = " AND ".join(f'"{t}"*' if len(t) >= MIN_PREFIX_LENGTH else f'"{t}"' for t in tokens)
+        weights = ", ".join(str(w) for w in FIELD_WEIGHTS.values())
+        sql = (
+            f"SELECT rowid, bm25(memory_fts, {weights}) AS rank FROM memory_fts WHERE memory_fts MATCH ?"
+            " ORDER BY rank, rowid DESC"
+        )
+        params: Tuple[Any, ...] = (match,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (match, limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        # bm25() de FTS5 est négatif (plus petit = meilleur) : on l'inverse.
+        return [(int(rowid), -float(rank)) for rowid, rank in rows]
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def build_search_index(backend: Optional[str] = None):
+    """Instancie le backend demandé (``bm25`` | ``sqlite``), ``MEMORY_SEARCH_BACKEND`` par défaut."""
+    if backend is None:
+        try:
+            from collegue.config import settings
+
+            backend = settings.MEMORY_SEARCH_BACKEND
+        except Exception:
+            backend = "bm25"
+    backend = (backend or "bm25").strip().lower()
+    if backend == "sqlite":
+        if SqliteMemorySearchIndex.is_available():
+            return SqliteMemorySearchIndex()
+        logger.warning("ProjectMemory: SQLite sans FTS5, repli sur l'index BM25 en mémoire")
+    elif backend != "bm25":
+        logger.warning("ProjectMemory: backend de recherche inconnu '%s', repli sur bm25", backend)
+    return MemorySearchIndex()
@@ -1,31 +1,128 @@
 """
 Code Parser - Analyse syntaxique du code pour différents langages
+
+Les résultats sont mémoïsés par instance dans un LRU borné en nombre d'entrées
+et en octets, indexé par ``(empreinte SHA-256 du contenu, langage)``. Le parser
+de l'application est créé une fois par ``core_lifespan`` : tous les outils qui
+le reçoivent partagent donc ce cache. Les valeurs sont gardées sérialisées
+(pickle) et désérialisées à chaque lecture : un appelant qui modifie le dict
+reçu n'altère ni le cache ni les autres appelants.
 """
 
 import ast
+import hashlib
+import pickle
 import re
-from typing import Any, Dict, List
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_CACHE_MAX_ENTRIES = 512
+DEFAULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
 
 
 class CodeParser:
-    def __init__(self):
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
         self.supported_languages = ["python", "javascript", "typescript", "php"]
+        if max_entries is None or max_bytes is None:
+            try:
+                from collegue.config import settings
+            except Exception:
+                settings = None
+            if max_entries is None:
+                max_entries = getattr(settings, "PARSER_CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES)
+            if max_bytes is None:
+                max_bytes = getattr(settings, "PARSER_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES)
+        self.cache_max_entries = max(0, int(max_entries))
+        self.cache_max_bytes = max(0, int(max_bytes))
+        self._cache: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._cache_bytes = 0
+        # Langage détecté par empreinte, pour les appels sans ``language``.
+        self._detected: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def parse(self, code: str, language: str = None) -> Dict[str, Any]:
+        digest = hashlib.sha256(code.encode("utf-8", "surrogatepass")).hexdigest()
         if language is None:
-            language = self._detect_language(code)
+            language = self._cached_language(digest, code)
 
         if language not in self.supported_languages:
             return {"error": f"Langage non supporté: {language}"}
 
+        key = (digest, language)
+        with self._cache_lock:
+            blob = self._cache.get(key)
+            if blob is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+        if blob is not None:
+            return pickle.loads(blob)
+
         if language == "python":
-            return self._parse_python(code)
+            result = self._parse_python(code)
         elif language == "javascript":
-            return self._parse_javascript(code)
+            result = self._parse_javascript(code)
         elif language == "typescript":
-            return self._parse_typescript(code)
-        elif language == "php":
-            return self._parse_php(code)
+            result = self._parse_typescript(code)
+        else:
+            result = self._parse_php(code)
+
+        blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._cache_lock:
+            self.cache_misses += 1
+            self._store(key, blob)
+        # Le résultat retourné n'est pas l'objet mis en cache : pas de copie à faire.
+        return result
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Compteurs et occupation du cache de résultats."""
+        with self._cache_lock:
+            return {
+                "entries": len(self._cache),
+                "bytes": self._cache_bytes,
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "max_entries": self.cache_max_entries,
+                "max_bytes": self.cache_max_bytes,
+            }
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+            self._detected.clear()
+            self._cache_bytes = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+
+    def _cached_language(self, digest: str, code: str) -> str:
+        with self._cache_lock:
+            language = self._detected.get(digest)
+            if language is not None:
+                self._detected.move_to_end(digest)
+                return language
+        language = self._detect_language(code)
+        if self.cache_max_entries:
+            with self._cache_lock:
+                self._detected[digest] = language
+                while len(self._detected) > self.cache_max_entries:
+                    self._detected.popitem(last=False)
+        return language
+
+    def _store(self, key: Tuple[str, str], blob: bytes) -> None:
+        """Insère ``blob`` puis évince les plus anciens (appelé sous ``_cache_lock``)."""
+        size = len(blob)
+        if not self.cache_max_entries or size > self.cache_max_bytes:
+            return
+        previous = self._cache.pop(key, None)
+        if previous is not None:
+            self._cache_bytes -= len(previous)
+        self._cache[key] = blob
+        self._cache_bytes += size
+        while len(self._cache) > self.cache_max_entries or self._cache_bytes > self.cache_max_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= len(evicted)
 
     def _detect_language(self, code: str) -> str:
         python_score = 0
@@ -127,7 +224,6 @@ class CodeParser:
                 "functions": functions,
                 "classes": classes,
                 "variables": variables,
-                "raw": code,
                 "ast_valid": True,
             }
         except SyntaxError:
@@ -137,7 +233,6 @@ class CodeParser:
                 "functions": self._extract_python_functions(code),
                 "classes": self._extract_python_classes(code),
                 "variables": [],
-                "raw": code,
                 "ast_valid": False,
                 "error": "Erreur de syntaxe dans le code Python",
             }
@@ -188,7 +283,6 @@ class CodeParser:
                 "functions": functions,
                 "classes": classes,
                 "variables": variables,
-                "raw": code,
                 "syntax_valid": True,
             }
         except Exception as e:
@@ -198,7 +292,6 @@ class CodeParser:
                 "functions": [],
                 "classes": [],
                 "variables": [],
-                "raw": code,
                 "syntax_valid": False,
                 "error": f"Erreur lors de l'analyse du code PHP: {str(e)}",
             }
@@ -338,7 +431,6 @@ class CodeParser:
                 "functions": functions,
                 "classes": classes,
                 "variables": variables,
-                "raw": code,
                 "syntax_valid": True,
             }
         except Exception as e:
@@ -348,7 +440,6 @@ class CodeParser:
                 "functions": [],
                 "classes": [],
                 "variables": [],
-                "raw": code,
                 "syntax_valid": False,
                 "error": f"Erreur lors de l'analyse du code JavaScript: {str(e)}",
             }
@@ -460,7 +551,6 @@ class CodeParser:
                 "interfaces": interfaces,
                 "types": types,
                 "variables": variables,
-                "raw": code,
                 "syntax_valid": True,
             }
         except Exception as e:
@@ -472,7 +562,6 @@ class CodeParser:
                 "interfaces": [],
                 "types": [],
                 "variables": [],
-                "raw": code,
                 "syntax_valid": False,
                 "error": f"Erreur lors de l'analyse du code TypeScript: {str(e)}",
             }
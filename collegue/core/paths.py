@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Optional
 
 
 def collegue_home() -> Path:
@@ -27,3 +28,19 @@ def memory_dir() -> Path:
 def monitoring_dir() -> Path:
     """Répertoire des métriques et journaux (``$COLLEGUE_HOME/monitoring``)."""
     return collegue_home() / "monitoring"
+
+
+def cache_dir() -> Path:
+    """Répertoire des caches persistants (``$COLLEGUE_HOME/cache``)."""
+    return collegue_home() / "cache"
+
+
+def prompts_dir() -> Optional[Path]:
+    """Stockage des prompts personnalisés et de leurs versions (``$COLLEGUE_HOME/prompts``).
+
+    ``None`` tant que ``COLLEGUE_HOME`` n'est pas défini explicitement : les moteurs
+    de prompts gardent alors leur stockage historique dans le package ``collegue/prompts``.
+    """
+    if not os.environ.get("COLLEGUE_HOME"):
+        return None
+    return collegue_home() / "prompts"
@@ -6,6 +6,7 @@ entre les sessions MCP. Chaque expert peut enrichir ses analyses
 avec le contexte historique mémorisé.
 """
 
+import bisect
 import json
 import logging
 import os
@@ -14,9 +15,10 @@ import threading
 import time
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from collegue.core import paths
+from collegue.core.memory_search import build_search_index, entry_fields
 
 logger = logging.getLogger(__name__)
 
@@ -60,20 +62,62 @@ DEFAULT_TTL = {
 
 MAX_ENTRIES_PER_EXPERT = 200
 MAX_TOTAL_ENTRIES = 2000
+# Compaction du journal dès qu'il dépasse max(COMPACT_MIN_RECORDS, nb d'entrées vivantes).
+COMPACT_MIN_RECORDS = 500
+
+# Champs indexés pour recall() (valeur -> entrées triées par score/timestamp).
+_INDEXED_FIELDS = ("entry_type", "expert", "language", "category", "file_path")
+
+
+def _rank_key(entry_id: int, entry: MemoryEntry) -> Tuple[float, float, int]:
+    """Clé d'ordre de recall : score décroissant, puis timestamp décroissant, puis insertion."""
+    return (-entry.score, -entry.timestamp, entry_id)
+
+
+def _remove_sorted(items: List[Any], item: Any) -> None:
+    i = bisect.bisect_left(items, item)
+    if i < len(items) and items[i] == item:
+        del items[i]
 
 
 class ProjectMemory:
     """Mémoire persistante du projet.
 
-    Stocke les entrées sur disque dans un répertoire `.collegue/memory/`.
-    Thread-safe avec filtrage par expert/type/catégorie/langage.
+    Stocke les entrées sur disque dans un répertoire `.collegue/memory/` :
+    un instantané (``project_memory.json``) et un journal append-only
+    (``project_memory.journal.jsonl``) rejoué au chargement puis compacté
+    périodiquement dans l'instantané — écrire une entrée coûte une ligne.
+    Chaque enregistrement du journal porte un numéro de séquence ; l'instantané
+    retient le dernier qu'il absorbe, et la relecture ignore ceux qui le
+    précèdent (journal non supprimé après une compaction interrompue).
+    Thread-safe ; ``recall`` s'appuie sur des index secondaires
+    (type/expert/langage/catégorie/fichier) déjà triés par score/timestamp.
     """
 
-    def __init__(self, memory_dir: Optional[str] = None, max_total: int = MAX_TOTAL_ENTRIES):
+    def __init__(
+        self,
+        memory_dir: Optional[str] = None,
+        max_total: int = MAX_TOTAL_ENTRIES,
+        search_backend: Optional[str] = None,
+    ):
         self._memory_dir = Path(memory_dir) if memory_dir else paths.memory_dir()
         self._max_total = max_total
-        self._entries: List[MemoryEntry] = []
+        self._entries: Dict[int, MemoryEntry] = {}
+        self._next_id = 0
+        # Index : ordre global, par champ/valeur, par ancienneté (global et par expert), par expiration.
+        self._ranked: List[Tuple[float, float, int]] = []
+        self._index: Dict[str, Dict[Any, List[Tuple[float, float, int]]]] = {f: {} for f in _INDEXED_FIELDS}
+        self._by_time: List[Tuple[float, int]] = []
+        self._expert_by_time: Dict[str, List[Tuple[float, int]]] = {}
+        self._by_expiry: List[Tuple[float, int]] = []
+        # Index plein texte (verrou propre : search() ne bloque pas store()).
+        self._search_index = build_search_index(search_backend)
         self._lock = threading.RLock()
+        # Enregistrements de journal en attente d'écriture (store(auto_save=False), prune…).
+        self._pending: List[Dict[str, Any]] = []
+        self._journal_records = 0
+        # Dernier numéro de séquence attribué à un enregistrement du journal.
+        self._seq = 0
         self._dirty = False
         self._load()
 
@@ -87,40 +131,185 @@ class ProjectMemory:
     def _storage_path(self) -> Path:
         return self._memory_dir / "project_memory.json"
 
+    def _journal_path(self) -> Path:
+        return self._memory_dir / "project_memory.journal.jsonl"
+
+    # ── index ────────────────────────────────────────────────────────────
+
+    def _add_locked(self, entry: MemoryEntry, entry_id: Optional[int] = None) -> int:
+        if entry_id is None:
+            entry_id = self._next_id
+        elif entry_id in self._entries:
+            # Identifiant réécrit : l'ancienne entrée quitte d'abord tous les index.
+            self._remove_locked(entry_id)
+        self._next_id = max(self._next_id, entry_id + 1)
+        self._entries[entry_id] = entry
+        key = _rank_key(entry_id, entry)
+        bisect.insort(self._ranked, key)
+        for field_name in _INDEXED_FIELDS:
+            value = getattr(entry, field_name)
+            if value is not None:
+                bisect.insort(self._index[field_name].setdefault(value, []), key)
+        bisect.insort(self._by_time, (entry.timestamp, entry_id))
+        bisect.insort(self._expert_by_time.setdefault(entry.expert, []), (entry.timestamp, entry_id))
+        if entry.ttl_seconds is not None:
+            bisect.insort(self._by_expiry, (entry.timestamp + entry.ttl_seconds, entry_id))
+        self._search_index.add(entry_id, entry_fields(entry))
+        return entry_id
+
+    def _remove_locked(self, entry_id: int) -> Optional[MemoryEntry]:
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return None
+        key = _rank_key(entry_id, entry)
+        _remove_sorted(self._ranked, key)
+        for field_name in _INDEXED_FIELDS:
+            value = getattr(entry, field_name)
+            bucket = self._index[field_name].get(value) if value is not None else None
+            if bucket is not None:
+                _remove_sorted(bucket, key)
+                if not bucket:
+                    del self._index[field_name][value]
+        _remove_sorted(self._by_time, (entry.timestamp, entry_id))
+        expert_times = self._expert_by_time.get(entry.expert)
+        if expert_times is not None:
+            _remove_sorted(expert_times, (entry.timestamp, entry_id))
+            if not expert_times:
+                del self._expert_by_time[entry.expert]
+        if entry.ttl_seconds is not None:
+            _remove_sorted(self._by_expiry, (entry.timestamp + entry.ttl_seconds, entry_id))
+        self._search_index.remove(entry_id)
+        return entry
+
+    def _reset_locked(self) -> None:
+        self._entries = {}
+        self._next_id = 0
+        self._ranked = []
+        self._index = {f: {} for f in _INDEXED_FIELDS}
+        self._by_time = []
+        self._expert_by_time = {}
+        self._by_expiry = []
+        self._search_index.clear()
+
+    # ── persistance ──────────────────────────────────────────────────────
+
     def _load(self) -> None:
         path = self._storage_path()
+        if path.exists():
+            try:
+                with open(path) as f:
+                    raw = json.load(f)
+                # Ancien format : simple liste d'entrées, sans numéro de séquence.
+                if isinstance(raw, dict):
+                    self._seq = int(raw.get("seq", 0))
+                    raw = raw.get("entries", [])
+                for e in raw:
+                    if isinstance(e, dict):
+                        self._add_locked(MemoryEntry.from_dict(e))
+            except Exception as exc:
+                logger.warning("ProjectMemory: erreur de chargement: %s", exc)
+                self._reset_locked()
+                self._seq = 0
+        self._replay_journal()
+        if self._entries:
+            logger.info("ProjectMemory: chargé %d entrées depuis %s", len(self._entries), self._memory_dir)
+
+    def _replay_journal(self) -> None:
+        """Rejoue le journal par-dessus l'instantané.
+
+        Les lignes illisibles sont ignorées, comme les enregistrements dont le
+        numéro de séquence est déjà couvert par l'instantané.
+        """
+        path = self._journal_path()
         if not path.exists():
             return
+        snapshot_seq = self._seq
         try:
-            with open(path) as f:
-                raw = json.load(f)
-            self._entries = [MemoryEntry.from_dict(e) for e in raw if isinstance(e, dict)]
-            logger.info("ProjectMemory: chargé %d entrées depuis %s", len(self._entries), path)
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # ligne tronquée (arrêt brutal pendant l'écriture)
+                    self._journal_records += 1
+                    seq = record.get("seq")
+                    if isinstance(seq, int):
+                        if seq <= snapshot_seq:
+                            continue
+                        self._seq = max(self._seq, seq)
+                    op = record.get("op")
+                    if op == "put" and isinstance(record.get("entry"), dict):
+                        self._add_locked(MemoryEntry.from_dict(record["entry"]), int(record["id"]))
+                    elif op == "del":
+                        for entry_id in record.get("ids", []):
+                            self._remove_locked(int(entry_id))
+                    elif op == "clear":
+                        self._reset_locked()
         except Exception as exc:
-            logger.warning("ProjectMemory: erreur de chargement: %s", exc)
-            self._entries = []
+            logger.warning("ProjectMemory: erreur de relecture du journal: %s", exc)
+
+    def _journal_locked(self, record: Dict[str, Any]) -> None:
+        self._seq += 1
+        record["seq"] = self._seq
+        self._pending.append(record)
+        self._dirty = True
 
     def save(self) -> None:
-        """Persiste la mémoire sur disque (écriture atomique via fichier temporaire)."""
+        """Persiste les modifications en attente (ajout au journal, compaction si due)."""
         with self._lock:
             if not self._dirty:
                 return
             self._ensure_dir()
-            path = self._storage_path()
             try:
-                fd, tmp_path = tempfile.mkstemp(dir=str(self._memory_dir), suffix=".tmp", prefix="memory_")
-                try:
-                    with os.fdopen(fd, "w", encoding="utf-8") as f:
-                        json.dump([e.to_dict() for e in self._entries], f, indent=2, default=str)
-                    os.replace(tmp_path, str(path))
-                except BaseException:
-                    os.unlink(tmp_path)
-                    raise
+                if self._journal_records + len(self._pending) > max(COMPACT_MIN_RECORDS, len(self._entries)):
+                    self._compact_locked()
+                else:
+                    with open(self._journal_path(), "a", encoding="utf-8") as f:
+                        f.write("".join(json.dumps(r, default=str) + "\n" for r in self._pending))
+                    self._journal_records += len(self._pending)
+                self._pending = []
                 self._dirty = False
-                logger.debug("ProjectMemory: sauvegardé %d entrées vers %s", len(self._entries), path)
             except Exception as exc:
                 logger.error("ProjectMemory: erreur de sauvegarde: %s", exc)
 
+    def compact(self) -> None:
+        """Réécrit l'instantané et vide le journal."""
+        with self._lock:
+            self._ensure_dir()
+            try:
+                self._compact_locked()
+                self._pending = []
+                self._dirty = False
+            except Exception as exc:
+                logger.error("ProjectMemory: erreur de compaction: %s", exc)
+
+    def _compact_locked(self) -> None:
+        """Instantané atomique (fichier temporaire), puis journal supprimé.
+
+        L'instantané retient le dernier numéro de séquence : un arrêt entre son
+        remplacement et la suppression du journal ne rejoue pas au chargement
+        des enregistrements qu'il contient déjà. Les identifiants sont
+        renumérotés dans l'ordre de l'instantané pour que les enregistrements
+        suivants du journal restent cohérents au rechargement.
+        """
+        ordered = [self._entries[entry_id] for _, entry_id in self._by_time]
+        path = self._storage_path()
+        fd, tmp_path = tempfile.mkstemp(dir=str(self._memory_dir), suffix=".tmp", prefix="memory_")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"seq": self._seq, "entries": [e.to_dict() for e in ordered]}, f, default=str)
+            os.replace(tmp_path, str(path))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        # Instantané durable : le journal qu'il absorbe peut disparaître.
+        self._journal_path().unlink(missing_ok=True)
+        self._journal_records = 0
+        self._reset_locked()
+        for entry in ordered:
+            self._add_locked(entry)
+        logger.debug("ProjectMemory: compacté %d entrées vers %s", len(ordered), path)
+
     def store(
         self,
         expert: str,
@@ -156,11 +345,11 @@ class ProjectMemory:
         )
 
         with self._lock:
-            self._entries.append(entry)
-            self._dirty = True
+            entry_id = self._add_locked(entry)
+            self._journal_locked({"op": "put", "id": entry_id, "entry": entry.to_dict()})
 
             # Pruning si nécessaire (global ou per-expert)
-            expert_count = sum(1 for e in self._entries if e.expert == expert)
+            expert_count = len(self._expert_by_time.get(expert, ()))
             if len(self._entries) > self._max_total or expert_count > MAX_ENTRIES_PER_EXPERT:
                 self._prune_locked()
 
@@ -192,51 +381,66 @@ class ProjectMemory:
         language: Optional[str] = None,
         limit: int = 20,
     ) -> List[MemoryEntry]:
-        """Recherche des entrées dans la mémoire."""
+        """Recherche des entrées dans la mémoire.
+
+        Parcourt la liste d'index la plus courte parmi les filtres fournis (déjà
+        triée par score puis timestamp décroissants) et s'arrête à ``limit``.
+        """
+        filters = {
+            name: value
+            for name, value in (
+                ("expert", expert),
+                ("entry_type", entry_type),
+                ("category", category),
+                ("file_path", file_path),
+                ("language", language),
+            )
+            if value
+        }
         with self._lock:
+            if filters:
+                candidates = min(
+                    (self._index[name].get(value, []) for name, value in filters.items()),
+                    key=len,
+                )
+            else:
+                candidates = self._ranked
             results = []
-            for entry in self._entries:
+            for key in candidates:
+                if len(results) >= limit:
+                    break
+                entry = self._entries[key[2]]
                 if entry.is_expired():
                     continue
-                if expert and entry.expert != expert:
-                    continue
-                if entry_type and entry.entry_type != entry_type:
-                    continue
-                if category and entry.category != category:
-                    continue
-                if file_path and entry.file_path != file_path:
-                    continue
-                if language and entry.language != language:
-                    continue
-                results.append(entry)
-
-            # Trier par score décroissant, puis par timestamp décroissant
-            results.sort(key=lambda e: (e.score, e.timestamp), reverse=True)
-            return results[:limit]
+                if all(getattr(entry, name) == value for name, value in filters.items()):
+                    results.append(entry)
+            return results
 
     def search(self, query: str, limit: int = 10) -> List[MemoryEntry]:
-        """Recherche textuelle dans les titres et données."""
-        query_lower = query.lower()
-        with self._lock:
+        """Recherche plein texte (titre, catégorie, expert, données) classée par BM25.
+
+        Tous les termes de la requête doivent apparaître (mot entier ou préfixe).
+        Les entrées expirées sont écartées ; à pertinence égale, la plus récente
+        passe devant. Seuls les ``limit`` meilleurs résultats sont demandés à
+        l'index, la fenêtre n'étant élargie que si des entrées expirées y
+        prennent des places.
+        """
+        if limit <= 0:
+            return []
+        fetch = limit
+        while True:
+            hits = self._search_index.search(query, limit=fetch)
             scored = []
-            for entry in self._entries:
-                if entry.is_expired():
+            for entry_id, relevance in hits:
+                entry = self._entries.get(entry_id)
+                if entry is None or entry.is_expired():
                     continue
-                relevance = 0.0
-                if query_lower in entry.title.lower():
-                    relevance += 1.0
-                if query_lower in entry.category.lower():
-                    relevance += 0.5
-                if query_lower in entry.expert.lower():
-                    relevance += 0.3
-                data_str = json.dumps(entry.data, default=str).lower()
-                if query_lower in data_str:
-                    relevance += 0.2
-                if relevance > 0:
-                    scored.append((relevance, entry))
-
-            scored.sort(key=lambda x: (x[0], x[1].timestamp), reverse=True)
-            return [e for _, e in scored[:limit]]
+                scored.append((relevance, entry))
+            if len(scored) >= limit or len(hits) < fetch:
+                break
+            fetch *= 2
+        scored.sort(key=lambda x: (x[0], x[1].timestamp), reverse=True)
+        return [e for _, e in scored[:limit]]
 
     def get_context_for(self, expert: str, language: Optional[str] = None) -> Dict[str, Any]:
         """Construit un contexte mémoire pour un expert donné.
@@ -299,45 +503,42 @@ class ProjectMemory:
             return self._prune_locked()
 
     def _prune_locked(self) -> int:
-        before = len(self._entries)
-        # Supprimer les expirées
-        self._entries = [e for e in self._entries if not e.is_expired()]
-
-        # Limiter par expert
-        expert_counts: Dict[str, int] = {}
-        kept = []
-        # Trier par timestamp décroissant pour garder les plus récentes
-        sorted_entries = sorted(self._entries, key=lambda e: e.timestamp, reverse=True)
-        for entry in sorted_entries:
-            count = expert_counts.get(entry.expert, 0)
-            if count < MAX_ENTRIES_PER_EXPERT:
-                kept.append(entry)
-                expert_counts[entry.expert] = count + 1
-
-        # Limiter au total
-        if len(kept) > self._max_total:
-            kept = kept[: self._max_total]
-
-        self._entries = kept
-        pruned = before - len(self._entries)
-        if pruned > 0:
-            self._dirty = True
-            logger.info("ProjectMemory: prunées %d entrées (%d restantes)", pruned, len(self._entries))
-        return pruned
+        """Expirées, puis plafond par expert, puis plafond global (les plus anciennes partent)."""
+        removed: List[int] = []
+        now = time.time()
+        while self._by_expiry and self._by_expiry[0][0] < now:
+            entry_id = self._by_expiry[0][1]
+            self._remove_locked(entry_id)
+            removed.append(entry_id)
+
+        for expert_times in [t for t in self._expert_by_time.values() if len(t) > MAX_ENTRIES_PER_EXPERT]:
+            for _, entry_id in expert_times[: len(expert_times) - MAX_ENTRIES_PER_EXPERT]:
+                self._remove_locked(entry_id)
+                removed.append(entry_id)
+
+        while len(self._entries) > self._max_total:
+            entry_id = self._by_time[0][1]
+            self._remove_locked(entry_id)
+            removed.append(entry_id)
+
+        if removed:
+            self._journal_locked({"op": "del", "ids": removed})
+            logger.info("ProjectMemory: prunées %d entrées (%d restantes)", len(removed), len(self._entries))
+        return len(removed)
 
     def export_stats(self) -> Dict[str, Any]:
         """Statistiques de la mémoire."""
         with self._lock:
             by_expert: Dict[str, int] = {}
             by_type: Dict[str, int] = {}
-            for entry in self._entries:
+            for entry in self._entries.values():
                 if not entry.is_expired():
                     by_expert[entry.expert] = by_expert.get(entry.expert, 0) + 1
                     by_type[entry.entry_type] = by_type.get(entry.entry_type, 0) + 1
 
             return {
                 "total_entries": len(self._entries),
-                "active_entries": sum(1 for e in self._entries if not e.is_expired()),
+                "active_entries": sum(by_type.values()),
                 "by_expert": by_expert,
                 "by_type": by_type,
                 "storage_path": str(self._storage_path()),
@@ -346,9 +547,9 @@ class ProjectMemory:
     def clear(self) -> None:
         """Vide la mémoire."""
         with self._lock:
-            self._entries = []
-            self._dirty = True
-        self.save()
+            self._reset_locked()
+            self._pending = []
+        self.compact()
 
     def __len__(self) -> int:
         with self._lock:
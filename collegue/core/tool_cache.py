@@ -0,0 +1,167 @@
+"""Cache persistant des résultats d'outils déterministes.
+
+Le ``ResponseCachingMiddleware`` de FastMCP est en mémoire, par process, indexé
+sur la requête brute et perdu au redémarrage. Ce cache vit au niveau de
+``BaseTool`` (opt-in, ``TOOL_RESULT_CACHE_ENABLED``) :
+
+- un outil se déclare ``deterministic`` (ou restreint via ``cache_key_fields``
+  les champs de requête qui influent sur sa sortie, ou surcharge
+  ``is_cacheable`` quand seule une partie de ses modes l'est) ;
+- la clé couvre le nom de l'outil, sa version de règles/config
+  (``get_cache_version``), la requête normalisée et l'empreinte du contenu des
+  fichiers qu'elle désigne par chemin (``get_cache_inputs``) ;
+- le résultat (JSON du ``response_model``) est stocké dans une
+  :class:`~collegue.core.disk_cache.SqliteLRUCache` bornée, partageable entre
+  réplicas via ``$COLLEGUE_HOME``.
+
+Les hits/misses sont remontés par ``BaseTool`` au ``MetricsCollector``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import stat
+import threading
+from typing import Any, Callable, Iterable, Optional
+
+from collegue.core.disk_cache import SqliteLRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 5_000
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+CACHE_FILE = "tool_results.sqlite3"
+KEY_VERSION = 1
+_READ_CHUNK = 1024 * 1024
+
+
+def fingerprint(obj: Any) -> str:
+    """SHA-256 d'une sérialisation JSON canonique (règles, config, requête)."""
+    blob = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _hash_file(path: str, digest: "hashlib._Hash", max_size: Optional[int] = None) -> None:
+    """Ajoute le contenu d'un fichier régulier (ni lien symbolique, ni FIFO, ni device).
+
+    Au-delà de ``max_size`` octets, seules la taille et la date de modification
+    sont prises en compte, sans lire le fichier.
+    """
+    st = os.lstat(path)
+    if not stat.S_ISREG(st.st_mode):
+        return
+    if max_size is not None and st.st_size > max_size:
+        digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode("ascii"))
+        return
+    # O_NOFOLLOW/O_NONBLOCK : le chemin a pu être remplacé depuis le lstat.
+    fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW | os.O_NONBLOCK)
+    with os.fdopen(fd, "rb") as fh:
+        if not stat.S_ISREG(os.fstat(fh.fileno()).st_mode):
+            return
+        while True:
+            chunk = fh.read(_READ_CHUNK)
+            if not chunk:
+                break
+            digest.update(chunk)
+
+
+def fingerprint_path(
+    path: str,
+    accept: Optional[Callable[[str], bool]] = None,
+    skip_dirs: Iterable[str] = (),
+    max_size: Optional[int] = None,
+) -> str:
+    """Empreinte d'un fichier (son contenu) ou d'une arborescence (ses métadonnées).
+
+    Pour un répertoire, chaque fichier régulier retenu par ``accept(chemin_relatif)``
+    (hors répertoires ``skip_dirs``) contribue son chemin relatif, sa taille et sa
+    date de modification (``st_mtime_ns``), dans un ordre stable, sans être lu —
+    comme le cache de fichiers de ``secret_scan`` ; liens symboliques, FIFO et
+    devices sont ignorés. Un fichier seul est haché sur son contenu, ou sur sa
+    taille et sa date au-delà de ``max_size`` octets.
+
+    Raises:
+        ValueError: Si ``path`` n'est ni un fichier régulier ni un répertoire
+            (lien symbolique compris) : le résultat ne doit pas être mis en cache.
+    """
+    digest = hashlib.sha256()
+    mode = os.lstat(path).st_mode
+    if stat.S_ISREG(mode):
+        _hash_file(path, digest, max_size)
+        return digest.hexdigest()
+    if not stat.S_ISDIR(mode):
+        raise ValueError(f"Ni fichier régulier ni répertoire : {path}")
+    skip = set(skip_dirs)
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d not in skip)
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            rel = os.path.relpath(full, path)
+            if accept is not None and not accept(rel):
+                continue
+            try:
+                st = os.lstat(full)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            digest.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\0".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def result_key(tool_name: str, version: str, request: Any, inputs: Any = None) -> str:
+    """Clé d'un résultat d'outil : nom, version des règles, requête, entrées externes."""
+    return fingerprint({"v": KEY_VERSION, "tool": tool_name, "version": version, "request": request, "inputs": inputs})
+
+
+class ToolResultCache(SqliteLRUCache):
+    """Résultats d'outils sérialisés (JSON du ``response_model``), étiquetés par outil."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        super().__init__(CACHE_FILE, cache_dir, max_entries=max_entries, max_bytes=max_bytes)
+
+
+_tool_cache: Optional[ToolResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_result_cache(settings_obj: Optional[object] = None) -> Optional[ToolResultCache]:
+    """Singleton du cache si ``TOOL_RESULT_CACHE_ENABLED``, sinon ``None``."""
+    global _tool_cache
+    if settings_obj is None:
+        try:
+            from collegue.config import settings as settings_obj
+        except Exception:
+            return None
+    if not bool(getattr(settings_obj, "TOOL_RESULT_CACHE_ENABLED", False)):
+        return None
+    with _cache_lock:
+        if _tool_cache is None:
+            try:
+                _tool_cache = ToolResultCache(
+                    max_entries=int(getattr(settings_obj, "TOOL_RESULT_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                    max_bytes=int(getattr(settings_obj, "TOOL_RESULT_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+                )
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("Cache de résultats d'outils indisponible (%s) : désactivé", exc)
+                return None
+        return _tool_cache
+
+
+def reset_tool_result_cache() -> None:
+    """Ferme et oublie le singleton (pour les tests)."""
+    global _tool_cache
+    with _cache_lock:
+        if _tool_cache is not None:
+            _tool_cache.close()
+        _tool_cache = None
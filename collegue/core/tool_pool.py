@@ -0,0 +1,135 @@
+"""Pool d'instances d'outils réutilisables.
+
+``smart_orchestrator`` et ``ExpertDelegationEngine`` construisaient une instance
+neuve (``tool_class({})``) à chaque étape puis la détruisaient : chaque appel
+repayait ``BaseTool.__init__`` (moteurs, regex compilées, enregistrement
+MemoryManager…). Le pool garde des instances chaudes par outil :
+
+- ``acquire`` prête une instance inactive (réutilisation) ou en construit une ;
+- ``release`` la rend au pool (au plus ``max_idle`` instances inactives par
+  outil) ou la nettoie (``cleanup()``) si le pool est plein ou l'appel a échoué.
+
+Une instance n'est prêtée qu'à un appel à la fois ; l'état propre à un appel
+(tokens, session, quota) vit de toute façon hors de l'instance
+(:class:`~collegue.tools.base.ToolCallState`). Réutilisations, créations et temps
+de construction sont remontés au ``MetricsCollector`` (``pool_*``).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_MAX_IDLE = 4
+
+_PoolKey = Tuple[str, Any]
+
+
+class ToolInstancePool:
+    """Instances inactives par ``(nom d'outil, fabrique)``."""
+
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE):
+        self.max_idle = max(0, int(max_idle))
+        self._idle: Dict[_PoolKey, List[Any]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self.reuses = 0
+        self.creations = 0
+
+    def acquire(self, tool_name: str, factory: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Prête une instance de ``tool_name`` (construite par ``factory({})`` si aucune n'est libre)."""
+        key = (tool_name, factory)
+        with self._lock:
+            idle = self._idle.get(key)
+            instance = idle.pop() if idle else None
+            if instance is not None:
+                self.reuses += 1
+        if instance is not None:
+            _record_checkout(tool_name, reused=True, setup_ms=0.0)
+            return instance
+
+        start = time.perf_counter()
+        instance = factory({})
+        setup_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.creations += 1
+        _record_checkout(tool_name, reused=False, setup_ms=setup_ms)
+        return instance
+
+    def release(
+        self,
+        tool_name: str,
+        factory: Callable[[Dict[str, Any]], Any],
+        instance: Any,
+        reusable: bool = True,
+    ) -> None:
+        """Rend une instance prêtée ; la nettoie si elle n'est pas gardée."""
+        if reusable and self.max_idle > 0:
+            with self._lock:
+                idle = self._idle[(tool_name, factory)]
+                if len(idle) < self.max_idle:
+                    idle.append(instance)
+                    return
+        _cleanup(instance)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "reuses": self.reuses,
+                "creations": self.creations,
+                "idle": {name: len(items) for (name, _), items in self._idle.items() if items},
+            }
+
+    def clear(self) -> None:
+        """Nettoie toutes les instances inactives."""
+        with self._lock:
+            instances = [inst for items in self._idle.values() for inst in items]
+            self._idle.clear()
+        for instance in instances:
+            _cleanup(instance)
+
+
+def _cleanup(instance: Any) -> None:
+    if hasattr(instance, "cleanup"):
+        try:
+            instance.cleanup()
+        except Exception:
+            # Ne jamais faire échouer le nettoyage
+            pass
+
+
+def _record_checkout(tool_name: str, reused: bool, setup_ms: float) -> None:
+    try:
+        from collegue.monitoring.metrics import get_metrics_collector
+
+        get_metrics_collector().record_pool_checkout(tool_name, reused=reused, setup_ms=setup_ms)
+    except Exception:
+        pass
+
+
+_tool_pool: Optional[ToolInstancePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_tool_pool(settings_obj: Optional[object] = None) -> ToolInstancePool:
+    """Singleton du pool ; ``TOOL_POOL_MAX_IDLE`` = 0 désactive la réutilisation."""
+    global _tool_pool
+    with _pool_lock:
+        if _tool_pool is None:
+            if settings_obj is None:
+                try:
+                    from collegue.config import settings as settings_obj
+                except Exception:
+                    settings_obj = None
+            _tool_pool = ToolInstancePool(max_idle=int(getattr(settings_obj, "TOOL_POOL_MAX_IDLE", DEFAULT_MAX_IDLE)))
+        return _tool_pool
+
+
+def reset_tool_pool() -> None:
+    """Nettoie et oublie le singleton (arrêt du serveur, tests)."""
+    global _tool_pool
+    with _pool_lock:
+        pool, _tool_pool = _tool_pool, None
+    if pool is not None:
+        pool.clear()
@@ -306,7 +306,9 @@ with tab_metrics:
                     "Executions": data.get("total_executions", 0),
                     "Succes": f"{data.get('success_rate', 0):.0%}",
                     "Latence moy.": f"{data.get('avg_latency_ms', 0):.0f} ms",
+                    "P50": f"{data.get('p50_latency_ms', 0):.0f} ms",
                     "P95": f"{data.get('p95_latency_ms', 0):.0f} ms",
+                    "P99": f"{data.get('p99_latency_ms', 0):.0f} ms",
                     "Tokens (in)": data.get("total_input_tokens", 0),
                     "Tokens (out)": data.get("total_output_tokens", 0),
                     "Cout": f"${data.get('total_cost_usd', 0):.5f}",
@@ -4,8 +4,8 @@ Data access layer for the Streamlit dashboard.
 Reads from disk-backed stores so the dashboard (separate process)
 sees data written by the MCP server or test scripts:
 - MetricsCollector (latency, tokens, costs, errors) — .collegue/monitoring/metrics.json
-- ActivityLog (LLM calls, results, delegations) — .collegue/monitoring/activity.jsonl
-- ProjectMemory (stored analysis results) — .collegue/memory/project_memory.json
+- ActivityLog (LLM calls, results, delegations) — .collegue/monitoring/activity-*.jsonl segments
+- ProjectMemory (stored analysis results) — .collegue/memory/project_memory.json + journal
 - ExpertDelegation (rules, chain history) — in-memory (static rules)
 """
 
@@ -13,6 +13,7 @@ reste donc importable partout sans installer OpenHands.
 
 from collegue.executor.agent import AgentResult, CodeAgent, FakeCodeAgent, IssueSpec
 from collegue.executor.command import CommandRunner, LocalCommandRunner
+from collegue.executor.deps_env import DepsEnvCache, DepsEnvSpec, get_deps_env_cache, reset_deps_env_cache
 from collegue.executor.openhands_agent import OpenHandsAgent
 from collegue.executor.openhands_sdk_agent import OHSdkAgent
 from collegue.executor.pipeline import ExecutionOutcome, execute_issue
@@ -29,21 +30,26 @@ from collegue.executor.pr import (
     verify_delivery_snapshot,
 )
 from collegue.executor.quality_gate import (
+    CANCEL_ON_RED_POLICIES,
     AdequacyChecker,
     AdequacyOutcome,
     ExpertReviewer,
     FakeAdequacyChecker,
     FakeReviewer,
     LLMAdequacyChecker,
+    PassTiming,
     QualityReport,
     Reviewer,
     ReviewFindingLite,
     ReviewOutcome,
+    deps_env_specs,
     e2e_gate_command,
     forbidden_committed_files,
     frontend_gate_command,
     installability_command,
+    installability_venv_command,
     issue_expects_code,
+    node_modules_build_command,
     outcome_from_review,
     removed_requirement_lines,
     requirement_keys_present,
@@ -61,6 +67,14 @@ from collegue.executor.revert import (
     revert_pr_preview,
 )
 from collegue.executor.runner import ExecutionResult, run_issue
+from collegue.executor.test_impact import (
+    ImportGraph,
+    TestImpactIndex,
+    TestSelection,
+    get_test_impact_index,
+    impact_test_command,
+    reset_test_impact_index,
+)
 from collegue.executor.workspace import (
     Workspace,
     WorkspaceError,
@@ -94,9 +108,24 @@ __all__ = [
     "FakeReviewer",
     "ExpertReviewer",
     "QualityReport",
+    "PassTiming",
+    "CANCEL_ON_RED_POLICIES",
     "run_quality_gate",
     "frontend_gate_command",
     "installability_command",
+    "installability_venv_command",
+    "node_modules_build_command",
+    "deps_env_specs",
+    "DepsEnvCache",
+    "DepsEnvSpec",
+    "get_deps_env_cache",
+    "reset_deps_env_cache",
+    "ImportGraph",
+    "TestImpactIndex",
+    "TestSelection",
+    "get_test_impact_index",
+    "impact_test_command",
+    "reset_test_impact_index",
     "removed_requirement_lines",
     "requirement_keys_present",
     "unpinned_requirement_lines",
@@ -0,0 +1,302 @@
+"""Environnements de dépendances pré-construits du gate qualité (opt-in, ``GATE_DEPS_ENV_CACHE``).
+
+Chaque passe du gate réinstallait les dépendances du projet dans un conteneur
+jetable : ``pip install --user`` (#414), venv nu de la passe d'installabilité
+(#439), ``npm ci`` du frontend (#438) — à chaque retry de chaque tâche, même
+quand ``requirements.txt`` / ``package-lock.json`` n'ont pas bougé.
+:class:`DepsEnvCache` construit chaque environnement **une fois** par contenu de
+ses fichiers de dépendances et par image sandbox, puis le garde sur l'hôte sous
+``$COLLEGUE_HOME/cache/deps_envs`` :
+
+- construction dans le sandbox du gate (mêmes réseau, image et durcissement),
+  le dossier de l'entrée monté en écriture sur ``/deps_env/<entrée>`` — chemin
+  identique à celui des passes suivantes, où il est monté **en lecture seule**
+  (un venv n'est pas relocalisable) ;
+- publication atomique (dossier de travail renommé), verrou par entrée
+  (``flock``) : deux gates concurrents ne construisent pas deux fois ;
+- échec de construction : rien n'est publié et le gate retombe sur
+  l'installation à la volée (le diagnostic pip/npm reste dans sa sortie) ;
+- éviction LRU (date du dernier usage) au-delà de ``max_entries`` entrées ou
+  ``max_bytes`` octets, sans toucher aux entrées servies récemment.
+
+La composition des commandes (quoi construire, comment l'utiliser) reste dans
+:mod:`collegue.executor.quality_gate`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import errno
+import fcntl
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Set
+
+from collegue.core import paths
+from collegue.core.tool_cache import fingerprint
+from collegue.sandbox.executor import SANDBOX_DEPS_ENV_MOUNT, run_sandbox_tests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024 * 1024
+# Une entrée servie depuis moins longtemps n'est pas évincée : un conteneur peut
+# encore la monter (le gate dure au plus SANDBOX_TIMEOUT).
+EVICTION_GRACE_SECONDS = 3600.0
+# Attente entre deux tentatives de prise du verrou d'une entrée en construction.
+_LOCK_POLL_SECONDS = 0.5
+_META_SUFFIX = ".json"
+
+
+@dataclass(frozen=True)
+class DepsEnvSpec:
+    """Un environnement à construire : ``kind`` (user, venv, node), dossier du projet et commande."""
+
+    kind: str
+    subdir: str
+    key: str
+    build_command: str
+
+    @property
+    def entry(self) -> str:
+        return f"{self.kind}-{self.key[:32]}"
+
+    @property
+    def container_path(self) -> str:
+        return f"{SANDBOX_DEPS_ENV_MOUNT}/{self.entry}"
+
+
+def deps_env_spec(
+    kind: str,
+    subdir: str,
+    inputs: Sequence[str],
+    image_id: str,
+    build_command,
+    extra: Optional[Mapping[str, Any]] = None,
+) -> DepsEnvSpec:
+    """Spec dont la clé couvre ``kind``, l'image et le contenu des fichiers ``inputs`` (absents compris).
+
+    ``build_command(container_path)`` produit la commande de construction ;
+    ``extra`` : autres entrées de la construction (empreintes de chemins locaux…).
+    """
+    contents = {}
+    for path in inputs:
+        try:
+            with open(path, "rb") as handle:
+                contents[os.path.basename(path)] = handle.read().hex()
+        except OSError:
+            contents[os.path.basename(path)] = None
+    material = {"kind": kind, "subdir": subdir, "image": image_id, "inputs": contents}
+    if extra:
+        material["extra"] = dict(extra)
+    key = fingerprint(material)
+    probe = DepsEnvSpec(kind, subdir, key, "")
+    return DepsEnvSpec(kind, subdir, key, build_command(probe.container_path))
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class DepsEnvCache:
+    """Dossier hôte des environnements pré-construits, évincés par LRU."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.root = Path(cache_dir) if cache_dir else paths.cache_dir() / "deps_envs"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        # Constructions en échec dans ce process : pas de nouvel essai pour la même clé.
+        self._failed: Set[str] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+
+    def _meta(self, entry: str) -> Path:
+        return self.root / f"{entry}{_META_SUFFIX}"
+
+    def lookup(self, entry: str) -> Optional[Path]:
+        """Dossier de l'entrée publiée (et la marque récente), ou ``None``."""
+        path, meta = self.root / entry, self._meta(entry)
+        if not (path.is_dir() and meta.is_file()):
+            return None
+        try:
+            os.utime(meta)
+        except OSError:
+            pass
+        return path
+
+    async def ensure(self, sandbox, workspace: str, spec: DepsEnvSpec) -> Optional[Path]:
+        """Dossier hôte de l'environnement ``spec``, construit s'il manque ; ``None`` en cas d'échec."""
+        found = self.lookup(spec.entry)
+        if found is not None:
+            with self._lock:
+                self.hits += 1
+            return found
+        with self._lock:
+            if spec.key in self._failed:
+                return None
+        fd = os.open(self.root / f".{spec.entry}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            await self._lock_entry(fd)
+            found = self.lookup(spec.entry)  # construit par un autre gate pendant l'attente
+            if found is not None:
+                with self._lock:
+                    self.hits += 1
+                return found
+            return await self._build(sandbox, workspace, spec)
+        finally:
+            os.close(fd)  # libère le verrou
+
+    @staticmethod
+    async def _lock_entry(fd: int) -> None:
+        # Attente non bloquante : une annulation pendant l'attente ne laisse pas de thread
+        # suspendu sur le descripteur.
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
+            except OSError as exc:
+                if exc.errno not in (errno.EAGAIN, errno.EACCES):
+                    raise
+            await asyncio.sleep(_LOCK_POLL_SECONDS)
+
+    async def _build(self, sandbox, workspace: str, spec: DepsEnvSpec) -> Optional[Path]:
+        staging = self.root / f".staging-{spec.entry}-{uuid.uuid4().hex[:8]}"
+        staging.mkdir()
+        start = time.monotonic()
+        try:
+            # Construction hors pool : le montage écrivable ne doit pas survivre à la passe.
+            builder = sandbox.with_options(deps_mounts=((str(staging), spec.entry, True),), pool=None)
+            result = await run_sandbox_tests(builder, workspace, spec.build_command)
+        except BaseException:
+            await asyncio.to_thread(shutil.rmtree, staging, True)
+            raise
+        if not result.ok:
+            await asyncio.to_thread(shutil.rmtree, staging, True)
+            with self._lock:
+                self._failed.add(spec.key)
+            tail = "\n".join(part for part in (result.stdout, result.stderr) if part).strip()[-300:]
+            logger.warning(
+                "Environnement %s non construit (code %s) : installation à la volée. %s",
+                spec.entry,
+                result.exit_code,
+                tail,
+            )
+            return None
+        size = await asyncio.to_thread(_tree_size, staging)
+        target = self.root / spec.entry
+        try:
+            os.rename(staging, target)
+        except OSError:
+            # Publiée entre-temps par un autre process : la nôtre est superflue.
+            await asyncio.to_thread(shutil.rmtree, staging, True)
+            return self.lookup(spec.entry)
+        self._meta(spec.entry).write_text(
+            json.dumps({"kind": spec.kind, "subdir": spec.subdir, "size": size, "created": time.time()}),
+            encoding="utf-8",
+        )
+        with self._lock:
+            self.builds += 1
+        logger.info("Environnement %s construit en %.1fs (%d octets)", spec.entry, time.monotonic() - start, size)
+        await asyncio.to_thread(self.evict, keep=(spec.entry,))
+        return target
+
+    def entries(self) -> List[str]:
+        """Entrées publiées, de la moins à la plus récemment servie."""
+        metas = []
+        for meta in self.root.glob(f"*{_META_SUFFIX}"):
+            try:
+                metas.append((meta.stat().st_mtime, meta.name[: -len(_META_SUFFIX)]))
+            except OSError:
+                continue
+        return [entry for _mtime, entry in sorted(metas)]
+
+    def evict(self, keep: Iterable[str] = ()) -> List[str]:
+        """Évince les entrées les moins récemment servies au-delà des bornes ; renvoie les évincées."""
+        keep = set(keep)
+        now = time.time()
+        entries = self.entries()
+        sizes = {}
+        for entry in entries:
+            try:
+                sizes[entry] = int(json.loads(self._meta(entry).read_text(encoding="utf-8")).get("size", 0))
+            except (OSError, ValueError):
+                sizes[entry] = 0
+        count, total = len(entries), sum(sizes.values())
+        evicted = []
+        for entry in entries:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            meta = self._meta(entry)
+            try:
+                recent = now - meta.stat().st_mtime < EVICTION_GRACE_SECONDS
+            except OSError:
+                continue
+            if entry in keep or recent:
+                continue
+            try:
+                meta.unlink()
+            except OSError:
+                continue
+            shutil.rmtree(self.root / entry, ignore_errors=True)
+            count -= 1
+            total -= sizes[entry]
+            evicted.append(entry)
+        return evicted
+
+
+_deps_env_cache: Optional[DepsEnvCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_deps_env_cache(settings_obj: Optional[object] = None) -> Optional[DepsEnvCache]:
+    """Singleton du cache si ``GATE_DEPS_ENV_CACHE``, sinon ``None``."""
+    global _deps_env_cache
+    if settings_obj is None:
+        try:
+            from collegue.config import settings as settings_obj
+        except Exception:
+            return None
+    if not bool(getattr(settings_obj, "GATE_DEPS_ENV_CACHE", False)):
+        return None
+    with _cache_lock:
+        if _deps_env_cache is None:
+            cache_dir = str(getattr(settings_obj, "GATE_DEPS_ENV_DIR", "") or "").strip()
+            try:
+                _deps_env_cache = DepsEnvCache(
+                    os.path.expanduser(cache_dir) if cache_dir else None,
+                    max_entries=int(getattr(settings_obj, "GATE_DEPS_ENV_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                    max_bytes=int(getattr(settings_obj, "GATE_DEPS_ENV_MAX_BYTES", DEFAULT_MAX_BYTES)),
+                )
+            except OSError as exc:
+                logger.warning("Cache des environnements de dépendances indisponible (%s) : désactivé", exc)
+                return None
+        return _deps_env_cache
+
+
+def reset_deps_env_cache() -> None:
+    """Oublie le singleton (pour les tests)."""
+    global _deps_env_cache
+    with _cache_lock:
+        _deps_env_cache = None
@@ -22,6 +22,7 @@ qu'il ne puisse pas forger de fausse bannière/section (cf. P5).
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac
@@ -30,12 +31,16 @@ import os
 import re
 import shlex
 import sys
+import time
 from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Iterator, List, Optional, Protocol, Tuple, runtime_checkable
+from typing import Iterator, List, Mapping, Optional, Protocol, Tuple, runtime_checkable
 
+from collegue.core.tool_cache import fingerprint_path
 from collegue.executor.agent import IssueSpec
-from collegue.sandbox.executor import DockerSandbox
+from collegue.executor.deps_env import DepsEnvCache, DepsEnvSpec, deps_env_spec
+from collegue.executor.test_impact import TestImpactIndex, impact_failed, impact_supported, impact_test_command
+from collegue.sandbox.executor import DockerSandbox, run_sandbox_tests
 from collegue.textnorm import inline
 
 # `python -m pytest` (et non le script `pytest`) ajoute le répertoire de travail
@@ -90,6 +95,9 @@ def deps_install_prelude(workspace: str, *, strict: bool = False, use_cache: boo
     return "; ".join(f"({part} || echo '{_INSTALL_FAILED_NOTE}')" for part in parts)
 
 
+# Install npm du frontend : ``npm ci`` reproductible, repli ``npm install`` sans lockfile (#438).
+_NPM_INSTALL = "(npm ci --no-audit --no-fund --silent || npm install --no-audit --no-fund --silent)"
+
 # Bannière de la passe d'installabilité dans la sortie du gate (#439).
 _INSTALLABILITY_BANNER = "[gate] installabilité : venv nu + requirements + collecte (#439)"
 _GATE_VENV = "/tmp/.gate_venv"
@@ -487,7 +495,7 @@ def e2e_gate_command(
     )
 
 
-def installability_command(workspace: str, *, use_cache: bool = False) -> Optional[str]:
+def installability_command(workspace: str, *, use_cache: bool = False, venv: Optional[str] = None) -> Optional[str]:
     """Passe d'installabilité en environnement NU (#439). Fail-closed.
 
     L'image sandbox pré-installe une stack web pour servir l'**agent** (#414) :
@@ -499,9 +507,24 @@ def installability_command(workspace: str, *, use_cache: bool = False) -> Option
     pytest (exécute les imports de conftest/tests, exactement le mode d'échec
     constaté). ``None`` sans ``requirements.txt``. Nécessite le réseau (PyPI) —
     opt-in via ``check_installability``.
+
+    ``venv`` : chemin (dans le conteneur) d'un venv déjà construit par
+    :func:`installability_venv_command` pour ce ``requirements.txt`` — seule la
+    collecte reste à faire (cf. :mod:`collegue.executor.deps_env`).
     """
     if not os.path.isfile(os.path.join(workspace, "requirements.txt")):
         return None
+    collect = " --collect-only -q --continue-on-collection-errors"
+    if venv is not None:
+        return f"{_PYTEST_WIDE_COLUMNS} {venv}/bin/python -m pytest{collect}"
+    return (
+        f"{installability_venv_command(_GATE_VENV, use_cache=use_cache)}"
+        f" && {_PYTEST_WIDE_COLUMNS} {_GATE_VENV}/bin/python -m pytest{collect}"
+    )
+
+
+def installability_venv_command(venv: str, *, use_cache: bool = False) -> str:
+    """Venv nu à ``venv`` + ``requirements.txt`` + pytest (socle de la passe d'installabilité, #439)."""
     # --retries/--timeout EXPLICITES (#461) : une micro-coupure PyPI pendant la
     # passe coûtait une tentative fonctionnelle entière (échec terminal FacNor
     # v3, itération 14) — pip ré-essaie d'abord, le moteur ne décompte qu'après.
@@ -511,11 +534,9 @@ def installability_command(workspace: str, *, use_cache: bool = False) -> Option
     # #496 : --no-cache-dir retiré si un cache pip est monté (use_cache).
     pip_flags = f"{'' if use_cache else '--no-cache-dir '}-q --retries 5 --timeout 30"
     return (
-        f"python -m venv --clear {_GATE_VENV}"
-        f" && {_GATE_VENV}/bin/python -m pip install {pip_flags} -r requirements.txt"
-        f" && {_GATE_VENV}/bin/python -m pip install {pip_flags} pytest"
-        f" && {_PYTEST_WIDE_COLUMNS} {_GATE_VENV}/bin/python -m pytest --collect-only -q"
-        " --continue-on-collection-errors"
+        f"python -m venv --clear {venv}"
+        f" && {venv}/bin/python -m pip install {pip_flags} -r requirements.txt"
+        f" && {venv}/bin/python -m pip install {pip_flags} pytest"
     )
 
 
@@ -762,7 +783,7 @@ def _frontend_dirs(workspace: str) -> List[str]:
     return dirs
 
 
-def frontend_gate_command(workspace: str, subdir: str = ".") -> Optional[str]:
+def frontend_gate_command(workspace: str, subdir: str = ".", node_modules: Optional[str] = None) -> Optional[str]:
     """Commande de gate frontend pour le ``package.json`` de ``workspace/subdir`` (#438).
 
     Le gate historique ne lançait QUE pytest : compilation TypeScript, build Vite
@@ -783,6 +804,11 @@ def frontend_gate_command(workspace: str, subdir: str = ".") -> Optional[str]:
     backend + ``frontend/``) — la commande s'exécute dedans (``cd``). ``CI=true``
     neutralise les modes watch (react-scripts, vitest) ; le cache npm vit sous
     ``/tmp`` (rootfs read-only, #414). ``None`` si pas de ``package.json``.
+
+    ``node_modules`` : chemin (dans le conteneur) d'un ``node_modules`` déjà
+    construit pour ce ``package-lock.json`` (cf. :mod:`collegue.executor.deps_env`),
+    recopié à la place de l'install — copié et non lié, le build pouvant écrire
+    dans ``node_modules`` (caches Vite & co).
     """
     base = workspace if subdir == "." else os.path.join(workspace, subdir)
     pkg_path = os.path.join(base, "package.json")
@@ -799,7 +825,10 @@ def frontend_gate_command(workspace: str, subdir: str = ".") -> Optional[str]:
         # package.json illisible : on garde au moins l'install (fail-closed — npm
         # signalera lui-même le JSON invalide au lieu d'un gate silencieusement vert).
         pass
-    steps = ["(npm ci --no-audit --no-fund --silent || npm install --no-audit --no-fund --silent)"]
+    if node_modules is not None:
+        steps = [f"rm -rf node_modules && cp -a {shlex.quote(node_modules)} node_modules"]
+    else:
+        steps = [_NPM_INSTALL]
     if "build" in scripts:
         steps.append("npm run build --silent")
     elif "typescript" in declared and os.path.isfile(os.path.join(base, "tsconfig.json")):
@@ -815,6 +844,14 @@ def frontend_gate_command(workspace: str, subdir: str = ".") -> Optional[str]:
     return prefix + " && ".join(steps)
 
 
+def node_modules_build_command(subdir: str, target: str) -> str:
+    """``npm ci`` du front ``subdir`` puis copie de ``node_modules`` dans ``target`` (environnement pré-construit)."""
+    prefix = "export CI=true NPM_CONFIG_CACHE=/tmp/.npm; "
+    if subdir != ".":
+        prefix += f"cd -- {shlex.quote(subdir)} && "
+    return f"{prefix}npm ci --no-audit --no-fund --silent && cp -a node_modules/. {shlex.quote(target)}/"
+
+
 # Triple-backtick de remplacement : neutralise les fences pour qu'un texte non
 # fiable ne puisse pas refermer le bloc de code et forger une fausse section.
 _FENCE = "```"
@@ -899,6 +936,14 @@ class QualityReport:
     # (mode toléré) — le vert des tests peut venir des paquets de l'IMAGE, pas du
     # requirements.txt du projet. Signal fort pour la PR et l'audit.
     deps_install_failed: bool = False
+    # Environnements de dépendances pré-construits servis au gate (``user``,
+    # ``venv``, ``node:<dossier>``) au lieu d'une installation à la volée.
+    deps_envs_prebuilt: Tuple[str, ...] = ()
+    # Tests impactés par le diff (graphe d'imports), lancés en tête du gate avant
+    # la suite complète ; ``impacted_tests_failed`` : ils ont échoué et la suite
+    # complète n'a pas été lancée (rejet rapide).
+    impacted_tests: Tuple[str, ...] = ()
+    impacted_tests_failed: bool = False
     # #437 : contrôle d'adéquation diff↔issue (None = non évalué). Fail-closed :
     # implemented=False ou erreur du checker ⇒ passed=False.
     adequacy_implemented: Optional[bool] = None
@@ -945,6 +990,9 @@ class QualityReport:
     # après avoir rechargé et vérifié l'artefact durable exact ; ``None`` pour
     # les checkers historiques/dynamiques qui ne peuvent pas fournir cette preuve.
     acceptance_oracle_sha256: Optional[str] = None
+    # Chronologie des passes (tests, revue, adéquation, acceptation) : début relatif,
+    # durée, issue — les passes concurrentes se chevauchent, le chemin critique se lit ici.
+    pass_timings: Tuple[PassTiming, ...] = ()
 
     def to_markdown(self) -> str:
         """Rapport Markdown pour le corps de PR (texte de revue fencé, anti-injection)."""
@@ -954,6 +1002,11 @@ class QualityReport:
             "",
             f"**Tests** : {tests_badge} (code de sortie {self.test_exit_code})",
         ]
+        if self.impacted_tests_failed:
+            lines.append(
+                f"> ⚡ **rejet rapide** : {len(self.impacted_tests)} fichier(s) de test impacté(s) par le diff "
+                "en échec — suite complète non lancée."
+            )
         if self.deps_install_failed:
             lines.append(
                 "> ⚠️ **installation des dépendances déclarées EN ÉCHEC** pendant le gate (#439) — "
@@ -1047,6 +1100,15 @@ class QualityReport:
                 f"> ⛔ contrôle d'acceptation (§4.7) indisponible (fail-closed) : "
                 f"{_fence_safe_line(self.acceptance_error)}",
             ]
+        if self.pass_timings:
+            lines += [
+                "",
+                "_Passes_ : "
+                + " · ".join(
+                    f"{timing.name} {timing.seconds:.1f} s" + (" (annulée)" if timing.status == "cancelled" else "")
+                    for timing in self.pass_timings
+                ),
+            ]
         lines += ["", f"**Verdict** : {'✅ PASSÉ' if self.passed else '❌ NON PASSÉ'}"]
         return "\n".join(lines)
 
@@ -1640,7 +1702,7 @@ raise SystemExit(exit_code)
     )
 
 
-def _run_acceptance_source(
+async def _run_acceptance_source(
     workspace: str,
     source: str,
     *,
@@ -1657,7 +1719,7 @@ def _run_acceptance_source(
     pytest_cmd = _acceptance_pytest_command(source)
     command = f"({prelude}) && {pytest_cmd}" if prelude else pytest_cmd
     try:
-        res = sandbox.run_tests(workspace, command)
+        res = await run_sandbox_tests(sandbox, workspace, command)
     except Exception as exc:  # noqa: BLE001 - checker activé = erreur bloquante
         return AcceptanceOutcome(
             error=f"exécution de l'oracle d'acceptation impossible : {exc}",
@@ -1838,7 +1900,7 @@ class StoredAcceptanceChecker:
         source, error = self._load_and_verify(issue)
         if error is not None or source is None:
             return AcceptanceOutcome(error=error or "oracle plan-time invalide")
-        return _run_acceptance_source(
+        return await _run_acceptance_source(
             workspace,
             source,
             sandbox=sandbox,
@@ -1903,7 +1965,7 @@ class LLMAcceptanceChecker:
             return AcceptanceOutcome(error=str(exc) or repr(exc))
         if not code.strip():
             return AcceptanceOutcome(error="génération de tests d'acceptation vide")
-        return _run_acceptance_source(workspace, code, sandbox=sandbox)
+        return await _run_acceptance_source(workspace, code, sandbox=sandbox)
 
 
 class FakeAdequacyChecker:
@@ -1966,6 +2028,383 @@ class FakeReviewer:
         )
 
 
+# Fichiers dont le contenu détermine chaque environnement pré-construit.
+_USER_ENV_INPUTS = ("requirements.txt", "pyproject.toml", "setup.py", "setup.cfg")
+_NODE_ENV_INPUTS = ("package.json", "package-lock.json")
+# Références hors fichiers de dépendances que pip lit aussi : ``-r``/``-c`` imbriqués,
+# chemins locaux (``-e ./lib``, ``./pkg``, ``pkg @ file:…``).
+_NESTED_REQUIREMENTS = re.compile(r"^(?:-r|--requirement|-c|--constraint)(?:\s+|=)(\S+)")
+_LOCAL_REQUIREMENT = re.compile(r"^(?:(?:-e|--editable)(?:\s+|=))?(file:\S+|\.{1,2}(?:[/\\]\S*)?(?=$|[\s\[#;]))")
+_FILE_URL = re.compile(r"""@\s*(file:[^\s"',;\]]+)""")
+_LOCAL_DEP_SKIP_DIRS = (".git", "node_modules", "__pycache__", ".venv", "venv", ".tox", "build", "dist")
+# Au-delà, une dépendance locale à fichier unique (wheel, archive) compte par sa taille et sa date, sans être lue.
+_LOCAL_DEP_MAX_FILE_SIZE = 1024 * 1024
+
+
+def _local_dependency_path(workspace: str, reference: str) -> str:
+    """Chemin hôte d'une référence locale (``file:`` ou relative au workspace, cwd de pip)."""
+    reference = re.split(r"[#\[]", reference, maxsplit=1)[0]
+    if reference.startswith("file:"):
+        reference = reference[len("file:") :]
+        if reference.startswith("//"):
+            reference = reference[2:]
+    return os.path.normpath(os.path.join(workspace, reference))
+
+
+def _requirements_local_inputs(workspace: str, *, editable_project: bool) -> dict:
+    """Empreintes de ce que l'installation lit hors de ``_USER_ENV_INPUTS`` (clé d'environnement).
+
+    - fichiers ``-r``/``-c`` imbriqués et dépendances locales citées par
+      ``requirements.txt`` ou par les métadonnées (``pkg @ file:…``) : contenu d'un
+      fichier, chemins, tailles et dates des fichiers d'un répertoire, sauf le workspace lui-même (installé en éditable, seules ses métadonnées
+      comptent) ;
+    - ``editable_project`` : paquets de premier niveau du projet (racine et
+      ``src/``), dont l'installation éditable fige la liste.
+    """
+    root = os.path.realpath(workspace)
+    inputs: dict = {}
+    local_refs: List[str] = []
+    queue = [os.path.join(workspace, "requirements.txt")]
+    seen = set()
+    while queue:
+        path = queue.pop(0)
+        real = os.path.realpath(path)
+        if real in seen:
+            continue
+        seen.add(real)
+        rel = os.path.relpath(real, root)
+        try:
+            with open(path, encoding="utf-8", errors="replace") as handle:
+                text = handle.read()
+        except OSError:
+            text = None
+        if rel != "requirements.txt":  # déjà dans _USER_ENV_INPUTS
+            inputs[f"file:{rel}"] = None if text is None else hashlib.sha256(text.encode("utf-8")).hexdigest()
+        if text is None:
+            continue
+        for raw in text.splitlines():
+            line = re.sub(r"(^|\s)#.*$", "", raw).strip()
+            nested = _NESTED_REQUIREMENTS.match(line)
+            if nested:
+                queue.append(os.path.join(os.path.dirname(path), nested.group(1)))
+                continue
+            local = _LOCAL_REQUIREMENT.match(line)
+            if local:
+                local_refs.append(local.group(1))
+            local_refs.extend(_FILE_URL.findall(line))
+    for name in ("pyproject.toml", "setup.py", "setup.cfg"):
+        try:
+            with open(os.path.join(workspace, name), encoding="utf-8", errors="replace") as handle:
+                local_refs.extend(_FILE_URL.findall(handle.read()))
+        except OSError:
+            continue
+    for reference in local_refs:
+        path = _local_dependency_path(workspace, reference)
+        if os.path.realpath(path) == root:
+            continue
+        try:
+            digest: Optional[str] = fingerprint_path(
+                path, skip_dirs=_LOCAL_DEP_SKIP_DIRS, max_size=_LOCAL_DEP_MAX_FILE_SIZE
+            )
+        except (OSError, ValueError):
+            digest = None
+        inputs[f"path:{os.path.relpath(os.path.realpath(path), root)}"] = digest
+    if editable_project:
+        packages = []
+        for base in (".", "src"):
+            try:
+                names = sorted(os.listdir(os.path.join(workspace, base)))
+            except OSError:
+                continue
+            packages.extend(
+                os.path.normpath(os.path.join(base, name))
+                for name in names
+                if os.path.isfile(os.path.join(workspace, base, name, "__init__.py"))
+            )
+        inputs["packages"] = packages
+    return inputs
+
+
+def deps_env_specs(
+    workspace: str,
+    image_id: str,
+    *,
+    install_deps: bool = True,
+    frontend_gate: bool = True,
+    check_installability: bool = False,
+    use_pip_cache: bool = False,
+) -> List[DepsEnvSpec]:
+    """Environnements pré-constructibles des passes du gate pour ce workspace.
+
+    - ``user`` : site ``pip --user`` du prelude #414 (construit en mode strict) ;
+    - ``venv`` : venv nu de la passe d'installabilité #439 ;
+    - pour ces deux-là, la clé couvre aussi les requirements imbriqués, les
+      dépendances locales et, pour l'installation éditable du projet, ses paquets
+      de premier niveau (cf. :func:`_requirements_local_inputs`) ;
+    - ``node`` : ``node_modules`` de chaque front **avec** ``package-lock.json``
+      (sans lockfile, ``npm install`` n'est pas reproductible : pas de cache).
+    """
+    specs: List[DepsEnvSpec] = []
+    prelude = deps_install_prelude(workspace, strict=True, use_cache=use_pip_cache) if install_deps else None
+    if prelude is not None:
+        specs.append(
+            deps_env_spec(
+                "user",
+                ".",
+                [os.path.join(workspace, name) for name in _USER_ENV_INPUTS],
+                image_id,
+                lambda path: f"export PYTHONUSERBASE={path} && {prelude}",
+                extra=_requirements_local_inputs(workspace, editable_project="-e ." in prelude),
+            )
+        )
+    if check_installability and os.path.isfile(os.path.join(workspace, "requirements.txt")):
+        specs.append(
+            deps_env_spec(
+                "venv",
+                ".",
+                [os.path.join(workspace, "requirements.txt")],
+                image_id,
+                lambda path: installability_venv_command(path, use_cache=use_pip_cache),
+                extra=_requirements_local_inputs(workspace, editable_project=False),
+            )
+        )
+    if frontend_gate:
+        for front_dir in _frontend_dirs(workspace):
+            base = workspace if front_dir == "." else os.path.join(workspace, front_dir)
+            if not os.path.isfile(os.path.join(base, "package-lock.json")):
+                continue
+            specs.append(
+                deps_env_spec(
+                    "node",
+                    front_dir,
+                    [os.path.join(base, name) for name in _NODE_ENV_INPUTS],
+                    image_id,
+                    lambda path, front_dir=front_dir: node_modules_build_command(front_dir, path),
+                )
+            )
+    return specs
+
+
+async def _prebuilt_deps_envs(cache: DepsEnvCache, sandbox, workspace: str, **gate_options) -> Tuple[object, dict]:
+    """``(sandbox, {(kind, dossier): chemin})`` : environnements prêts, montés en lecture seule.
+
+    Chaque environnement manquant est construit une fois (cf. :class:`DepsEnvCache`) ;
+    un échec, une image introuvable ou un sandbox sans montages (doubles de test)
+    laissent l'installation à la volée correspondante.
+    """
+    if not (hasattr(sandbox, "with_options") and hasattr(sandbox, "image_id_async")):
+        return sandbox, {}
+    image_id = await sandbox.image_id_async()
+    if image_id is None:
+        return sandbox, {}
+    specs = deps_env_specs(
+        workspace,
+        image_id,
+        install_deps=gate_options["install_deps"],
+        frontend_gate=gate_options["frontend_gate"],
+        check_installability=gate_options["check_installability"],
+        use_pip_cache=gate_options["use_pip_cache"],
+    )
+    envs = {}
+    mounts = []
+    for spec in specs:
+        path = await cache.ensure(sandbox, workspace, spec)
+        if path is not None:
+            envs[(spec.kind, spec.subdir)] = spec.container_path
+            mounts.append((str(path), spec.entry, False))
+    if not mounts:
+        return sandbox, {}
+    return sandbox.with_options(deps_mounts=tuple(mounts)), envs
+
+
+def _gate_command(
+    workspace: str,
+    *,
+    test_command: str,
+    install_deps: bool,
+    require_deps_install: bool,
+    use_pip_cache: bool,
+    frontend_gate: bool,
+    check_installability: bool,
+    e2e_gate: bool,
+    e2e_timeout: float,
+    smoke_run: bool,
+    smoke_command: Optional[str],
+    smoke_paths: Tuple[str, ...],
+    smoke_timeout: float,
+    smoke_cors_origin: str,
+    deps_envs: Mapping[Tuple[str, str], str],
+) -> str:
+    """Commande shell unique du gate : install + tests, puis passes frontend, installabilité, E2E et smoke.
+
+    ``deps_envs`` : environnements pré-construits montés dans le conteneur,
+    ``(kind, dossier) → chemin`` (cf. :func:`_prebuilt_deps_envs`) ; chacun
+    remplace l'installation à la volée correspondante.
+    """
+    command = test_command
+    user_env = deps_envs.get(("user", "."))
+    if install_deps and user_env is None:
+        prelude = deps_install_prelude(workspace, strict=require_deps_install, use_cache=use_pip_cache)
+        if prelude is not None:
+            # Strict (#439) : install bloquante. Toléré (#414) : les tests
+            # tournent quand même, l'échec laisse sa note dans la sortie.
+            command = f"({prelude}) && {test_command}" if require_deps_install else f"{prelude}; {test_command}"
+    front_commands: List[str] = []
+    if frontend_gate:
+        for front_dir in _frontend_dirs(workspace):
+            front = frontend_gate_command(workspace, subdir=front_dir, node_modules=deps_envs.get(("node", front_dir)))
+            if front is None:
+                continue
+            # Une passe PAR répertoire détecté (#457 : la racine ET les
+            # sous-répertoires de 1er niveau — layout monorepo).
+            banner = _FRONTEND_BANNER if front_dir == "." else f"{_FRONTEND_BANNER} [{front_dir}]"
+            front_commands.append(f"echo {shlex.quote(banner)} && ({front})")
+    if front_commands:
+        # #463 : « aucun test pytest collecté » est NORMAL quand une passe
+        # frontend couvre la tâche — exit 5 toléré DANS ce cas seulement.
+        command = _tolerate_pytest_exit5(command)
+    for front in front_commands:
+        # `&&` : chaque passe frontend ne tourne que si la précédente est
+        # verte (le verdict est déjà rouge sinon) et son échec rend le
+        # gate rouge.
+        command = f"({command}) && {front}"
+    if check_installability:
+        installability = installability_command(workspace, use_cache=use_pip_cache, venv=deps_envs.get(("venv", ".")))
+        if installability is not None:
+            if front_commands:
+                # La collecte de la passe d'installabilité (#439) renvoie
+                # AUSSI exit 5 sans test pytest — même tolérance (#463).
+                installability = _tolerate_pytest_exit5(installability)
+            command = f"({command}) && echo '{_INSTALLABILITY_BANNER}' && ({installability})"
+    if e2e_gate:
+        # #503 (suivi) : passe E2E navigateur — l'UI RÉELLE contre l'API. Insérée
+        # AVANT le smoke car sa sonde est écrite dans un fichier (pas un heredoc
+        # nu) → chaînable ; le smoke reste le heredoc FINAL. Full-stack uniquement
+        # (None sinon). Échec front<->back (contrat/préfixe/CORS/base d'URL) = rouge.
+        e2e = e2e_gate_command(workspace, timeout=e2e_timeout)
+        if e2e is not None:
+            command = f"({command}) && echo {shlex.quote(_E2E_BANNER)} && ({e2e})"
+    if smoke_run:
+        # #503 (suivi v6) : le contrôle CORS du smoke n'a de sens QUE si un
+        # frontend existe — un backend ISOLÉ n'a légitimement pas de middleware
+        # CORS et était faussement rejeté (run v6, tâche d'init backend). On
+        # n'exige donc le CORS par DÉFAUT que si un frontend est détecté dans le
+        # workspace ; un ``smoke_cors_origin`` EXPLICITE (≠ défaut) reste toujours
+        # respecté (override opérateur), et "" garde le contrôle désactivé.
+        cors = smoke_cors_origin
+        if cors == _SMOKE_DEFAULT_ORIGIN and not _frontend_dirs(workspace):
+            cors = ""
+        smoke = smoke_run_command(
+            workspace,
+            command=smoke_command,
+            paths=smoke_paths,
+            timeout=smoke_timeout,
+            cors_origin=cors,
+        )
+        if smoke is not None:
+            # Dernière passe (le heredoc doit clore la commande) : l'app est
+            # lancée dans le même conteneur, après install des deps (#414).
+            command = f"({command}) && echo {shlex.quote(_SMOKE_BANNER)} && {smoke}"
+    if user_env is not None:
+        # Site utilisateur pré-construit (monté en lecture seule) à la place du prelude
+        # #414 : exporté en tête, hérité par toutes les passes (sous-shells compris).
+        command = f'export PYTHONUSERBASE={user_env} PATH="{user_env}/bin:$PATH"; {command}'
+    return command
+
+
+PASS_TESTS = "tests"
+PASS_REVIEW = "review"
+PASS_ADEQUACY = "adequacy"
+PASS_ACCEPTANCE = "acceptance"
+# Politique ``cancel_on_red`` : passes LLM annulées dès que les tests sont rouges.
+CANCEL_ON_RED_NONE = "none"
+CANCEL_ON_RED_ADEQUACY = "adequacy"
+CANCEL_ON_RED_ALL = "all"
+_CANCELLED_ON_RED = {
+    CANCEL_ON_RED_NONE: (),
+    CANCEL_ON_RED_ADEQUACY: (PASS_ADEQUACY,),
+    CANCEL_ON_RED_ALL: (PASS_ADEQUACY, PASS_REVIEW),
+}
+# Politiques acceptées (validation de ``GATE_LLM_CANCEL_ON_RED`` côté pilote).
+CANCEL_ON_RED_POLICIES = tuple(_CANCELLED_ON_RED)
+
+
+@dataclass(frozen=True)
+class PassTiming:
+    """Chronologie d'une passe du gate : début (s depuis le début du gate), durée et issue."""
+
+    name: str
+    started: float
+    seconds: float
+    status: str  # done, cancelled, error
+
+
+class _PassScheduler:
+    """Passes du gate en tâches asyncio concurrentes, chronométrées.
+
+    Chaque passe capture elle-même ses ``Exception`` (fail-closed) : une exception
+    qui s'en échappe (budget, annulation) est fatale et remonte dès qu'elle se
+    produit, quelle que soit la passe attendue. :meth:`aclose` annule les passes
+    encore en vol.
+    """
+
+    def __init__(self):
+        self._origin = time.monotonic()
+        self._tasks: dict = {}
+        self._coros: list = []
+        self._timings: dict = {}
+
+    def start(self, name: str, coro) -> None:
+        self._coros.append(coro)
+        self._tasks[name] = asyncio.ensure_future(self._timed(name, coro))
+
+    async def _timed(self, name: str, coro):
+        start = time.monotonic()
+        status = "error"
+        try:
+            result = await coro
+            status = "done"
+            return result
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            self._timings[name] = PassTiming(name, start - self._origin, time.monotonic() - start, status)
+
+    def cancel(self, *names: str) -> None:
+        for name in names:
+            task = self._tasks.get(name)
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def result(self, name: str, default=None):
+        """Résultat de la passe ``name`` (``default`` si annulée)."""
+        task = self._tasks[name]
+        while not task.done():
+            pending = [other for other in self._tasks.values() if not other.done()]
+            await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for other in self._tasks.values():
+                if other is not task and other.done() and not other.cancelled() and other.exception() is not None:
+                    raise other.exception()
+        if task.cancelled():
+            return default
+        return task.result()
+
+    async def aclose(self) -> None:
+        self.cancel(*self._tasks)
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        for coro in self._coros:
+            coro.close()  # passe annulée avant d'avoir démarré : jamais attendue
+
+    def timings(self) -> Tuple[PassTiming, ...]:
+        timings = dict(self._timings)
+        for name, task in self._tasks.items():
+            # Annulée avant d'avoir démarré : aucune chronologie enregistrée par _timed.
+            if name not in timings and task.cancelled():
+                timings[name] = PassTiming(name, time.monotonic() - self._origin, 0.0, "cancelled")
+        return tuple(sorted(timings.values(), key=lambda timing: timing.started))
+
+
 async def run_quality_gate(
     workspace: str,
     diff: str,
@@ -1994,6 +2433,10 @@ async def run_quality_gate(
     pin_guard: bool = True,
     forbidden_files_guard: bool = True,
     forbidden_files_block: bool = False,
+    deps_env_cache: Optional[DepsEnvCache] = None,
+    test_impact: Optional[TestImpactIndex] = None,
+    concurrent_adequacy: bool = False,
+    cancel_on_red: str = CANCEL_ON_RED_ADEQUACY,
 ) -> QualityReport:
     """Exécute les tests (sandbox) + la revue (reviewer) sur un diff. Fail-closed.
 
@@ -2036,7 +2479,22 @@ async def run_quality_gate(
     :func:`e2e_gate_command` renvoie ``None`` et la passe est inerte. EXIGE une
     image sandbox avec Playwright + chromium (cf. ``docker/sandbox/Dockerfile``) ;
     passer ``e2e_gate=False`` la désactive explicitement.
+    ``deps_env_cache`` (opt-in) : dépendances pip/venv/npm pré-construites une
+    fois par contenu de leurs fichiers et par image, montées en lecture seule à
+    la place de l'installation à la volée (cf. :mod:`collegue.executor.deps_env`).
+    ``test_impact`` (opt-in) : les tests qui importent les fichiers du diff sont
+    lancés en tête (``-x``), la suite complète seulement s'ils sont verts — une
+    tentative cassée est rejetée sans payer toute la suite (cf.
+    :mod:`collegue.executor.test_impact`).
+    La revue tourne en parallèle des tests. ``concurrent_adequacy`` : le contrôle
+    d'adéquation démarre aussi avec les tests (spéculatif : écarté si le gate est
+    rouge, comme en séquentiel) au lieu d'attendre un reste vert. ``cancel_on_red``
+    (``none``, ``adequacy``, ``all``) : passes LLM annulées dès que les tests sont
+    rouges (``all`` annule aussi la revue). Chronologie des passes dans
+    ``QualityReport.pass_timings``.
     """
+    if cancel_on_red not in CANCEL_ON_RED_POLICIES:
+        raise ValueError(f"cancel_on_red inconnu : {cancel_on_red!r} (attendu : {', '.join(CANCEL_ON_RED_POLICIES)})")
     sandbox = sandbox or DockerSandbox()
     reviewer = reviewer or _default_reviewer()
     # #496 : le cache pip n'est utilisé que si le sandbox monte effectivement le
@@ -2067,163 +2525,165 @@ async def run_quality_gate(
     if forbidden_files_guard:
         forbidden_files = forbidden_committed_files(diff)
 
-    # 1. Tests dans le sandbox. Une incapacité à les exécuter = non passé
-    #    (fail-closed), pas une exception qui remonterait.
+    # Passes du gate (cf. :class:`_PassScheduler`). La revue — qui ne dépend que du
+    # diff et de l'issue — tourne PENDANT les tests au lieu de les attendre ;
+    # l'adéquation aussi quand ``concurrent_adequacy``. Le verdict reste celui de
+    # l'enchaînement séquentiel : seul le chemin critique raccourcit.
     deps_install_failed = False
     requirements_added: List[str] = []
-    try:
-        command = test_command
-        if install_deps:
-            prelude = deps_install_prelude(workspace, strict=require_deps_install, use_cache=use_pip_cache)
-            if prelude is not None:
-                # Strict (#439) : install bloquante. Toléré (#414) : les tests
-                # tournent quand même, l'échec laisse sa note dans la sortie.
-                command = f"({prelude}) && {test_command}" if require_deps_install else f"{prelude}; {test_command}"
-        front_commands: List[str] = []
-        if frontend_gate:
-            for front_dir in _frontend_dirs(workspace):
-                front = frontend_gate_command(workspace, subdir=front_dir)
-                if front is None:
-                    continue
-                # Une passe PAR répertoire détecté (#457 : la racine ET les
-                # sous-répertoires de 1er niveau — layout monorepo).
-                banner = _FRONTEND_BANNER if front_dir == "." else f"{_FRONTEND_BANNER} [{front_dir}]"
-                front_commands.append(f"echo {shlex.quote(banner)} && ({front})")
-        if front_commands:
-            # #463 : « aucun test pytest collecté » est NORMAL quand une passe
-            # frontend couvre la tâche — exit 5 toléré DANS ce cas seulement.
-            command = _tolerate_pytest_exit5(command)
-        for front in front_commands:
-            # `&&` : chaque passe frontend ne tourne que si la précédente est
-            # verte (le verdict est déjà rouge sinon) et son échec rend le
-            # gate rouge.
-            command = f"({command}) && {front}"
-        if check_installability:
-            installability = installability_command(workspace, use_cache=use_pip_cache)
-            if installability is not None:
-                if front_commands:
-                    # La collecte de la passe d'installabilité (#439) renvoie
-                    # AUSSI exit 5 sans test pytest — même tolérance (#463).
-                    installability = _tolerate_pytest_exit5(installability)
-                command = f"({command}) && echo '{_INSTALLABILITY_BANNER}' && ({installability})"
-        if e2e_gate:
-            # #503 (suivi) : passe E2E navigateur — l'UI RÉELLE contre l'API. Insérée
-            # AVANT le smoke car sa sonde est écrite dans un fichier (pas un heredoc
-            # nu) → chaînable ; le smoke reste le heredoc FINAL. Full-stack uniquement
-            # (None sinon). Échec front<->back (contrat/préfixe/CORS/base d'URL) = rouge.
-            e2e = e2e_gate_command(workspace, timeout=e2e_timeout)
-            if e2e is not None:
-                command = f"({command}) && echo {shlex.quote(_E2E_BANNER)} && ({e2e})"
-        if smoke_run:
-            # #503 (suivi v6) : le contrôle CORS du smoke n'a de sens QUE si un
-            # frontend existe — un backend ISOLÉ n'a légitimement pas de middleware
-            # CORS et était faussement rejeté (run v6, tâche d'init backend). On
-            # n'exige donc le CORS par DÉFAUT que si un frontend est détecté dans le
-            # workspace ; un ``smoke_cors_origin`` EXPLICITE (≠ défaut) reste toujours
-            # respecté (override opérateur), et "" garde le contrôle désactivé.
-            cors = smoke_cors_origin
-            if cors == _SMOKE_DEFAULT_ORIGIN and not _frontend_dirs(workspace):
-                cors = ""
-            smoke = smoke_run_command(
-                workspace,
-                command=smoke_command,
-                paths=smoke_paths,
-                timeout=smoke_timeout,
-                cors_origin=cors,
+    deps_envs: Mapping[Tuple[str, str], str] = {}
+    impacted: Tuple[str, ...] = ()
+
+    async def _tests_pass() -> Tuple[bool, int, str]:
+        # 1. Tests dans le sandbox. Une incapacité à les exécuter = non passé
+        #    (fail-closed), pas une exception qui remonterait.
+        nonlocal deps_install_failed, deps_envs, impacted
+        try:
+            gate_test_command = test_command
+            if test_impact is not None and impact_supported(test_command):
+                selection = await asyncio.to_thread(test_impact.select, workspace, list(_diff_paths(diff)))
+                impacted = selection.tests
+                gate_test_command = impact_test_command(test_command, impacted) or test_command
+            gate_options = dict(
+                test_command=gate_test_command,
+                install_deps=install_deps,
+                require_deps_install=require_deps_install,
+                use_pip_cache=use_pip_cache,
+                frontend_gate=frontend_gate,
+                check_installability=check_installability,
+                e2e_gate=e2e_gate,
+                e2e_timeout=e2e_timeout,
+                smoke_run=smoke_run,
+                smoke_command=smoke_command,
+                smoke_paths=smoke_paths,
+                smoke_timeout=smoke_timeout,
+                smoke_cors_origin=smoke_cors_origin,
             )
-            if smoke is not None:
-                # Dernière passe (le heredoc doit clore la commande) : l'app est
-                # lancée dans le même conteneur, après install des deps (#414).
-                command = f"({command}) && echo {shlex.quote(_SMOKE_BANNER)} && {smoke}"
-        test_res = sandbox.run_tests(workspace, command)
-        if fix_missing_requirements:
-            # #481 : une ModuleNotFoundError en venv nu est un trou de
-            # requirements.txt, pas un problème de code — remédiation
-            # déterministe (table module→paquet) + relance de la MÊME commande,
-            # au lieu d'un cycle LLM complet PAR paquet. Borné : une chaîne
-            # d'imports ne révèle qu'un module manquant par passage.
-            for _ in range(_MAX_REMEDIATION_ROUNDS):
-                if test_res.ok:
-                    break
-                added = remediate_missing_requirements(
-                    workspace, "\n".join(part for part in (test_res.stdout, test_res.stderr) if part)
-                )
-                if not added:
-                    break
-                requirements_added.extend(added)
-                test_res = sandbox.run_tests(workspace, command)
-        tests_passed = test_res.ok
-        test_exit_code = test_res.exit_code
-        test_output = "\n".join(part for part in (test_res.stdout, test_res.stderr) if part).strip()
-        # #439 : la note du prelude toléré (#414) devient un SIGNAL structuré —
-        # un vert obtenu avec une install en échec n'a pas la même valeur.
-        deps_install_failed = _INSTALL_FAILED_NOTE in test_output
-    except Exception as exc:  # noqa: BLE001 - fail-closed ; BaseException (budget) remonte
-        tests_passed = False
-        test_exit_code = -1
-        test_output = f"tests non exécutables : {exc}"
-
-    # 2. Revue. Une exception du reviewer = bloquant (fail-closed).
-    review_error: Optional[str] = None
-    try:
-        outcome = await reviewer.review(diff, ctx, issue=issue)
-        review_summary = outcome.summary
-        review_findings = outcome.findings
-        review_blocking = outcome.blocking
-    except Exception as exc:  # noqa: BLE001 - fail-closed ; BaseException (budget) remonte
-        review_error = str(exc) or repr(exc)
-        review_summary = "revue indisponible (erreur)"
-        review_findings = ()
-        review_blocking = True
-
-    # 3. Adéquation diff↔issue (#437) — lancée seulement si le reste est vert
-    #    (économie d'appels LLM : un gate déjà rouge n'a pas besoin du verdict).
-    #    Fail-closed : non conforme OU erreur du checker ⇒ non passé.
-    would_pass = bool(tests_passed and not review_blocking and review_error is None and not requirements_removed)
-    adequacy_implemented: Optional[bool] = None
-    adequacy_justification = ""
-    adequacy_error: Optional[str] = None
-    adequacy_tests_assert: Optional[bool] = None
-    adequacy_tests_justification = ""
-    if adequacy_checker is not None and issue is not None and would_pass:
+            run_sandbox = sandbox
+            if deps_env_cache is not None:
+                run_sandbox, deps_envs = await _prebuilt_deps_envs(deps_env_cache, sandbox, workspace, **gate_options)
+            command = _gate_command(workspace, deps_envs=deps_envs, **gate_options)
+            test_res = await run_sandbox_tests(run_sandbox, workspace, command)
+            if fix_missing_requirements:
+                # #481 : une ModuleNotFoundError en venv nu est un trou de
+                # requirements.txt, pas un problème de code — remédiation
+                # déterministe (table module→paquet) + relance de la MÊME commande,
+                # au lieu d'un cycle LLM complet PAR paquet. Borné : une chaîne
+                # d'imports ne révèle qu'un module manquant par passage.
+                for _ in range(_MAX_REMEDIATION_ROUNDS):
+                    if test_res.ok:
+                        break
+                    added = remediate_missing_requirements(
+                        workspace, "\n".join(part for part in (test_res.stdout, test_res.stderr) if part)
+                    )
+                    if not added:
+                        break
+                    requirements_added.extend(added)
+                    if deps_env_cache is not None:
+                        # requirements.txt a changé : nouvel environnement (construit une fois, resservi au retry).
+                        run_sandbox, deps_envs = await _prebuilt_deps_envs(
+                            deps_env_cache, sandbox, workspace, **gate_options
+                        )
+                        command = _gate_command(workspace, deps_envs=deps_envs, **gate_options)
+                    test_res = await run_sandbox_tests(run_sandbox, workspace, command)
+            output = "\n".join(part for part in (test_res.stdout, test_res.stderr) if part).strip()
+            # #439 : la note du prelude toléré (#414) devient un SIGNAL structuré —
+            # un vert obtenu avec une install en échec n'a pas la même valeur.
+            deps_install_failed = _INSTALL_FAILED_NOTE in output
+            return test_res.ok, test_res.exit_code, output
+        except Exception as exc:  # noqa: BLE001 - fail-closed ; BaseException (budget) remonte
+            return False, -1, f"tests non exécutables : {exc}"
+
+    async def _review_pass() -> Tuple[str, Tuple[ReviewFindingLite, ...], bool, Optional[str]]:
+        # 2. Revue. Une exception du reviewer = bloquant (fail-closed).
         try:
-            adequacy = await adequacy_checker.check(diff, issue, ctx)
-            adequacy_implemented = bool(adequacy.implemented)
-            adequacy_justification = adequacy.justification
-            # #499 : couverture des critères par les tests (None = non évalué).
-            adequacy_tests_assert = adequacy.tests_assert_criteria
-            adequacy_tests_justification = adequacy.tests_justification
+            outcome = await reviewer.review(diff, ctx, issue=issue)
+            return outcome.summary, outcome.findings, outcome.blocking, None
         except Exception as exc:  # noqa: BLE001 - fail-closed ; BaseException (budget) remonte
-            adequacy_error = str(exc) or repr(exc)
+            return "revue indisponible (erreur)", (), True, str(exc) or repr(exc)
 
-    # §4.7 (Phase B) : tests d'acceptation EXÉCUTABLES (auteur indépendant du coder)
-    # lancés en sandbox — verdict OBJECTIF. Seulement si le reste est vert (borne
-    # le coût). Dès qu'un checker est fourni, son contrat devient OBLIGATOIRE :
-    # issue/critères absents, skip, verdict None ou erreur bloquent fail-closed.
-    acceptance_passed: Optional[bool] = None
-    acceptance_output = ""
-    acceptance_error: Optional[str] = None
-    acceptance_oracle_sha256: Optional[str] = None
-    acceptance_required = acceptance_checker is not None
-    if acceptance_required and would_pass:
-        if issue is None:
-            acceptance_error = "issue absente : critères d'acceptation impossibles à vérifier"
-        elif not issue.acceptance_criteria:
-            acceptance_error = "aucun critère d'acceptation à vérifier"
-        else:
-            try:
-                acc = await acceptance_checker.check(workspace, diff, issue, ctx, sandbox=sandbox)
-                acceptance_passed = acc.passed
-                acceptance_output = acc.output
-                acceptance_error = acc.error
-                acceptance_oracle_sha256 = acc.oracle_sha256
-                if acc.skipped:
-                    acceptance_passed = None
-                    acceptance_error = acceptance_error or "contrôle d'acceptation ignoré sans verdict"
-                elif acceptance_passed is None:
-                    acceptance_error = acceptance_error or "contrôle d'acceptation terminé sans verdict"
-            except Exception as exc:  # noqa: BLE001 - fail-closed ; BaseException (budget) remonte
-                acceptance_error = str(exc) or repr(exc)
+    async def _adequacy_pass():
+        # 3. Adéquation diff↔issue (#437). Fail-closed : non conforme OU erreur du
+        #    checker ⇒ non passé. Renvoie ``(outcome, erreur)``.
+        try:
+            return await adequacy_checker.check(diff, issue, ctx), None
+        except Exception as exc:  # noqa: BLE001 - fail-closed ; BaseException (budget) remonte
+            return None, str(exc) or repr(exc)
+
+    scheduler = _PassScheduler()
+    wants_adequacy = adequacy_checker is not None and issue is not None and not requirements_removed
+    try:
+        scheduler.start(PASS_TESTS, _tests_pass())
+        scheduler.start(PASS_REVIEW, _review_pass())
+        if wants_adequacy and concurrent_adequacy:
+            scheduler.start(PASS_ADEQUACY, _adequacy_pass())
+        tests_passed, test_exit_code, test_output = await scheduler.result(PASS_TESTS)
+        if not tests_passed:
+            # Gate rouge quoi qu'il arrive : les passes LLM encore en vol ne
+            # changeraient plus le verdict (politique ``cancel_on_red``).
+            scheduler.cancel(*_CANCELLED_ON_RED[cancel_on_red])
+        review_summary, review_findings, review_blocking, review_error = await scheduler.result(
+            PASS_REVIEW, default=("revue annulée : tests en échec", (), False, None)
+        )
+
+        # L'adéquation ne compte que si le reste est vert (économie d'appels LLM #437 :
+        # lancée seulement à ce stade, sauf ``concurrent_adequacy``).
+        would_pass = bool(tests_passed and not review_blocking and review_error is None and not requirements_removed)
+        adequacy_implemented: Optional[bool] = None
+        adequacy_justification = ""
+        adequacy_error: Optional[str] = None
+        adequacy_tests_assert: Optional[bool] = None
+        adequacy_tests_justification = ""
+        if wants_adequacy and would_pass:
+            if not concurrent_adequacy:
+                scheduler.start(PASS_ADEQUACY, _adequacy_pass())
+            adequacy, adequacy_error = await scheduler.result(PASS_ADEQUACY)
+            if adequacy is not None:
+                adequacy_implemented = bool(adequacy.implemented)
+                adequacy_justification = adequacy.justification
+                # #499 : couverture des critères par les tests (None = non évalué).
+                adequacy_tests_assert = adequacy.tests_assert_criteria
+                adequacy_tests_justification = adequacy.tests_justification
+        elif wants_adequacy and concurrent_adequacy:
+            # Gate rouge (revue bloquante) : verdict d'adéquation écarté, comme en séquentiel.
+            if cancel_on_red != CANCEL_ON_RED_NONE:
+                scheduler.cancel(PASS_ADEQUACY)
+            await scheduler.result(PASS_ADEQUACY)
+
+        # §4.7 (Phase B) : tests d'acceptation EXÉCUTABLES (auteur indépendant du coder)
+        # lancés en sandbox — verdict OBJECTIF. Seulement si le reste est vert (borne
+        # le coût). Dès qu'un checker est fourni, son contrat devient OBLIGATOIRE :
+        # issue/critères absents, skip, verdict None ou erreur bloquent fail-closed.
+        acceptance_passed: Optional[bool] = None
+        acceptance_output = ""
+        acceptance_error: Optional[str] = None
+        acceptance_oracle_sha256: Optional[str] = None
+        acceptance_required = acceptance_checker is not None
+        if acceptance_required and would_pass:
+            if issue is None:
+                acceptance_error = "issue absente : critères d'acceptation impossibles à vérifier"
+            elif not issue.acceptance_criteria:
+                acceptance_error = "aucun critère d'acceptation à vérifier"
+            else:
+                try:
+                    scheduler.start(
+                        PASS_ACCEPTANCE, acceptance_checker.check(workspace, diff, issue, ctx, sandbox=sandbox)
+                    )
+                    acc = await scheduler.result(PASS_ACCEPTANCE)
+                    acceptance_passed = acc.passed
+                    acceptance_output = acc.output
+                    acceptance_error = acc.error
+                    acceptance_oracle_sha256 = acc.oracle_sha256
+                    if acc.skipped:
+                        acceptance_passed = None
+                        acceptance_error = acceptance_error or "contrôle d'acceptation ignoré sans verdict"
+                    elif acceptance_passed is None:
+                        acceptance_error = acceptance_error or "contrôle d'acceptation terminé sans verdict"
+                except Exception as exc:  # noqa: BLE001 - fail-closed ; BaseException (budget) remonte
+                    acceptance_error = str(exc) or repr(exc)
+    finally:
+        # Exception qui remonte (budget, annulation) : aucune passe ne survit au gate.
+        await scheduler.aclose()
 
     touched = tests_touched(diff)
     # #499 : `is not False` — None (non évalué) et True passent ; seul False
@@ -2256,6 +2716,9 @@ async def run_quality_gate(
         passed=passed,
         review_error=review_error,
         deps_install_failed=deps_install_failed,
+        deps_envs_prebuilt=tuple(kind if subdir == "." else f"{kind}:{subdir}" for kind, subdir in deps_envs),
+        impacted_tests=impacted,
+        impacted_tests_failed=bool(impacted and not tests_passed and impact_failed(test_output)),
         adequacy_implemented=adequacy_implemented,
         adequacy_justification=adequacy_justification,
         adequacy_error=adequacy_error,
@@ -2271,6 +2734,7 @@ async def run_quality_gate(
         acceptance_output=acceptance_output,
         acceptance_error=acceptance_error,
         acceptance_oracle_sha256=acceptance_oracle_sha256,
+        pass_timings=scheduler.timings(),
     )
 
 
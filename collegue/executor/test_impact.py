@@ -0,0 +1,401 @@
+"""Sélection des tests impactés par un diff (opt-in, ``GATE_TEST_IMPACT``).
+
+Le gate lance toujours la suite complète, et le pilote retente une tâche jusqu'à
+``max_task_attempts`` fois : un diff manifestement cassé payait la suite entière
+à chaque tentative. :class:`TestImpactIndex` construit le **graphe d'imports**
+Python du workspace (fichier → modules importés, par analyse AST, sans exécuter
+le code du projet) au **commit de base**, le met en cache sur l'hôte sous
+``$COLLEGUE_HOME/cache/test_impact`` (une entrée par commit), puis y superpose
+les fichiers du diff pour remonter des chemins touchés aux fichiers de test qui
+les importent, directement ou transitivement.
+
+Le gate lance ces tests en tête de la commande, ``-x``, et n'enchaîne la suite
+complète que s'ils sont verts (cf. :func:`impact_test_command`). La sélection
+est une **heuristique d'ordre**, pas un filtre : la suite complète tourne
+toujours avant un verdict vert. Elle sur-sélectionne volontiers (noms de module
+ambigus, ``conftest.py``) et n'est pas proposée quand elle couvre déjà l'essentiel
+de la suite (``max_ratio``) ou quand la commande de tests n'est pas un pytest
+simple.
+"""
+
+from __future__ import annotations
+
+import ast
+import collections
+import json
+import logging
+import os
+import re
+import shlex
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from collegue.core import paths
+from collegue.executor.command import LocalCommandRunner
+
+logger = logging.getLogger(__name__)
+
+# Incrémenté quand l'analyse change : les graphes en cache deviennent invalides.
+GRAPH_FORMAT_VERSION = 1
+DEFAULT_MAX_RATIO = 0.5
+DEFAULT_MAX_ENTRIES = 64
+# Graphes gardés en mémoire (les retries d'une tâche partagent le même commit de base).
+_MEMORY_ENTRIES = 8
+# Au-delà, un fichier n'est pas analysé (fixture générée, dump…).
+_MAX_SOURCE_BYTES = 1024 * 1024
+_SKIPPED_DIRS = frozenset({"node_modules", "__pycache__", "venv", ".venv", "site-packages", "build", "dist"})
+_TEST_FILE_RE = re.compile(r"(^|/)(test_[^/]*|[^/]*_test)\.py$")
+_COMMIT_RE = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+_PYTEST_BINARIES = frozenset({"pytest", "py.test"})
+
+_IMPACT_BANNER = "[gate] tests impactés par le diff (passe rapide)"
+_IMPACT_FAILED_NOTE = "[gate] tests impactés en ÉCHEC — suite complète non lancée"
+_FULL_SUITE_BANNER = "[gate] suite complète"
+
+
+def is_test_file(path: str) -> bool:
+    """Fichier de test au sens des motifs par défaut de pytest (``test_*.py``, ``*_test.py``)."""
+    return bool(_TEST_FILE_RE.search(path))
+
+
+def module_names(path: str) -> Tuple[str, ...]:
+    """Noms sous lesquels ``path`` (relatif au workspace) peut être importé.
+
+    Nom pointé depuis la racine, depuis ``src/`` (layout src), et nom nu du
+    module : ``python -m pytest`` ajoute la racine à ``sys.path``, pytest y
+    insère le dossier des tests, et un import plat intra-package (``import
+    utils``) vise un voisin. Un nom de trop ne coûte qu'un test sélectionné de trop.
+    """
+    if not path.endswith(".py"):
+        return ()
+    parts = path[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    if not parts:
+        return ()
+    names = [".".join(parts)]
+    if parts[0] == "src" and len(parts) > 1:
+        names.append(".".join(parts[1:]))
+    if parts[-1] not in names:
+        names.append(parts[-1])
+    return tuple(names)
+
+
+def python_imports(source: str, path: str) -> Tuple[str, ...]:
+    """Modules importés par ``source`` (fichier ``path``), imports relatifs résolus.
+
+    Pour ``from a import b``, ``a`` et ``a.b`` sont retenus (``b`` peut être un
+    sous-module). Imports locaux aux fonctions compris ; syntaxe invalide → ``()``.
+    """
+    try:
+        tree = ast.parse(source, filename=path)
+    except (SyntaxError, ValueError):
+        return ()
+    names = module_names(path)
+    package = names[0].split(".") if names else []
+    if not path.endswith("/__init__.py") and path != "__init__.py":
+        package = package[:-1]
+    found: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                if node.level - 1 > len(package):
+                    continue
+                base = package[: len(package) - (node.level - 1)]
+                prefix = ".".join(base + ([node.module] if node.module else []))
+            else:
+                prefix = node.module or ""
+            if prefix:
+                found.add(prefix)
+            found.update(
+                f"{prefix}.{alias.name}" if prefix else alias.name for alias in node.names if alias.name != "*"
+            )
+    return tuple(sorted(found))
+
+
+class ImportGraph:
+    """Imports de chaque fichier Python d'un workspace (chemins relatifs → noms de modules)."""
+
+    def __init__(self, files: Mapping[str, Sequence[str]]):
+        self.files: Dict[str, Tuple[str, ...]] = {path: tuple(names) for path, names in files.items()}
+
+    def overlay(self, workspace: str, changed: Iterable[str]) -> "ImportGraph":
+        """Copie du graphe où les fichiers ``changed`` reflètent le working tree (absent = supprimé)."""
+        files = dict(self.files)
+        for path in changed:
+            if not path.endswith(".py"):
+                continue
+            source = _read_source(os.path.join(workspace, path))
+            if source is None:
+                files.pop(path, None)
+            else:
+                files[path] = python_imports(source, path)
+        return ImportGraph(files)
+
+    def test_files(self) -> List[str]:
+        return sorted(path for path in self.files if is_test_file(path))
+
+    def impacted_tests(self, changed: Iterable[str]) -> Tuple[str, ...]:
+        """Fichiers de test qui importent (transitivement) un des chemins ``changed``, ou en sont un."""
+        importers: Dict[str, Set[str]] = collections.defaultdict(set)
+        for path, imports in self.files.items():
+            for name in imports:
+                # `import a.b.c` exécute aussi a/__init__.py et a/b/__init__.py.
+                parts = name.split(".")
+                for end in range(1, len(parts) + 1):
+                    importers[".".join(parts[:end])].add(path)
+        pending = [path for path in changed if path.endswith(".py")]
+        reached: Set[str] = set()
+        while pending:
+            path = pending.pop()
+            if path in reached:
+                continue
+            reached.add(path)
+            for name in module_names(path):
+                pending.extend(importers.get(name, ()))
+        tests = {path for path in reached if is_test_file(path) and path in self.files}
+        # Un conftest.py touché (ou qui importe un module touché) concerne tous les tests de son dossier.
+        for path in reached:
+            if os.path.basename(path) == "conftest.py":
+                scope = os.path.dirname(path)
+                tests.update(test for test in self.test_files() if not scope or test.startswith(f"{scope}/"))
+        return tuple(sorted(tests))
+
+    def to_json(self) -> str:
+        return json.dumps({"version": GRAPH_FORMAT_VERSION, "files": self.files}, sort_keys=True)
+
+    @classmethod
+    def from_json(cls, text: str) -> Optional["ImportGraph"]:
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+        if not isinstance(data, dict) or data.get("version") != GRAPH_FORMAT_VERSION:
+            return None
+        return cls(data.get("files") or {})
+
+
+def _read_source(path: str) -> Optional[str]:
+    try:
+        if os.path.getsize(path) > _MAX_SOURCE_BYTES:
+            return ""
+        with open(path, "rb") as handle:
+            return handle.read().decode("utf-8", errors="replace")
+    except OSError:
+        return None
+
+
+def _walk_python_files(workspace: str) -> Iterable[str]:
+    for root, dirs, files in os.walk(workspace):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d not in _SKIPPED_DIRS)
+        for name in sorted(files):
+            if name.endswith(".py"):
+                yield os.path.relpath(os.path.join(root, name), workspace).replace(os.sep, "/")
+
+
+@dataclass(frozen=True)
+class TestSelection:
+    """Tests à lancer en tête du gate (vide = pas de passe rapide) et taille de la suite."""
+
+    __test__ = False
+
+    tests: Tuple[str, ...]
+    total: int
+    base_commit: Optional[str] = None
+
+
+class TestImpactIndex:
+    """Graphes d'imports par commit de base (disque + mémoire) et sélection des tests impactés."""
+
+    __test__ = False
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        max_ratio: float = DEFAULT_MAX_RATIO,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        git_bin: str = "git",
+    ):
+        self.root = Path(cache_dir) if cache_dir else paths.cache_dir() / "test_impact"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_ratio = float(max_ratio)
+        self.max_entries = max(1, int(max_entries))
+        self.git_bin = git_bin
+        self._runner = LocalCommandRunner(timeout=60.0)
+        self._memory: "collections.OrderedDict[str, ImportGraph]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+
+    def _git(self, workspace: str, *args: str):
+        return self._runner.run_command([self.git_bin, *args], workspace)
+
+    def _base_commit(self, workspace: str) -> Optional[str]:
+        head = self._git(workspace, "rev-parse", "HEAD")
+        commit = head.stdout.strip() if head.ok else ""
+        return commit if _COMMIT_RE.match(commit) else None
+
+    def base_graph(self, workspace: str, changed: Sequence[str]) -> Tuple[ImportGraph, Optional[str]]:
+        """Graphe du commit de base (``HEAD`` du workspace) et son SHA.
+
+        Hors dépôt git, graphe du working tree tel quel (non mis en cache) : la
+        superposition du diff y est alors sans effet.
+        """
+        commit = self._base_commit(workspace)
+        if commit is None:
+            files = {}
+            for path in _walk_python_files(workspace):
+                source = _read_source(os.path.join(workspace, path))
+                if source is not None:
+                    files[path] = python_imports(source, path)
+            return ImportGraph(files), None
+        with self._lock:
+            graph = self._memory.get(commit)
+            if graph is not None:
+                self._memory.move_to_end(commit)
+                self.hits += 1
+                return graph, commit
+        graph = self._load(commit)
+        if graph is None:
+            graph = self._build(workspace, commit, changed)
+            self._store(commit, graph)
+            with self._lock:
+                self.builds += 1
+        else:
+            with self._lock:
+                self.hits += 1
+        with self._lock:
+            self._memory[commit] = graph
+            while len(self._memory) > _MEMORY_ENTRIES:
+                self._memory.popitem(last=False)
+        return graph, commit
+
+    def _build(self, workspace: str, commit: str, changed: Sequence[str]) -> ImportGraph:
+        listing = self._git(workspace, "ls-tree", "-r", "-z", "--name-only", commit)
+        tracked = [path for path in listing.stdout.split("\0") if path.endswith(".py")] if listing.ok else []
+        changed_set = set(changed)
+        files = {}
+        for path in tracked:
+            if any(part.startswith(".") or part in _SKIPPED_DIRS for part in path.split("/")[:-1]):
+                continue
+            # Les chemins du diff sont lus au commit de base : le graphe en cache ne doit pas
+            # porter les imports d'une tentative.
+            source = None if path in changed_set else _read_source(os.path.join(workspace, path))
+            if source is None:
+                shown = self._git(workspace, "show", f"{commit}:{path}")
+                if not shown.ok:
+                    continue
+                source = shown.stdout
+            files[path] = python_imports(source, path)
+        return ImportGraph(files)
+
+    def _load(self, commit: str) -> Optional[ImportGraph]:
+        try:
+            text = (self.root / f"{commit}.json").read_text(encoding="utf-8")
+        except OSError:
+            return None
+        return ImportGraph.from_json(text)
+
+    def _store(self, commit: str, graph: ImportGraph) -> None:
+        target = self.root / f"{commit}.json"
+        staging = self.root / f".{commit}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            staging.write_text(graph.to_json(), encoding="utf-8")
+            os.replace(staging, target)
+        except OSError as exc:
+            logger.warning("Graphe d'imports de %s non mis en cache : %s", commit[:12], exc)
+            staging.unlink(missing_ok=True)
+            return
+        entries = sorted(self.root.glob("*.json"), key=lambda p: p.stat().st_mtime if p.exists() else 0)
+        for stale in entries[: max(0, len(entries) - self.max_entries)]:
+            stale.unlink(missing_ok=True)
+
+    def select(self, workspace: str, changed: Sequence[str]) -> TestSelection:
+        """Tests impactés par les chemins ``changed`` ; vide si la sélection dépasse ``max_ratio`` de la suite.
+
+        Une analyse en échec laisse la sélection vide : la suite complète tourne seule.
+        """
+        try:
+            graph, commit = self.base_graph(workspace, changed)
+            graph = graph.overlay(workspace, changed)
+        except Exception as exc:  # noqa: BLE001 - optimisation seulement, jamais bloquante
+            logger.warning("Graphe d'imports indisponible (%s) : pas de passe rapide", exc)
+            return TestSelection((), 0)
+        total = len(graph.test_files())
+        tests = graph.impacted_tests(changed)
+        if not tests or len(tests) > self.max_ratio * total:
+            return TestSelection((), total, commit)
+        return TestSelection(tests, total, commit)
+
+
+def impact_supported(test_command: str) -> bool:
+    """``test_command`` est-il un pytest sans chemin explicite (on sait alors y cibler des fichiers) ?"""
+    try:
+        tokens = shlex.split(test_command)
+    except ValueError:
+        return False
+    runner = max((i for i, token in enumerate(tokens) if os.path.basename(token) in _PYTEST_BINARIES), default=None)
+    return runner is not None and all(token.startswith("-") for token in tokens[runner + 1 :])
+
+
+def impact_test_command(test_command: str, tests: Sequence[str]) -> Optional[str]:
+    """Commande « tests impactés ``-x`` puis, s'ils sont verts, ``test_command`` ».
+
+    ``None`` si ``tests`` est vide ou si ``test_command`` ne s'y prête pas (cf.
+    :func:`impact_supported`). L'exit 5 (« aucun test collecté ») de la passe
+    rapide n'arrête pas la suite.
+    """
+    if not tests or not impact_supported(test_command):
+        return None
+    targets = " ".join(shlex.quote(test) for test in tests)
+    # Sous-shell : la commande reste un bloc unique derrière le `&&` du prelude strict (#439).
+    return (
+        f"(echo {shlex.quote(_IMPACT_BANNER)}; {test_command} -x {targets}; _rc=$?; "
+        f"if [ $_rc -ne 0 ] && [ $_rc -ne 5 ]; then echo {shlex.quote(_IMPACT_FAILED_NOTE)}; exit $_rc; fi; "
+        f"echo {shlex.quote(_FULL_SUITE_BANNER)}; {test_command})"
+    )
+
+
+def impact_failed(output: str) -> bool:
+    """La passe rapide a-t-elle rejeté le diff (suite complète non lancée) ?"""
+    return _IMPACT_FAILED_NOTE in output
+
+
+_test_impact_index: Optional[TestImpactIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_test_impact_index(settings_obj: Optional[object] = None) -> Optional[TestImpactIndex]:
+    """Singleton de l'index si ``GATE_TEST_IMPACT``, sinon ``None``."""
+    global _test_impact_index
+    if settings_obj is None:
+        try:
+            from collegue.config import settings as settings_obj
+        except Exception:
+            return None
+    if not bool(getattr(settings_obj, "GATE_TEST_IMPACT", False)):
+        return None
+    with _index_lock:
+        if _test_impact_index is None:
+            cache_dir = str(getattr(settings_obj, "GATE_TEST_IMPACT_DIR", "") or "").strip()
+            try:
+                _test_impact_index = TestImpactIndex(
+                    os.path.expanduser(cache_dir) if cache_dir else None,
+                    max_ratio=float(getattr(settings_obj, "GATE_TEST_IMPACT_MAX_RATIO", DEFAULT_MAX_RATIO)),
+                )
+            except OSError as exc:
+                logger.warning("Index d'impact des tests indisponible (%s) : désactivé", exc)
+                return None
+        return _test_impact_index
+
+
+def reset_test_impact_index() -> None:
+    """Oublie le singleton (pour les tests)."""
+    global _test_impact_index
+    with _index_lock:
+        _test_impact_index = None
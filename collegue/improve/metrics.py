@@ -35,6 +35,8 @@ import sys
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
+from collegue.sandbox.executor import run_sandbox_tests
+
 # Commande de couverture par défaut. ``python -m pytest`` (et non ``pytest`` nu) met le
 # CWD sur ``sys.path`` → un projet src-layout (imports ``from app…``) est collectable sans
 # install editable (#577) ; cohérent avec le gate de build qui utilise déjà ``python -m``.
@@ -465,7 +467,8 @@ async def measure(
 ) -> ProjectQualityMetrics:
     """Mesure couverture + sécu + lint/complexité (déterministes) → composite.
 
-    ``sandbox`` est injectable (mocké en CI) ; la couverture vient du parsing de la
+    ``sandbox`` est injectable (mocké en CI) et lancé sans bloquer la boucle
+    (:func:`~collegue.sandbox.executor.run_sandbox_tests`) ; la couverture vient du parsing de la
     sortie de tests (multi-format, ``parse_coverage`` #577) et ``tests_passed`` = exit 0.
     Sécu (``security_scan_fn``) et
     lint/complexité (``quality_scan_fn``) viennent de scans **statiques déterministes**
@@ -474,7 +477,7 @@ async def measure(
     (``dep_vulns_fn``) ne sont mesurées que si ``dep_vulns_enabled`` (opt-in, gaté).
     La revue LLM (``reviewer``/``diff``) est **optionnelle et informative**.
     """
-    test_res = sandbox.run_tests(workspace, coverage_command)
+    test_res = await run_sandbox_tests(sandbox, workspace, coverage_command)
     tests_passed = bool(test_res.ok)
     raw_coverage = parse_coverage(test_res.stdout)
     coverage_measured = raw_coverage is not None
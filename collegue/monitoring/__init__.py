@@ -15,10 +15,12 @@ from .metrics import (
     MetricsSummary,
     get_metrics_collector,
 )
+from .sketch import LatencySketch
 
 __all__ = [
     "ActivityLog",
     "ExpertMetrics",
+    "LatencySketch",
     "MetricsCollector",
     "MetricsSummary",
     "get_activity_log",
@@ -1,9 +1,9 @@
 """
 Disk-backed activity log for the Collegue MCP expert system.
 
-Records every significant event to a JSON-lines file so that
-the Streamlit dashboard (separate process) can read them in
-real-time.
+Records every significant event to segmented JSON-lines files so
+that the Streamlit dashboard (separate process) can read them in
+near real-time (writes are batched every ``FLUSH_INTERVAL``).
 
 Event types:
 - llm_call: LLM request/response for an expert
@@ -12,12 +12,18 @@ Event types:
 - memory_write: Entry stored to ProjectMemory
 """
 
+import atexit
+import bisect
+import fcntl
 import json
 import logging
+import os
+import re
+import tempfile
 import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from collegue.core.paths import monitoring_dir
 
@@ -25,21 +31,162 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_DIR = monitoring_dir()
 
+_SEGMENT_RE = re.compile(r"^activity-(\d{6})\.jsonl$")
+
+
+def _new_index() -> Dict[str, Any]:
+    return {"count": 0, "bytes": 0, "ts_min": None, "ts_max": None, "offsets": [], "types": {}, "experts": {}}
+
+
+def _index_line(index: Dict[str, Any], offset: int, event: Dict[str, Any]) -> None:
+    """Ajoute l'événement situé à ``offset`` à l'index de son segment."""
+    index["count"] += 1
+    index["offsets"].append(offset)
+    ev_type = event.get("type")
+    if ev_type:
+        index["types"].setdefault(str(ev_type), []).append(offset)
+    expert = event.get("expert")
+    if expert:
+        index["experts"].setdefault(str(expert), []).append(offset)
+    ts = event.get("ts")
+    if isinstance(ts, (int, float)):
+        index["ts_min"] = ts if index["ts_min"] is None else min(index["ts_min"], ts)
+        index["ts_max"] = ts if index["ts_max"] is None else max(index["ts_max"], ts)
+
+
+def _intersect_sorted(a: List[int], b: List[int]) -> List[int]:
+    if len(a) > len(b):
+        a, b = b, a
+    out = []
+    for x in a:
+        i = bisect.bisect_left(b, x)
+        if i < len(b) and b[i] == x:
+            out.append(x)
+    return out
+
 
 class ActivityLog:
     """Append-only, disk-backed activity log.
 
-    Each event is a single JSON line written to ``activity.jsonl``.
-    The dashboard reads this file to display real-time activity.
+    Events are JSON lines spread over rotating segment files
+    (``activity-NNNNNN.jsonl``, ``SEGMENT_MAX_EVENTS`` events each), each with a
+    small sidecar index (``.idx.json``: byte offsets per event type and per
+    expert, timestamp range). Appends are queued and written in batches by a
+    background writer thread; reads walk segments newest-first through their
+    index and stop as soon as ``limit`` matches are found. Retention deletes
+    whole segments — nothing is ever rewritten.
     """
 
-    MAX_EVENTS = 2000  # keep the last N events on disk
+    MAX_EVENTS = 2000  # keep (at least) the last N events on disk
+    SEGMENT_MAX_EVENTS = 500
+    FLUSH_INTERVAL = 0.5  # s, batching window of the writer thread
+    MAX_PENDING = 256  # au-delà, l'appelant vide la file lui-même (back-pressure)
 
     def __init__(self, base_dir: Optional[Path] = None):
         self._dir = base_dir or _DEFAULT_DIR
         self._dir.mkdir(parents=True, exist_ok=True)
-        self._path = self._dir / "activity.jsonl"
+        self._legacy_path = self._dir / "activity.jsonl"
+        self._lock_path = self._dir / "activity.lock"
         self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: List[Dict[str, Any]] = []
+        self._wakeup = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        # Cache lecteur : seq -> (taille fichier connue, index).
+        self._index_cache: Dict[int, tuple[int, Dict[str, Any]]] = {}
+        self._migrate_legacy()
+
+    # ── segments ─────────────────────────────────────────────────────────
+
+    def _segment_path(self, seq: int) -> Path:
+        return self._dir / f"activity-{seq:06d}.jsonl"
+
+    def _index_path(self, seq: int) -> Path:
+        return self._dir / f"activity-{seq:06d}.idx.json"
+
+    def _segments(self) -> List[int]:
+        """Numéros de segment présents sur disque, du plus ancien au plus récent."""
+        try:
+            names = os.listdir(self._dir)
+        except OSError:
+            return []
+        return sorted(int(m.group(1)) for m in map(_SEGMENT_RE.match, names) if m)
+
+    def _migrate_legacy(self) -> None:
+        """Reprend un ancien ``activity.jsonl`` monolithique comme segment 0."""
+        if not self._legacy_path.exists() or self._segment_path(0).exists():
+            return
+        try:
+            os.replace(self._legacy_path, self._segment_path(0))
+        except OSError as exc:
+            logger.warning("activity_log migration error: %s", exc)
+
+    def _scan_into(self, seq: int, index: Dict[str, Any], size: int) -> None:
+        """Indexe les lignes de ``index['bytes']`` jusqu'à ``size`` (lignes complètes)."""
+        try:
+            with open(self._segment_path(seq), "rb") as f:
+                f.seek(index["bytes"])
+                offset = index["bytes"]
+                while offset < size:
+                    raw = f.readline()
+                    if not raw or not raw.endswith(b"\n"):
+                        break  # ligne partielle (écriture concurrente en cours)
+                    try:
+                        event = json.loads(raw)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        event = None
+                    if isinstance(event, dict):
+                        _index_line(index, offset, event)
+                    offset += len(raw)
+                index["bytes"] = offset
+        except OSError:
+            pass
+
+    def _load_index(self, seq: int) -> Dict[str, Any]:
+        """Index à jour du segment ``seq`` (sidecar, complété par scan de la queue)."""
+        try:
+            size = self._segment_path(seq).stat().st_size
+        except OSError:
+            return _new_index()
+        cached = self._index_cache.get(seq)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+        index = None
+        if cached is not None and cached[0] < size:
+            index = cached[1]
+        else:
+            try:
+                with open(self._index_path(seq), encoding="utf-8") as f:
+                    index = json.load(f)
+                if not isinstance(index, dict) or index.get("bytes", 0) > size:
+                    index = None
+            except (OSError, json.JSONDecodeError):
+                index = None
+        if index is None:
+            index = _new_index()
+        if index["bytes"] < size:
+            self._scan_into(seq, index, size)
+        self._index_cache[seq] = (index["bytes"], index)
+        return index
+
+    def _write_index(self, seq: int, index: Dict[str, Any]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=str(self._dir), prefix="activity_idx_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(tmp_path, self._index_path(seq))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _delete_segment(self, seq: int) -> None:
+        self._index_cache.pop(seq, None)
+        for path in (self._segment_path(seq), self._index_path(seq)):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
 
     # ── write ────────────────────────────────────────────────────────────
 
@@ -47,12 +194,78 @@ class ActivityLog:
         event.setdefault("ts", time.time())
         event.setdefault("time", time.strftime("%H:%M:%S"))
         with self._lock:
+            self._pending.append(event)
+            backlog = len(self._pending)
+            self._ensure_writer_locked()
+        if backlog >= self.MAX_PENDING:
+            self.flush()
+        else:
+            self._wakeup.set()
+
+    def _ensure_writer_locked(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            return
+        self._writer = threading.Thread(target=self._writer_loop, name="activity-log-writer", daemon=True)
+        self._writer.start()
+
+    def _writer_loop(self) -> None:
+        while True:
+            self._wakeup.wait()
+            # Fenêtre de regroupement : les événements d'une même rafale partent ensemble.
+            time.sleep(self.FLUSH_INTERVAL)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every queued event now (one append + one index update per segment)."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
             try:
-                with open(self._path, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(event, default=str, ensure_ascii=False) + "\n")
+                with open(self._lock_path, "a") as lock_file:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                    try:
+                        self._write_batch(batch)
+                    finally:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
             except OSError as exc:
                 logger.warning("activity_log write error: %s", exc)
 
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        segments = self._segments()
+        seq = segments[-1] if segments else 1
+        index = self._load_index(seq)
+        rotated = False
+        while batch:
+            if index["count"] >= self.SEGMENT_MAX_EVENTS:
+                seq += 1
+                index = _new_index()
+                rotated = True
+            room = self.SEGMENT_MAX_EVENTS - index["count"]
+            chunk, batch = batch[:room], batch[room:]
+            with open(self._segment_path(seq), "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                if offset != index["bytes"]:
+                    # Un autre process a écrit (ou vidé) le segment depuis notre dernier passage.
+                    if offset < index["bytes"]:
+                        index = _new_index()
+                    self._scan_into(seq, index, offset)
+                    offset = index["bytes"]
+                lines = []
+                for event in chunk:
+                    raw = (json.dumps(event, default=str, ensure_ascii=False) + "\n").encode("utf-8")
+                    _index_line(index, offset, event)
+                    offset += len(raw)
+                    lines.append(raw)
+                f.write(b"".join(lines))
+            index["bytes"] = offset
+            self._index_cache[seq] = (offset, index)
+            self._write_index(seq, index)
+        if rotated:
+            self._enforce_retention()
+
     def log_llm_call(
         self,
         expert: str,
@@ -161,52 +374,87 @@ class ActivityLog:
 
     # ── read ─────────────────────────────────────────────────────────────
 
+    def _iter_matches(
+        self,
+        event_type: Optional[str],
+        expert: Optional[str],
+        since: Optional[float],
+    ) -> Iterator[Dict[str, Any]]:
+        """Événements correspondants, du plus récent au plus ancien."""
+        for seq in reversed(self._segments()):
+            # Copie sous verrou : ``_write_batch`` complète l'index en place.
+            with self._flush_lock:
+                index = self._load_index(seq)
+                ts_max = index["ts_max"]
+                if event_type and expert:
+                    offsets = _intersect_sorted(index["types"].get(event_type, []), index["experts"].get(expert, []))
+                elif event_type:
+                    offsets = list(index["types"].get(event_type, []))
+                elif expert:
+                    offsets = list(index["experts"].get(expert, []))
+                else:
+                    offsets = list(index["offsets"])
+            if since is not None and ts_max is not None and ts_max < since:
+                return  # segments plus anciens : hors fenêtre
+            if not offsets:
+                continue
+            try:
+                with open(self._segment_path(seq), "rb") as f:
+                    for offset in reversed(offsets):
+                        f.seek(offset)
+                        try:
+                            ev = json.loads(f.readline())
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            continue
+                        if since is not None and ev.get("ts", 0) < since:
+                            continue
+                        yield ev
+            except OSError:
+                continue
+
     def read_events(
         self,
         event_type: Optional[str] = None,
         expert: Optional[str] = None,
         limit: int = 200,
+        since: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
-        """Read recent events, optionally filtered."""
+        """Read the ``limit`` most recent events (oldest first), optionally filtered."""
+        if limit <= 0:
+            return []
+        self.flush()
         events: List[Dict[str, Any]] = []
-        try:
-            if not self._path.exists():
-                return []
-            with open(self._path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        ev = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if event_type and ev.get("type") != event_type:
-                        continue
-                    if expert and ev.get("expert") != expert:
-                        continue
-                    events.append(ev)
-        except OSError:
-            pass
-        return events[-limit:]
+        for ev in self._iter_matches(event_type, expert, since):
+            events.append(ev)
+            if len(events) >= limit:
+                break
+        events.reverse()
+        return events
 
     def clear(self) -> None:
-        with self._lock:
-            try:
-                self._path.unlink(missing_ok=True)
-            except OSError:
-                pass
+        with self._flush_lock:
+            with self._lock:
+                self._pending = []
+            for seq in self._segments():
+                self._delete_segment(seq)
+            self._legacy_path.unlink(missing_ok=True)
+
+    def _enforce_retention(self) -> None:
+        """Supprime les segments les plus anciens tant que les suivants gardent MAX_EVENTS événements."""
+        segments = self._segments()
+        counts = {seq: self._load_index(seq)["count"] for seq in segments}
+        total = sum(counts.values())
+        for seq in segments[:-1]:
+            if total - counts[seq] < self.MAX_EVENTS:
+                break
+            total -= counts[seq]
+            self._delete_segment(seq)
 
     def prune(self) -> None:
-        """Keep only the last MAX_EVENTS events."""
-        events = self.read_events(limit=self.MAX_EVENTS)
-        with self._lock:
-            try:
-                with open(self._path, "w", encoding="utf-8") as f:
-                    for ev in events:
-                        f.write(json.dumps(ev, default=str, ensure_ascii=False) + "\n")
-            except OSError:
-                pass
+        """Keep (at least) the last MAX_EVENTS events by deleting whole old segments."""
+        self.flush()
+        with self._flush_lock:
+            self._enforce_retention()
 
 
 # ── singleton ────────────────────────────────────────────────────────────
@@ -222,4 +470,5 @@ def get_activity_log() -> ActivityLog:
         with _activity_lock:
             if _activity_log is None:
                 _activity_log = ActivityLog()
+                atexit.register(_activity_log.flush)
     return _activity_log
@@ -2,15 +2,18 @@
 Metrics Collector for Collegue MCP Expert System.
 
 Tracks per-expert:
-- Execution latency (min, max, avg, p95)
+- Execution latency (min, max, avg, p50/p90/p95/p99 via a mergeable quantile sketch)
 - LLM API costs (input/output tokens, estimated cost)
 - Errors (count, types, rates)
 - Success/failure rates
 """
 
+import atexit
 import json
 import logging
 import math
+import os
+import tempfile
 import threading
 import time
 from collections import defaultdict
@@ -19,6 +22,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from collegue.core.paths import monitoring_dir
+from collegue.monitoring.sketch import LatencySketch
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +31,10 @@ logger = logging.getLogger(__name__)
 DEFAULT_INPUT_COST_PER_TOKEN = 0.00000015
 DEFAULT_OUTPUT_COST_PER_TOKEN = 0.00000060
 
+# Persistance write-behind de metrics.json (surchargeable par settings).
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+DEFAULT_MAX_STALENESS_SECONDS = 10.0
+
 
 @dataclass
 class ErrorRecord:
@@ -54,7 +62,16 @@ class ExecutionRecord:
 
 @dataclass
 class ExpertMetrics:
-    """Aggregated metrics for a single expert."""
+    """Aggregated metrics for a single expert.
+
+    Latency percentiles come from a fixed-memory :class:`LatencySketch`
+    (global, plus one per ``LATENCY_WINDOW_SECONDS`` window for the last
+    ``MAX_LATENCY_WINDOWS`` windows), so reads cost O(buckets) and two
+    ``ExpertMetrics`` from different processes can be merged exactly.
+    """
+
+    LATENCY_WINDOW_SECONDS = 3600
+    MAX_LATENCY_WINDOWS = 24
 
     expert_name: str
     total_executions: int = 0
@@ -66,9 +83,38 @@ class ExpertMetrics:
     total_input_tokens: int = 0
     total_output_tokens: int = 0
     total_cost: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    pool_reuses: int = 0
+    pool_creations: int = 0
+    pool_setup_ms: float = 0.0
+    # Analyses AST partagées (collegue.core.code_facts) : parsings faits / évités et leur coût.
+    code_facts_parses: int = 0
+    code_facts_reuses: int = 0
+    code_facts_parse_ms: float = 0.0
+    code_facts_saved_ms: float = 0.0
     errors_by_type: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
     last_execution_time: float = 0.0
-    latency_samples: List[float] = field(default_factory=list)
+    latency_sketch: LatencySketch = field(default_factory=LatencySketch)
+    latency_windows: Dict[int, LatencySketch] = field(default_factory=dict)
+
+    def record_latency(self, duration_ms: float, timestamp: Optional[float] = None) -> None:
+        """Add a latency sample to the global and per-window sketches."""
+        self.latency_sketch.add(duration_ms)
+        if self.LATENCY_WINDOW_SECONDS <= 0:
+            return
+        ts = time.time() if timestamp is None else timestamp
+        window = int(ts // self.LATENCY_WINDOW_SECONDS) * self.LATENCY_WINDOW_SECONDS
+        sketch = self.latency_windows.get(window)
+        if sketch is None:
+            sketch = self.latency_windows[window] = LatencySketch(alpha=self.latency_sketch.alpha)
+            self._trim_windows()
+        sketch.add(duration_ms)
+
+    def _trim_windows(self) -> None:
+        if len(self.latency_windows) > self.MAX_LATENCY_WINDOWS:
+            for window in sorted(self.latency_windows)[: -self.MAX_LATENCY_WINDOWS]:
+                del self.latency_windows[window]
 
     @property
     def avg_latency_ms(self) -> float:
@@ -76,13 +122,38 @@ class ExpertMetrics:
             return 0.0
         return self.total_latency_ms / self.total_executions
 
+    @property
+    def p50_latency_ms(self) -> float:
+        return self.latency_sketch.quantile(0.50)
+
+    @property
+    def p90_latency_ms(self) -> float:
+        return self.latency_sketch.quantile(0.90)
+
     @property
     def p95_latency_ms(self) -> float:
-        if not self.latency_samples:
-            return 0.0
-        sorted_samples = sorted(self.latency_samples)
-        idx = int(len(sorted_samples) * 0.95)
-        return sorted_samples[min(idx, len(sorted_samples) - 1)]
+        return self.latency_sketch.quantile(0.95)
+
+    @property
+    def p99_latency_ms(self) -> float:
+        return self.latency_sketch.quantile(0.99)
+
+    def latency_histogram(self) -> List[Dict[str, Any]]:
+        """Per-window latency summary (oldest first): start, count, p50/p95/p99."""
+        rows = []
+        for window in sorted(self.latency_windows):
+            sketch = self.latency_windows[window]
+            q = sketch.quantiles((0.50, 0.95, 0.99))
+            rows.append(
+                {
+                    "window_start": window,
+                    "count": sketch.count,
+                    "p50_latency_ms": round(q[0.50], 2),
+                    "p95_latency_ms": round(q[0.95], 2),
+                    "p99_latency_ms": round(q[0.99], 2),
+                }
+            )
+        return rows
 
     @property
     def success_rate(self) -> float:
@@ -96,7 +167,39 @@ class ExpertMetrics:
             return 0.0
         return self.failed_executions / self.total_executions
 
+    def merge(self, other: "ExpertMetrics") -> None:
+        """Fold ``other`` (same expert, another process/replica) into this one."""
+        self.total_executions += other.total_executions
+        self.successful_executions += other.successful_executions
+        self.failed_executions += other.failed_executions
+        self.total_latency_ms += other.total_latency_ms
+        self.min_latency_ms = min(self.min_latency_ms, other.min_latency_ms)
+        self.max_latency_ms = max(self.max_latency_ms, other.max_latency_ms)
+        self.total_input_tokens += other.total_input_tokens
+        self.total_output_tokens += other.total_output_tokens
+        self.total_cost += other.total_cost
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.pool_reuses += other.pool_reuses
+        self.pool_creations += other.pool_creations
+        self.pool_setup_ms += other.pool_setup_ms
+        self.code_facts_parses += other.code_facts_parses
+        self.code_facts_reuses += other.code_facts_reuses
+        self.code_facts_parse_ms += other.code_facts_parse_ms
+        self.code_facts_saved_ms += other.code_facts_saved_ms
+        for error_type, n in other.errors_by_type.items():
+            self.errors_by_type[error_type] += n
+        self.last_execution_time = max(self.last_execution_time, other.last_execution_time)
+        self.latency_sketch.merge(other.latency_sketch)
+        for window, sketch in other.latency_windows.items():
+            if window in self.latency_windows:
+                self.latency_windows[window].merge(sketch)
+            else:
+                self.latency_windows[window] = sketch.copy()
+        self._trim_windows()
+
     def to_dict(self) -> Dict[str, Any]:
+        q = self.latency_sketch.quantiles((0.50, 0.90, 0.95, 0.99))
         return {
             "expert_name": self.expert_name,
             "total_executions": self.total_executions,
@@ -105,18 +208,66 @@ class ExpertMetrics:
             "avg_latency_ms": round(self.avg_latency_ms, 2),
             "min_latency_ms": round(self.min_latency_ms, 2) if self.min_latency_ms != float("inf") else 0.0,
             "max_latency_ms": round(self.max_latency_ms, 2),
-            "p95_latency_ms": round(self.p95_latency_ms, 2),
+            "p50_latency_ms": round(q[0.50], 2),
+            "p90_latency_ms": round(q[0.90], 2),
+            "p95_latency_ms": round(q[0.95], 2),
+            "p99_latency_ms": round(q[0.99], 2),
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
             "total_cost_usd": round(self.total_cost, 6),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "pool_reuses": self.pool_reuses,
+            "pool_creations": self.pool_creations,
+            "pool_setup_ms": round(self.pool_setup_ms, 2),
+            "code_facts_parses": self.code_facts_parses,
+            "code_facts_reuses": self.code_facts_reuses,
+            "code_facts_parse_ms": round(self.code_facts_parse_ms, 2),
+            "code_facts_saved_ms": round(self.code_facts_saved_ms, 2),
             "success_rate": round(self.success_rate, 4),
             "error_rate": round(self.error_rate, 4),
             "errors_by_type": dict(self.errors_by_type),
             "last_execution_time": self.last_execution_time,
-            # Persisté pour que le P95 (recalculé) survive à reload_from_disk côté dashboard.
-            "latency_samples": self.latency_samples,
+            # Persistés (compacts) pour que les percentiles survivent à reload_from_disk
+            # côté dashboard et se fusionnent entre réplicas.
+            "latency_sketch": self.latency_sketch.to_dict(),
+            "latency_windows": {str(w): sk.to_dict() for w, sk in sorted(self.latency_windows.items())},
         }
 
+    @classmethod
+    def from_dict(cls, expert_name: str, d: Dict[str, Any]) -> "ExpertMetrics":
+        """Rebuild from :meth:`to_dict` output (persisted ``metrics.json`` entry)."""
+        m = cls(expert_name=expert_name)
+        m.total_executions = d.get("total_executions", 0)
+        m.successful_executions = d.get("successful_executions", 0)
+        m.failed_executions = d.get("failed_executions", 0)
+        m.total_latency_ms = d.get("avg_latency_ms", 0) * m.total_executions
+        m.total_input_tokens = d.get("total_input_tokens", 0)
+        m.total_output_tokens = d.get("total_output_tokens", 0)
+        m.total_cost = d.get("total_cost_usd", 0)
+        m.cache_hits = d.get("cache_hits", 0)
+        m.cache_misses = d.get("cache_misses", 0)
+        m.pool_reuses = d.get("pool_reuses", 0)
+        m.pool_creations = d.get("pool_creations", 0)
+        m.pool_setup_ms = d.get("pool_setup_ms", 0.0)
+        m.code_facts_parses = d.get("code_facts_parses", 0)
+        m.code_facts_reuses = d.get("code_facts_reuses", 0)
+        m.code_facts_parse_ms = d.get("code_facts_parse_ms", 0.0)
+        m.code_facts_saved_ms = d.get("code_facts_saved_ms", 0.0)
+        m.last_execution_time = d.get("last_execution_time", 0)
+        min_lat = d.get("min_latency_ms", 0)
+        m.min_latency_ms = min_lat if min_lat > 0 else float("inf")
+        m.max_latency_ms = d.get("max_latency_ms", 0)
+        m.errors_by_type = defaultdict(int, d.get("errors_by_type", {}))
+        if "latency_sketch" in d:
+            m.latency_sketch = LatencySketch.from_dict(d.get("latency_sketch"))
+        else:
+            # Ancien format : échantillons bruts, repris dans le sketch global.
+            m.latency_sketch.update(d.get("latency_samples", []))
+        m.latency_windows = {int(w): LatencySketch.from_dict(sk) for w, sk in (d.get("latency_windows") or {}).items()}
+        m._trim_windows()
+        return m
+
 
 @dataclass
 class MetricsSummary:
@@ -153,11 +304,16 @@ class MetricsCollector:
     """Thread-safe metrics collector for the expert system.
 
     Tracks execution latency, token costs, and errors per expert.
-    Maintains a rolling window of samples for percentile calculations.
+    Latency percentiles come from per-expert quantile sketches (fixed memory).
+
+    Persistence is write-behind: ``record_execution`` only marks the collector
+    dirty, and a background flusher rewrites ``metrics.json`` atomically once
+    ``flush_interval`` seconds pass without new records, or at the latest
+    ``max_staleness`` seconds after the first unsaved change. ``flush()`` forces
+    a synchronous write (shutdown, tests); ``flush_interval=0`` restores the
+    historical write-per-execution behaviour.
     """
 
-    MAX_LATENCY_SAMPLES = 1000
-
     _PERSIST_DIR = monitoring_dir()
     _PERSIST_FILE = "metrics.json"
 
@@ -166,6 +322,8 @@ class MetricsCollector:
         input_cost_per_token: Optional[float] = None,
         output_cost_per_token: Optional[float] = None,
         model: Optional[str] = None,
+        flush_interval: Optional[float] = None,
+        max_staleness: Optional[float] = None,
     ):
         # Tarifs : valeurs explicites si fournies (tests), sinon grille par modèle
         # selon le modèle configuré (LLM_MODEL), avec repli sur les défauts.
@@ -177,6 +335,22 @@ class MetricsCollector:
         self._experts: Dict[str, ExpertMetrics] = {}
         self._input_cost_per_token = input_cost_per_token
         self._output_cost_per_token = output_cost_per_token
+        if flush_interval is None or max_staleness is None:
+            resolved_interval, resolved_staleness = self._resolve_flush_policy()
+            flush_interval = flush_interval if flush_interval is not None else resolved_interval
+            max_staleness = max_staleness if max_staleness is not None else resolved_staleness
+        self._flush_interval = max(0.0, float(flush_interval))
+        self._max_staleness = max(self._flush_interval, float(max_staleness))
+        # État write-behind : générations modifiée/persistée (sous _lock), date de la
+        # première modification non persistée et de la dernière, thread flusher lazy.
+        self._generation = 0
+        self._saved_generation = 0
+        self._dirty_since = 0.0
+        self._last_change = 0.0
+        self._flush_io_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
         self._load_from_disk()
 
     @staticmethod
@@ -194,6 +368,19 @@ class MetricsCollector:
         except Exception:
             return DEFAULT_INPUT_COST_PER_TOKEN, DEFAULT_OUTPUT_COST_PER_TOKEN
 
+    @staticmethod
+    def _resolve_flush_policy() -> tuple[float, float]:
+        """(flush_interval, max_staleness) en secondes depuis la configuration."""
+        try:
+            from collegue.config import settings
+
+            return (
+                float(settings.METRICS_FLUSH_INTERVAL_SECONDS),
+                float(settings.METRICS_MAX_STALENESS_SECONDS),
+            )
+        except Exception:
+            return DEFAULT_FLUSH_INTERVAL_SECONDS, DEFAULT_MAX_STALENESS_SECONDS
+
     def _get_or_create_expert(self, expert_name: str) -> ExpertMetrics:
         if expert_name not in self._experts:
             self._experts[expert_name] = ExpertMetrics(expert_name=expert_name)
@@ -210,6 +397,7 @@ class MetricsCollector:
         error_message: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         cost_usd: Optional[float] = None,
+        cache_hit: Optional[bool] = None,
     ) -> None:
         """Record a single expert execution.
 
@@ -222,6 +410,9 @@ class MetricsCollector:
             error_type: Type of error (if failed)
             error_message: Error message (if failed)
             metadata: Additional metadata
+            cost_usd: Actual cost, overriding the per-token estimate
+            cache_hit: True if served from a cache (LLM response or tool result),
+                False on a cache miss, None when no cache was consulted
         """
         with self._lock:
             metrics = self._get_or_create_expert(expert_name)
@@ -235,10 +426,8 @@ class MetricsCollector:
             if duration_ms > metrics.max_latency_ms:
                 metrics.max_latency_ms = duration_ms
 
-            # Rolling window for percentile
-            metrics.latency_samples.append(duration_ms)
-            if len(metrics.latency_samples) > self.MAX_LATENCY_SAMPLES:
-                metrics.latency_samples = metrics.latency_samples[-self.MAX_LATENCY_SAMPLES :]
+            # Percentiles (sketch global + fenêtre courante)
+            metrics.record_latency(duration_ms, metrics.last_execution_time)
 
             # Token/cost tracking
             metrics.total_input_tokens += input_tokens
@@ -249,6 +438,10 @@ class MetricsCollector:
                 else (input_tokens * self._input_cost_per_token) + (output_tokens * self._output_cost_per_token)
             )
             metrics.total_cost += cost
+            if cache_hit is True:
+                metrics.cache_hits += 1
+            elif cache_hit is False:
+                metrics.cache_misses += 1
 
             # Success/failure tracking
             if success:
@@ -258,7 +451,39 @@ class MetricsCollector:
                 if error_type:
                     metrics.errors_by_type[error_type] += 1
 
-            self._save_to_disk()
+            self._mark_dirty_locked()
+
+        if self._flush_interval <= 0:
+            self.flush()
+
+    def record_pool_checkout(self, expert_name: str, reused: bool, setup_ms: float = 0.0) -> None:
+        """Record an instance checkout from the tool pool (reuse or fresh construction)."""
+        with self._lock:
+            metrics = self._get_or_create_expert(expert_name)
+            if reused:
+                metrics.pool_reuses += 1
+            else:
+                metrics.pool_creations += 1
+                metrics.pool_setup_ms += setup_ms
+            self._mark_dirty_locked()
+
+        if self._flush_interval <= 0:
+            self.flush()
+
+    def record_code_facts(
+        self, expert_name: str, parses: int, reuses: int, parse_ms: float = 0.0, saved_ms: float = 0.0
+    ) -> None:
+        """Record the shared AST analyses of one execution (parsed vs served from the facts cache)."""
+        with self._lock:
+            metrics = self._get_or_create_expert(expert_name)
+            metrics.code_facts_parses += parses
+            metrics.code_facts_reuses += reuses
+            metrics.code_facts_parse_ms += parse_ms
+            metrics.code_facts_saved_ms += saved_ms
+            self._mark_dirty_locked()
+
+        if self._flush_interval <= 0:
+            self.flush()
 
     def record_start(self, expert_name: str) -> float:
         """Record the start of an execution. Returns start timestamp."""
@@ -390,15 +615,101 @@ class MetricsCollector:
         self._PERSIST_DIR.mkdir(parents=True, exist_ok=True)
         return self._PERSIST_DIR / self._PERSIST_FILE
 
-    def _save_to_disk(self) -> None:
-        """Persist current metrics to disk (called after each recording)."""
+    def _mark_dirty_locked(self) -> None:
+        """Signale une modification non persistée (appelant détient ``_lock``)."""
+        now = time.monotonic()
+        if self._generation == self._saved_generation:
+            self._dirty_since = now
+        self._last_change = now
+        self._generation += 1
+        if self._flush_interval > 0:
+            self._ensure_flusher_locked()
+            self._wakeup.set()
+
+    def _ensure_flusher_locked(self) -> None:
+        if self._closed or (self._flusher is not None and self._flusher.is_alive()):
+            return
+        self._flusher = threading.Thread(target=self._flush_loop, name="metrics-flusher", daemon=True)
+        self._flusher.start()
+
+    def _flush_delay_locked(self) -> Optional[float]:
+        """Secondes avant la prochaine écriture due, ``None`` si rien à persister."""
+        if self._generation == self._saved_generation:
+            return None
+        now = time.monotonic()
+        quiet_deadline = self._last_change + self._flush_interval
+        staleness_deadline = self._dirty_since + self._max_staleness
+        return max(0.0, min(quiet_deadline, staleness_deadline) - now)
+
+    def _flush_loop(self) -> None:
+        """Boucle du thread flusher : attend d'être réveillé puis écrit à l'échéance."""
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            while True:
+                with self._lock:
+                    if self._closed:
+                        return
+                    delay = self._flush_delay_locked()
+                if delay is None:
+                    break
+                if delay > 0:
+                    # Un nouvel enregistrement réveille l'attente : l'échéance est recalculée.
+                    self._wakeup.wait(delay)
+                    self._wakeup.clear()
+                    continue
+                self.flush()
+
+    def flush(self) -> bool:
+        """Persist pending metrics now. Returns ``True`` if a write happened."""
+        with self._flush_io_lock:
+            with self._lock:
+                if self._generation == self._saved_generation:
+                    return False
+                generation = self._generation
+                snapshot_at = time.monotonic()
+                data = {name: m.to_dict() for name, m in self._experts.items()}
+            saved = self._save_to_disk(data)
+            with self._lock:
+                if not saved:
+                    # Échec d'I/O : on retente après un intervalle plutôt qu'en boucle.
+                    self._dirty_since = self._last_change = time.monotonic()
+                    return False
+                self._saved_generation = max(self._saved_generation, generation)
+                if self._generation != self._saved_generation:
+                    # Les modifications restantes sont postérieures au snapshot.
+                    self._dirty_since = snapshot_at
+            return True
+
+    def close(self) -> None:
+        """Flush pending metrics and stop the background flusher."""
+        self.flush()
+        with self._lock:
+            self._closed = True
+            flusher = self._flusher
+        self._wakeup.set()
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(timeout=5.0)
+
+    def _save_to_disk(self, data: Dict[str, Any]) -> bool:
+        """Écrit ``data`` atomiquement (fichier temporaire + fsync + rename)."""
         try:
-            data = {name: m.to_dict() for name, m in self._experts.items()}
             path = self._persist_path()
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix="metrics_", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, default=str, separators=(",", ":"))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+            return True
         except OSError as exc:
             logger.debug("metrics persist error: %s", exc)
+            return False
 
     def _load_from_disk(self) -> None:
         """Load metrics from disk on startup."""
@@ -409,21 +720,7 @@ class MetricsCollector:
             with open(path, encoding="utf-8") as f:
                 data = json.load(f)
             for name, d in data.items():
-                m = ExpertMetrics(expert_name=name)
-                m.total_executions = d.get("total_executions", 0)
-                m.successful_executions = d.get("successful_executions", 0)
-                m.failed_executions = d.get("failed_executions", 0)
-                m.total_latency_ms = d.get("avg_latency_ms", 0) * m.total_executions
-                m.total_input_tokens = d.get("total_input_tokens", 0)
-                m.total_output_tokens = d.get("total_output_tokens", 0)
-                m.total_cost = d.get("total_cost_usd", 0)
-                m.last_execution_time = d.get("last_execution_time", 0)
-                min_lat = d.get("min_latency_ms", 0)
-                m.min_latency_ms = min_lat if min_lat > 0 else float("inf")
-                m.max_latency_ms = d.get("max_latency_ms", 0)
-                m.errors_by_type = defaultdict(int, d.get("errors_by_type", {}))
-                m.latency_samples = list(d.get("latency_samples", []))
-                self._experts[name] = m
+                self._experts[name] = ExpertMetrics.from_dict(name, d)
         except (OSError, json.JSONDecodeError) as exc:
             logger.debug("metrics load error: %s", exc)
 
@@ -432,17 +729,36 @@ class MetricsCollector:
         with self._lock:
             self._experts.clear()
             self._load_from_disk()
+            self._saved_generation = self._generation
+
+    def merge_snapshot(self, data: Dict[str, Dict[str, Any]]) -> None:
+        """Merge a ``metrics.json``-shaped snapshot (another process/replica) into this collector.
+
+        Counters add up and latency sketches merge exactly, so the combined
+        percentiles are those of the union of both traffics. Meant for read-side
+        aggregation (dashboard): the merge itself does not schedule a write.
+        """
+        with self._lock:
+            for name, d in data.items():
+                incoming = ExpertMetrics.from_dict(name, d)
+                current = self._experts.get(name)
+                if current is None:
+                    self._experts[name] = incoming
+                else:
+                    current.merge(incoming)
 
     def reset(self) -> None:
         """Reset all metrics."""
         with self._lock:
             self._experts.clear()
-            self._save_to_disk()
+            self._mark_dirty_locked()
+        self.flush()
 
     def reset_expert(self, expert_name: str) -> None:
         """Reset metrics for a specific expert."""
         with self._lock:
-            self._experts.pop(expert_name, None)
+            if self._experts.pop(expert_name, None) is not None:
+                self._mark_dirty_locked()
 
 
 # Singleton instance
@@ -457,6 +773,9 @@ def get_metrics_collector() -> MetricsCollector:
         with _metrics_lock:
             if _metrics_collector is None:
                 _metrics_collector = MetricsCollector()
+                # Filet pour les process sans lifespan (pilote CLI) : rien de
+                # modifié ne doit être perdu à la sortie normale.
+                atexit.register(_metrics_collector.flush)
     return _metrics_collector
 
 
@@ -19,6 +19,8 @@ from typing import Optional, Tuple
 _last_usage: contextvars.ContextVar[Optional[Tuple[int, int, str]]] = contextvars.ContextVar(
     "collegue_last_sampling_usage", default=None
 )
+# Nombre d'appels servis par le cache de réponses LLM depuis la dernière capture.
+_cache_hits: contextvars.ContextVar[int] = contextvars.ContextVar("collegue_sampling_cache_hits", default=0)
 
 
 @dataclass
@@ -26,6 +28,7 @@ class UsageCapture:
     """Résultat d'une capture isolée, renseigné à la sortie du contexte."""
 
     usage: Optional[Tuple[int, int, str]] = None
+    cache_hits: int = 0
 
 
 @contextmanager
@@ -37,11 +40,14 @@ def capture_usage():
     """
     captured = UsageCapture()
     token = _last_usage.set(None)
+    hits_token = _cache_hits.set(0)
     try:
         yield captured
     finally:
         captured.usage = _last_usage.get()
+        captured.cache_hits = _cache_hits.get()
         _last_usage.reset(token)
+        _cache_hits.reset(hits_token)
 
 
 def record_usage(prompt_tokens: int, completion_tokens: int, model: str = "") -> None:
@@ -61,6 +67,16 @@ def record_usage(prompt_tokens: int, completion_tokens: int, model: str = "") ->
     _last_usage.set((prev_p + prompt_tokens, prev_c + completion_tokens, model))
 
 
+def record_cache_hit(model: str = "") -> None:
+    """Signale un appel servi par le cache de réponses : 0 token, 0 coût.
+
+    L'usage est tout de même renseigné (à zéro) pour que l'appelant distingue
+    « appel gratuit prouvé » de « usage inconnu » et que les budgets restent exacts.
+    """
+    record_usage(0, 0, model)
+    _cache_hits.set(_cache_hits.get() + 1)
+
+
 def take_usage() -> Optional[Tuple[int, int, str]]:
     """Récupère et remet à zéro l'usage cumulé.
 
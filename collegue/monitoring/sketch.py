@@ -0,0 +1,159 @@
+"""
+Quantile sketch for expert latencies.
+
+DDSketch-style logarithmic buckets: each positive value ``v`` falls into bucket
+``ceil(log(v) / log(gamma))`` with ``gamma = (1 + alpha) / (1 - alpha)``, so any
+quantile is returned with a relative error bounded by ``alpha``. Memory is fixed
+(``max_buckets``), sketches merge exactly by adding bucket counts (replicas,
+dashboard), and a percentile read costs O(buckets) whatever the traffic.
+"""
+
+import math
+from typing import Any, Dict, Iterable, Optional
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+# Plus petite valeur indexée (ms) : en dessous, on compte dans le seau zéro.
+MIN_INDEXABLE_VALUE = 1e-3
+
+
+class LatencySketch:
+    """Mergeable, fixed-memory quantile sketch (relative accuracy ``alpha``)."""
+
+    __slots__ = ("alpha", "max_buckets", "_gamma_log", "_buckets", "_zero_count", "_count", "_min", "_max")
+
+    def __init__(self, alpha: float = DEFAULT_RELATIVE_ACCURACY, max_buckets: int = DEFAULT_MAX_BUCKETS):
+        if not 0.0 < alpha < 1.0:
+            raise ValueError(f"alpha doit être dans ]0, 1[ (reçu {alpha})")
+        self.alpha = alpha
+        self.max_buckets = max(1, int(max_buckets))
+        self._gamma_log = math.log((1.0 + alpha) / (1.0 - alpha))
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    # ── écriture ─────────────────────────────────────────────────────────────
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record ``value`` (negative values are clamped to 0)."""
+        if count <= 0 or math.isnan(value):
+            return
+        value = max(0.0, float(value))
+        if value <= MIN_INDEXABLE_VALUE:
+            self._zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._gamma_log)
+            self._buckets[key] = self._buckets.get(key, 0) + count
+            if len(self._buckets) > self.max_buckets:
+                self._collapse()
+        self._count += count
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def update(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "LatencySketch") -> None:
+        """Add ``other``'s counts into this sketch (same ``alpha`` required)."""
+        if other._count == 0:
+            return
+        if not math.isclose(other.alpha, self.alpha):
+            raise ValueError(f"sketches incompatibles (alpha {self.alpha} ≠ {other.alpha})")
+        for key, n in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + n
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+        self._zero_count += other._zero_count
+        self._count += other._count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    def _collapse(self) -> None:
+        """Fusionne les seaux les plus bas pour respecter ``max_buckets``.
+
+        Les queues hautes (p95/p99) sont ce qui compte pour la latence : on
+        sacrifie la précision des plus petites valeurs.
+        """
+        keys = sorted(self._buckets)
+        excess = len(keys) - self.max_buckets
+        if excess <= 0:
+            return
+        target = keys[excess]
+        moved = sum(self._buckets.pop(k) for k in keys[:excess])
+        self._buckets[target] += moved
+
+    # ── lecture ──────────────────────────────────────────────────────────────
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def _bucket_value(self, key: int) -> float:
+        # Milieu (au sens relatif) de ]gamma^(k-1), gamma^k] : erreur relative ≤ alpha.
+        return 2.0 * math.exp(key * self._gamma_log) / (1.0 + math.exp(self._gamma_log))
+
+    def quantile(self, q: float) -> float:
+        """Estimated ``q``-quantile (0 ≤ q ≤ 1); 0.0 for an empty sketch."""
+        q = min(1.0, max(0.0, q))
+        return self.quantiles((q,))[q]
+
+    def quantiles(self, qs: Iterable[float]) -> Dict[float, float]:
+        """Several quantiles in a single ascending pass over the buckets."""
+        wanted = sorted(set(min(1.0, max(0.0, q)) for q in qs))
+        result = {q: 0.0 for q in wanted}
+        if self._count == 0:
+            return result
+        pending = [(q, q * (self._count - 1)) for q in wanted]
+        i = 0
+        seen = self._zero_count
+        # Seau zéro : toutes ses valeurs sont ≤ MIN_INDEXABLE_VALUE, le min observé les représente.
+        while i < len(pending) and pending[i][1] < seen:
+            result[pending[i][0]] = self._min
+            i += 1
+        for key in sorted(self._buckets):
+            if i >= len(pending):
+                break
+            seen += self._buckets[key]
+            value = min(max(self._bucket_value(key), self._min), self._max)
+            while i < len(pending) and pending[i][1] < seen:
+                result[pending[i][0]] = value
+                i += 1
+        for q, _ in pending[i:]:
+            result[q] = self._max
+        return result
+
+    # ── sérialisation ────────────────────────────────────────────────────────
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact JSON form: ``{"a": alpha, "z": zero_count, "b": {key: count}, ...}``."""
+        return {
+            "a": self.alpha,
+            "n": self._count,
+            "z": self._zero_count,
+            "min": self._min if self._count else 0.0,
+            "max": self._max if self._count else 0.0,
+            "b": {str(k): n for k, n in sorted(self._buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]], max_buckets: int = DEFAULT_MAX_BUCKETS) -> "LatencySketch":
+        if not data:
+            return cls(max_buckets=max_buckets)
+        sketch = cls(alpha=float(data.get("a", DEFAULT_RELATIVE_ACCURACY)), max_buckets=max_buckets)
+        sketch._buckets = {int(k): int(n) for k, n in (data.get("b") or {}).items() if int(n) > 0}
+        sketch._zero_count = int(data.get("z", 0))
+        sketch._count = sketch._zero_count + sum(sketch._buckets.values())
+        if sketch._count:
+            sketch._min = float(data.get("min", 0.0))
+            sketch._max = float(data.get("max", 0.0))
+        if len(sketch._buckets) > sketch.max_buckets:
+            sketch._collapse()
+        return sketch
+
+    def copy(self) -> "LatencySketch":
+        clone = LatencySketch(alpha=self.alpha, max_buckets=self.max_buckets)
+        clone.merge(self)
+        return clone
@@ -1,7 +1,23 @@
+import logging
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from .base import BaseParser, Declaration, DeclarationType, Import, ImportType
+from .js_tokenizer import tokenize, tree_sitter_available, tree_sitter_tokenize
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _configured_backend() -> str:
+    """Backend de tokenisation de ``JS_TOKENIZER_BACKEND`` (``regex`` par défaut)."""
+    try:
+        from collegue.config import settings
+
+        return str(getattr(settings, "JS_TOKENIZER_BACKEND", "regex") or "regex")
+    except Exception:
+        return "regex"
 
 
 class JSParser(BaseParser):
@@ -116,183 +132,25 @@ class JSParser(BaseParser):
         "JSON",
     }
 
-    def __init__(self, content: str, filename: Optional[str] = None):
+    def __init__(self, content: str, filename: Optional[str] = None, backend: Optional[str] = None):
         super().__init__(content, filename)
+        self.backend = backend or _configured_backend()
         self.tokens = self._tokenize()
 
     def _tokenize(self) -> List[Tuple[str, int, int, str]]:
-        tokens = []
-        line = 1
-        col = 1
-        i = 0
-        content = self.content
-        while i < len(content):
-            char = content[i]
-            if char in " \t":
-                col += 1
-                i += 1
-                continue
-            if char == "\n":
-                line += 1
-                col = 1
-                i += 1
-                continue
-            if char == "/":
-                if i + 1 < len(content) and content[i + 1] == "/":
-                    while i < len(content) and content[i] != "\n":
-                        i += 1
-                    continue
-                if i + 1 < len(content) and content[i + 1] == "*":
-                    i += 2
-                    while i < len(content) - 1 and not (content[i] == "*" and content[i + 1] == "/"):
-                        if content[i] == "\n":
-                            line += 1
-                            col = 1
-                        else:
-                            col += 1
-                        i += 1
-                    i += 2
-                    continue
-                is_regex = True
-                if tokens:
-                    prev_type = tokens[-1][0]
-                    if prev_type in ("IDENT", "NUMBER", ")", "]"):
-                        is_regex = False
-                if is_regex and i + 1 < len(content) and content[i + 1] not in ("=", " ", "\n", "\t"):
-                    start_line, start_col = line, col
-                    value = char
-                    i += 1
-                    col += 1
-                    while i < len(content) and content[i] != "/":
-                        if content[i] == "\\":
-                            value += content[i : i + 2]
-                            i += 2
-                            col += 2
-                        elif content[i] == "\n":
-                            break
-                        else:
-                            value += content[i]
-                            i += 1
-                            col += 1
-                    if i < len(content) and content[i] == "/":
-                        value += content[i]
-                        i += 1
-                        col += 1
-                        while i < len(content) and content[i].isalpha():
-                            value += content[i]
-                            i += 1
-                            col += 1
-                        tokens.append(("STRING", start_line, start_col, value))
-                        continue
-                start_line, start_col = line, col
-                value = "/"
-                i += 1
-                col += 1
-                if i < len(content) and content[i] == "=":
-                    value += "="
-                    i += 1
-                    col += 1
-                tokens.append(("OP", start_line, start_col, value))
-                continue
-            if char in "\"'":
-                quote = char
-                start_line, start_col = line, col
-                value = char
-                i += 1
-                col += 1
-                while i < len(content) and content[i] != quote:
-                    if content[i] == "\\":
-                        value += content[i : i + 2]
-                        i += 2
-                        col += 2
-                    elif content[i] == "\n":
-                        value += content[i]
-                        line += 1
-                        col = 1
-                        i += 1
-                    else:
-                        value += content[i]
-                        i += 1
-                        col += 1
-                if i < len(content):
-                    value += content[i]
-                    i += 1
-                    col += 1
-                tokens.append(("STRING", start_line, start_col, value))
-                continue
-            if char == "`":
-                start_line, start_col = line, col
-                value = char
-                i += 1
-                col += 1
-                depth = 0
-                while i < len(content):
-                    c = content[i]
-                    if c == "\\":
-                        value += content[i : i + 2]
-                        i += 2
-                        col += 2
-                    elif c == "$" and i + 1 < len(content) and content[i + 1] == "{":
-                        value += "${"
-                        i += 2
-                        col += 2
-                        depth += 1
-                    elif c == "{" and depth > 0:
-                        value += c
-                        i += 1
-                        col += 1
-                        depth += 1
-                    elif c == "}" and depth > 0:
-                        value += c
-                        i += 1
-                        col += 1
-                        depth -= 1
-                    elif c == "`" and depth == 0:
-                        value += c
-                        i += 1
-                        col += 1
-                        break
-                    elif c == "\n":
-                        value += c
-                        line += 1
-                        col = 1
-                        i += 1
-                    else:
-                        value += c
-                        i += 1
-                        col += 1
-                tokens.append(("STRING", start_line, start_col, value))
-                continue
-            if char.isalpha() or char == "_" or char == "$":
-                start_line, start_col = line, col
-                value = ""
-                while i < len(content) and (content[i].isalnum() or content[i] in "_$"):
-                    value += content[i]
-                    i += 1
-                    col += 1
-                if value in self.RESERVED_KEYWORDS:
-                    tokens.append(("KEYWORD", start_line, start_col, value))
-                else:
-                    tokens.append(("IDENT", start_line, start_col, value))
-                continue
-            start_line, start_col = line, col
-            if char in "{}[](),;:":
-                tokens.append((char, start_line, start_col, char))
-                i += 1
-                col += 1
-            elif char in "+-*/%=!<>&|^~":
-                value = char
-                i += 1
-                col += 1
-                if i < len(content) and content[i] in "=+-":
-                    value += content[i]
-                    i += 1
-                    col += 1
-                tokens.append(("OP", start_line, start_col, value))
-            else:
-                i += 1
-                col += 1
-        return tokens
+        if self.backend == "tree_sitter" and tree_sitter_available():
+            try:
+                return tree_sitter_tokenize(self.content, self.RESERVED_KEYWORDS, self._tree_sitter_grammar())
+            except Exception as e:
+                logger.debug("Tokenizer tree-sitter en échec (%s), repli regex: %s", self.filename or "<source>", e)
+        return tokenize(self.content, self.RESERVED_KEYWORDS)
+
+    def _tree_sitter_grammar(self) -> str:
+        if self.filename.endswith(".tsx"):
+            return "tsx"
+        if self.filename.endswith((".ts", ".mts", ".cts")) or self._detect_language() == "typescript":
+            return "typescript"
+        return "javascript"
 
     def find_imports(self) -> List[Import]:
         imports = []
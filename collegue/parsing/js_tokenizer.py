@@ -0,0 +1,299 @@
+"""
+Tokenizers du JSParser.
+
+:func:`tokenize` produit les tuples ``(type, ligne, colonne, valeur)`` consommés
+par :class:`~collegue.parsing.javascript.JSParser` à partir d'une regex maîtresse
+compilée : une itération Python par token ou par plage ignorée, au lieu d'une par
+caractère. Le flux est identique, particularités comprises, à celui de l'ancien
+tokenizer caractère par caractère (``tests/test_js_tokenizer.py``) :
+
+- nombres, ``.``, ``?``, ``@``… ne produisent aucun token ;
+- ``/`` ouvre une regex sauf après IDENT, ``)`` ou ``]`` ; une regex non terminée
+  sur sa ligne donne un OP ``/`` à la position du saut de ligne, lequel est
+  consommé sans incrémenter la ligne ;
+- les délimiteurs ``/*`` ``*/`` ne comptent pas dans la colonne, et un saut de
+  ligne échappé (``\\`` en fin de ligne dans une chaîne) pas dans la ligne.
+
+:func:`tree_sitter_tokenize` est un backend optionnel (paquets ``tree-sitter``,
+``tree-sitter-javascript`` et ``tree-sitter-typescript``) qui produit le même
+vocabulaire de tokens à partir d'un vrai arbre syntaxique : chaînes, templates,
+regex et commentaires y sont délimités exactement, positions réelles comprises.
+"""
+
+import re
+from functools import lru_cache
+from typing import Collection, Dict, List, Tuple
+
+Token = Tuple[str, int, int, str]
+
+_MASTER = re.compile(
+    "|".join(
+        (
+            r"(?P<IDENT>(?:[^\W\d]|\$)[\w$]*)",
+            r"(?P<SKIP>(?:\d|[^\w$/\"'`{}\[\](),;:+\-*%=!<>&|^~])+)",
+            r"(?P<PUNCT>[{}\[\](),;:])",
+            r"(?P<OP>[+\-*%=!<>&|^~][=+\-]?)",
+            r"(?P<STRING>\"(?:[^\"\\]+|\\[\s\S]?)*\"?|'(?:[^'\\]+|\\[\s\S]?)*'?)",
+            r"(?P<TEMPLATE>`)",
+            r"(?P<LINE_COMMENT>//[^\n]*)",
+            r"(?P<BLOCK_COMMENT>/\*)",
+            r"(?P<SLASH>/)",
+        )
+    )
+)
+# Plage sans chaîne, template, commentaire, regex ni caractère non ASCII : seuls
+# des mots, de la ponctuation et des opérateurs peuvent y commencer.
+_SIMPLE_RUN = re.compile(r"[^\"'`/\x80-\U0010ffff]*")
+_SIMPLE_SPLIT = re.compile(r"([A-Za-z_$][\w$]*|[{}\[\](),;:]|[+\-*%=!<>&|^~][=+\-]?)")
+_SIMPLE_TYPES = {char: char for char in "{}[](),;:"}
+_SIMPLE_TYPES.update({op + suffix: "OP" for op in "+-*%=!<>&|^~" for suffix in ("", "=", "+", "-")})
+_REGEX_BODY = re.compile(r"(?:[^/\\\n]+|\\[\s\S]?)*")
+_REGEX_FLAGS = re.compile(r"[^\W\d_]*")
+_TEMPLATE_EVENT = re.compile(r"\\[\s\S]?|\$\{|[{}`]")
+_ESCAPE_OR_NEWLINE = re.compile(r"\\[\s\S]?|\n")
+
+# Types de token après lesquels ``/`` est une division.
+_DIVISION_PREFIXES = ("IDENT", "NUMBER", ")", "]")
+
+
+def tokenize(content: str, keywords: Collection[str]) -> List[Token]:
+    """Tokens ``(type, ligne, colonne, valeur)`` de ``content``.
+
+    La colonne vaut ``position - col_base`` : chaque saut de ligne compté replace
+    ``col_base`` sur lui-même, et les caractères non comptés (délimiteurs de
+    commentaire bloc) le décalent. Les plages « simples » sont découpées d'un
+    seul ``split`` ; la boucle générale ne traite que les chaînes, commentaires,
+    regex et caractères non ASCII.
+    """
+    tokens: List[Token] = []
+    append = tokens.append
+    match = _MASTER.match
+    simple_run = _SIMPLE_RUN.match
+    types = dict(_SIMPLE_TYPES)
+    types.update(dict.fromkeys(keywords, "KEYWORD"))
+    n = len(content)
+    pos = 0
+    line = 1
+    col_base = -1
+    while pos < n:
+        run_end = simple_run(content, pos).end()
+        if run_end < n and content[run_end] > "\x7f":
+            # Un mot collé à un caractère non ASCII est laissé en entier à la boucle générale.
+            while run_end > pos and (content[run_end - 1].isalnum() or content[run_end - 1] in "_$"):
+                run_end -= 1
+        if run_end > pos:
+            line, col_base = _tokenize_simple(content, pos, run_end, line, col_base, tokens, types)
+            pos = run_end
+            if pos >= n:
+                break
+        m = match(content, pos)
+        kind = m.lastgroup
+        end = m.end()
+        if kind == "IDENT":
+            value = m.group()
+            first = value[0]
+            if first > "\x7f" and not first.isalpha():
+                # Caractère numérique non décimal ('²', 'Ⅻ'…) : ignoré comme un chiffre.
+                pos += 1
+                continue
+            append(("KEYWORD" if value in keywords else "IDENT", line, pos - col_base, value))
+        elif kind == "SKIP":
+            newlines = content.count("\n", pos, end)
+            if newlines:
+                line += newlines
+                col_base = content.rfind("\n", pos, end)
+        elif kind == "PUNCT":
+            value = m.group()
+            append((value, line, pos - col_base, value))
+        elif kind == "OP":
+            append(("OP", line, pos - col_base, m.group()))
+        elif kind == "STRING" or kind == "TEMPLATE":
+            if kind == "TEMPLATE":
+                end = _template_end(content, pos)
+            value = content[pos:end]
+            append(("STRING", line, pos - col_base, value))
+            if "\n" in value:
+                newlines, last = _counted_newlines(value)
+                if newlines:
+                    line += newlines
+                    col_base = pos + last
+        elif kind == "BLOCK_COMMENT":
+            close = content.find("*/", pos + 2)
+            if close < 0:
+                break
+            newlines = content.count("\n", pos + 2, close)
+            if newlines:
+                line += newlines
+                col_base = content.rfind("\n", pos + 2, close) + 2
+            else:
+                col_base += 4
+            end = close + 2
+        elif kind == "SLASH":
+            start = pos
+            if (not tokens or tokens[-1][0] not in _DIVISION_PREFIXES) and end < n and content[end] not in "= \n\t":
+                body_end = _REGEX_BODY.match(content, end).end()
+                if body_end < n and content[body_end] == "/":
+                    end = _flags_end(content, body_end + 1)
+                    append(("STRING", line, pos - col_base, content[pos:end]))
+                    pos = end
+                    continue
+                # Regex non terminée : l'OP est placé là où la lecture s'est arrêtée,
+                # et le caractère d'arrêt (saut de ligne) est consommé sans compter de ligne.
+                start = body_end
+                if body_end == n and (n - len(content.rstrip("\\"))) % 2:
+                    # Échappement coupé par la fin du fichier : l'ancien curseur avait dépassé d'un cran.
+                    start = n + 1
+                end = start + 1
+            value = "/"
+            if end < n and content[end] == "=":
+                value = "/="
+                end += 1
+            append(("OP", line, start - col_base, value))
+        pos = end
+    return tokens
+
+
+def _tokenize_simple(
+    content: str, start: int, end: int, line: int, col_base: int, tokens: List[Token], types: Dict[str, str]
+) -> Tuple[int, int]:
+    """Tokenise la plage simple ``[start, end)`` ; renvoie ``(line, col_base)`` à sa fin."""
+    parts = _SIMPLE_SPLIT.split(content[start:end])
+    append = tokens.append
+    get_type = types.get
+    col = start - col_base
+    # ``split`` alterne intervalle ignoré / token et se termine par un intervalle
+    # (nombre impair de morceaux : le dernier est traité après la boucle).
+    pairs = iter(parts)
+    for gap, value in zip(pairs, pairs, strict=False):
+        if "\n" in gap:
+            line += gap.count("\n")
+            col = len(gap) - gap.rfind("\n")
+        else:
+            col += len(gap)
+        append((get_type(value, "IDENT"), line, col, value))
+        col += len(value)
+    gap = parts[-1]
+    if "\n" in gap:
+        line += gap.count("\n")
+        col = len(gap) - gap.rfind("\n")
+    else:
+        col += len(gap)
+    return line, end - col
+
+
+def _template_end(content: str, start: int) -> int:
+    """Fin du template littéral ouvert en ``start`` (``${…}`` imbriqués compris)."""
+    depth = 0
+    for m in _TEMPLATE_EVENT.finditer(content, start + 1):
+        event = m.group()
+        if event == "`":
+            if not depth:
+                return m.end()
+        elif event == "${":
+            depth += 1
+        elif event == "{":
+            if depth:
+                depth += 1
+        elif event == "}":
+            if depth:
+                depth -= 1
+    return len(content)
+
+
+def _counted_newlines(value: str) -> Tuple[int, int]:
+    """Sauts de ligne non échappés de ``value`` et index du dernier (-1 si aucun)."""
+    if "\\" not in value:
+        return value.count("\n"), value.rfind("\n")
+    count = 0
+    last = -1
+    for m in _ESCAPE_OR_NEWLINE.finditer(value):
+        if m.group() == "\n":
+            count += 1
+            last = m.start()
+    return count, last
+
+
+def _flags_end(content: str, start: int) -> int:
+    end = _REGEX_FLAGS.match(content, start).end()
+    flags = content[start:end]
+    if not flags.isascii():
+        for offset, char in enumerate(flags):
+            if not char.isalpha():
+                return start + offset
+    return end
+
+
+# --- Backend tree-sitter (optionnel) -----------------------------------------
+
+_TS_STRING_NODES = {"string", "template_string", "regex"}
+_TS_SKIPPED_NODES = {"comment", "html_comment", "hash_bang_line", "number"}
+_PUNCT = set("{}[](),;:")
+_OP_CHARS = set("+-*/%=!<>&|^~")
+_WORD = re.compile(r"(?:[^\W\d]|\$)[\w$]*\Z")
+
+
+@lru_cache(maxsize=1)
+def tree_sitter_available() -> bool:
+    """Vrai si ``tree_sitter`` et les grammaires JavaScript/TypeScript sont installés."""
+    try:
+        _ts_language("javascript")
+        _ts_language("typescript")
+    except Exception:
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _ts_language(grammar: str):
+    from tree_sitter import Language
+
+    if grammar == "javascript":
+        import tree_sitter_javascript
+
+        return Language(tree_sitter_javascript.language())
+    import tree_sitter_typescript
+
+    if grammar == "tsx":
+        return Language(tree_sitter_typescript.language_tsx())
+    return Language(tree_sitter_typescript.language_typescript())
+
+
+def tree_sitter_tokenize(content: str, keywords: Collection[str], grammar: str = "javascript") -> List[Token]:
+    """Tokens de ``content`` depuis l'arbre tree-sitter (``grammar`` : javascript, typescript ou tsx).
+
+    Les feuilles sont ramenées au vocabulaire de :func:`tokenize` : mots →
+    KEYWORD/IDENT, ponctuation, opérateurs → OP, chaînes/templates/regex →
+    STRING d'un seul tenant ; nombres, commentaires et le reste sont ignorés.
+    """
+    from tree_sitter import Parser
+
+    source = content.encode("utf-8", "surrogatepass")
+    # Un Parser par appel : l'objet n'est pas garanti thread-safe, la grammaire est partagée.
+    tree = Parser(_ts_language(grammar)).parse(source)
+    ascii_only = content.isascii()
+    tokens: List[Token] = []
+    stack = [tree.root_node]
+    while stack:
+        node = stack.pop()
+        # Les types de nœud ne valent que pour les nœuds nommés : en TypeScript,
+        # ``string`` / ``number`` sont aussi des mots-clés de type anonymes.
+        kind = node.type if node.is_named else ""
+        if node.child_count and kind not in _TS_STRING_NODES:
+            stack.extend(reversed(node.children))
+            continue
+        if kind in _TS_SKIPPED_NODES or node.start_byte == node.end_byte:
+            continue
+        text = source[node.start_byte : node.end_byte].decode("utf-8", "replace")
+        row, column = node.start_point
+        if not ascii_only:
+            column = len(source[node.start_byte - column : node.start_byte].decode("utf-8", "replace"))
+        position = (row + 1, column + 1)
+        if kind in _TS_STRING_NODES:
+            tokens.append(("STRING", *position, text))
+        elif text in _PUNCT:
+            tokens.append((text, *position, text))
+        elif _WORD.match(text):
+            tokens.append(("KEYWORD" if text in keywords else "IDENT", *position, text))
+        elif text[0] in _OP_CHARS:
+            tokens.append(("OP", *position, text))
+    return tokens
@@ -88,6 +88,14 @@ def _sandbox_dns(settings_obj) -> tuple:
     return tuple(server.strip() for server in raw.split(",") if server.strip())
 
 
+def _sandbox_limiter(settings_obj):
+    """Plafond partagé de conteneurs simultanés — ``SANDBOX_MAX_CONTAINERS`` (0 = aucun)."""
+    from collegue.sandbox import DEFAULT_CONTAINER_LIMITER
+
+    DEFAULT_CONTAINER_LIMITER.set_limit(int(getattr(settings_obj, "SANDBOX_MAX_CONTAINERS", 4) or 0))
+    return DEFAULT_CONTAINER_LIMITER
+
+
 def _sandbox_pip_cache(settings_obj):
     """Cache pip persistant du sandbox (#496) — ``SANDBOX_PIP_CACHE_DIR`` (chemin hôte).
 
@@ -170,6 +178,7 @@ def _build_sandbox(settings_obj):  # pragma: no cover - infra réelle (integrati
         memory=str(getattr(settings_obj, "SANDBOX_MEMORY", "6g") or "6g"),
         cpus=str(getattr(settings_obj, "SANDBOX_CPUS", "2.0") or "2.0"),
         timeout=float(getattr(settings_obj, "SANDBOX_TIMEOUT", 2400.0) or 2400.0),
+        limiter=_sandbox_limiter(settings_obj),
     )
 
 
@@ -181,8 +190,11 @@ def _build_gate_sandbox(settings_obj):  # pragma: no cover - infra réelle (inte
     ne reçoit **aucun** environnement LLM ni montage des identifiants d'abonnement.
     Les tests, hooks pytest et scripts d'installation du projet sont non fiables et
     ne doivent jamais pouvoir lire ces secrets.
+
+    ``SANDBOX_POOL_ENABLED`` : les passes réutilisent des conteneurs chauds
+    (:mod:`collegue.sandbox.pool`) ; le coder, lui, garde un ``docker run`` par exécution.
     """
-    from collegue.sandbox import DEFAULT_SANDBOX_IMAGE, DockerSandbox
+    from collegue.sandbox import DEFAULT_SANDBOX_IMAGE, DockerSandbox, get_container_pool
 
     return DockerSandbox(
         image=str(getattr(settings_obj, "SANDBOX_IMAGE", DEFAULT_SANDBOX_IMAGE) or DEFAULT_SANDBOX_IMAGE),
@@ -192,6 +204,8 @@ def _build_gate_sandbox(settings_obj):  # pragma: no cover - infra réelle (inte
         memory=str(getattr(settings_obj, "SANDBOX_MEMORY", "6g") or "6g"),
         cpus=str(getattr(settings_obj, "SANDBOX_CPUS", "2.0") or "2.0"),
         timeout=float(getattr(settings_obj, "SANDBOX_TIMEOUT", 2400.0) or 2400.0),
+        limiter=_sandbox_limiter(settings_obj),
+        pool=get_container_pool(settings_obj),
     )
 
 
@@ -254,11 +268,33 @@ def _gate_options(settings_obj, *, manager=None, project_id: Optional[int] = Non
         options["forbidden_files_guard"] = False
     if bool(getattr(settings_obj, "GATE_FORBIDDEN_FILES_BLOCK", False)):
         options["forbidden_files_block"] = True
+    # Dépendances pré-construites (opt-in) : clé émise seulement quand activé.
+    from collegue.executor.deps_env import get_deps_env_cache
+
+    deps_env_cache = get_deps_env_cache(settings_obj)
+    if deps_env_cache is not None:
+        options["deps_env_cache"] = deps_env_cache
+    # Passe rapide des tests impactés (opt-in) : même convention.
+    from collegue.executor.test_impact import get_test_impact_index
+
+    test_impact = get_test_impact_index(settings_obj)
+    if test_impact is not None:
+        options["test_impact"] = test_impact
     test_command = getattr(settings_obj, "GATE_TEST_COMMAND", None)
     if test_command:
         options["test_command"] = str(test_command)
     if bool(getattr(settings_obj, "GATE_ADEQUACY", False)):
         options["adequacy_checker"] = _build_adequacy_checker(settings_obj)
+    # Ordonnancement des passes LLM : clés émises seulement hors défaut.
+    if bool(getattr(settings_obj, "GATE_CONCURRENT_ADEQUACY", False)):
+        options["concurrent_adequacy"] = True
+    from collegue.executor.quality_gate import CANCEL_ON_RED_ADEQUACY, CANCEL_ON_RED_POLICIES
+
+    cancel_on_red = str(getattr(settings_obj, "GATE_LLM_CANCEL_ON_RED", CANCEL_ON_RED_ADEQUACY) or "").strip()
+    if cancel_on_red and cancel_on_red != CANCEL_ON_RED_ADEQUACY:
+        if cancel_on_red not in CANCEL_ON_RED_POLICIES:
+            raise ValueError(f"GATE_LLM_CANCEL_ON_RED inconnu : {cancel_on_red!r}")
+        options["cancel_on_red"] = cancel_on_red
     # §4.7 (Phase B, opt-in) : tests d'acceptation EXÉCUTABLES dérivés du SPEC, écrits
     # par un rôle indépendant du coder et lancés en sandbox (verdict objectif).
     configured_acceptance = bool(getattr(settings_obj, "GATE_ACCEPTANCE_TESTS", False))
@@ -9,6 +9,7 @@ import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ...core import paths
 from .models import PromptCategory, PromptExecution, PromptLibrary, PromptTemplate, PromptVariable
 
 logging.basicConfig(level=logging.INFO)
@@ -27,10 +28,17 @@ class PromptEngine:
         """
         self.library = PromptLibrary()
 
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        package_templates = os.path.join(os.path.dirname(current_dir), "templates")
+        # Catégories livrées avec le package, reprises si le stockage n'a pas les siennes.
+        self._seed_categories_path: Optional[str] = None
         if storage_path is None:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            parent_dir = os.path.dirname(current_dir)
-            self.storage_path = os.path.join(parent_dir, "templates")
+            home = paths.prompts_dir()
+            if home is None:
+                self.storage_path = package_templates
+            else:
+                self.storage_path = str(home / "templates")
+                self._seed_categories_path = os.path.join(package_templates, "categories.json")
         else:
             self.storage_path = storage_path
 
@@ -41,6 +49,8 @@ class PromptEngine:
     def _load_library(self):
         """Charge la bibliothèque de prompts depuis le stockage."""
         categories_path = os.path.join(self.storage_path, "categories.json")
+        if not os.path.exists(categories_path) and self._seed_categories_path:
+            categories_path = self._seed_categories_path
         if os.path.exists(categories_path):
             try:
                 with open(categories_path, "r", encoding="utf-8") as f:
@@ -11,6 +11,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ...core import paths
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +43,8 @@ class PromptVersion:
 
 class PromptVersionManager:
     def __init__(self, storage_path: str = None):
+        if storage_path is None and paths.prompts_dir() is not None:
+            storage_path = str(paths.prompts_dir() / "versions")
         self.storage_path = storage_path or os.path.join(os.path.dirname(__file__), "..", "versions")
         Path(self.storage_path).mkdir(parents=True, exist_ok=True)
         self.versions_file = os.path.join(self.storage_path, "versions.json")
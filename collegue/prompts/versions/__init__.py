@@ -7,14 +7,19 @@ import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ...core import paths
+
 
 def get_versions_file() -> Path:
     """
     Récupère le chemin du fichier de versions.
 
     Returns:
-        Path vers le fichier versions.json
+        Path vers le fichier versions.json (sous ``$COLLEGUE_HOME/prompts`` s'il est défini)
     """
+    home = paths.prompts_dir()
+    if home is not None:
+        return home / "versions" / "versions.json"
     return Path(__file__).parent / "versions.json"
 
 
@@ -67,6 +72,7 @@ def save_version_metrics(tool_name: str, version: str, metrics: Dict[str, Any])
             data[tool_name] = {}
         data[tool_name][version] = metrics
 
+        versions_file.parent.mkdir(parents=True, exist_ok=True)
         with open(versions_file, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
 
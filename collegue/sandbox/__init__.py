@@ -6,15 +6,25 @@ l'intégration OpenHands est différée en Phase 2).
 """
 
 from collegue.sandbox.executor import (
+    DEFAULT_CONTAINER_LIMITER,
     DEFAULT_SANDBOX_IMAGE,
+    ContainerLimiter,
     DockerSandbox,
     SandboxResult,
     SandboxUnavailable,
+    run_sandbox_tests,
 )
+from collegue.sandbox.pool import ContainerPool, get_container_pool, reset_container_pool
 
 __all__ = [
     "DockerSandbox",
     "SandboxResult",
     "SandboxUnavailable",
+    "ContainerLimiter",
+    "DEFAULT_CONTAINER_LIMITER",
     "DEFAULT_SANDBOX_IMAGE",
+    "run_sandbox_tests",
+    "ContainerPool",
+    "get_container_pool",
+    "reset_container_pool",
 ]
@@ -12,8 +12,22 @@ Durcissement appliqué :
   ``workspace_root`` confine les workspaces autorisés (recommandé en Phase 3) ;
 - **conteneur nommé + kill au timeout** : un ``docker run`` qui dépasse le délai ne
   laisse pas de conteneur orphelin (tuer le client ne tue pas le conteneur) ;
-- **sortie bornée** : stdout/stderr vont sur disque puis sont relus avec un plafond,
-  pour qu'une commande hostile ne fasse pas exploser la mémoire du parent.
+- **sortie bornée** : stdout/stderr vont sur disque puis sont relus avec un plafond
+  (API async : lus au fil de l'eau dans des tampons plafonnés), pour qu'une commande
+  hostile ne fasse pas exploser la mémoire du parent.
+
+API async (:meth:`DockerSandbox.run_command_async`, :meth:`DockerSandbox.run_tests_async`) :
+``asyncio.create_subprocess_exec`` au lieu d'un ``subprocess.run`` bloquant — la
+boucle d'événements (requêtes MCP, watchdog, progression ``ctx``) continue de tourner
+pendant un run pytest. L'annulation de la tâche tue le conteneur nommé, et un
+:class:`ContainerLimiter` partagé plafonne le nombre de conteneurs lancés en même
+temps. :func:`run_sandbox_tests` est le point d'entrée des appelants async : il
+retombe sur ``run_tests`` (dans un thread) pour les sandboxes sans API async.
+
+Pool de conteneurs chauds (opt-in, :class:`~collegue.sandbox.pool.ContainerPool`) :
+l'API async exécute alors la commande par ``docker exec`` dans un conteneur
+pré-démarré avec exactement le même argv durci (même workspace, mêmes limites)
+au lieu d'un ``docker run`` par passe.
 
 Architecture testable : la **construction** de la commande ``docker run`` est pure
 (testée sans Docker) ; l'**exécution** est testée par mock de subprocess en CI et
@@ -31,12 +45,22 @@ différée en Phase 2 ; le pilote Phase 3 câblera cet exécuteur).
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import os
+import re
+import signal
 import subprocess
 import tempfile
+import threading
 import uuid
+from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import List, Mapping, Optional, Tuple, Union
+from typing import TYPE_CHECKING, AsyncIterator, Deque, List, Mapping, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .pool import ContainerPool
 
 DEFAULT_SANDBOX_IMAGE = "collegue-sandbox:latest"
 # #496 : point de montage du cache pip persistant dans le conteneur.
@@ -47,6 +71,10 @@ SANDBOX_PIP_CACHE_MOUNT = "/tmp/.pip_cache"
 # creds NE peuvent PAS vivre sous /tmp (le ``--tmpfs /tmp`` les masquerait), d'où
 # le fail-loud si HOME pointe sous /tmp (cf. _build_run_argv).
 SANDBOX_OPENHANDS_AUTH_SUBPATH = ".openhands"
+# Racine des environnements de dépendances pré-construits du gate, montés en
+# lecture seule sous ``/deps_env/<entrée>`` (cf. collegue.executor.deps_env).
+SANDBOX_DEPS_ENV_MOUNT = "/deps_env"
+_DEPS_ENV_ENTRY_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]*\Z")
 
 # Code de sortie conventionnel pour un dépassement de délai (cf. coreutils timeout).
 TIMEOUT_EXIT_CODE = 124
@@ -55,6 +83,15 @@ TIMEOUT_EXIT_CODE = 124
 # consommé par le moteur (#461 : classification infra ; #464 : usage perdu).
 TIMEOUT_NOTE = "[sandbox] délai dépassé après"
 
+# Conteneurs lancés simultanément par l'API async (cf. ContainerLimiter).
+DEFAULT_MAX_CONTAINERS = 4
+
+# Commande de maintien en vie des conteneurs de pool (cf. ContainerPool).
+POOL_KEEPALIVE_CMD = ("sleep", "infinity")
+
+# Taille des lectures de stdout/stderr par l'API async.
+_READ_CHUNK = 64 * 1024
+
 
 class SandboxUnavailable(RuntimeError):
     """Docker indisponible, ou refus de s'exécuter (ex. en root)."""
@@ -68,12 +105,125 @@ class SandboxResult:
     stdout: str
     stderr: str
     timed_out: bool = False
+    # Temps d'obtention du conteneur (pool : réutilisé ≈ 0, démarré à froid sinon) ;
+    # ``None`` pour un ``docker run`` éphémère, où il n'est pas séparable de la commande.
+    startup_seconds: Optional[float] = None
 
     @property
     def ok(self) -> bool:
         return self.exit_code == 0 and not self.timed_out
 
 
+class ContainerLimiter:
+    """Plafond de conteneurs lancés simultanément par l'API async du sandbox.
+
+    Partagé entre boucles d'événements (celle du pilote et les boucles éphémères
+    de ``run_async_from_sync``) : l'état est protégé par un verrou de thread et un
+    créneau libéré est remis au plus ancien demandeur via ``call_soon_threadsafe``.
+    ``limit <= 0`` : pas de plafond. L'API synchrone (worker OpenHands) n'y passe
+    pas : une attente bloquante sur le thread de la boucle pourrait interbloquer
+    les conteneurs async qui détiennent les créneaux.
+    """
+
+    def __init__(self, limit: int = DEFAULT_MAX_CONTAINERS):
+        self._limit = int(limit)
+        self._active = 0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def set_limit(self, limit: int) -> None:
+        """Change le plafond ; un plafond relevé réveille aussitôt les demandeurs."""
+        with self._lock:
+            self._limit = int(limit)
+            self._wake_locked()
+
+    def _has_slot_locked(self) -> bool:
+        return self._limit <= 0 or self._active < self._limit
+
+    def _wake_locked(self) -> None:
+        while self._waiters and self._has_slot_locked():
+            loop, fut = self._waiters.popleft()
+            self._active += 1
+            try:
+                loop.call_soon_threadsafe(self._grant, fut)
+            except RuntimeError:  # boucle fermée entre-temps : créneau rendu
+                self._active -= 1
+
+    def _grant(self, fut: asyncio.Future) -> None:
+        if fut.done():  # demandeur annulé pendant la remise : le créneau est rendu
+            self.release()
+        else:
+            fut.set_result(None)
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self._has_slot_locked():
+                self._active += 1
+                return
+            fut = loop.create_future()
+            self._waiters.append((loop, fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            with self._lock:
+                if (loop, fut) in self._waiters:
+                    self._waiters.remove((loop, fut))
+                    raise
+            if fut.done() and not fut.cancelled():  # créneau reçu juste avant l'annulation
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            self._active -= 1
+            self._wake_locked()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+# Plafond partagé par défaut de tous les sandboxes (réglé par le runtime du pilote).
+DEFAULT_CONTAINER_LIMITER = ContainerLimiter()
+
+
+class _CappedBuffer:
+    """Garde les ``limit`` premiers octets d'un flux et compte le reste (jeté)."""
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._chunks: List[bytes] = []
+        self._kept = 0
+        self.total = 0
+
+    def feed(self, chunk: bytes) -> None:
+        self.total += len(chunk)
+        room = self._limit - self._kept
+        if room > 0:
+            kept = chunk[:room]
+            self._chunks.append(kept)
+            self._kept += len(kept)
+
+    def text(self) -> str:
+        text = b"".join(self._chunks).decode("utf-8", errors="replace")
+        if self.total > self._limit:
+            text += f"\n[sandbox] sortie tronquée à {self._limit} octets"
+        return text
+
+
 class DockerSandbox:
     """Exécute des commandes dans un conteneur Docker isolé et durci.
 
@@ -103,6 +253,9 @@ class DockerSandbox:
         env: Optional[Mapping[str, str]] = None,
         env_passthrough: Tuple[str, ...] = (),
         read_only: bool = True,
+        limiter: Optional[ContainerLimiter] = None,
+        pool: Optional["ContainerPool"] = None,
+        deps_mounts: Tuple[Tuple[str, str, bool], ...] = (),
     ):
         self.image = image
         self.network = network
@@ -141,6 +294,14 @@ class DockerSandbox:
         self.env = dict(env) if env else {}
         self.env_passthrough = tuple(env_passthrough)
         self.read_only = bool(read_only)
+        # Plafond de conteneurs simultanés de l'API async (partagé par défaut).
+        self.limiter = limiter if limiter is not None else DEFAULT_CONTAINER_LIMITER
+        # Pool de conteneurs chauds de l'API async (opt-in ; None = docker run par passe).
+        self.pool = pool
+        # Environnements de dépendances pré-construits : ``(dossier hôte, entrée,
+        # écrivable)`` montés sur /deps_env/<entrée>, en lecture seule sauf pendant
+        # leur construction. Vide (défaut) = argv inchangé.
+        self.deps_mounts = tuple(deps_mounts)
 
     # ── validation / construction (pur, testable sans Docker) ─────────────────────
 
@@ -217,6 +378,14 @@ class DockerSandbox:
                     "(le tmpfs /tmp masquerait le montage des creds d'abonnement)"
                 )
             argv += ["-v", f"{auth}:{home}/{SANDBOX_OPENHANDS_AUTH_SUBPATH}"]
+        # Environnements de dépendances du gate : même validation que le cache pip,
+        # hors confinement workspace_root ; lecture seule hors passe de construction.
+        for host_dir, entry, writable in self.deps_mounts:
+            env_dir = os.path.realpath(os.path.abspath(host_dir))
+            if ":" in env_dir or env_dir == os.path.sep or not _DEPS_ENV_ENTRY_RE.match(entry):
+                raise ValueError(f"environnement de dépendances invalide: {env_dir} -> {entry}")
+            mount = f"{env_dir}:{SANDBOX_DEPS_ENV_MOUNT}/{entry}"
+            argv += ["-v", mount if writable else f"{mount}:ro"]
         if self.read_only:
             argv += ["--read-only"]  # root FS en lecture seule
         argv += [
@@ -256,6 +425,30 @@ class DockerSandbox:
         ]
         return argv
 
+    def _build_pool_argv(self, workspace: str, name: str, label: str) -> List[str]:
+        """``docker run -d`` d'un conteneur de pool : argv durci de :meth:`_build_run_argv`, maintenu en vie."""
+        argv = self._build_run_argv(list(POOL_KEEPALIVE_CMD), workspace, name=name)
+        argv[2:2] = ["-d", "--label", label]
+        return argv
+
+    def _build_exec_argv(self, name: str, cmd: Union[str, List[str]]) -> List[str]:
+        """``docker exec`` dans un conteneur de pool (utilisateur, env et ``-w`` hérités du ``run``)."""
+        inner = ["sh", "-c", cmd] if isinstance(cmd, str) else list(cmd)
+        return [self.docker_bin, "exec", name, *inner]
+
+    def pool_profile(self, workspace: str) -> Tuple[str, ...]:
+        """Clé de pool : l'argv durci complet (image, limites, env, montages, workspace)."""
+        return tuple(self._build_run_argv(list(POOL_KEEPALIVE_CMD), workspace))
+
+    def with_options(self, **changes) -> "DockerSandbox":
+        """Copie du sandbox avec quelques attributs remplacés (ex. ``deps_mounts``, ``pool``)."""
+        clone = copy.copy(self)
+        for key, value in changes.items():
+            if not hasattr(self, key):
+                raise AttributeError(f"option de sandbox inconnue: {key}")
+            setattr(clone, key, value)
+        return clone
+
     # ── exécution ─────────────────────────────────────────────────────────────────
 
     def _read_capped(self, path: str) -> str:
@@ -274,13 +467,8 @@ class DockerSandbox:
         except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
             pass
 
-    def run_command(self, cmd: Union[str, List[str]], workspace: str) -> SandboxResult:
-        """Exécute ``cmd`` dans le sandbox, workspace monté sur ``/workspace``.
-
-        ``cmd`` peut être une chaîne (``sh -c`` dans le conteneur) ou un argv (liste).
-        Lève :class:`SandboxUnavailable` si Docker est absent ou si l'on tourne en
-        root sans ``allow_root``. Lève ``ValueError`` si le workspace est invalide.
-        """
+    def prepare_workspace(self, workspace: str) -> str:
+        """Contrôles communs à tous les lancements : refus root, workspace validé et créé."""
         if not self.allow_root and hasattr(os, "getuid") and os.getuid() == 0:
             raise SandboxUnavailable(
                 "refus de lancer le sandbox en root (le code non fiable tournerait en uid 0) ; "
@@ -288,8 +476,22 @@ class DockerSandbox:
             )
         ws = self._validate_workspace(workspace)
         os.makedirs(ws, exist_ok=True)
+        return ws
+
+    def _prepare_run(self, cmd: Union[str, List[str]], workspace: str) -> Tuple[str, List[str]]:
+        """Workspace préparé et argv ``docker run`` sous un nom de conteneur unique."""
+        ws = self.prepare_workspace(workspace)
         name = f"collegue-sbx-{uuid.uuid4().hex[:12]}"
-        argv = self._build_run_argv(cmd, ws, name=name)
+        return name, self._build_run_argv(cmd, ws, name=name)
+
+    def run_command(self, cmd: Union[str, List[str]], workspace: str) -> SandboxResult:
+        """Exécute ``cmd`` dans le sandbox, workspace monté sur ``/workspace``.
+
+        ``cmd`` peut être une chaîne (``sh -c`` dans le conteneur) ou un argv (liste).
+        Lève :class:`SandboxUnavailable` si Docker est absent ou si l'on tourne en
+        root sans ``allow_root``. Lève ``ValueError`` si le workspace est invalide.
+        """
+        name, argv = self._prepare_run(cmd, workspace)
 
         out_f = tempfile.NamedTemporaryFile(prefix="sbx-out-", delete=False)
         err_f = tempfile.NamedTemporaryFile(prefix="sbx-err-", delete=False)
@@ -326,6 +528,133 @@ class DockerSandbox:
         """Lance la suite de tests d'un projet dans le sandbox (défaut : ``pytest -q``)."""
         return self.run_command(command, workspace)
 
+    async def _kill_container_async(self, name: str) -> None:
+        """Comme :meth:`_kill_container`, sans bloquer la boucle."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self.docker_bin,
+                "kill",
+                name,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=15)
+        except asyncio.TimeoutError:
+            proc.kill()
+
+    async def _abort(self, proc: asyncio.subprocess.Process, name: str) -> None:
+        """Tue le conteneur puis le client ``docker run`` et attend sa fin."""
+        await self._kill_container_async(name)
+        try:
+            # Groupe entier : un descendant qui garderait stdout/stderr ouverts
+            # bloquerait ``wait()`` (asyncio attend aussi la fermeture des tubes).
+            if hasattr(os, "killpg"):
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+        await proc.wait()
+
+    @staticmethod
+    async def _drain(stream: asyncio.StreamReader, buffer: _CappedBuffer) -> None:
+        while True:
+            chunk = await stream.read(_READ_CHUNK)
+            if not chunk:
+                return
+            buffer.feed(chunk)
+
+    async def run_command_async(self, cmd: Union[str, List[str]], workspace: str) -> SandboxResult:
+        """Comme :meth:`run_command`, sans bloquer la boucle d'événements.
+
+        Attend un créneau du :class:`ContainerLimiter`, puis lit stdout/stderr au
+        fil de l'eau dans des tampons plafonnés (``max_output_bytes`` chacun).
+        Timeout : conteneur tué, ``exit_code`` 124. Annulation de la tâche :
+        conteneur tué avant de propager ``CancelledError`` (pas d'orphelin).
+        Avec un ``pool``, la commande passe par un conteneur chaud.
+        """
+        if self.pool is not None:
+            return await self.pool.run(self, cmd, workspace)
+        name, argv = self._prepare_run(cmd, workspace)
+        async with self.limiter.slot():
+            return await self.exec_argv_async(argv, name)
+
+    async def exec_argv_async(self, argv: List[str], name: str, timeout: Optional[float] = None) -> SandboxResult:
+        """Lance ``argv`` (``docker run``/``exec``) et lit sa sortie plafonnée.
+
+        Au timeout (``self.timeout`` par défaut) ou à l'annulation, le conteneur
+        ``name`` est tué avec le client. Ne prend pas de créneau du limiteur.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
+            )
+        except FileNotFoundError as exc:
+            raise SandboxUnavailable(f"Binaire Docker introuvable: {self.docker_bin}") from exc
+        out = _CappedBuffer(self.max_output_bytes)
+        err = _CappedBuffer(self.max_output_bytes)
+        timed_out = False
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(self._drain(proc.stdout, out), self._drain(proc.stderr, err), proc.wait()),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            timed_out = True
+            await self._abort(proc, name)
+        except asyncio.CancelledError:
+            # Le nettoyage va au bout même si l'appelant ré-annule.
+            await asyncio.shield(self._abort(proc, name))
+            raise
+
+        stderr = err.text()
+        if timed_out:
+            stderr += f"\n{TIMEOUT_NOTE} {timeout:g}s"
+        return SandboxResult(
+            exit_code=TIMEOUT_EXIT_CODE if timed_out else proc.returncode,
+            stdout=out.text(),
+            stderr=stderr,
+            timed_out=timed_out,
+        )
+
+    async def run_tests_async(self, workspace: str, command: Union[str, List[str]] = "pytest -q") -> SandboxResult:
+        """Version async de :meth:`run_tests`."""
+        return await self.run_command_async(command, workspace)
+
+    async def image_id_async(self) -> Optional[str]:
+        """Identifiant (digest) local de l'image, ``None`` si Docker ne la connaît pas."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self.docker_bin,
+                "image",
+                "inspect",
+                "--format",
+                "{{.Id}}",
+                self.image,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+        try:
+            out, _ = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return None
+        image_id = out.decode("utf-8", errors="replace").strip()
+        return image_id if proc.returncode == 0 and image_id else None
+
     def is_available(self) -> bool:
         """True si le binaire Docker répond (``docker version``)."""
         try:
@@ -338,3 +667,15 @@ class DockerSandbox:
         except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
             return False
         return proc.returncode == 0
+
+
+async def run_sandbox_tests(sandbox, workspace: str, command: Union[str, List[str]] = "pytest -q") -> SandboxResult:
+    """Lance les tests via ``sandbox`` sans bloquer la boucle d'événements.
+
+    Utilise ``run_tests_async`` si le sandbox l'expose (:class:`DockerSandbox`),
+    sinon ``run_tests`` synchrone dans un thread (doubles de test, runners tiers).
+    """
+    run_async = getattr(sandbox, "run_tests_async", None)
+    if run_async is not None:
+        return await run_async(workspace, command)
+    return await asyncio.to_thread(sandbox.run_tests, workspace, command)
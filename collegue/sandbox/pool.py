@@ -0,0 +1,323 @@
+"""Pool de conteneurs chauds pour les passes du gate (opt-in, ``SANDBOX_POOL_ENABLED``).
+
+Chaque passe du gate (tests, oracle d'acceptation, remédiation, mesures) payait
+un ``docker run`` complet : création du conteneur, montages, démarrage du
+runtime — plusieurs centaines de millisecondes à plusieurs secondes avant la
+première ligne de pytest. :class:`ContainerPool` garde des conteneurs
+pré-démarrés (``docker run -d … sleep infinity``) et y lance les passes par
+``docker exec``.
+
+Isolation inchangée : un conteneur de pool est démarré avec l'argv durci de
+:meth:`DockerSandbox._build_run_argv` (rootfs en lecture seule, réseau, limites
+pids/mémoire/CPU, capabilities, utilisateur non-root, workspace seul monté). La
+clé du pool est cet argv complet : un conteneur ne sert qu'au même profil
+(image, limites, environnement) **et** au même workspace — jamais d'un projet à
+l'autre.
+
+Cycle de vie :
+
+- après chaque passe, remise à zéro par ``docker exec`` : processus restants
+  tués (``kill -9 -1`` épargne le PID 1 du conteneur) et tmpfs ``/tmp`` vidé
+  (cache pip monté excepté), comme le ferait un conteneur neuf ; un échec de la
+  remise à zéro écarte le conteneur ;
+- recyclage après ``max_uses`` passes, après un timeout ou une annulation
+  (conteneur tué), et après ``idle_ttl`` secondes d'inactivité ;
+- contrôle de santé (``docker exec … true``) d'un conteneur inactif depuis plus
+  de ``health_interval`` secondes avant de le confier à une passe ;
+- au plus ``max_containers`` conteneurs vivants : au-delà, le conteneur inactif
+  le plus ancien (autre profil compris) est tué, et si tous sont occupés la
+  passe retombe sur un ``docker run`` éphémère.
+
+:meth:`ContainerPool.close` (synchrone, enregistrée via ``atexit`` par le
+runtime) tue les conteneurs restants ; ils portent le label
+``collegue.sandbox.pool`` pour un nettoyage manuel après un crash.
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from .executor import SANDBOX_PIP_CACHE_MOUNT, SandboxResult
+
+if TYPE_CHECKING:
+    from .executor import DockerSandbox
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_MAX_CONTAINERS = 4
+DEFAULT_POOL_MAX_USES = 20
+DEFAULT_POOL_IDLE_TTL = 300.0
+DEFAULT_POOL_HEALTH_INTERVAL = 30.0
+
+POOL_LABEL = "collegue.sandbox.pool"
+
+# Délais des opérations d'administration d'un conteneur de pool (démarrage, remise à zéro, santé).
+START_TIMEOUT = 120.0
+RESET_TIMEOUT = 30.0
+HEALTH_TIMEOUT = 10.0
+
+# Remise à zéro entre deux passes. Le préfixe ``:`` (no-op) identifie la commande
+# pour les doubles de ``docker`` des tests, qui ne doivent pas l'exécuter sur l'hôte.
+POOL_RESET_SCRIPT = (
+    ": collegue-pool-reset; "
+    "kill -9 -1 2>/dev/null; "
+    f"find /tmp -mindepth 1 -maxdepth 1 ! -path {SANDBOX_PIP_CACHE_MOUNT} -exec rm -rf {{}} + 2>/dev/null; "
+    "true"
+)
+
+Profile = Tuple[str, ...]
+
+
+@dataclass
+class _PooledContainer:
+    name: str
+    profile: Profile
+    docker_bin: str
+    uses: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class ContainerPool:
+    """Conteneurs pré-démarrés par profil durci, servis par ``docker exec``.
+
+    Partagé entre boucles d'événements comme :class:`ContainerLimiter` : l'état
+    est protégé par un verrou de thread et ne contient que des noms de
+    conteneurs, aucun objet lié à une boucle.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_containers: int = DEFAULT_POOL_MAX_CONTAINERS,
+        max_uses: int = DEFAULT_POOL_MAX_USES,
+        idle_ttl: float = DEFAULT_POOL_IDLE_TTL,
+        health_interval: float = DEFAULT_POOL_HEALTH_INTERVAL,
+    ):
+        self.max_containers = max(1, int(max_containers))
+        self.max_uses = max(1, int(max_uses))
+        self.idle_ttl = float(idle_ttl)
+        self.health_interval = float(health_interval)
+        self._idle: Dict[Profile, List[_PooledContainer]] = {}
+        self._live: Dict[str, _PooledContainer] = {}
+        self._starting = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs : ``started``, ``reused``, ``recycled``, ``discarded``, ``fallback``, ``live``, ``idle``."""
+        with self._lock:
+            return {
+                **{key: self._stats[key] for key in ("started", "reused", "recycled", "discarded", "fallback")},
+                "live": len(self._live),
+                "idle": sum(len(items) for items in self._idle.values()),
+            }
+
+    async def run(self, sandbox: "DockerSandbox", cmd: Union[str, List[str]], workspace: str) -> SandboxResult:
+        """Exécute ``cmd`` pour ``sandbox`` dans un conteneur chaud du profil de ``workspace``.
+
+        Mêmes garanties que :meth:`DockerSandbox.run_command_async` (créneau du
+        limiteur, sortie plafonnée, timeout à 124, annulation sans orphelin) ;
+        ``startup_seconds`` du résultat mesure l'obtention du conteneur.
+        """
+        ws = sandbox.prepare_workspace(workspace)
+        profile = sandbox.pool_profile(ws)
+        async with sandbox.limiter.slot():
+            start = time.perf_counter()
+            container = await self._checkout(sandbox, profile, ws)
+            startup = time.perf_counter() - start
+            if container is None:
+                with self._lock:
+                    self._stats["fallback"] += 1
+                name, argv = sandbox._prepare_run(cmd, ws)
+                return await sandbox.exec_argv_async(argv, name)
+            try:
+                result = await sandbox.exec_argv_async(sandbox._build_exec_argv(container.name, cmd), container.name)
+                if result.timed_out:
+                    self._forget(container, "discarded")  # déjà tué par exec_argv_async
+                else:
+                    await self._checkin(sandbox, container)
+            except BaseException:
+                # Annulation : exec_argv_async a déjà tué le conteneur.
+                self._forget(container, "discarded")
+                raise
+        result.startup_seconds = startup
+        logger.debug("Pool sandbox : %s prêt en %.3fs (passe %d)", container.name, startup, container.uses)
+        return result
+
+    # ── obtention / restitution ──────────────────────────────────────────────────
+
+    async def _checkout(self, sandbox: "DockerSandbox", profile: Profile, workspace: str) -> Optional[_PooledContainer]:
+        """Conteneur inactif sain du profil, sinon démarré ; ``None`` si le pool est plein."""
+        await self._reap_idle(sandbox)
+        while True:
+            with self._lock:
+                candidates = self._idle.get(profile)
+                container = candidates.pop() if candidates else None
+            if container is None:
+                break
+            if time.monotonic() - container.last_used > self.health_interval:
+                try:
+                    healthy = await self._healthy(sandbox, container)
+                except BaseException:
+                    self._forget(container, "discarded")
+                    raise
+                if not healthy:
+                    await self._discard(sandbox, container)
+                    continue
+            container.uses += 1
+            with self._lock:
+                self._stats["reused"] += 1
+            return container
+
+        victim = None
+        with self._lock:
+            if self._closed:
+                return None
+            if len(self._live) + self._starting >= self.max_containers:
+                victim = self._oldest_idle_locked()
+                if victim is None:
+                    return None
+            self._starting += 1
+        try:
+            if victim is not None:
+                await self._discard(sandbox, victim, "recycled")
+            return await self._start(sandbox, profile, workspace)
+        finally:
+            with self._lock:
+                self._starting -= 1
+
+    def _oldest_idle_locked(self) -> Optional[_PooledContainer]:
+        oldest = None
+        for items in self._idle.values():
+            for container in items:
+                if oldest is None or container.last_used < oldest.last_used:
+                    oldest = container
+        if oldest is not None:
+            self._idle[oldest.profile].remove(oldest)
+        return oldest
+
+    async def _start(self, sandbox: "DockerSandbox", profile: Profile, workspace: str) -> Optional[_PooledContainer]:
+        name = f"collegue-pool-{uuid.uuid4().hex[:12]}"
+        result = await sandbox.exec_argv_async(
+            sandbox._build_pool_argv(workspace, name, POOL_LABEL), name, timeout=START_TIMEOUT
+        )
+        if not result.ok:
+            # Le docker run éphémère de repli remontera l'erreur dans la sortie de la passe.
+            logger.warning("Pool sandbox : démarrage de %s impossible (%s)", name, result.stderr.strip()[:200])
+            return None
+        container = _PooledContainer(name=name, profile=profile, docker_bin=sandbox.docker_bin, uses=1)
+        with self._lock:
+            self._live[name] = container
+            self._stats["started"] += 1
+        return container
+
+    async def _checkin(self, sandbox: "DockerSandbox", container: _PooledContainer) -> None:
+        with self._lock:
+            closed = self._closed
+        if closed or container.uses >= self.max_uses:
+            await self._discard(sandbox, container, "recycled")
+            return
+        reset = await sandbox.exec_argv_async(
+            sandbox._build_exec_argv(container.name, POOL_RESET_SCRIPT), container.name, timeout=RESET_TIMEOUT
+        )
+        if not reset.ok:
+            await self._discard(sandbox, container)
+            return
+        container.last_used = time.monotonic()
+        with self._lock:
+            if not self._closed and container.name in self._live:
+                self._idle.setdefault(container.profile, []).append(container)
+                return
+        await self._discard(sandbox, container)
+
+    async def _healthy(self, sandbox: "DockerSandbox", container: _PooledContainer) -> bool:
+        result = await sandbox.exec_argv_async(
+            sandbox._build_exec_argv(container.name, ["true"]), container.name, timeout=HEALTH_TIMEOUT
+        )
+        return result.ok
+
+    async def _reap_idle(self, sandbox: "DockerSandbox") -> None:
+        """Tue les conteneurs inactifs depuis plus de ``idle_ttl`` secondes."""
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            for profile, items in self._idle.items():
+                keep = [container for container in items if now - container.last_used <= self.idle_ttl]
+                expired += [container for container in items if now - container.last_used > self.idle_ttl]
+                self._idle[profile] = keep
+        for container in expired:
+            await self._discard(sandbox, container, "recycled")
+
+    def _forget(self, container: _PooledContainer, reason: str) -> None:
+        with self._lock:
+            if self._live.pop(container.name, None) is not None:
+                self._stats[reason] += 1
+
+    async def _discard(self, sandbox: "DockerSandbox", container: _PooledContainer, reason: str = "discarded") -> None:
+        self._forget(container, reason)
+        await sandbox._kill_container_async(container.name)
+
+    # ── arrêt ────────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Tue tous les conteneurs du pool (synchrone : appelable depuis ``atexit``).
+
+        Les conteneurs occupés sont tués aussi ; leur passe en cours échoue.
+        """
+        with self._lock:
+            self._closed = True
+            containers = list(self._live.values())
+            self._live.clear()
+            self._idle.clear()
+        by_bin: Dict[str, List[str]] = {}
+        for container in containers:
+            by_bin.setdefault(container.docker_bin, []).append(container.name)
+        for docker_bin, names in by_bin.items():
+            try:
+                subprocess.run([docker_bin, "kill", *names], capture_output=True, timeout=30)
+            except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+                pass
+
+
+_default_pool: Optional[ContainerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_container_pool(settings_obj: Optional[object] = None) -> Optional[ContainerPool]:
+    """Pool partagé si ``SANDBOX_POOL_ENABLED``, sinon ``None``."""
+    global _default_pool
+    if settings_obj is None:
+        try:
+            from collegue.config import settings as settings_obj
+        except Exception:
+            return None
+    if not bool(getattr(settings_obj, "SANDBOX_POOL_ENABLED", False)):
+        return None
+    with _pool_lock:
+        if _default_pool is None:
+            import atexit
+
+            _default_pool = ContainerPool(
+                max_containers=int(getattr(settings_obj, "SANDBOX_POOL_MAX_CONTAINERS", DEFAULT_POOL_MAX_CONTAINERS)),
+                max_uses=int(getattr(settings_obj, "SANDBOX_POOL_MAX_USES", DEFAULT_POOL_MAX_USES)),
+                idle_ttl=float(getattr(settings_obj, "SANDBOX_POOL_IDLE_TTL", DEFAULT_POOL_IDLE_TTL)),
+            )
+            atexit.register(_default_pool.close)
+        return _default_pool
+
+
+def reset_container_pool() -> None:
+    """Ferme et oublie le pool partagé (pour les tests)."""
+    global _default_pool
+    with _pool_lock:
+        if _default_pool is not None:
+            _default_pool.close()
+        _default_pool = None
@@ -10,11 +10,15 @@ import logging
 import os
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, Union
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Type, Union
 
 from pydantic import BaseModel, ValidationError
 from pydantic_core import PydanticUndefined
 
+from ..core.code_facts import ParseStats, capture_parse_stats
 from ..core.security_logger import security_logger
 from ..monitoring.metrics import get_metrics_collector
 from .quotas import (
@@ -67,6 +71,43 @@ class ToolQuotaError(ToolExecutionError):
     pass
 
 
+@dataclass
+class ToolCallState:
+    """État propre à un appel d'outil (session, quota, tokens, mémoire, prompt).
+
+    Porté par une ContextVar pendant ``execute``/``execute_async`` : une même
+    instance (pool, endpoint FastMCP) peut servir des appels concurrents sans
+    qu'ils se mélangent leurs compteurs. Hors appel, l'instance expose l'état de
+    son dernier appel terminé.
+    """
+
+    owner: Any = None
+    session_id: str = "default"
+    quota_manager: Optional[QuotaManager] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    memory_written: bool = False
+    prompt_template_id: Optional[str] = None
+    prompt_version: Optional[str] = None
+    # Analyses AST (collegue.core.code_facts) faites ou reprises du cache pendant l'appel.
+    parse_stats: Optional[ParseStats] = None
+
+
+_current_call: ContextVar[Optional[ToolCallState]] = ContextVar("collegue_tool_call", default=None)
+
+
+def _call_state_attr(field_name: str) -> property:
+    """Attribut d'instance redirigé vers le :class:`ToolCallState` courant."""
+
+    def _get(self: "BaseTool") -> Any:
+        return getattr(self._call_state(), field_name)
+
+    def _set(self: "BaseTool", value: Any) -> None:
+        setattr(self._call_state(), field_name, value)
+
+    return property(_get, _set)
+
+
 class BaseTool(ABC):
     """
     Classe de base pour tous les outils Collegue.
@@ -92,6 +133,24 @@ class BaseTool(ABC):
     quota_enabled: bool = True
     custom_rate_limit: Optional[RateLimitConfig] = None
 
+    # Cache persistant des résultats (collegue.core.tool_cache). Réservé aux outils
+    # dont la sortie ne dépend que de la requête, de leurs règles et des fichiers
+    # lus : ``cache_key_fields`` restreint les champs de requête pris dans la clé
+    # (None = tous), ``cache_version`` est à incrémenter quand la logique change.
+    deterministic: bool = False
+    cache_key_fields: Optional[List[str]] = None
+    cache_version: str = "1"
+
+    # État par appel (voir ToolCallState) : les noms historiques restent lisibles
+    # et assignables, mais ne sont plus partagés entre appels concurrents.
+    _session_id = _call_state_attr("session_id")
+    _quota_manager = _call_state_attr("quota_manager")
+    _last_input_tokens = _call_state_attr("input_tokens")
+    _last_output_tokens = _call_state_attr("output_tokens")
+    _memory_written = _call_state_attr("memory_written")
+    _last_prompt_template_id = _call_state_attr("prompt_template_id")
+    _last_prompt_version = _call_state_attr("prompt_version")
+
     def __init__(self, config: Optional[Dict[str, Any]] = None, app_state: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.app_state = app_state or {}
@@ -140,6 +199,40 @@ class BaseTool(ABC):
     def is_long_running(self) -> bool:
         return self.long_running
 
+    def _call_state(self) -> ToolCallState:
+        state = _current_call.get()
+        if state is not None and state.owner is self:
+            return state
+        last = self.__dict__.get("_last_call")
+        if last is None:
+            last = self.__dict__["_last_call"] = ToolCallState()
+        return last
+
+    @contextmanager
+    def _request_scope(self) -> Iterator[ToolCallState]:
+        """Ouvre un état d'appel isolé, conservé ensuite comme « dernier appel »."""
+        state = ToolCallState(owner=self)
+        token = _current_call.set(state)
+        try:
+            with capture_parse_stats() as state.parse_stats:
+                yield state
+        finally:
+            _current_call.reset(token)
+            state.owner = None
+            self.__dict__["_last_call"] = state
+            self._record_parse_stats(state.parse_stats)
+
+    def _record_parse_stats(self, stats: Optional[ParseStats]) -> None:
+        """Remonte au ``MetricsCollector`` le temps de parsing dépensé/économisé par l'appel."""
+        if stats is None or not (stats.parses or stats.reuses):
+            return
+        try:
+            get_metrics_collector().record_code_facts(
+                self.tool_name, stats.parses, stats.reuses, parse_ms=stats.parse_ms, saved_ms=stats.saved_ms
+            )
+        except Exception as e:
+            self.logger.debug(f"Métriques d'analyse AST non enregistrées: {e}")
+
     def _get_session_id(self, **kwargs) -> str:
         """Récupère l'ID de session depuis les headers ou kwargs."""
         # Essayer de récupérer depuis les headers HTTP
@@ -156,6 +249,56 @@ class BaseTool(ABC):
         # Sinon depuis les kwargs
         return kwargs.get("session_id", self._session_id)
 
+    def is_cacheable(self, request: BaseModel) -> bool:
+        """Vrai si le résultat de cette requête peut être servi depuis le cache."""
+        return self.deterministic
+
+    def get_cache_version(self) -> str:
+        """Version des règles/config : la changer invalide les résultats en cache."""
+        return self.cache_version
+
+    def get_cache_inputs(self, request: BaseModel) -> Any:
+        """Entrées lues hors requête (ex. empreinte des fichiers désignés par chemin)."""
+        return None
+
+    def _result_cache_lookup(self, request: BaseModel):
+        """``(cache, clé)`` si le cache est actif et la requête cachable, sinon ``(None, None)``."""
+        if not self.is_cacheable(request):
+            return None, None
+        from ..core.tool_cache import get_tool_result_cache, result_key
+
+        cache = get_tool_result_cache()
+        if cache is None:
+            return None, None
+        try:
+            fields = set(self.cache_key_fields) if self.cache_key_fields is not None else None
+            key = result_key(
+                self.tool_name,
+                self.get_cache_version(),
+                request.model_dump(mode="json", include=fields),
+                self.get_cache_inputs(request),
+            )
+        except Exception as e:
+            self.logger.debug(f"Clé de cache non calculable pour {self.tool_name}: {e}")
+            return None, None
+        return cache, key
+
+    def _load_cached_result(self, cache, key: str) -> Optional[BaseModel]:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        try:
+            return self.get_response_model().model_validate_json(entry["text"])
+        except ValidationError:
+            # Modèle de réponse changé depuis l'écriture : traité comme un miss.
+            return None
+
+    def _store_cached_result(self, cache, key: str, result: BaseModel) -> None:
+        try:
+            cache.put(key, result.model_dump_json(), self.tool_name)
+        except Exception as e:
+            self.logger.debug(f"Résultat de {self.tool_name} non mis en cache: {e}")
+
     def _check_rate_limit(self):
         """
         Vérifie le rate limiting pour ce tool.
@@ -544,6 +687,10 @@ class BaseTool(ABC):
             ToolValidationError: Si la requête est invalide
             ToolExecutionError: En cas d'erreur d'exécution
         """
+        with self._request_scope():
+            return self._execute_in_scope(request, **kwargs)
+
+    def _execute_in_scope(self, request: Union[BaseModel, Dict[str, Any]], **kwargs) -> BaseModel:
         # Vérifier rate limiting
         self._check_rate_limit()
 
@@ -574,10 +721,18 @@ class BaseTool(ABC):
             },
         )
 
+        cache, cache_key = self._result_cache_lookup(normalized_request)
+        if cache_key is not None:
+            cached = self._load_cached_result(cache, cache_key)
+            if cached is not None:
+                return cached
+
         start_time = time.time()
         try:
             result = self._execute_core_logic(normalized_request, **kwargs)
             self._validate_result(result)
+            if cache_key is not None:
+                self._store_cached_result(cache, cache_key, result)
 
             execution_time = time.time() - start_time
             self.logger.debug(f"Tool {self.tool_name} executed in {execution_time:.2f}s")
@@ -599,6 +754,10 @@ class BaseTool(ABC):
         Returns:
             Résultat du tool
         """
+        with self._request_scope():
+            return await self._execute_async_in_scope(request, **kwargs)
+
+    async def _execute_async_in_scope(self, request: Union[BaseModel, Dict[str, Any]], **kwargs) -> BaseModel:
         ctx = kwargs.get("ctx")
 
         # Vérifier rate limiting
@@ -628,6 +787,24 @@ class BaseTool(ABC):
             await ctx.report_progress(progress=1, total=total_steps)
 
         metrics = get_metrics_collector()
+        cache, cache_key = None, None
+        if self.is_cacheable(normalized_request):
+            # Empreinte des entrées (parcours de fichiers) et SQLite hors de la boucle d'événements.
+            cache, cache_key = await asyncio.to_thread(self._result_cache_lookup, normalized_request)
+        if cache_key is not None:
+            cache_start = time.time()
+            cached = await asyncio.to_thread(self._load_cached_result, cache, cache_key)
+            if cached is not None:
+                metrics.record_execution(
+                    expert_name=self.tool_name,
+                    duration_ms=(time.time() - cache_start) * 1000,
+                    success=True,
+                    cache_hit=True,
+                )
+                if ctx:
+                    await ctx.report_progress(progress=total_steps, total=total_steps)
+                return cached
+
         self._last_input_tokens = 0
         self._last_output_tokens = 0
         # Passé à True par _store_to_memory() ; sinon une entrée de repli est
@@ -646,6 +823,8 @@ class BaseTool(ABC):
                     self._check_execution_time(**kwargs)
 
             self._validate_result(result)
+            if cache_key is not None:
+                await asyncio.to_thread(self._store_cached_result, cache, cache_key, result)
 
             if ctx:
                 await ctx.report_progress(progress=total_steps, total=total_steps)
@@ -660,6 +839,7 @@ class BaseTool(ABC):
                 success=True,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
+                cache_hit=False if cache_key is not None else None,
             )
 
             # Activity log: expert result
@@ -5,10 +5,10 @@ Contient la logique métier pure : détection de problèmes, calcul de scores,
 analyse de patterns.
 """
 
-import ast
 import re
 from typing import Dict, List
 
+from ...core.code_facts import CodeFacts, get_code_facts
 from .config import (
     COMPLEXITY_KEYWORDS,
     SECURITY_PATTERNS,
@@ -50,35 +50,33 @@ class CodeReviewEngine:
 
     def _check_python_naming(self, code: str) -> List[ReviewFinding]:
         findings = []
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
+        facts = get_code_facts(code)
+        if not facts.valid:
             return findings
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if not re.match(r"^[a-z_][a-z0-9_]*$", node.name) and not node.name.startswith("_"):
-                    findings.append(
-                        ReviewFinding(
-                            category="naming",
-                            severity="warning",
-                            line=node.lineno,
-                            title=f"Nom de fonction non snake_case: '{node.name}'",
-                            description=f"La fonction '{node.name}' ne suit pas la convention snake_case (PEP 8).",
-                            suggestion=f"Renommer en '{self._to_snake_case(node.name)}'",
-                        )
+        for function in facts.functions:
+            if not re.match(r"^[a-z_][a-z0-9_]*$", function.name) and not function.name.startswith("_"):
+                findings.append(
+                    ReviewFinding(
+                        category="naming",
+                        severity="warning",
+                        line=function.line,
+                        title=f"Nom de fonction non snake_case: '{function.name}'",
+                        description=f"La fonction '{function.name}' ne suit pas la convention snake_case (PEP 8).",
+                        suggestion=f"Renommer en '{self._to_snake_case(function.name)}'",
                     )
-            elif isinstance(node, ast.ClassDef):
-                if not re.match(r"^[A-Z][a-zA-Z0-9]*$", node.name):
-                    findings.append(
-                        ReviewFinding(
-                            category="naming",
-                            severity="warning",
-                            line=node.lineno,
-                            title=f"Nom de classe non PascalCase: '{node.name}'",
-                            description=f"La classe '{node.name}' ne suit pas la convention PascalCase (PEP 8).",
-                        )
+                )
+        for cls in facts.classes:
+            if not re.match(r"^[A-Z][a-zA-Z0-9]*$", cls.name):
+                findings.append(
+                    ReviewFinding(
+                        category="naming",
+                        severity="warning",
+                        line=cls.line,
+                        title=f"Nom de classe non PascalCase: '{cls.name}'",
+                        description=f"La classe '{cls.name}' ne suit pas la convention PascalCase (PEP 8).",
                     )
+                )
 
         return findings
 
@@ -105,6 +103,11 @@ class CodeReviewEngine:
         """Analyse la complexité du code."""
         findings = []
         lang = language.lower()
+        if lang == "python":
+            facts = get_code_facts(code)
+            if facts.valid:
+                return self._python_complexity(facts)
+        # Langages sans AST (ou Python non parsable, ex. un diff) : heuristique par lignes.
         keywords = COMPLEXITY_KEYWORDS.get(lang, COMPLEXITY_KEYWORDS.get("python", []))
 
         lines = code.split("\n")
@@ -179,6 +182,41 @@ class CodeReviewEngine:
 
         return findings
 
+    def _python_complexity(self, facts: CodeFacts) -> List[ReviewFinding]:
+        """Complexité cyclomatique par fonction et imbrication des instructions, depuis l'AST."""
+        findings = []
+        for function in facts.functions:
+            if function.complexity > 10:
+                findings.append(
+                    ReviewFinding(
+                        category="complexity",
+                        # Maintenabilité = ADVISORY (cf. analyze_complexity, run V11 #63) — jamais bloquant.
+                        severity="warning",
+                        line=function.line,
+                        title=f"Complexité élevée: '{function.name}' (score={function.complexity})",
+                        description=(
+                            f"La fonction '{function.name}' a une complexité cyclomatique de {function.complexity}. "
+                            "Recommandé: < 10."
+                        ),
+                    )
+                )
+
+        for line, depth in sorted(facts.statement_depths.items()):
+            if depth >= 5:
+                findings.append(
+                    ReviewFinding(
+                        category="complexity",
+                        severity="warning",
+                        line=line,
+                        title=f"Imbrication excessive (niveau {depth})",
+                        description=(
+                            f"L'imbrication de {depth} niveaux rend le code difficile à lire. Recommandé: < 4 niveaux."
+                        ),
+                    )
+                )
+
+        return findings
+
     def analyze_security(self, code: str, language: str) -> List[ReviewFinding]:
         """Détecte les problèmes de sécurité."""
         findings = []
@@ -237,6 +275,10 @@ class CodeReviewEngine:
         lang = language.lower()
 
         if lang == "python":
+            facts = get_code_facts(code)
+            if facts.valid:
+                return self._python_error_handling(facts)
+            # Python non parsable (ex. un diff) : heuristique par lignes.
             for i, line in enumerate(code.split("\n"), 1):
                 stripped = line.strip()
                 if stripped == "except:" or stripped == "except Exception:":
@@ -269,6 +311,33 @@ class CodeReviewEngine:
 
         return findings
 
+    def _python_error_handling(self, facts: CodeFacts) -> List[ReviewFinding]:
+        """Handlers ``except`` trop larges ou silencieux, depuis l'AST."""
+        findings = []
+        for handler in facts.except_handlers:
+            if handler.is_broad:
+                findings.append(
+                    ReviewFinding(
+                        category="error_handling",
+                        severity="warning",
+                        line=handler.line,
+                        title="Except trop large",
+                        description="Catch trop générique. Attrapez des exceptions spécifiques.",
+                    )
+                )
+            if handler.silent_line is not None:
+                findings.append(
+                    ReviewFinding(
+                        category="error_handling",
+                        # ADVISORY, comme l'heuristique par lignes (cf. analyze_error_handling).
+                        severity="warning",
+                        line=handler.silent_line,
+                        title="Exception silencieuse",
+                        description="Exception attrapée et ignorée (pass). Loggez ou re-lancez l'erreur.",
+                    )
+                )
+        return findings
+
     def calculate_quality_score(self, findings: List[ReviewFinding], total_lines: int) -> float:
         """Calcule le score de qualité global."""
         if total_lines == 0:
@@ -310,6 +379,9 @@ class CodeReviewEngine:
         lines = code.split("\n")
 
         if language.lower() == "python":
+            facts = get_code_facts(code)
+            if facts.valid:
+                return self._python_strengths(facts, len(lines))
             has_type_hints = any(":" in line and "->" in line for line in lines if "def " in line)
             if has_type_hints:
                 strengths.append("Utilisation de type hints")
@@ -330,6 +402,24 @@ class CodeReviewEngine:
 
         return strengths
 
+    @staticmethod
+    def _python_strengths(facts: CodeFacts, total_lines: int) -> List[str]:
+        strengths = []
+        functions = facts.functions
+        if any(function.annotated for function in functions):
+            strengths.append("Utilisation de type hints")
+        if (
+            facts.module_docstring
+            or any(function.has_docstring for function in functions)
+            or any(cls.has_docstring for cls in facts.classes)
+        ):
+            strengths.append("Documentation avec docstrings")
+        if facts.except_handlers:
+            strengths.append("Gestion des erreurs présente")
+        if functions and total_lines / len(functions) < 30:
+            strengths.append("Fonctions courtes et focalisées")
+        return strengths
+
     @staticmethod
     def _to_snake_case(name: str) -> str:
         s = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
@@ -0,0 +1,171 @@
+"""
+Cache disque des métadonnées de registres et des résultats OSV.
+
+Chaque analyse ré-interrogeait PyPI/npm/Packagist et OSV pour toutes les
+dépendances, même inchangées depuis le scan précédent. Ce cache (opt-in,
+``DEPENDENCY_GUARD_CACHE_ENABLED``) mémorise, sous ``$COLLEGUE_HOME/cache`` :
+
+- ``(registre, package)`` → existence, dernière version et ETag, valable
+  ``DEPENDENCY_GUARD_CACHE_TTL`` secondes (une heure au plus pour un package
+  introuvable, qui peut être publié entre-temps) ; une entrée expirée munie
+  d'un ETag est revalidée par une requête conditionnelle ;
+- ``(écosystème, package, version)`` → identifiants des vulnérabilités OSV, et
+  identifiant → détails utiles de la vulnérabilité, valables
+  ``DEPENDENCY_GUARD_OSV_CACHE_TTL`` secondes.
+
+Les erreurs réseau (``exists`` à ``None``) ne sont jamais mises en cache.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ...core.disk_cache import SqliteLRUCache
+from ...core.tool_cache import fingerprint
+from .config import NOT_FOUND_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 3600
+DEFAULT_OSV_TTL = 6 * 3600
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CACHE_FILE = "dependency_guard.sqlite3"
+
+PackageVersion = Tuple[str, str]
+
+
+class RegistryMetadataCache(SqliteLRUCache):
+    """Entrées JSON horodatées (``checked_at``) ; l'expiration est décidée à la lecture."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        ttl: float = DEFAULT_TTL,
+        osv_ttl: float = DEFAULT_OSV_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        super().__init__(CACHE_FILE, cache_dir, max_entries=max_entries, max_bytes=max_bytes)
+        self.ttl = ttl
+        self.osv_ttl = osv_ttl
+
+    @staticmethod
+    def _metadata_key(registry: str, name: str) -> str:
+        return fingerprint({"registry": registry, "package": name})
+
+    @staticmethod
+    def _osv_key(ecosystem: str, name: str, version: str) -> str:
+        return fingerprint({"osv": ecosystem, "package": name, "version": version})
+
+    @staticmethod
+    def _vuln_key(vuln_id: str) -> str:
+        return fingerprint({"osv_vuln": vuln_id})
+
+    def _lookup(self, keys: Dict[Any, str]) -> Dict[Any, Dict[str, Any]]:
+        entries = self.get_many(keys.values())
+        found = {}
+        for item, key in keys.items():
+            entry = entries.get(key)
+            payload = _decode(entry["text"]) if entry else None
+            if isinstance(payload, dict):
+                found[item] = payload
+        return found
+
+    def _store(self, items: Iterable[Tuple[str, Dict[str, Any], str]]) -> None:
+        now = time.time()
+        self.put_many(
+            (key, json.dumps({**payload, "checked_at": now}, ensure_ascii=False), tag) for key, payload, tag in items
+        )
+
+    def lookup_metadata(self, registry: str, names: Sequence[str]) -> Dict[str, Tuple[Dict[str, Any], bool]]:
+        """``{package: (entrée, fraîche)}`` des packages connus du cache, expirés compris."""
+        now = time.time()
+        found = {}
+        for name, entry in self._lookup({name: self._metadata_key(registry, name) for name in names}).items():
+            ttl = self.ttl if entry.get("exists") else min(self.ttl, NOT_FOUND_TTL_SECONDS)
+            found[name] = (entry, now - entry.get("checked_at", 0) < ttl)
+        return found
+
+    def store_metadata(self, registry: str, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Enregistre des ``(package, {"exists", "latest_version", "etag"})``, horodatés maintenant."""
+        self._store((self._metadata_key(registry, name), entry, "metadata") for name, entry in entries)
+
+    def lookup_osv(self, ecosystem: str, packages: Sequence[PackageVersion]) -> Dict[PackageVersion, List[str]]:
+        """Identifiants de vulnérabilités encore frais pour des ``(package, version)``."""
+        now = time.time()
+        keys = {package: self._osv_key(ecosystem, *package) for package in packages}
+        return {
+            package: entry.get("vulns", [])
+            for package, entry in self._lookup(keys).items()
+            if now - entry.get("checked_at", 0) < self.osv_ttl
+        }
+
+    def store_osv(self, ecosystem: str, results: Dict[PackageVersion, List[str]]) -> None:
+        self._store(
+            (self._osv_key(ecosystem, *package), {"vulns": vuln_ids}, "osv") for package, vuln_ids in results.items()
+        )
+
+    def lookup_vulns(self, vuln_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Détails encore frais des vulnérabilités ``vuln_ids``."""
+        now = time.time()
+        keys = {vuln_id: self._vuln_key(vuln_id) for vuln_id in vuln_ids}
+        return {
+            vuln_id: entry["details"]
+            for vuln_id, entry in self._lookup(keys).items()
+            if "details" in entry and now - entry.get("checked_at", 0) < self.osv_ttl
+        }
+
+    def store_vulns(self, details: Dict[str, Dict[str, Any]]) -> None:
+        self._store((self._vuln_key(vuln_id), {"details": data}, "vuln") for vuln_id, data in details.items())
+
+
+def _decode(text: str) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+_registry_cache: Optional[RegistryMetadataCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_registry_cache(settings_obj: Optional[object] = None) -> Optional[RegistryMetadataCache]:
+    """Singleton du cache si ``DEPENDENCY_GUARD_CACHE_ENABLED``, sinon ``None``."""
+    global _registry_cache
+    if settings_obj is None:
+        try:
+            from collegue.config import settings as settings_obj
+        except Exception:
+            return None
+    if not bool(getattr(settings_obj, "DEPENDENCY_GUARD_CACHE_ENABLED", False)):
+        return None
+    with _cache_lock:
+        if _registry_cache is None:
+            try:
+                _registry_cache = RegistryMetadataCache(
+                    ttl=float(getattr(settings_obj, "DEPENDENCY_GUARD_CACHE_TTL", DEFAULT_TTL)),
+                    osv_ttl=float(getattr(settings_obj, "DEPENDENCY_GUARD_OSV_CACHE_TTL", DEFAULT_OSV_TTL)),
+                    max_entries=int(getattr(settings_obj, "DEPENDENCY_GUARD_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                    max_bytes=int(getattr(settings_obj, "DEPENDENCY_GUARD_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+                )
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("Cache des registres de dependency_guard indisponible (%s) : désactivé", exc)
+                return None
+        return _registry_cache
+
+
+def reset_registry_cache() -> None:
+    """Ferme et oublie le singleton (pour les tests)."""
+    global _registry_cache
+    with _cache_lock:
+        if _registry_cache is not None:
+            _registry_cache.close()
+        _registry_cache = None
@@ -66,3 +66,13 @@ LANGUAGE_ECOSYSTEM = {"python": "PyPI", "javascript": "npm", "php": "Packagist"}
 
 # Taille maximale pour les requêtes batch OSV
 OSV_CHUNK_SIZE = 1000
+
+# Timeouts HTTP (secondes) : requête de registre ou de détail OSV, requête batch OSV
+HTTP_TIMEOUT = 10
+OSV_BATCH_TIMEOUT = 60
+
+# Requêtes simultanées par défaut vers un registre ou OSV
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Durée de validité max en cache d'un package introuvable (il peut être publié depuis)
+NOT_FOUND_TTL_SECONDS = 3600
@@ -7,20 +7,19 @@ d'existence, détection de vulnérabilités.
 
 import json
 import re
-import urllib.error
-import urllib.parse
-import urllib.request
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from ...core.shared import run_async_from_sync
 from ..base import ToolValidationError
-from .config import OSV_BATCH_URL, OSV_CHUNK_SIZE, OSV_VULN_URL, REGISTRY_URLS
+from .registry import RegistryClient, registry_for_language
 
 
 class DependencyAnalysisEngine:
     """Moteur d'analyse des dépendances."""
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, registry: Optional[RegistryClient] = None):
         self.logger = logger
+        self.registry = registry if registry is not None else RegistryClient.from_settings()
 
     # ==================== Parsing des fichiers ====================
 
@@ -142,69 +141,17 @@ class DependencyAnalysisEngine:
 
     # ==================== Vérification d'existence ====================
 
-    def check_pypi_existence(self, package_name: str) -> Dict[str, Any]:
-        """Vérifie si un package existe sur PyPI."""
-        try:
-            url = REGISTRY_URLS["pypi"].format(package=package_name)
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode("utf-8"))
-                    return {"exists": True, "latest_version": data.get("info", {}).get("version")}
-            return {"exists": False}
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                return {"exists": False}
-            return {"exists": None, "error": str(e)}
-        except Exception as e:
-            return {"exists": None, "error": str(e)}
-
-    def check_npm_existence(self, package_name: str) -> Dict[str, Any]:
-        """Vérifie si un package existe sur npm."""
-        try:
-            safe_name = urllib.parse.quote(package_name, safe="@")
-            url = REGISTRY_URLS["npm"].format(package=safe_name)
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode("utf-8"))
-                    latest = data.get("dist-tags", {}).get("latest")
-                    return {"exists": True, "latest_version": latest}
-            return {"exists": False}
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                return {"exists": False}
-            return {"exists": None, "error": str(e)}
-        except Exception as e:
-            return {"exists": None, "error": str(e)}
+    async def check_packages_existence(self, package_names: List[str], language: str) -> Dict[str, Dict[str, Any]]:
+        """Vérifie l'existence d'un lot de packages sur le registre du langage.
 
-    def check_packagist_existence(self, package_name: str) -> Dict[str, Any]:
-        """Vérifie si un package existe sur Packagist."""
-        try:
-            url = REGISTRY_URLS["packagist"].format(package=package_name)
-            req = urllib.request.Request(url)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode("utf-8"))
-                    versions = list(data.get("package", {}).get("versions", {}).keys())
-                    latest = next((v for v in versions if "dev" not in v), versions[0] if versions else None)
-                    return {"exists": True, "latest_version": latest}
-            return {"exists": False}
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                return {"exists": False}
-            return {"exists": None, "error": f"HTTP {e.code}"}
-        except Exception as e:
-            return {"exists": None, "error": str(e)}
+        Renvoie ``{package: {"exists": True, "latest_version"}}``, ``{"exists": False}``
+        (404) ou ``{"exists": None, "error"}`` (registre injoignable).
+        """
+        return await self.registry.check_existence(package_names, registry_for_language(language))
 
     def check_package_existence(self, package_name: str, language: str) -> Dict[str, Any]:
-        """Vérifie l'existence d'un package selon le langage."""
-        if language == "python":
-            return self.check_pypi_existence(package_name)
-        elif language == "php":
-            return self.check_packagist_existence(package_name)
-        else:
-            return self.check_npm_existence(package_name)
+        """Vérifie l'existence d'un package selon le langage (appel synchrone isolé)."""
+        return run_async_from_sync(self.check_packages_existence([package_name], language), timeout=None)[package_name]
 
     # ==================== Vérification des vulnérabilités ====================
 
@@ -249,105 +196,46 @@ class DependencyAnalysisEngine:
 
         return "medium"
 
-    def check_osv_vulnerabilities(self, deps: List[Dict[str, str]], ecosystem: str) -> List[Dict[str, Any]]:
+    async def check_osv_vulnerabilities_async(self, deps: List[Dict[str, str]], ecosystem: str) -> List[Dict[str, Any]]:
         """Vérifie les vulnérabilités via l'API OSV."""
         vulnerabilities = []
-        queries = []
-        dep_map = {}
-
-        for _i, dep in enumerate(deps):
-            name = dep["name"]
+        packages = []
+        for dep in deps:
             version = self.extract_version(dep.get("version", "*"))
-            if not version or version == "*":
-                continue
-            queries.append({"package": {"name": name, "ecosystem": ecosystem}, "version": version})
-            dep_map[len(queries) - 1] = {"name": name, "version": version}
+            if version and version != "*":
+                packages.append((dep["name"], version))
 
-        if not queries:
+        if not packages:
             return vulnerabilities
 
         if self.logger:
-            self.logger.info(f"Vérification OSV batch pour {len(queries)} packages ({ecosystem})...")
+            self.logger.info(f"Vérification OSV batch pour {len(packages)} packages ({ecosystem})...")
 
         try:
-            vuln_to_packages = {}
-
-            for chunk_start in range(0, len(queries), OSV_CHUNK_SIZE):
-                chunk_queries = queries[chunk_start : chunk_start + OSV_CHUNK_SIZE]
-                batch_data = {"queries": chunk_queries}
-
-                req = urllib.request.Request(
-                    OSV_BATCH_URL,
-                    data=json.dumps(batch_data).encode("utf-8"),
-                    headers={"Content-Type": "application/json"},
-                )
-
-                with urllib.request.urlopen(req, timeout=60) as response:
-                    result = json.loads(response.read().decode("utf-8"))
-
-                for chunk_idx, result_item in enumerate(result.get("results", [])):
-                    global_idx = chunk_start + chunk_idx
-                    if global_idx not in dep_map:
-                        continue
-                    pkg_info = dep_map[global_idx]
-
-                    for vuln in result_item.get("vulns", []):
-                        vuln_id = vuln.get("id", "")
-                        if vuln_id:
-                            if vuln_id not in vuln_to_packages:
-                                vuln_to_packages[vuln_id] = []
-                            vuln_to_packages[vuln_id].append(pkg_info)
+            vuln_to_packages: Dict[str, List[Dict[str, str]]] = {}
+            for (name, version), vuln_ids in (await self.registry.query_osv(packages, ecosystem)).items():
+                for vuln_id in vuln_ids:
+                    vuln_to_packages.setdefault(vuln_id, []).append({"name": name, "version": version})
 
             if self.logger:
                 self.logger.info(f"Récupération des détails pour {len(vuln_to_packages)} vulnérabilités...")
 
-            for vuln_id, packages in vuln_to_packages.items():
-                try:
-                    vuln_req = urllib.request.Request(f"{OSV_VULN_URL}{vuln_id}")
-                    with urllib.request.urlopen(vuln_req, timeout=10) as resp:
-                        vuln_details = json.loads(resp.read().decode("utf-8"))
-
-                    severity = self.extract_osv_severity(vuln_details)
-                    description = vuln_details.get("summary", vuln_details.get("details", ""))[:200]
-                    if not description:
-                        description = f"Vulnérabilité {vuln_id}"
-
-                    aliases = vuln_details.get("aliases", [])
-                    cve_id = next((a for a in aliases if a.startswith("CVE-")), vuln_id)
-
-                    fix_versions = []
-                    for affected in vuln_details.get("affected", []):
-                        for range_info in affected.get("ranges", []):
-                            for event in range_info.get("events", []):
-                                if "fixed" in event:
-                                    fix_versions.append(event["fixed"])
-
-                    for pkg_info in packages:
-                        vulnerabilities.append(
-                            {
-                                "package": pkg_info["name"],
-                                "version": pkg_info["version"],
-                                "vulnerability_id": cve_id,
-                                "severity": severity,
-                                "description": description,
-                                "fix_versions": fix_versions or ["dernière version stable"],
-                            }
-                        )
-
-                except Exception as e:
+            details_by_id = await self.registry.fetch_vulnerabilities(list(vuln_to_packages))
+            for vuln_id, pkgs in vuln_to_packages.items():
+                vuln_details = details_by_id.get(vuln_id)
+                if vuln_details is None:
                     if self.logger:
-                        self.logger.debug(f"Erreur récupération détails {vuln_id}: {e}")
-                    for pkg_info in packages:
-                        vulnerabilities.append(
-                            {
-                                "package": pkg_info["name"],
-                                "version": pkg_info["version"],
-                                "vulnerability_id": vuln_id,
-                                "severity": "medium",
-                                "description": f"Vulnérabilité {vuln_id}",
-                                "fix_versions": ["dernière version stable"],
-                            }
-                        )
+                        self.logger.debug(f"Erreur récupération détails {vuln_id}")
+                    record = {
+                        "vulnerability_id": vuln_id,
+                        "severity": "medium",
+                        "description": f"Vulnérabilité {vuln_id}",
+                        "fix_versions": ["dernière version stable"],
+                    }
+                else:
+                    record = self._vulnerability_record(vuln_id, vuln_details)
+                for pkg_info in pkgs:
+                    vulnerabilities.append({"package": pkg_info["name"], "version": pkg_info["version"], **record})
 
         except Exception as e:
             if self.logger:
@@ -357,3 +245,30 @@ class DependencyAnalysisEngine:
             self.logger.info(f"OSV: {len(vulnerabilities)} vulnérabilité(s) détectée(s)")
 
         return vulnerabilities
+
+    def check_osv_vulnerabilities(self, deps: List[Dict[str, str]], ecosystem: str) -> List[Dict[str, Any]]:
+        """Version synchrone de :meth:`check_osv_vulnerabilities_async`."""
+        return run_async_from_sync(self.check_osv_vulnerabilities_async(deps, ecosystem), timeout=None)
+
+    def _vulnerability_record(self, vuln_id: str, vuln_details: Dict[str, Any]) -> Dict[str, Any]:
+        """Identifiant (CVE de préférence), sévérité, description et correctifs d'une vulnérabilité OSV."""
+        description = vuln_details.get("summary", vuln_details.get("details", ""))[:200]
+        if not description:
+            description = f"Vulnérabilité {vuln_id}"
+
+        aliases = vuln_details.get("aliases", [])
+        cve_id = next((a for a in aliases if a.startswith("CVE-")), vuln_id)
+
+        fix_versions = []
+        for affected in vuln_details.get("affected", []):
+            for range_info in affected.get("ranges", []):
+                for event in range_info.get("events", []):
+                    if "fixed" in event:
+                        fix_versions.append(event["fixed"])
+
+        return {
+            "vulnerability_id": cve_id,
+            "severity": self.extract_osv_severity(vuln_details),
+            "description": description,
+            "fix_versions": fix_versions or ["dernière version stable"],
+        }
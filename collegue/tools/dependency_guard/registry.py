@@ -0,0 +1,285 @@
+"""
+Client HTTP des registres (PyPI, npm, Packagist) et de l'API OSV.
+
+Chaque vérification ouvrait sa propre connexion urllib (une poignée de main
+TCP+TLS par package, dix threads au plus) et les détails des vulnérabilités OSV
+étaient récupérés un par un. :class:`RegistryClient` regroupe les requêtes d'un
+lot sur un ``httpx.AsyncClient`` : connexions keep-alive réutilisées, HTTP/2 si
+le paquet ``h2`` est installé, requêtes simultanées bornées par
+``DEPENDENCY_GUARD_MAX_CONCURRENCY``. Les réponses passent par le cache disque
+optionnel (:mod:`.cache`), les entrées expirées munies d'un ETag étant
+revalidées par ``If-None-Match``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import urllib.parse
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from .cache import PackageVersion, RegistryMetadataCache, get_registry_cache
+from .config import (
+    DEFAULT_MAX_CONCURRENCY,
+    HTTP_TIMEOUT,
+    OSV_BATCH_TIMEOUT,
+    OSV_BATCH_URL,
+    OSV_CHUNK_SIZE,
+    OSV_VULN_URL,
+    REGISTRY_URLS,
+)
+
+# Métadonnées abrégées de npm : ``dist-tags`` sans le détail de chaque version publiée.
+_NPM_ABBREVIATED = "application/vnd.npm.install-v1+json; q=1.0, application/json; q=0.8"
+
+# Longueur de description gardée des détails OSV (le moteur en affiche 200 caractères).
+_DESCRIPTION_LENGTH = 200
+
+
+@lru_cache(maxsize=1)
+def http2_available() -> bool:
+    """Vrai si ``h2`` est installé (HTTP/2 de httpx)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def registry_for_language(language: str) -> str:
+    if language == "python":
+        return "pypi"
+    if language == "php":
+        return "packagist"
+    return "npm"
+
+
+class RegistryClient:
+    """Requêtes groupées vers les registres et OSV, avec cache optionnel.
+
+    Un ``httpx.AsyncClient`` est ouvert par lot (un appel de méthode) et fermé à
+    la fin : il appartient à la boucle d'événements de l'appel, qui peut être
+    éphémère (``run_async_from_sync``).
+    """
+
+    def __init__(
+        self,
+        cache: Optional[RegistryMetadataCache] = None,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = HTTP_TIMEOUT,
+        registry_urls: Optional[Dict[str, str]] = None,
+        osv_batch_url: str = OSV_BATCH_URL,
+        osv_vuln_url: str = OSV_VULN_URL,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.cache = cache
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.timeout = timeout
+        self.registry_urls = {**REGISTRY_URLS, **(registry_urls or {})}
+        self.osv_batch_url = osv_batch_url
+        self.osv_vuln_url = osv_vuln_url
+        self._transport = transport
+
+    @classmethod
+    def from_settings(cls, settings_obj: Optional[object] = None) -> "RegistryClient":
+        """Client configuré par ``DEPENDENCY_GUARD_*`` (cache compris s'il est activé)."""
+        if settings_obj is None:
+            try:
+                from collegue.config import settings as settings_obj
+            except Exception:
+                return cls()
+        return cls(
+            get_registry_cache(settings_obj),
+            max_concurrency=int(getattr(settings_obj, "DEPENDENCY_GUARD_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+        )
+
+    def _open(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=limits,
+            http2=self._transport is None and http2_available(),
+            follow_redirects=True,
+            transport=self._transport,
+        )
+
+    # ==================== Registres ====================
+
+    def _package_url(self, registry: str, name: str) -> str:
+        if registry == "npm":
+            # Paquets scopés : ``@scope/nom`` → ``@scope%2Fnom``.
+            name = urllib.parse.quote(name, safe="@")
+        return self.registry_urls[registry].format(package=name)
+
+    async def check_existence(self, names: Sequence[str], registry: str) -> Dict[str, Dict[str, Any]]:
+        """``{package: {"exists", "latest_version"}}`` (ou ``{"exists": None, "error"}``) pour ``names``."""
+        unique = list(dict.fromkeys(names))
+        cached = self.cache.lookup_metadata(registry, unique) if self.cache is not None else {}
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        for name in unique:
+            entry, fresh = cached.get(name, (None, False))
+            if fresh:
+                results[name] = _public(entry)
+            else:
+                pending.append((name, entry if entry and entry.get("etag") else None))
+        if not pending:
+            return results
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._open() as client:
+            fetched = await asyncio.gather(
+                *(self._fetch_metadata(client, semaphore, registry, name, stale) for name, stale in pending)
+            )
+        to_store = []
+        for (name, _stale), (result, entry) in zip(pending, fetched, strict=True):
+            results[name] = result
+            if entry is not None:
+                to_store.append((name, entry))
+        if self.cache is not None and to_store:
+            self.cache.store_metadata(registry, to_store)
+        return results
+
+    async def _fetch_metadata(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        registry: str,
+        name: str,
+        stale: Optional[Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """``(résultat, entrée à mettre en cache ou None)`` pour un package."""
+        headers = {}
+        if registry == "npm":
+            headers["Accept"] = _NPM_ABBREVIATED
+        if stale is not None:
+            headers["If-None-Match"] = stale["etag"]
+        try:
+            async with semaphore:
+                response = await client.get(self._package_url(registry, name), headers=headers)
+        except httpx.HTTPError as e:
+            return {"exists": None, "error": str(e) or type(e).__name__}, None
+        if response.status_code == 304 and stale is not None:
+            return _public(stale), stale
+        if response.status_code == 404:
+            return {"exists": False}, {"exists": False}
+        if response.status_code != 200:
+            return {"exists": None, "error": f"HTTP {response.status_code}"}, None
+        try:
+            latest = _latest_version(registry, response.json())
+        except ValueError as e:
+            return {"exists": None, "error": str(e)}, None
+        entry = {"exists": True, "latest_version": latest, "etag": response.headers.get("etag")}
+        return _public(entry), entry
+
+    # ==================== OSV ====================
+
+    async def query_osv(self, packages: Sequence[PackageVersion], ecosystem: str) -> Dict[PackageVersion, List[str]]:
+        """Identifiants des vulnérabilités OSV de chaque ``(package, version)``.
+
+        Les requêtes batch non couvertes par le cache partent en parallèle, par
+        lots de ``OSV_CHUNK_SIZE`` ; une erreur HTTP est propagée, une réponse batch
+        d'une autre longueur que son lot lève ``ValueError``.
+        """
+        unique = list(dict.fromkeys(packages))
+        results = self.cache.lookup_osv(ecosystem, unique) if self.cache is not None else {}
+        missing = [package for package in unique if package not in results]
+        if not missing:
+            return results
+
+        chunks = [missing[start : start + OSV_CHUNK_SIZE] for start in range(0, len(missing), OSV_CHUNK_SIZE)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._open() as client:
+            answers = await asyncio.gather(
+                *(self._query_batch(client, semaphore, chunk, ecosystem) for chunk in chunks)
+            )
+        fetched: Dict[PackageVersion, List[str]] = {}
+        for chunk, answer in zip(chunks, answers, strict=True):
+            for package, item in zip(chunk, answer, strict=True):
+                fetched[package] = [vuln["id"] for vuln in (item or {}).get("vulns", []) if vuln.get("id")]
+        if self.cache is not None:
+            self.cache.store_osv(ecosystem, fetched)
+        results.update(fetched)
+        return results
+
+    async def _query_batch(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        chunk: Sequence[PackageVersion],
+        ecosystem: str,
+    ) -> List[Dict[str, Any]]:
+        queries = [{"package": {"name": name, "ecosystem": ecosystem}, "version": version} for name, version in chunk]
+        async with semaphore:
+            response = await client.post(self.osv_batch_url, json={"queries": queries}, timeout=OSV_BATCH_TIMEOUT)
+        response.raise_for_status()
+        return response.json().get("results", [])
+
+    async def fetch_vulnerabilities(self, vuln_ids: Sequence[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Détails OSV de chaque identifiant, ``None`` si la récupération a échoué."""
+        unique = list(dict.fromkeys(vuln_ids))
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        if self.cache is not None:
+            results.update(self.cache.lookup_vulns(unique))
+        missing = [vuln_id for vuln_id in unique if vuln_id not in results]
+        if not missing:
+            return results
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._open() as client:
+            fetched = await asyncio.gather(*(self._fetch_vuln(client, semaphore, vuln_id) for vuln_id in missing))
+        found = {vuln_id: details for vuln_id, details in zip(missing, fetched, strict=True) if details is not None}
+        if self.cache is not None and found:
+            self.cache.store_vulns(found)
+        results.update(zip(missing, fetched, strict=True))
+        return results
+
+    async def _fetch_vuln(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, vuln_id: str
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            async with semaphore:
+                response = await client.get(f"{self.osv_vuln_url}{vuln_id}")
+            response.raise_for_status()
+            return _trim_vuln(response.json())
+        except (httpx.HTTPError, ValueError):
+            return None
+
+
+def _public(entry: Dict[str, Any]) -> Dict[str, Any]:
+    if entry.get("exists"):
+        return {"exists": True, "latest_version": entry.get("latest_version")}
+    return {"exists": False}
+
+
+def _latest_version(registry: str, data: Dict[str, Any]) -> Optional[str]:
+    if registry == "pypi":
+        return data.get("info", {}).get("version")
+    if registry == "packagist":
+        versions = list(data.get("package", {}).get("versions", {}).keys())
+        return next((v for v in versions if "dev" not in v), versions[0] if versions else None)
+    return data.get("dist-tags", {}).get("latest")
+
+
+def _trim_vuln(details: Dict[str, Any]) -> Dict[str, Any]:
+    """Sous-ensemble des détails OSV lu par le moteur (sévérité, résumé, alias, correctifs)."""
+    trimmed = {field: details[field][:_DESCRIPTION_LENGTH] for field in ("summary", "details") if field in details}
+    trimmed["aliases"] = details.get("aliases", [])
+    trimmed["database_specific"] = _severity_only(details.get("database_specific"))
+    trimmed["affected"] = [
+        {
+            "ecosystem_specific": _severity_only(affected.get("ecosystem_specific")),
+            "ranges": [
+                {"events": [event for event in range_info.get("events", []) if "fixed" in event]}
+                for range_info in affected.get("ranges", [])
+            ],
+        }
+        for affected in details.get("affected", [])
+    ]
+    return trimmed
+
+
+def _severity_only(section: Any) -> Dict[str, Any]:
+    if isinstance(section, dict) and "severity" in section:
+        return {"severity": section["severity"]}
+    return {}
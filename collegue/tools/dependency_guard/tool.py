@@ -11,10 +11,11 @@ Cet outil vérifie la validité et la sécurité des dépendances d'un projet:
 Refactorisé: Le fichier original faisait 834 lignes, maintenant ~200 lignes.
 """
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Optional
 
-from ...core.shared import aggregate_severities
+from ...core.shared import aggregate_severities, run_async_from_sync
+from ...core.tool_cache import fingerprint
 from ..base import BaseTool, ToolValidationError
 from .config import DEPRECATED_PACKAGES, KNOWN_MALICIOUS_PACKAGES, LANGUAGE_ECOSYSTEM
 from .engine import DependencyAnalysisEngine
@@ -56,6 +57,13 @@ class DependencyGuardTool(BaseTool):
         super().__init__(config, app_state)
         self._engine = DependencyAnalysisEngine(logger=self.logger)
 
+    def is_cacheable(self, request: DependencyGuardRequest) -> bool:
+        """Sans interrogation des registres/OSV, l'analyse est purement statique."""
+        return not request.check_vulnerabilities and not request.check_existence
+
+    def get_cache_version(self) -> str:
+        return f"{self.cache_version}:{fingerprint((KNOWN_MALICIOUS_PACKAGES, DEPRECATED_PACKAGES))}"
+
     def get_usage_description(self) -> str:
         return (
             "Outil de validation des dépendances qui vérifie l'existence des packages, "
@@ -105,11 +113,11 @@ class DependencyGuardTool(BaseTool):
         self,
         dep: Dict[str, str],
         language: str,
-        check_existence: bool,
+        existence: Optional[Dict[str, Any]],
         allowlist: List[str],
         blocklist: List[str],
     ) -> List[DependencyIssue]:
-        """Vérifie une seule dépendance."""
+        """Vérifie une seule dépendance (``existence`` : résultat du registre, ``None`` si non vérifiée)."""
         issues = []
         name = dep["name"]
         version = dep["version"]
@@ -170,9 +178,8 @@ class DependencyGuardTool(BaseTool):
             )
 
         # Vérifier l'existence sur le registre
-        if check_existence:
-            check = self._engine.check_package_existence(name, language)
-            if check.get("exists") is False:
+        if existence is not None:
+            if existence.get("exists") is False:
                 issues.append(
                     DependencyIssue(
                         package=name,
@@ -186,8 +193,24 @@ class DependencyGuardTool(BaseTool):
 
         return issues
 
+    async def _check_existence(
+        self, deps: List[Dict[str, str]], request: DependencyGuardRequest
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Existence de chaque dépendance sur le registre, ``None`` si la vérification est désactivée."""
+        if not request.check_existence or not deps:
+            return None
+        return await self._engine.check_packages_existence([dep["name"] for dep in deps], request.language)
+
     def _execute_core_logic(self, request: DependencyGuardRequest, **kwargs) -> DependencyGuardResponse:
-        """Exécute la validation des dépendances."""
+        """Exécute la validation des dépendances (les timeouts HTTP bornent chaque requête)."""
+        return run_async_from_sync(self._execute_core_logic_async(request, **kwargs), timeout=None)
+
+    async def _execute_core_logic_async(self, request: DependencyGuardRequest, **kwargs) -> DependencyGuardResponse:
+        """Exécute la validation des dépendances.
+
+        Existence sur le registre et vulnérabilités OSV sont interrogées en même
+        temps, chacune en un lot de requêtes concurrentes (voir :mod:`.registry`).
+        """
         issues = []
 
         # Détecter le type de fichier
@@ -210,42 +233,43 @@ class DependencyGuardTool(BaseTool):
 
         deps = parser(request.content)
 
-        # Vérifier les dépendances en parallèle
-        def check_dep(dep):
-            return self._check_single_dep(
-                dep,
-                request.language,
-                request.check_existence,
-                request.allowlist or [],
-                request.blocklist or [],
-            )
+        # Interroger registre et OSV en parallèle
+        ecosystem = LANGUAGE_ECOSYSTEM.get(request.language, "npm")
+        existence, vulns = await asyncio.gather(
+            self._check_existence(deps, request),
+            self._engine.check_osv_vulnerabilities_async(deps, ecosystem)
+            if request.check_vulnerabilities
+            else _no_result(),
+        )
 
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(check_dep, deps))
-            for res in results:
-                issues.extend(res)
+        for dep in deps:
+            issues.extend(
+                self._check_single_dep(
+                    dep,
+                    request.language,
+                    existence.get(dep["name"]) if existence is not None else None,
+                    request.allowlist or [],
+                    request.blocklist or [],
+                )
+            )
 
         # Vérifier les vulnérabilités
-        if request.check_vulnerabilities:
-            ecosystem = LANGUAGE_ECOSYSTEM.get(request.language, "npm")
-            vulns = self._engine.check_osv_vulnerabilities(deps, ecosystem)
+        for vuln in vulns or []:
+            severity = vuln.get("severity", "high")
+            if severity not in ["low", "medium", "high", "critical"]:
+                severity = "high"
 
-            for vuln in vulns:
-                severity = vuln.get("severity", "high")
-                if severity not in ["low", "medium", "high", "critical"]:
-                    severity = "high"
-
-                issues.append(
-                    DependencyIssue(
-                        package=vuln["package"],
-                        version=vuln.get("version"),
-                        issue_type="vulnerable",
-                        severity=severity,
-                        message=vuln.get("description", "Vulnérabilité connue"),
-                        recommendation=f"Mettez à jour vers: {vuln.get('fix_versions', ['dernière version'])}",
-                        cve_ids=[vuln.get("vulnerability_id")] if vuln.get("vulnerability_id") else None,
-                    )
+            issues.append(
+                DependencyIssue(
+                    package=vuln["package"],
+                    version=vuln.get("version"),
+                    issue_type="vulnerable",
+                    severity=severity,
+                    message=vuln.get("description", "Vulnérabilité connue"),
+                    recommendation=f"Mettez à jour vers: {vuln.get('fix_versions', ['dernière version'])}",
+                    cve_ids=[vuln.get("vulnerability_id")] if vuln.get("vulnerability_id") else None,
                 )
+            )
 
         # Calculer les statistiques
         severity_counts = aggregate_severities(issues)
@@ -273,3 +297,7 @@ class DependencyGuardTool(BaseTool):
             low=severity_counts["low"],
             issues=issues,
         )
+
+
+async def _no_result() -> None:
+    return None
@@ -2,13 +2,36 @@
 Moteur d'analyse pour l'outil IaC Guardrails Scan.
 
 Contient la logique métier pure, séparée de l'orchestration du Tool.
+
+L'outil passe par :class:`IacFileScanner` : pour chaque fichier, détection du
+type, scanner dédié puis policies personnalisées (compilées une fois par requête,
+:mod:`.ruleset`), en partageant l'index de lignes (et le manifeste YAML) du
+fichier ; au-delà de ``PARALLEL_MIN_FILES`` fichiers, ils sont répartis sur un
+pool de process. Les règles YAML embarquées n'y servent qu'au décompte des
+règles évaluées : leurs identifiants recoupent ceux des scanners dédiés avec un
+autre sens (``K8S-008``…), les appliquer changerait les résultats de l'outil.
+
+Elles restent appliquées par l'API du moteur (:meth:`IacAnalysisEngine.scan_kubernetes`,
+``scan_terraform``, ``scan_dockerfile``), qui les compile une fois par moteur
+(:meth:`IacAnalysisEngine.ruleset`).
 """
 
-import re
-from typing import Dict, List, Tuple
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..scanners import BaseScanner, LineIndex
+from ..scanners.dockerfile import DockerfileScanner
+from ..scanners.kubernetes import KubernetesManifest, KubernetesScanner, parse_manifest
+from ..scanners.terraform import TerraformScanner
 from .config import SEVERITY_WEIGHTS
 from .models import IacFinding
+from .ruleset import CompiledRuleset, compile_ruleset
+
+# Nombre minimal de fichiers pour répartir un scan sur un pool de process.
+PARALLEL_MIN_FILES = 64
+
+_ScanResult = Tuple[List[IacFinding], int]
 
 
 class IacAnalysisEngine:
@@ -19,6 +42,20 @@ class IacAnalysisEngine:
         self.tf_rules = tf_rules
         self.dockerfile_rules = dockerfile_rules
         self.logger = logger
+        self._rulesets: Dict[Tuple[str, str, Tuple[str, ...]], CompiledRuleset] = {}
+
+    def rules_for(self, kind: str) -> dict:
+        """Règles brutes d'un type de fichier (``kubernetes``, ``terraform``, ``dockerfile``)."""
+        return {"kubernetes": self.k8s_rules, "terraform": self.tf_rules, "dockerfile": self.dockerfile_rules}[kind]
+
+    def ruleset(self, kind: str, level: str, exclude: Tuple[str, ...] = ()) -> CompiledRuleset:
+        """Règles ``level`` (baseline/strict) d'un type de fichier, compilées au premier usage."""
+        key = (kind, level, exclude)
+        compiled = self._rulesets.get(key)
+        if compiled is None:
+            compiled = compile_ruleset(self.rules_for(kind).get(level, []), exclude, self.logger)
+            self._rulesets[key] = compiled
+        return compiled
 
     def detect_file_type(self, filepath: str, content: str) -> str:
         """Détecte le type de fichier IaC."""
@@ -39,64 +76,43 @@ class IacAnalysisEngine:
 
         return "unknown"
 
-    def apply_regex_rule(self, rule: Dict, content: str, filepath: str, lines: List[str]) -> List[IacFinding]:
-        """Applique une règle regex sur le contenu d'un fichier."""
+    def apply_regex_rule(
+        self,
+        rule: Dict,
+        content: str,
+        filepath: str,
+        lines: List[str],
+        line_index: Optional[LineIndex] = None,
+    ) -> List[IacFinding]:
+        """Applique une règle regex sur le contenu d'un fichier (``line_index`` : index partagé)."""
+        return compile_ruleset([rule], logger=self.logger).scan(content, filepath, line_index)
+
+    def scan_kubernetes(
+        self, content: str, filepath: str, profile: str, manifest: Optional[KubernetesManifest] = None
+    ) -> List[IacFinding]:
+        """Scan un fichier Kubernetes avec les règles YAML embarquées (API du moteur, hors outil).
+
+        ``manifest`` : analyse YAML déjà faite (partagée avec ``KubernetesScanner.scan``),
+        sinon le contenu est analysé ici. Un YAML invalide garde les règles regex.
+        """
         findings = []
-        pattern = rule["pattern"]
-        check_type = rule.get("check_type", "presence")
-
-        try:
-            if check_type == "presence":
-                matches = list(re.finditer(pattern, content, re.MULTILINE | re.IGNORECASE))
-                for match in matches:
-                    line_num = content[: match.start()].count("\n") + 1
-                    findings.append(
-                        IacFinding(
-                            rule_id=rule["id"],
-                            severity=rule["severity"],
-                            path=filepath,
-                            line=line_num,
-                            title=rule["title"],
-                            description=rule["description"],
-                            remediation=rule["remediation"],
-                            references=rule.get("references", []),
-                            engine="embedded-rules",
-                        )
-                    )
 
-            elif check_type == "absence":
-                if not re.search(pattern, content, re.MULTILINE | re.IGNORECASE):
-                    findings.append(
-                        IacFinding(
-                            rule_id=rule["id"],
-                            severity=rule["severity"],
-                            path=filepath,
-                            line=1,
-                            title=rule["title"],
-                            description=rule["description"],
-                            remediation=rule["remediation"],
-                            references=rule.get("references", []),
-                            engine="embedded-rules",
-                        )
-                    )
-        except re.error as e:
-            if self.logger:
-                self.logger.warning(f"Erreur regex pour {rule['id']}: {e}")
-
-        return findings
-
-    def scan_kubernetes(self, content: str, filepath: str, profile: str) -> List[IacFinding]:
-        """Scan un fichier Kubernetes."""
-        findings = []
-        lines = content.split("\n")
+        if manifest is None:
+            try:
+                manifest = parse_manifest(content)
+            except Exception:
+                manifest = None
+        line_index = manifest.line_index if manifest is not None else LineIndex(content)
 
-        for rule in self.k8s_rules.get("baseline", []):
-            findings.extend(self.apply_regex_rule(rule, content, filepath, lines))
+        findings.extend(self.ruleset("kubernetes", "baseline").scan(content, filepath, line_index))
 
         if profile == "strict":
-            if "securityContext" in content:
-                for rule in self.k8s_rules.get("strict", []):
-                    findings.extend(self.apply_regex_rule(rule, content, filepath, lines))
+            if manifest is not None:
+                has_security_context = manifest.has_key("securityContext")
+            else:
+                has_security_context = "securityContext" in content
+            if has_security_context:
+                findings.extend(self.ruleset("kubernetes", "strict").scan(content, filepath, line_index))
             else:
                 findings.append(
                     IacFinding(
@@ -115,21 +131,19 @@ class IacAnalysisEngine:
         return findings
 
     def scan_terraform(self, content: str, filepath: str, profile: str) -> List[IacFinding]:
-        """Scan un fichier Terraform."""
+        """Scan un fichier Terraform avec les règles YAML embarquées (API du moteur, hors outil)."""
         findings = []
-        lines = content.split("\n")
+        line_index = LineIndex(content)
 
-        for rule in self.tf_rules.get("baseline", []):
-            findings.extend(self.apply_regex_rule(rule, content, filepath, lines))
+        findings.extend(self.ruleset("terraform", "baseline").scan(content, filepath, line_index))
 
         if profile == "strict":
-            for rule in self.tf_rules.get("strict", []):
-                findings.extend(self.apply_regex_rule(rule, content, filepath, lines))
+            findings.extend(self.ruleset("terraform", "strict").scan(content, filepath, line_index))
 
         return findings
 
     def scan_dockerfile(self, content: str, filepath: str, profile: str) -> List[IacFinding]:
-        """Scan un Dockerfile."""
+        """Scan un Dockerfile avec les règles YAML embarquées (API du moteur, hors outil)."""
         findings = []
         lines = content.split("\n")
 
@@ -158,14 +172,13 @@ class IacAnalysisEngine:
                 )
             )
 
-        for rule in self.dockerfile_rules.get("baseline", []):
-            if rule["id"] == "DOCKER-001":
-                continue
-            findings.extend(self.apply_regex_rule(rule, content, filepath, lines))
+        line_index = LineIndex(content)
+        findings.extend(
+            self.ruleset("dockerfile", "baseline", exclude=("DOCKER-001",)).scan(content, filepath, line_index)
+        )
 
         if profile == "strict":
-            for rule in self.dockerfile_rules.get("strict", []):
-                findings.extend(self.apply_regex_rule(rule, content, filepath, lines))
+            findings.extend(self.ruleset("dockerfile", "strict").scan(content, filepath, line_index))
 
         return findings
 
@@ -306,3 +319,110 @@ class IacAnalysisEngine:
                 f"Critique({severity_counts['critical']}), Haute({severity_counts['high']}), "
                 f"Moyenne({severity_counts['medium']}), Basse({severity_counts['low']})."
             )
+
+
+class IacFileScanner:
+    """Scan d'un fichier IaC par l'outil : scanner dédié au type détecté, puis policies personnalisées.
+
+    Les règles YAML embarquées ne sont pas appliquées ici (voir le docstring du module) ;
+    elles ne comptent que dans le nombre de règles évaluées.
+    """
+
+    def __init__(
+        self,
+        engine: IacAnalysisEngine,
+        scanners: Optional[Dict[str, BaseScanner]] = None,
+        custom_rules: Optional[CompiledRuleset] = None,
+        custom_max_size: int = 1_000_000,
+        logger=None,
+    ):
+        self.engine = engine
+        self.scanners = scanners or {
+            "kubernetes": KubernetesScanner(logger=logger),
+            "terraform": TerraformScanner(logger=logger),
+            "dockerfile": DockerfileScanner(logger=logger),
+        }
+        self.custom_rules = custom_rules
+        self.custom_max_size = custom_max_size
+        self.logger = logger
+
+    def scan(self, path: str, content: str, profile: str) -> _ScanResult:
+        """Findings d'un fichier et nombre de règles embarquées évaluées."""
+        file_type = self.engine.detect_file_type(path, content)
+        if self.logger:
+            self.logger.debug(f"Fichier {path}: type={file_type}")
+
+        findings: List[IacFinding] = []
+        rules_count = 0
+        line_index: Optional[LineIndex] = None
+
+        if file_type in self.scanners:
+            rules = self.engine.rules_for(file_type)
+            rules_count += len(rules.get("baseline", []))
+            if profile == "strict":
+                rules_count += len(rules.get("strict", []))
+
+            scanner = self.scanners[file_type]
+            raw = []
+            if file_type == "kubernetes":
+                try:
+                    manifest = parse_manifest(content)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.warning(f"Erreur parsing YAML {path}: {e}")
+                else:
+                    line_index = manifest.line_index
+                    raw = scanner.scan(content, path, profile, manifest=manifest)
+            elif file_type == "terraform":
+                line_index = LineIndex(content)
+                raw = scanner.scan(content, path, profile, line_index=line_index)
+            else:
+                raw = scanner.scan(content, path, profile)
+            findings.extend(self.engine.convert_findings(raw))
+
+        if self.custom_rules:
+            # Contenu plafonné une fois pour toutes les policies ; l'index de lignes du
+            # fichier complet reste valable sur son préfixe.
+            scan_content = content[: self.custom_max_size]
+            if len(content) > self.custom_max_size and self.logger:
+                self.logger.info(
+                    f"Custom policy scan: content truncated from {len(content)} to "
+                    f"{self.custom_max_size} bytes for {path}"
+                )
+            findings.extend(self.custom_rules.scan(scan_content, path, line_index))
+
+        return findings, rules_count
+
+    def scan_files(self, files: List[Tuple[str, str]], profile: str, workers: int = 1) -> List[_ScanResult]:
+        """Scanne des ``(chemin, contenu)`` dans l'ordre, en parallèle si ``workers`` > 1 et assez de fichiers."""
+        if workers > 1 and len(files) >= PARALLEL_MIN_FILES:
+            engine = self.engine
+            rules = (engine.k8s_rules, engine.tf_rules, engine.dockerfile_rules)
+            custom_rules = dataclasses.replace(self.custom_rules, logger=None) if self.custom_rules else None
+            jobs = [(path, content, profile) for path, content in files]
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_scan_worker,
+                    initargs=(rules, custom_rules, self.custom_max_size),
+                ) as pool:
+                    return list(pool.map(_scan_file_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+            except Exception as e:
+                # Pool indisponible (sandbox, ressources) : repli séquentiel
+                if self.logger:
+                    self.logger.warning(f"Scan IaC parallèle indisponible ({e}), repli séquentiel")
+        return [self.scan(path, content, profile) for path, content in files]
+
+
+# État des process du pool (un moteur, des scanners et les policies compilées par process).
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_scan_worker(rules: Tuple[dict, dict, dict], custom_rules: Optional[CompiledRuleset], custom_max_size: int):
+    engine = IacAnalysisEngine(*rules)
+    _worker_state["scanner"] = IacFileScanner(engine, custom_rules=custom_rules, custom_max_size=custom_max_size)
+
+
+def _scan_file_job(job: Tuple[str, str, str]) -> _ScanResult:
+    path, content, profile = job
+    return _worker_state["scanner"].scan(path, content, profile)
@@ -0,0 +1,234 @@
+"""
+Compilation des règles IaC pour l'outil IaC Guardrails Scan.
+
+Les règles YAML embarquées (K8s, Terraform, Dockerfile, baseline/strict) et les
+policies personnalisées d'une requête sont compilées une fois en un
+:class:`CompiledRuleset` réutilisé pour chaque fichier :
+
+- chaque pattern est compilé une seule fois (``compile_pattern``, mis en cache) ;
+- les lignes des correspondances viennent d'un
+  :class:`~collegue.tools.scanners.LineIndex` construit une fois par fichier et
+  partagé par toutes les règles (au lieu de recompter les retours à la ligne
+  depuis le début du fichier à chaque correspondance) ;
+- les règles de présence sont d'abord cherchées ensemble, en une passe, via une
+  alternation de leurs patterns : si elle ne trouve rien, aucune ne peut
+  correspondre et le fichier n'est pas reparcouru règle par règle.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+import yaml
+
+from ..scanners import LineIndex
+from .models import CustomPolicy, IacFinding
+
+_FLAGS = re.MULTILINE | re.IGNORECASE
+# Patterns exclus de la passe combinée : références arrière (numérotation décalée dans
+# l'alternation) et drapeaux globaux inline (ils s'appliqueraient aux autres patterns).
+_UNCOMBINABLE = re.compile(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)")
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> Pattern[str]:
+    """Pattern de règle compilé (``MULTILINE | IGNORECASE``) ; lève ``re.error`` si invalide."""
+    return re.compile(pattern, _FLAGS)
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """Règle prête à l'emploi : regex compilée et gabarit du finding produit."""
+
+    rule_id: str
+    severity: str
+    title: str
+    description: str
+    remediation: str
+    regex: Pattern[str]
+    # presence : un finding par correspondance ; absence : un finding si aucune ;
+    # first : un seul finding (ligne 1) dès la première correspondance.
+    check_type: str = "presence"
+    references: Tuple[str, ...] = ()
+    engine: str = "embedded-rules"
+
+    @classmethod
+    def from_rule(cls, rule: Dict[str, Any], engine: str = "embedded-rules") -> "CompiledRule":
+        """Compile une règle des fichiers YAML de ``collegue/tools/rules``."""
+        return cls(
+            rule_id=rule["id"],
+            severity=rule["severity"],
+            title=rule["title"],
+            description=rule["description"],
+            remediation=rule["remediation"],
+            regex=compile_pattern(rule["pattern"]),
+            check_type=rule.get("check_type", "presence"),
+            references=tuple(rule.get("references", [])),
+            engine=engine,
+        )
+
+    def finding(self, filepath: str, line: int) -> IacFinding:
+        return IacFinding(
+            rule_id=self.rule_id,
+            severity=self.severity,
+            path=filepath,
+            line=line,
+            title=self.title,
+            description=self.description,
+            remediation=self.remediation,
+            references=list(self.references),
+            engine=self.engine,
+        )
+
+
+@dataclass
+class CompiledRuleset:
+    """Ensemble ordonné de règles compilées, appliqué fichier par fichier."""
+
+    rules: Tuple[CompiledRule, ...]
+    # Au-delà, les correspondances d'une règle de présence sont ignorées (policies utilisateur).
+    max_matches: Optional[int] = None
+    logger: Any = None
+    _prefilter: Optional[Pattern[str]] = field(init=False, default=None, repr=False)
+    _gated: Tuple[bool, ...] = field(init=False, default=(), repr=False)
+
+    def __post_init__(self):
+        gated = [rule.check_type != "absence" and not _UNCOMBINABLE.search(rule.regex.pattern) for rule in self.rules]
+        patterns = [rule.regex.pattern for rule, keep in zip(self.rules, gated, strict=True) if keep]
+        # Une passe combinée n'a d'intérêt qu'à partir de deux règles.
+        if len(patterns) > 1:
+            try:
+                self._prefilter = re.compile("|".join(f"(?:{p})" for p in patterns), _FLAGS)
+            except re.error:
+                # Groupes nommés en double, drapeaux globaux en milieu de pattern… : pas de passe combinée.
+                gated = [False] * len(self.rules)
+        else:
+            gated = [False] * len(self.rules)
+        self._gated = tuple(gated)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def scan(self, content: str, filepath: str, line_index: Optional[LineIndex] = None) -> List[IacFinding]:
+        """Applique les règles dans l'ordre ; ``line_index`` : index de lignes partagé de ``content``."""
+        findings: List[IacFinding] = []
+        if not self.rules:
+            return findings
+        any_match = self._prefilter is None or self._prefilter.search(content) is not None
+
+        for rule, gated in zip(self.rules, self._gated, strict=True):
+            if rule.check_type == "absence":
+                if not rule.regex.search(content):
+                    findings.append(rule.finding(filepath, 1))
+                continue
+            if gated and not any_match:
+                continue
+            if rule.check_type == "first":
+                if rule.regex.search(content):
+                    findings.append(rule.finding(filepath, 1))
+                continue
+            if rule.check_type != "presence":
+                continue
+            for count, match in enumerate(rule.regex.finditer(content)):
+                if self.max_matches is not None and count >= self.max_matches:
+                    if self.logger:
+                        self.logger.warning(f"Policy {rule.rule_id} hit match cap ({self.max_matches})")
+                    break
+                if line_index is None:
+                    line_index = LineIndex(content)
+                findings.append(rule.finding(filepath, line_index.line_at(match.start())))
+
+        return findings
+
+
+def compile_ruleset(rules: Iterable[Dict[str, Any]], exclude: Sequence[str] = (), logger=None) -> CompiledRuleset:
+    """Compile une liste de règles YAML (hors ``exclude``) ; une regex invalide est ignorée."""
+    compiled = []
+    for rule in rules:
+        if rule["id"] in exclude:
+            continue
+        try:
+            compiled.append(CompiledRule.from_rule(rule))
+        except re.error as e:
+            if logger:
+                logger.warning(f"Erreur regex pour {rule['id']}: {e}")
+    return CompiledRuleset(tuple(compiled), logger=logger)
+
+
+def compile_custom_policies(
+    policies: Iterable[CustomPolicy],
+    looks_dangerous: Callable[[str], bool],
+    max_matches: Optional[int] = None,
+    logger=None,
+) -> CompiledRuleset:
+    """Compile les policies personnalisées d'une requête (une fois pour tous ses fichiers).
+
+    Les patterns rejetés par ``looks_dangerous`` (formes ReDoS connues), les regex
+    invalides et les policies YAML illisibles sont écartés avec un avertissement.
+    """
+    compiled = []
+    for policy in policies:
+        if policy.language == "regex":
+            if looks_dangerous(policy.content):
+                if logger:
+                    logger.warning(
+                        f"Policy {policy.id} rejected: regex pattern matches a known "
+                        f"ReDoS shape (nested quantifiers or alternation)."
+                    )
+                continue
+            try:
+                regex = compile_pattern(policy.content)
+            except re.error as e:
+                if logger:
+                    logger.warning(f"Erreur regex dans policy {policy.id}: {e}")
+                continue
+            compiled.append(
+                CompiledRule(
+                    rule_id=policy.id,
+                    severity=policy.severity,
+                    title=policy.description or f"Custom policy {policy.id}",
+                    description=policy.description or "Policy personnalisée déclenchée",
+                    remediation="Voir la documentation de la policy personnalisée",
+                    regex=regex,
+                    engine="custom-policy",
+                )
+            )
+
+        elif policy.language == "yaml-rules":
+            try:
+                rule_def = yaml.safe_load(policy.content)
+            except yaml.YAMLError as e:
+                if logger:
+                    logger.warning(f"Erreur YAML dans policy {policy.id}: {e}")
+                continue
+            if not isinstance(rule_def, dict):
+                continue
+            pattern = rule_def.get("pattern", "")
+            if not pattern:
+                continue
+            if looks_dangerous(pattern):
+                if logger:
+                    logger.warning(f"YAML policy {policy.id} rejected: pattern has ReDoS shape")
+                continue
+            try:
+                regex = compile_pattern(pattern)
+            except re.error as e:
+                if logger:
+                    logger.warning(f"Erreur regex dans policy {policy.id}: {e}")
+                continue
+            compiled.append(
+                CompiledRule(
+                    rule_id=policy.id,
+                    severity=policy.severity,
+                    title=rule_def.get("title", policy.description or policy.id),
+                    description=rule_def.get("description", policy.description or ""),
+                    remediation=rule_def.get("remediation", "Voir documentation"),
+                    regex=regex,
+                    check_type="first",
+                    references=tuple(rule_def.get("references", [])),
+                    engine="custom-yaml-policy",
+                )
+            )
+
+    return CompiledRuleset(tuple(compiled), max_matches=max_matches, logger=logger)
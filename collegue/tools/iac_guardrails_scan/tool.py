@@ -12,16 +12,18 @@ La logique métier a été déplacée dans engine.py, les modèles dans models.p
 """
 
 import asyncio
+import os
 from typing import Any, Dict, List
 
 from ...core.shared import aggregate_severities, load_rules
+from ...core.tool_cache import fingerprint
 from ..agent_loop import AgentLoopConfig, AgentLoopMixin
 from ..base import BaseTool
 from ..scanners.dockerfile import DockerfileScanner
 from ..scanners.kubernetes import KubernetesScanner
 from ..scanners.terraform import TerraformScanner
-from .config import DEEP_ANALYSIS_PROMPT_TEMPLATE
-from .engine import IacAnalysisEngine
+from .config import DEEP_ANALYSIS_PROMPT_TEMPLATE, RISK_THRESHOLDS, SEVERITY_WEIGHTS
+from .engine import IacAnalysisEngine, IacFileScanner
 from .models import (
     CustomPolicy,
     FileInput,
@@ -31,6 +33,7 @@ from .models import (
     LLMSecurityInsight,
     RemediationAction,
 )
+from .ruleset import CompiledRuleset, compile_custom_policies
 
 
 class IacGuardrailsScanTool(AgentLoopMixin, BaseTool):
@@ -68,6 +71,8 @@ class IacGuardrailsScanTool(AgentLoopMixin, BaseTool):
     response_model = IacGuardrailsResponse
     supported_languages = ["terraform", "kubernetes", "dockerfile", "yaml", "hcl", "tf"]
     long_running = False
+    # 2 : lignes des findings Kubernetes issues des positions YAML (clé exacte, pas 1re occurrence).
+    cache_version = "2"
 
     agent_config = AgentLoopConfig(
         max_iterations=2,
@@ -89,6 +94,14 @@ class IacGuardrailsScanTool(AgentLoopMixin, BaseTool):
         self._tf_scanner = TerraformScanner(logger=self.logger)
         self._dockerfile_scanner = DockerfileScanner(logger=self.logger)
 
+    def is_cacheable(self, request: IacGuardrailsRequest) -> bool:
+        """Seul le scan ``fast`` sans remédiation chaînée est déterministe (pas de LLM)."""
+        return request.analysis_depth == "fast" and not request.auto_chain
+
+    def get_cache_version(self) -> str:
+        rules = (self.K8S_RULES, self.TF_RULES, self.DOCKERFILE_RULES, SEVERITY_WEIGHTS, RISK_THRESHOLDS)
+        return f"{self.cache_version}:{fingerprint(rules)}"
+
     def cleanup(self, force_gc: bool = False) -> None:
         """Nettoie les ressources pour éviter les fuites mémoire."""
         super().cleanup(force_gc=force_gc)
@@ -165,82 +178,22 @@ class IacGuardrailsScanTool(AgentLoopMixin, BaseTool):
                 return True
         return False
 
-    def _apply_custom_policies(self, content: str, filepath: str, policies: List[CustomPolicy]) -> List[IacFinding]:
-        """Applique les policies personnalisées sur un fichier."""
-        import re
-
-        import yaml
-
-        findings = []
+    def _compile_custom_policies(self, policies: List[CustomPolicy]) -> CompiledRuleset:
+        """Compile les policies personnalisées une fois pour tous les fichiers de la requête."""
+        return compile_custom_policies(
+            policies, self._regex_looks_dangerous, max_matches=self._MAX_REGEX_MATCHES, logger=self.logger
+        )
 
-        # Cap content size once for all regex policies on this file
-        scan_content = content[: self._MAX_REGEX_CONTENT_SIZE]
-        if len(content) > self._MAX_REGEX_CONTENT_SIZE:
-            self.logger.info(
-                f"Custom policy scan: content truncated from {len(content)} to "
-                f"{self._MAX_REGEX_CONTENT_SIZE} bytes for {filepath}"
-            )
+    @staticmethod
+    def _scan_workers() -> int:
+        """Process du scan de fichiers (``IAC_SCAN_WORKERS``, 1 par défaut = séquentiel, 0 = un par cœur)."""
+        try:
+            from collegue.config import settings
 
-        for policy in policies:
-            if policy.language == "regex":
-                if self._regex_looks_dangerous(policy.content):
-                    self.logger.warning(
-                        f"Policy {policy.id} rejected: regex pattern matches a known "
-                        f"ReDoS shape (nested quantifiers or alternation)."
-                    )
-                    continue
-                try:
-                    matches_iter = re.finditer(policy.content, scan_content, re.MULTILINE | re.IGNORECASE)
-                    matches = []
-                    for i, m in enumerate(matches_iter):
-                        if i >= self._MAX_REGEX_MATCHES:
-                            self.logger.warning(f"Policy {policy.id} hit match cap ({self._MAX_REGEX_MATCHES})")
-                            break
-                        matches.append(m)
-                    for match in matches:
-                        line_num = scan_content[: match.start()].count("\n") + 1
-                        findings.append(
-                            IacFinding(
-                                rule_id=policy.id,
-                                severity=policy.severity,
-                                path=filepath,
-                                line=line_num,
-                                title=policy.description or f"Custom policy {policy.id}",
-                                description=policy.description or "Policy personnalisée déclenchée",
-                                remediation="Voir la documentation de la policy personnalisée",
-                                references=[],
-                                engine="custom-policy",
-                            )
-                        )
-                except re.error as e:
-                    self.logger.warning(f"Erreur regex dans policy {policy.id}: {e}")
-
-            elif policy.language == "yaml-rules":
-                try:
-                    rule_def = yaml.safe_load(policy.content)
-                    if isinstance(rule_def, dict):
-                        pattern = rule_def.get("pattern", "")
-                        if pattern and self._regex_looks_dangerous(pattern):
-                            self.logger.warning(f"YAML policy {policy.id} rejected: pattern has ReDoS shape")
-                            continue
-                        if pattern and re.search(pattern, scan_content, re.MULTILINE | re.IGNORECASE):
-                            findings.append(
-                                IacFinding(
-                                    rule_id=policy.id,
-                                    severity=policy.severity,
-                                    path=filepath,
-                                    line=1,
-                                    title=rule_def.get("title", policy.description or policy.id),
-                                    description=rule_def.get("description", policy.description or ""),
-                                    remediation=rule_def.get("remediation", "Voir documentation"),
-                                    references=rule_def.get("references", []),
-                                    engine="custom-yaml-policy",
-                                )
-                            )
-                except yaml.YAMLError as e:
-                    self.logger.warning(f"Erreur YAML dans policy {policy.id}: {e}")
-
-        return findings
+            workers = int(getattr(settings, "IAC_SCAN_WORKERS", 1))
+        except Exception:
+            workers = 1
+        return workers if workers > 0 else (os.cpu_count() or 1)
 
     def _generate_remediation_actions(
         self, findings: List[IacFinding], files: List[FileInput], security_score: float
@@ -366,34 +319,23 @@ class IacGuardrailsScanTool(AgentLoopMixin, BaseTool):
         all_findings = []
         rules_count = 0
 
-        for file in request.files:
-            file_type = self._engine.detect_file_type(file.path, file.content)
-            self.logger.debug(f"Fichier {file.path}: type={file_type}")
-
-            if file_type == "kubernetes":
-                rules_count += len(self.K8S_RULES.get("baseline", []))
-                if request.policy_profile == "strict":
-                    rules_count += len(self.K8S_RULES.get("strict", []))
-                findings = self._k8s_scanner.scan(file.content, file.path, request.policy_profile)
-                all_findings.extend(self._engine.convert_findings(findings))
-
-            elif file_type == "terraform":
-                rules_count += len(self.TF_RULES.get("baseline", []))
-                if request.policy_profile == "strict":
-                    rules_count += len(self.TF_RULES.get("strict", []))
-                findings = self._tf_scanner.scan(file.content, file.path, request.policy_profile)
-                all_findings.extend(self._engine.convert_findings(findings))
-
-            elif file_type == "dockerfile":
-                rules_count += len(self.DOCKERFILE_RULES.get("baseline", []))
-                if request.policy_profile == "strict":
-                    rules_count += len(self.DOCKERFILE_RULES.get("strict", []))
-                findings = self._dockerfile_scanner.scan(file.content, file.path, request.policy_profile)
-                all_findings.extend(self._engine.convert_findings(findings))
-
-            if request.custom_policies:
-                rules_count += len(request.custom_policies)
-                all_findings.extend(self._apply_custom_policies(file.content, file.path, request.custom_policies))
+        file_scanner = IacFileScanner(
+            self._engine,
+            scanners={
+                "kubernetes": self._k8s_scanner,
+                "terraform": self._tf_scanner,
+                "dockerfile": self._dockerfile_scanner,
+            },
+            custom_rules=self._compile_custom_policies(request.custom_policies) if request.custom_policies else None,
+            custom_max_size=self._MAX_REGEX_CONTENT_SIZE,
+            logger=self.logger,
+        )
+        files = [(file.path, file.content) for file in request.files]
+        for findings, count in file_scanner.scan_files(files, request.policy_profile, workers=self._scan_workers()):
+            all_findings.extend(findings)
+            rules_count += count
+        if request.custom_policies:
+            rules_count += len(request.custom_policies) * len(request.files)
 
         unique_findings = self._engine.deduplicate_findings(all_findings)
         severity_counts = aggregate_severities(unique_findings)
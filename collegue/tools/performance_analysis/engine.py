@@ -5,10 +5,10 @@ Contient la logique métier pure : détection de patterns inefficaces,
 estimation de complexité, identification de hotspots.
 """
 
-import ast
 import re
 from typing import Any, Dict, List
 
+from ...core.code_facts import get_code_facts
 from .config import INEFFICIENT_PATTERNS
 from .models import PerformanceIssue
 
@@ -55,84 +55,60 @@ class PerformanceEngine:
 
     def _analyze_python_complexity(self, code: str) -> List[PerformanceIssue]:
         issues = []
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
+        facts = get_code_facts(code)
+        if not facts.valid:
             return issues
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                loop_depth = self._get_max_loop_depth(node)
-                if loop_depth >= 3:
-                    issues.append(
-                        PerformanceIssue(
-                            category="algorithmic",
-                            severity="critical",
-                            line=node.lineno,
-                            title=f"Complexité O(n^{loop_depth}) dans '{node.name}'",
-                            description=(
-                                f"La fonction '{node.name}' contient {loop_depth} niveaux de boucles imbriquées, "
-                                f"suggérant une complexité O(n^{loop_depth})."
-                            ),
-                            estimated_complexity=f"O(n^{loop_depth})",
-                        )
+        for function in facts.functions:
+            loop_depth = function.max_loop_depth
+            if loop_depth >= 3:
+                issues.append(
+                    PerformanceIssue(
+                        category="algorithmic",
+                        severity="critical",
+                        line=function.line,
+                        title=f"Complexité O(n^{loop_depth}) dans '{function.name}'",
+                        description=(
+                            f"La fonction '{function.name}' contient {loop_depth} niveaux de boucles imbriquées, "
+                            f"suggérant une complexité O(n^{loop_depth})."
+                        ),
+                        estimated_complexity=f"O(n^{loop_depth})",
                     )
-                elif loop_depth == 2:
-                    issues.append(
-                        PerformanceIssue(
-                            category="algorithmic",
-                            severity="warning",
-                            line=node.lineno,
-                            title=f"Complexité O(n²) potentielle dans '{node.name}'",
-                            description=(
-                                f"La fonction '{node.name}' contient des boucles imbriquées. "
-                                "Vérifiez si une structure de données (set, dict) peut réduire la complexité."
-                            ),
-                            estimated_complexity="O(n²)",
-                        )
+                )
+            elif loop_depth == 2:
+                issues.append(
+                    PerformanceIssue(
+                        category="algorithmic",
+                        severity="warning",
+                        line=function.line,
+                        title=f"Complexité O(n²) potentielle dans '{function.name}'",
+                        description=(
+                            f"La fonction '{function.name}' contient des boucles imbriquées. "
+                            "Vérifiez si une structure de données (set, dict) peut réduire la complexité."
+                        ),
+                        estimated_complexity="O(n²)",
                     )
+                )
 
-                # Vérifier les opérations 'in' sur des listes dans des boucles
-                self._check_list_search_in_loop(node, issues)
+            # Opérateur 'in' dans une boucle : recherche linéaire si la collection est une liste
+            if function.loop_membership_line is not None:
+                issues.append(
+                    PerformanceIssue(
+                        category="algorithmic",
+                        severity="warning",
+                        line=function.loop_membership_line,
+                        title="Recherche linéaire dans une boucle",
+                        description=(
+                            "Opérateur 'in' dans une boucle — si la collection est une liste, "
+                            "la complexité est O(n²). Utiliser un set pour O(n)."
+                        ),
+                        estimated_complexity="O(n²) → O(n)",
+                        suggestion="Convertir la collection en set() avant la boucle.",
+                    )
+                )
 
         return issues
 
-    def _get_max_loop_depth(self, node: ast.AST, current_depth: int = 0) -> int:
-        """Calcule la profondeur maximale de boucles imbriquées."""
-        max_depth = current_depth
-        for child in ast.iter_child_nodes(node):
-            if isinstance(child, (ast.For, ast.While)):
-                child_depth = self._get_max_loop_depth(child, current_depth + 1)
-                max_depth = max(max_depth, child_depth)
-            else:
-                child_depth = self._get_max_loop_depth(child, current_depth)
-                max_depth = max(max_depth, child_depth)
-        return max_depth
-
-    def _check_list_search_in_loop(self, func_node: ast.FunctionDef, issues: List[PerformanceIssue]) -> None:
-        """Détecte les recherches linéaires dans des boucles."""
-        for node in ast.walk(func_node):
-            if isinstance(node, (ast.For, ast.While)):
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Compare):
-                        for op in child.ops:
-                            if isinstance(op, ast.In):
-                                issues.append(
-                                    PerformanceIssue(
-                                        category="algorithmic",
-                                        severity="warning",
-                                        line=getattr(child, "lineno", func_node.lineno),
-                                        title="Recherche linéaire dans une boucle",
-                                        description=(
-                                            "Opérateur 'in' dans une boucle — si la collection est une liste, "
-                                            "la complexité est O(n²). Utiliser un set pour O(n)."
-                                        ),
-                                        estimated_complexity="O(n²) → O(n)",
-                                        suggestion="Convertir la collection en set() avant la boucle.",
-                                    )
-                                )
-                                return
-
     def _analyze_generic_complexity(self, code: str) -> List[PerformanceIssue]:
         issues = []
         lines = code.split("\n")
@@ -5,11 +5,11 @@ Contient la logique métier pure : analyse de métriques, validation syntaxique,
 extraction de code, calcul des améliorations.
 """
 
-import ast
 import json
 import re
 from typing import Any, Dict, List, Tuple
 
+from ...core.code_facts import get_code_facts
 from .config import COMMENT_PATTERNS, COMPLEXITY_INDICATORS, REFACTORING_TYPES
 
 
@@ -52,11 +52,10 @@ class RefactoringEngine:
         lang = language.lower()
 
         if lang == "python":
-            try:
-                ast.parse(code)
+            facts = get_code_facts(code)
+            if facts.valid:
                 return True, ""
-            except SyntaxError as e:
-                return False, f"Ligne {e.lineno}: {e.msg}"
+            return False, f"Ligne {facts.syntax_error_line}: {facts.syntax_error}"
 
         elif lang == "json":
             try:
@@ -99,8 +98,13 @@ class RefactoringEngine:
         # Compter fonctions et classes selon le langage
         lang = language.lower()
         if lang == "python":
-            metrics["function_count"] = sum(1 for line in non_empty_lines if line.strip().startswith("def "))
-            metrics["class_count"] = sum(1 for line in non_empty_lines if line.strip().startswith("class "))
+            facts = get_code_facts(code)
+            if facts.valid:
+                metrics["function_count"] = len(facts.functions)
+                metrics["class_count"] = len(facts.classes)
+            else:
+                metrics["function_count"] = sum(1 for line in non_empty_lines if line.strip().startswith("def "))
+                metrics["class_count"] = sum(1 for line in non_empty_lines if line.strip().startswith("class "))
         elif lang == "php":
             metrics["function_count"] = sum(1 for line in non_empty_lines if "function " in line)
             metrics["class_count"] = sum(
@@ -3,16 +3,53 @@ Moteur d'analyse de cohérence pour le Repo Consistency Check.
 
 Contient la logique métier pure : détection de duplication, analyse de symboles,
 calcul de scores, etc.
+
+La duplication repose sur un index global « empreinte de fenêtre → emplacements » :
+chaque ligne est normalisée une fois et remplacée par un identifiant entier, puis
+une empreinte glissante (Rabin-Karp) est calculée en O(1) par fenêtre de
+``min_lines`` lignes. Les fenêtres présentes dans au moins deux fichiers forment
+des groupes de clones, prolongés tant que tous leurs emplacements continuent
+ensemble : coût linéaire en nombre de lignes, quel que soit le nombre de fichiers.
 """
 
 import ast
 import hashlib
 import re
-from typing import Dict, List, Set, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
 
 from ...core.shared import ConsistencyIssue, detect_language_from_extension
 from .config import BUILTINS, DUPLICATION_MIN_LINES, REFACTORING_THRESHOLDS, REFACTORING_WEIGHTS
 
+# Empreinte glissante : polynôme en base _HASH_BASE modulo le premier de Mersenne 2^61 - 1.
+_HASH_MOD = (1 << 61) - 1
+_HASH_BASE = 1_000_003
+# Emplacement d'une fenêtre encodé en un entier : indice de fichier * _LOC_STRIDE + ligne
+# (des entiers plutôt que des tuples : rien à suivre pour le ramasse-miettes).
+_LOC_STRIDE = 1 << 32
+# Nombre d'emplacements cités dans le message d'une issue de duplication.
+_MAX_LISTED_LOCATIONS = 5
+
+
+def _normalize(line: str) -> str:
+    """Ligne sans espaces de bord ni commentaire ``//`` ou ``#`` (cf. ``normalize_line``)."""
+    line = line.strip()
+    cut = line.find("//")
+    if cut >= 0:
+        line = line[:cut]
+    cut = line.find("#")
+    if cut >= 0:
+        line = line[:cut]
+    return line
+
+
+@dataclass
+class CloneGroup:
+    """Bloc de ``length`` lignes présent à l'identique (après normalisation) à plusieurs endroits."""
+
+    length: int
+    locations: List[Tuple[str, int]] = field(default_factory=list)  # (chemin, ligne 1-based), triés
+
 
 class ConsistencyAnalysisEngine:
     """Moteur d'analyse de cohérence du code."""
@@ -26,18 +63,16 @@ class ConsistencyAnalysisEngine:
 
     def normalize_line(self, line: str) -> str:
         """Normalise une ligne de code pour la comparaison."""
-        line = line.strip()
-        line = re.sub(r"//.*$", "", line)
-        line = re.sub(r"#.*$", "", line)
-        return line
+        return _normalize(line)
 
     def get_code_blocks(self, content: str, block_size: int = DUPLICATION_MIN_LINES) -> Dict[str, Tuple[int, str]]:
         """Extrait les blocs de code avec leur hash."""
         lines = content.split("\n")
+        normalized = [_normalize(line) for line in lines]
         blocks = {}
 
         for i in range(len(lines) - block_size + 1):
-            block_lines = [self.normalize_line(l) for l in lines[i : i + block_size]]
+            block_lines = normalized[i : i + block_size]
 
             # Ignorer les blocs trop courts ou vides
             if all(len(l) < 3 for l in block_lines):
@@ -49,43 +84,130 @@ class ConsistencyAnalysisEngine:
 
         return blocks
 
-    def analyze_duplication(self, files: List, min_lines: int = DUPLICATION_MIN_LINES) -> List[ConsistencyIssue]:
-        """Détecte la duplication de code entre fichiers."""
-        issues = []
-        file_blocks = {}
+    def find_clone_groups(self, files: List, min_lines: int = DUPLICATION_MIN_LINES) -> List[CloneGroup]:
+        """Groupes de clones inter-fichiers, prolongés à leur longueur maximale.
+
+        Une fenêtre de ``min_lines`` lignes (dont au moins une de 3 caractères ou
+        plus) est un clone si elle apparaît dans au moins deux fichiers ; le groupe
+        réunit tous ses emplacements. Deux groupes consécutifs dont tous les
+        emplacements se suivent fusionnent en un clone plus long.
+        """
+        k = max(1, min_lines)
+        top = pow(_HASH_BASE, k - 1, _HASH_MOD)
+        line_ids: Dict[str, int] = {}
+        file_ids: List[List[int]] = []
+        # Empreinte → premier emplacement ; empreintes vues plusieurs fois → tous les emplacements.
+        first_seen: Dict[int, int] = {}
+        repeated: Dict[int, List[int]] = {}
+
+        for file_idx, file in enumerate(files):
+            ids = []
+            significant = []
+            for raw in file.content.split("\n"):
+                line = _normalize(raw)
+                ids.append(line_ids.setdefault(line, len(line_ids) + 1))
+                significant.append(len(line) >= 3)
+            file_ids.append(ids)
+            if len(ids) < k:
+                continue
 
-        # Extraire les blocs de chaque fichier
-        for file in files:
-            file_blocks[file.path] = self.get_code_blocks(file.content, min_lines)
+            base_loc = file_idx * _LOC_STRIDE
+            digest = 0
+            count = 0
+            for j in range(k):
+                digest = (digest * _HASH_BASE + ids[j]) % _HASH_MOD
+                count += significant[j]
+            for start in range(len(ids) - k + 1):
+                if start:
+                    end = start + k - 1
+                    digest = ((digest - ids[start - 1] * top) * _HASH_BASE + ids[end]) % _HASH_MOD
+                    count += significant[end] - significant[start - 1]
+                if not count:
+                    continue
+                loc = base_loc + start
+                previous = first_seen.setdefault(digest, loc)
+                if previous != loc:
+                    locations = repeated.get(digest)
+                    if locations is None:
+                        repeated[digest] = [previous, loc]
+                    else:
+                        locations.append(loc)
 
-        # Chercher les doublons
-        seen_duplicates = set()
-        for path1, blocks1 in file_blocks.items():
-            for path2, blocks2 in file_blocks.items():
-                if path1 >= path2:
+        # Groupes de fenêtres identiques présentes dans au moins deux fichiers.
+        groups: List[List[int]] = []
+        window_group: Dict[int, int] = {}
+        for locations in repeated.values():
+            if all(loc // _LOC_STRIDE == locations[0] // _LOC_STRIDE for loc in locations):
+                continue
+            # Contenu comparé exactement : une collision d'empreinte sépare les groupes.
+            by_content: Dict[Tuple[int, ...], List[int]] = {}
+            for loc in locations:
+                file_idx, start = divmod(loc, _LOC_STRIDE)
+                by_content.setdefault(tuple(file_ids[file_idx][start : start + k]), []).append(loc)
+            for same in by_content.values():
+                if len({loc // _LOC_STRIDE for loc in same}) < 2:
                     continue
+                for loc in same:
+                    window_group[loc] = len(groups)
+                groups.append(same)
+
+        def successor(group_id: int) -> Optional[int]:
+            """Groupe de la fenêtre suivante, si tous les emplacements y continuent ensemble."""
+            locations = groups[group_id]
+            nxt = window_group.get(locations[0] + 1)
+            if nxt is None or len(groups[nxt]) != len(locations):
+                return None
+            if all(window_group.get(loc + 1) == nxt for loc in locations):
+                return nxt
+            return None
+
+        successors = {}
+        for group_id in range(len(groups)):
+            nxt = successor(group_id)
+            if nxt is not None:
+                successors[group_id] = nxt
+        continued = set(successors.values())
+
+        clones = []
+        for group_id, locations in enumerate(groups):
+            if group_id in continued:
+                continue
+            length = k
+            current = group_id
+            while current in successors:
+                current = successors[current]
+                length += 1
+            clones.append(
+                CloneGroup(
+                    length=length,
+                    locations=sorted((files[loc // _LOC_STRIDE].path, loc % _LOC_STRIDE + 1) for loc in locations),
+                )
+            )
+        clones.sort(key=lambda clone: clone.locations[0])
+        return clones
 
-                common = set(blocks1.keys()) & set(blocks2.keys())
-                for block_hash in common:
-                    if block_hash in seen_duplicates:
-                        continue
-                    seen_duplicates.add(block_hash)
-
-                    line1, code = blocks1[block_hash]
-                    line2, _ = blocks2[block_hash]
-
-                    issues.append(
-                        ConsistencyIssue(
-                            kind="duplication",
-                            severity="low",
-                            path=path1,
-                            line=line1,
-                            message=f"Bloc de code dupliqué dans {path2}:{line2}",
-                            confidence=80,
-                            suggested_fix="Extraire dans une fonction/module partagé",
-                            engine="hash-comparator",
-                        )
-                    )
+    def analyze_duplication(self, files: List, min_lines: int = DUPLICATION_MIN_LINES) -> List[ConsistencyIssue]:
+        """Détecte la duplication de code entre fichiers (une issue par groupe de clones)."""
+        issues = []
+        for clone in self.find_clone_groups(files, min_lines):
+            path, line = clone.locations[0]
+            others = [f"{other_path}:{other_line}" for other_path, other_line in clone.locations[1:]]
+            where = ", ".join(others[:_MAX_LISTED_LOCATIONS])
+            if len(others) > _MAX_LISTED_LOCATIONS:
+                where += f" (+{len(others) - _MAX_LISTED_LOCATIONS} autre(s))"
+
+            issues.append(
+                ConsistencyIssue(
+                    kind="duplication",
+                    severity="low",
+                    path=path,
+                    line=line,
+                    message=f"Bloc de code dupliqué ({clone.length} lignes) dans {where}",
+                    confidence=80,
+                    suggested_fix="Extraire dans une fonction/module partagé",
+                    engine="hash-comparator",
+                )
+            )
 
         return issues
 
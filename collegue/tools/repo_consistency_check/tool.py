@@ -17,11 +17,13 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from ...core.llm_response_parser import LLMConsistencyResponse, parse_llm_response_strict
 from ...core.shared import aggregate_severities, parse_llm_json_response
+from ...core.tool_cache import fingerprint
 from ..agent_loop import AgentLoopConfig, AgentLoopMixin
 from ..analyzers.javascript import JavaScriptAnalyzer
 from ..analyzers.php import PHPAnalyzer
 from ..analyzers.python import PythonAnalyzer
 from ..base import BaseTool
+from . import config as consistency_config
 from .config import ALL_CHECKS
 from .engine import ConsistencyAnalysisEngine
 from .models import (
@@ -63,6 +65,8 @@ class RepoConsistencyCheckTool(AgentLoopMixin, BaseTool):
     response_model = ConsistencyCheckResponse
     supported_languages = ["python", "typescript", "javascript", "php", "auto"]
     long_running = False
+    # 2 : duplication rapportée par groupes de clones de longueur maximale.
+    cache_version = "2"
 
     agent_config = AgentLoopConfig(
         max_iterations=2,
@@ -78,6 +82,14 @@ class RepoConsistencyCheckTool(AgentLoopMixin, BaseTool):
         self._js_analyzer = JavaScriptAnalyzer(logger=self.logger)
         self._php_analyzer = PHPAnalyzer(logger=self.logger)
 
+    def is_cacheable(self, request: ConsistencyCheckRequest) -> bool:
+        """Seule l'analyse ``fast`` sans refactoring chaîné est déterministe (pas de LLM)."""
+        return request.analysis_depth == "fast" and not request.auto_chain
+
+    def get_cache_version(self) -> str:
+        settings = {k: v for k, v in vars(consistency_config).items() if k.isupper()}
+        return f"{self.cache_version}:{fingerprint(settings)}"
+
     # --- AgentLoopMixin hooks ---
 
     async def validate_agent_output(self, output: str, context: Dict[str, Any]) -> List[str]:
@@ -5,6 +5,7 @@ Provides common functionality for IaC-specific scanners.
 """
 
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from typing import Any, Dict, List, Optional
 
 from ..base import ToolError
@@ -42,6 +43,25 @@ class IacFinding:
         self.engine = engine
 
 
+class LineIndex:
+    """Offset -> 1-based line lookups, built once per file and shared by every rule."""
+
+    __slots__ = ("_starts",)
+
+    def __init__(self, content: str):
+        starts = [0]
+        find = content.find
+        pos = find("\n")
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find("\n", pos + 1)
+        self._starts = starts
+
+    def line_at(self, offset: int) -> int:
+        """Line containing character ``offset``."""
+        return bisect_right(self._starts, offset)
+
+
 class BaseScanner(ABC):
     """Classe de base pour les scanners IaC."""
 
@@ -9,6 +9,18 @@ from typing import List
 
 from . import BaseScanner, IacFinding
 
+# Patterns compiled once, matched line by line.
+_FROM_LATEST = re.compile(r"^FROM\s+[\w\-./]+:latest", re.IGNORECASE)
+_FROM_UNTAGGED = re.compile(r"^FROM\s+[\w\-./]+\s*$", re.IGNORECASE)
+_USER = re.compile(r"^USER\s+(\S+)?", re.IGNORECASE)
+_SECRET_ENV = re.compile(
+    r'(?:ENV|ARG)\s+(?:\w+_)?(?:PASSWORD|SECRET|TOKEN|API_KEY|ACCESS_KEY)\s*=\s*["\']?[^\s"\'$]+["\']?', re.IGNORECASE
+)
+_CURL_PIPE = re.compile(r"(?:curl|wget)\s+[^\|]+\|\s*(?:bash|sh)", re.IGNORECASE)
+_APT_INSTALL = re.compile(r"apt-get\s+install", re.IGNORECASE)
+_APT_CLEANUP = re.compile(r"rm\s+-rf\s+/var/lib/apt", re.IGNORECASE)
+_ADD_LOCAL = re.compile(r"^ADD\s+(?!https?://)", re.IGNORECASE)
+
 
 class DockerfileScanner(BaseScanner):
     """Scanner for Dockerfiles."""
@@ -32,9 +44,8 @@ class DockerfileScanner(BaseScanner):
         findings = []
 
         # Check for latest tag
-        pattern = r"^FROM\s+[\w\-./]+:latest"
         for i, line in enumerate(lines, 1):
-            if re.match(pattern, line, re.IGNORECASE):
+            if _FROM_LATEST.match(line):
                 findings.append(
                     IacFinding(
                         rule_id="DOCKER-002",
@@ -50,9 +61,8 @@ class DockerfileScanner(BaseScanner):
                 )
 
         # Check for missing tag (defaults to latest)
-        pattern = r"^FROM\s+[\w\-./]+\s*$"
         for i, line in enumerate(lines, 1):
-            if re.match(pattern, line, re.IGNORECASE):
+            if _FROM_UNTAGGED.match(line):
                 findings.append(
                     IacFinding(
                         rule_id="DOCKER-003",
@@ -78,10 +88,10 @@ class DockerfileScanner(BaseScanner):
         runs_as_root = True
 
         for _i, line in enumerate(lines, 1):
-            if re.match(r"^USER\s+", line, re.IGNORECASE):
+            user_match = _USER.match(line)
+            if user_match:
                 has_user = True
-                user_match = re.match(r"^USER\s+(\S+)", line, re.IGNORECASE)
-                if user_match:
+                if user_match.group(1):
                     user = user_match.group(1)
                     if user != "root" and not user.startswith("0"):
                         runs_as_root = False
@@ -108,9 +118,8 @@ class DockerfileScanner(BaseScanner):
         findings = []
 
         # Check for hardcoded passwords/keys in ENV or ARG
-        pattern = r'(?:ENV|ARG)\s+(?:\w+_)?(?:PASSWORD|SECRET|TOKEN|API_KEY|ACCESS_KEY)\s*=\s*["\']?[^\s"\'$]+["\']?'
         for i, line in enumerate(lines, 1):
-            if re.search(pattern, line, re.IGNORECASE):
+            if _SECRET_ENV.search(line):
                 findings.append(
                     IacFinding(
                         rule_id="DOCKER-005",
@@ -131,9 +140,8 @@ class DockerfileScanner(BaseScanner):
         """Scan for curl/wget piped to shell."""
         findings = []
 
-        pattern = r"(?:curl|wget)\s+[^\|]+\|\s*(?:bash|sh)"
         for i, line in enumerate(lines, 1):
-            if re.search(pattern, line, re.IGNORECASE):
+            if _CURL_PIPE.search(line):
                 findings.append(
                     IacFinding(
                         rule_id="DOCKER-006",
@@ -159,9 +167,9 @@ class DockerfileScanner(BaseScanner):
         has_apt_cleanup = False
 
         for line in lines:
-            if re.search(r"apt-get\s+install", line, re.IGNORECASE):
+            if _APT_INSTALL.search(line):
                 has_apt_install = True
-            if re.search(r"rm\s+-rf\s+/var/lib/apt", line, re.IGNORECASE):
+            if _APT_CLEANUP.search(line):
                 has_apt_cleanup = True
 
         if has_apt_install and not has_apt_cleanup:
@@ -185,9 +193,8 @@ class DockerfileScanner(BaseScanner):
         """Check for ADD used instead of COPY."""
         findings = []
 
-        pattern = r"^ADD\s+(?!https?://)"
         for i, line in enumerate(lines, 1):
-            if re.match(pattern, line, re.IGNORECASE):
+            if _ADD_LOCAL.match(line):
                 findings.append(
                     IacFinding(
                         rule_id="DOCKER-004",
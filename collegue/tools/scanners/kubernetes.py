@@ -2,57 +2,153 @@
 Kubernetes Scanner for IaC Guardrails.
 
 Scans Kubernetes YAML manifests for security issues.
+
+Manifests are parsed once into a :class:`KubernetesManifest`: the documents are
+constructed from the YAML node graph, whose start marks give a
+``(document, key path) -> line`` map built in the same pass. Findings get the
+line of the exact key they refer to (the second container's ``privileged``,
+not the first occurrence in the file). ``IacFileScanner`` parses each manifest
+once and reuses its line index for custom policies; the parse can also be
+passed to the embedded regex rules of ``IacAnalysisEngine.scan_kubernetes``,
+which the tool itself does not run.
 """
 
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from . import BaseScanner, IacFinding, LineIndex
+
+# libyaml when available: same SafeLoader semantics, much faster on large manifests.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_Path = Tuple[Any, ...]
+
+
+class KubernetesManifest:
+    """Multi-document YAML manifest parsed once, with source positions."""
+
+    def __init__(self, content: str, documents: List[Any], positions: List[Dict[_Path, int]]):
+        self.content = content
+        self.documents = documents
+        self._positions = positions
+        self._line_index: Optional[LineIndex] = None
+
+    def line_of(self, doc_idx: int, *path: Any) -> int:
+        """Line of the key (or sequence item) at ``path``, or of its closest known ancestor."""
+        positions = self._positions[doc_idx]
+        while path not in positions:
+            path = path[:-1]
+        return positions[path]
+
+    @property
+    def line_index(self) -> LineIndex:
+        """Line index of the content, shared with the regex rules."""
+        if self._line_index is None:
+            self._line_index = LineIndex(self.content)
+        return self._line_index
 
-from . import BaseScanner, IacFinding
+    def line_at(self, offset: int) -> int:
+        """Line containing character ``offset`` of the content."""
+        return self.line_index.line_at(offset)
+
+    def has_key(self, key: str) -> bool:
+        """True if a mapping key ``key`` appears anywhere in the manifest."""
+        return any(path and path[-1] == key for positions in self._positions for path in positions)
+
+
+def parse_manifest(content: str) -> KubernetesManifest:
+    """Parse every document of ``content``; raises ``yaml.YAMLError`` on invalid YAML."""
+    documents: List[Any] = []
+    positions: List[Dict[_Path, int]] = []
+    loader = _Loader(content)
+    try:
+        while loader.check_node():
+            node = loader.get_node()
+            documents.append(loader.construct_document(node))
+            # After construction: merge keys (<<) have been flattened into the mapping nodes.
+            positions.append(_index_positions(node))
+    finally:
+        loader.dispose()
+    return KubernetesManifest(content, documents, positions)
+
+
+def _index_positions(root: yaml.Node) -> Dict[_Path, int]:
+    """Map every key path of a document node to its 1-based line."""
+    positions: Dict[_Path, int] = {(): root.start_mark.line + 1}
+    stack: List[Tuple[_Path, yaml.Node]] = [((), root)]
+    seen = set()
+    while stack:
+        path, node = stack.pop()
+        # Aliased nodes are indexed once (also guards against recursive anchors).
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                if isinstance(key_node, yaml.ScalarNode):
+                    child = path + (key_node.value,)
+                    positions.setdefault(child, key_node.start_mark.line + 1)
+                    stack.append((child, value_node))
+        elif isinstance(node, yaml.SequenceNode):
+            for idx, item in enumerate(node.value):
+                child = path + (idx,)
+                positions[child] = item.start_mark.line + 1
+                stack.append((child, item))
+    return positions
 
 
 class KubernetesScanner(BaseScanner):
     """Scanner for Kubernetes manifests."""
 
-    def scan(self, content: str, filepath: str, profile: str) -> List[IacFinding]:
-        """Scan Kubernetes manifest for security issues."""
+    def scan(
+        self, content: str, filepath: str, profile: str, manifest: Optional[KubernetesManifest] = None
+    ) -> List[IacFinding]:
+        """Scan Kubernetes manifest for security issues (``manifest``: already parsed ``content``)."""
         findings = []
-        lines = content.split("\n")
-
-        try:
-            import yaml
 
-            docs = list(yaml.safe_load_all(content))
-        except Exception as e:
-            self._log_warning(f"Erreur parsing YAML {filepath}: {e}")
-            return findings
+        if manifest is None:
+            try:
+                manifest = parse_manifest(content)
+            except Exception as e:
+                self._log_warning(f"Erreur parsing YAML {filepath}: {e}")
+                return findings
 
-        for doc_idx, doc in enumerate(docs):
+        for doc_idx, doc in enumerate(manifest.documents):
             if not doc or not isinstance(doc, dict):
                 continue
 
             if doc.get("kind") == "Pod":
-                findings.extend(self._scan_pod(doc, filepath, lines, doc_idx))
+                findings.extend(self._scan_pod(doc, filepath, manifest, doc_idx))
             elif doc.get("kind") in ["Deployment", "StatefulSet", "DaemonSet", "ReplicaSet"]:
-                findings.extend(self._scan_deployment(doc, filepath, lines, doc_idx))
+                findings.extend(self._scan_deployment(doc, filepath, manifest, doc_idx))
             elif doc.get("kind") == "Service":
-                findings.extend(self._scan_service(doc, filepath, lines, doc_idx))
+                findings.extend(self._scan_service(doc, filepath, manifest, doc_idx))
 
         return findings
 
-    def _scan_pod(self, doc: Dict, filepath: str, lines: List[str], doc_idx: int) -> List[IacFinding]:
+    def _scan_pod(self, doc: Dict, filepath: str, manifest: KubernetesManifest, doc_idx: int) -> List[IacFinding]:
         """Scan Pod spec for security issues."""
         spec = doc.get("spec", {})
-        return self._scan_containers(spec.get("containers", []), filepath, lines, doc_idx)
+        return self._scan_containers(spec.get("containers", []), filepath, manifest, doc_idx, ("spec",))
 
     def _scan_containers(
-        self, containers: List[Dict], filepath: str, lines: List[str], doc_idx: int
+        self,
+        containers: List[Dict],
+        filepath: str,
+        manifest: KubernetesManifest,
+        doc_idx: int,
+        spec_path: _Path,
     ) -> List[IacFinding]:
         """Scan a list of container specs (shared between Pod and Deployment scanners)."""
         findings = []
         for idx, container in enumerate(containers):
             sec = container.get("securityContext", {}) or {}
+            container_path = spec_path + ("containers", idx)
+            sec_path = container_path + ("securityContext",)
 
             if sec.get("privileged", False):
-                line = self._find_line(lines, "privileged:", doc_idx)
+                line = manifest.line_of(doc_idx, *sec_path, "privileged")
                 findings.append(
                     IacFinding(
                         rule_id="K8S-001",
@@ -69,7 +165,7 @@ class KubernetesScanner(BaseScanner):
 
             # runAsNonRoot should be explicitly true; false or missing both deserve a finding
             if sec.get("runAsNonRoot") is False:
-                line = self._find_line(lines, "runAsNonRoot:", doc_idx)
+                line = manifest.line_of(doc_idx, *sec_path, "runAsNonRoot")
                 findings.append(
                     IacFinding(
                         rule_id="K8S-008",
@@ -85,7 +181,7 @@ class KubernetesScanner(BaseScanner):
                 )
 
             if sec.get("allowPrivilegeEscalation", False) is True:
-                line = self._find_line(lines, "allowPrivilegeEscalation:", doc_idx)
+                line = manifest.line_of(doc_idx, *sec_path, "allowPrivilegeEscalation")
                 findings.append(
                     IacFinding(
                         rule_id="K8S-010",
@@ -101,7 +197,7 @@ class KubernetesScanner(BaseScanner):
                 )
 
             if not container.get("resources", {}).get("limits"):
-                line = self._find_line(lines, "containers:", doc_idx)
+                line = manifest.line_of(doc_idx, *container_path)
                 findings.append(
                     IacFinding(
                         rule_id="K8S-007",
@@ -118,18 +214,21 @@ class KubernetesScanner(BaseScanner):
 
         return findings
 
-    def _scan_deployment(self, doc: Dict, filepath: str, lines: List[str], doc_idx: int) -> List[IacFinding]:
+    def _scan_deployment(
+        self, doc: Dict, filepath: str, manifest: KubernetesManifest, doc_idx: int
+    ) -> List[IacFinding]:
         """Scan Deployment spec for security issues."""
         findings = []
         spec = doc.get("spec", {}).get("template", {}).get("spec", {})
+        spec_path = ("spec", "template", "spec")
 
         # Containers inside a Deployment's template need the same security checks as
         # top-level Pod containers — privileged, runAsNonRoot, resource limits, etc.
-        findings.extend(self._scan_containers(spec.get("containers", []) or [], filepath, lines, doc_idx))
+        findings.extend(self._scan_containers(spec.get("containers", []) or [], filepath, manifest, doc_idx, spec_path))
 
         # Check hostNetwork
         if spec.get("hostNetwork", False):
-            line = self._find_line(lines, "hostNetwork:", doc_idx)
+            line = manifest.line_of(doc_idx, *spec_path, "hostNetwork")
             findings.append(
                 IacFinding(
                     rule_id="K8S-002",
@@ -146,7 +245,7 @@ class KubernetesScanner(BaseScanner):
 
         # Check hostPID
         if spec.get("hostPID", False):
-            line = self._find_line(lines, "hostPID:", doc_idx)
+            line = manifest.line_of(doc_idx, *spec_path, "hostPID")
             findings.append(
                 IacFinding(
                     rule_id="K8S-003",
@@ -163,17 +262,17 @@ class KubernetesScanner(BaseScanner):
 
         return findings
 
-    def _scan_service(self, doc: Dict, filepath: str, lines: List[str], doc_idx: int) -> List[IacFinding]:
+    def _scan_service(self, doc: Dict, filepath: str, manifest: KubernetesManifest, doc_idx: int) -> List[IacFinding]:
         """Scan Service spec for security issues."""
         findings = []
         spec = doc.get("spec", {})
 
         # Check NodePort on sensitive ports
         if spec.get("type") == "NodePort":
-            for port in spec.get("ports", []):
+            for port_idx, port in enumerate(spec.get("ports", [])):
                 node_port = port.get("nodePort", 0)
                 if 30000 <= node_port <= 32767:
-                    line = self._find_line(lines, f"nodePort: {node_port}", doc_idx)
+                    line = manifest.line_of(doc_idx, "spec", "ports", port_idx, "nodePort")
                     findings.append(
                         IacFinding(
                             rule_id="K8S-009",
@@ -189,10 +288,3 @@ class KubernetesScanner(BaseScanner):
                     )
 
         return findings
-
-    def _find_line(self, lines: List[str], pattern: str, doc_idx: int) -> int:
-        """Find line number containing pattern."""
-        for i, line in enumerate(lines, 1):
-            if pattern in line:
-                return i
-        return doc_idx + 1
@@ -5,35 +5,44 @@ Scans Terraform HCL files for security issues.
 """
 
 import re
-from typing import List
+from typing import List, Optional
 
-from . import BaseScanner, IacFinding
+from . import BaseScanner, IacFinding, LineIndex
+
+# Patterns compiled once for every file scanned.
+_OPEN_CIDR = re.compile(r'cidr_blocks\s*=\s*\[\s*"0\.0\.0\.0/0"\s*\]', re.MULTILINE)
+_OPEN_SSH = re.compile(r'(?:from_port|to_port)\s*=\s*22[\s\S]*?cidr_blocks\s*=\s*\[\s*"0\.0\.0\.0/0"\s*\]')
+_PUBLIC_ACL = re.compile(r'acl\s*=\s*"public-read(?:-write)?"', re.MULTILINE)
+_PUBLIC_RDS = re.compile(r"publicly_accessible\s*=\s*true", re.MULTILINE)
+_WILDCARD_ACTION = re.compile(r'"Action"\s*:\s*(?:\[\s*)?"\*"', re.MULTILINE)
+_WILDCARD_RESOURCE = re.compile(r'"Resource"\s*:\s*(?:\[\s*)?"\*"', re.MULTILINE)
 
 
 class TerraformScanner(BaseScanner):
     """Scanner for Terraform configuration."""
 
-    def scan(self, content: str, filepath: str, profile: str) -> List[IacFinding]:
-        """Scan Terraform configuration for security issues."""
+    def scan(
+        self, content: str, filepath: str, profile: str, line_index: Optional[LineIndex] = None
+    ) -> List[IacFinding]:
+        """Scan Terraform configuration for security issues (``line_index``: shared index of ``content``)."""
         findings = []
-        lines = content.split("\n")
+        index = line_index or LineIndex(content)
 
-        findings.extend(self._scan_security_groups(content, filepath, lines))
-        findings.extend(self._scan_s3_buckets(content, filepath, lines))
-        findings.extend(self._scan_rds(content, filepath, lines))
-        findings.extend(self._scan_iam(content, filepath, lines))
-        findings.extend(self._scan_encryption(content, filepath, lines))
+        findings.extend(self._scan_security_groups(content, filepath, index))
+        findings.extend(self._scan_s3_buckets(content, filepath, index))
+        findings.extend(self._scan_rds(content, filepath, index))
+        findings.extend(self._scan_iam(content, filepath, index))
+        findings.extend(self._scan_encryption(content, filepath, index))
 
         return findings
 
-    def _scan_security_groups(self, content: str, filepath: str, lines: List[str]) -> List[IacFinding]:
+    def _scan_security_groups(self, content: str, filepath: str, index: LineIndex) -> List[IacFinding]:
         """Scan for overly permissive security groups."""
         findings = []
 
         # Check for 0.0.0.0/0 in ingress rules
-        pattern = r'cidr_blocks\s*=\s*\[\s*"0\.0\.0\.0/0"\s*\]'
-        for match in re.finditer(pattern, content, re.MULTILINE):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in _OPEN_CIDR.finditer(content):
+            line_num = index.line_at(match.start())
             findings.append(
                 IacFinding(
                     rule_id="TF-001",
@@ -51,8 +60,7 @@ class TerraformScanner(BaseScanner):
             )
 
         # Check for open SSH (port 22) from internet
-        ssh_pattern = r'(?:from_port|to_port)\s*=\s*22[\s\S]*?cidr_blocks\s*=\s*\[\s*"0\.0\.0\.0/0"\s*\]'
-        if re.search(ssh_pattern, content):
+        if _OPEN_SSH.search(content):
             findings.append(
                 IacFinding(
                     rule_id="TF-004",
@@ -71,14 +79,13 @@ class TerraformScanner(BaseScanner):
 
         return findings
 
-    def _scan_s3_buckets(self, content: str, filepath: str, lines: List[str]) -> List[IacFinding]:
+    def _scan_s3_buckets(self, content: str, filepath: str, index: LineIndex) -> List[IacFinding]:
         """Scan for public S3 bucket configurations."""
         findings = []
 
         # Check for public-read ACL
-        pattern = r'acl\s*=\s*"public-read(?:-write)?"'
-        for match in re.finditer(pattern, content, re.MULTILINE):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in _PUBLIC_ACL.finditer(content):
+            line_num = index.line_at(match.start())
             findings.append(
                 IacFinding(
                     rule_id="TF-002",
@@ -97,13 +104,12 @@ class TerraformScanner(BaseScanner):
 
         return findings
 
-    def _scan_rds(self, content: str, filepath: str, lines: List[str]) -> List[IacFinding]:
+    def _scan_rds(self, content: str, filepath: str, index: LineIndex) -> List[IacFinding]:
         """Scan for publicly accessible RDS instances."""
         findings = []
 
-        pattern = r"publicly_accessible\s*=\s*true"
-        for match in re.finditer(pattern, content, re.MULTILINE):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in _PUBLIC_RDS.finditer(content):
+            line_num = index.line_at(match.start())
             findings.append(
                 IacFinding(
                     rule_id="TF-003",
@@ -120,14 +126,13 @@ class TerraformScanner(BaseScanner):
 
         return findings
 
-    def _scan_iam(self, content: str, filepath: str, lines: List[str]) -> List[IacFinding]:
+    def _scan_iam(self, content: str, filepath: str, index: LineIndex) -> List[IacFinding]:
         """Scan for overly permissive IAM policies."""
         findings = []
 
         # Check for wildcard actions
-        pattern = r'"Action"\s*:\s*(?:\[\s*)?"\*"'
-        for match in re.finditer(pattern, content, re.MULTILINE):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in _WILDCARD_ACTION.finditer(content):
+            line_num = index.line_at(match.start())
             findings.append(
                 IacFinding(
                     rule_id="TF-006",
@@ -143,9 +148,8 @@ class TerraformScanner(BaseScanner):
             )
 
         # Check for wildcard resources
-        pattern = r'"Resource"\s*:\s*(?:\[\s*)?"\*"'
-        for match in re.finditer(pattern, content, re.MULTILINE):
-            line_num = content[: match.start()].count("\n") + 1
+        for match in _WILDCARD_RESOURCE.finditer(content):
+            line_num = index.line_at(match.start())
             findings.append(
                 IacFinding(
                     rule_id="TF-007",
@@ -162,7 +166,7 @@ class TerraformScanner(BaseScanner):
 
         return findings
 
-    def _scan_encryption(self, content: str, filepath: str, lines: List[str]) -> List[IacFinding]:
+    def _scan_encryption(self, content: str, filepath: str, index: LineIndex) -> List[IacFinding]:
         """Scan for missing encryption settings."""
         findings = []
 
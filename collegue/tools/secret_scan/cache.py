@@ -0,0 +1,129 @@
+"""
+Cache disque des findings par fichier pour les scans de répertoires.
+
+Re-scanner un monorepo inchangé coûtait autant que le premier scan. Ce cache
+(opt-in, ``SECRET_SCAN_FILE_CACHE_ENABLED``) mémorise, sous ``$COLLEGUE_HOME/cache`` :
+
+- ``(chemin absolu, taille, mtime, version)`` → empreinte SHA-256 du contenu
+  (fichiers réguliers seulement, liens symboliques non suivis) :
+  un fichier dont les métadonnées n'ont pas bougé n'est même pas relu ;
+- ``(empreinte du contenu, version)`` → findings : un fichier touché mais
+  identique (checkout, copie) n'est pas re-scanné.
+
+La « version » couvre le jeu de règles, le seuil de sévérité et la taille max
+(:func:`~collegue.tools.secret_scan.engine.ruleset_fingerprint`).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...core.disk_cache import SqliteLRUCache
+from ...core.tool_cache import fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 200_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CACHE_FILE = "secret_scan_files.sqlite3"
+
+
+class SecretScanFileCache(SqliteLRUCache):
+    """Empreintes de fichiers et findings sérialisés (dicts ``SecretFinding`` sans ``file``)."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        super().__init__(CACHE_FILE, cache_dir, max_entries=max_entries, max_bytes=max_bytes)
+
+    @staticmethod
+    def _stat_key(path: str, size: int, mtime_ns: int, version: str) -> str:
+        return fingerprint({"stat": path, "size": size, "mtime_ns": mtime_ns, "version": version})
+
+    @staticmethod
+    def _content_key(digest: str, version: str) -> str:
+        return fingerprint({"content": digest, "version": version})
+
+    def lookup(self, files: List[Tuple[str, int, int]], version: str) -> List[Optional[List[Dict[str, Any]]]]:
+        """Findings en cache de chaque ``(chemin absolu, taille, mtime_ns)``, ``None`` si absents."""
+        stat_keys = [self._stat_key(path, size, mtime_ns, version) for path, size, mtime_ns in files]
+        digests = self.get_many(stat_keys)
+        content_keys = {key: self._content_key(entry["text"], version) for key, entry in digests.items()}
+        contents = self.get_many(content_keys.values())
+        results: List[Optional[List[Dict[str, Any]]]] = []
+        for key in stat_keys:
+            entry = contents.get(content_keys.get(key, ""))
+            results.append(_decode(entry["text"]) if entry else None)
+        return results
+
+    def get_findings(self, digest: str, version: str) -> Optional[List[Dict[str, Any]]]:
+        """Findings connus pour un contenu d'empreinte ``digest``."""
+        entry = self.get(self._content_key(digest, version))
+        return _decode(entry["text"]) if entry else None
+
+    def store(
+        self,
+        entries: List[Tuple[str, int, int, str, Optional[List[Dict[str, Any]]]]],
+        version: str,
+    ) -> None:
+        """Enregistre des ``(chemin absolu, taille, mtime_ns, empreinte, findings)``.
+
+        ``findings`` à ``None`` : contenu déjà en cache, seules les métadonnées sont associées.
+        """
+        items = []
+        for path, size, mtime_ns, digest, findings in entries:
+            items.append((self._stat_key(path, size, mtime_ns, version), digest, "stat"))
+            if findings is not None:
+                items.append((self._content_key(digest, version), json.dumps(findings, ensure_ascii=False), "content"))
+        self.put_many(items)
+
+
+def _decode(text: str) -> Optional[List[Dict[str, Any]]]:
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+_file_cache: Optional[SecretScanFileCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_secret_scan_cache(settings_obj: Optional[object] = None) -> Optional[SecretScanFileCache]:
+    """Singleton du cache si ``SECRET_SCAN_FILE_CACHE_ENABLED``, sinon ``None``."""
+    global _file_cache
+    if settings_obj is None:
+        try:
+            from collegue.config import settings as settings_obj
+        except Exception:
+            return None
+    if not bool(getattr(settings_obj, "SECRET_SCAN_FILE_CACHE_ENABLED", False)):
+        return None
+    with _cache_lock:
+        if _file_cache is None:
+            try:
+                _file_cache = SecretScanFileCache(
+                    max_entries=int(getattr(settings_obj, "SECRET_SCAN_FILE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                    max_bytes=int(getattr(settings_obj, "SECRET_SCAN_FILE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+                )
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("Cache de scan de secrets indisponible (%s) : désactivé", exc)
+                return None
+        return _file_cache
+
+
+def reset_secret_scan_cache() -> None:
+    """Ferme et oublie le singleton (pour les tests)."""
+    global _file_cache
+    with _cache_lock:
+        if _file_cache is not None:
+            _file_cache.close()
+        _file_cache = None
@@ -83,6 +83,44 @@ SECRET_PATTERNS = [
     ),
 ]
 
+# Ancres littérales par pattern : toute correspondance du pattern COMMENCE par
+# l'une d'elles (comparaison insensible à la casse). Le moteur les cherche en une
+# seule passe et n'évalue chaque regex qu'aux positions candidates. Un pattern
+# sans entrée ici est évalué sur tout le contenu (plus lent, jamais faux).
+SECRET_ANCHORS = {
+    "aws_access_key": ("A3T", "AKIA", "AGPA", "AIDA", "AROA", "AIPA", "ANPA", "ANVA", "ASIA"),
+    "aws_secret_key": ("aws",),
+    "gcp_api_key": ("AIza",),
+    "gcp_service_account": ('"type":',),
+    "azure_storage_key": ("DefaultEndpointsProtocol", "AccountKey"),
+    "openai_api_key": ("sk-",),
+    "anthropic_api_key": ("sk-ant-",),
+    "gemini_api_key": ("AIzaSy",),
+    "github_token": ("ghp_", "gho_", "ghu_", "ghs_", "ghr_"),
+    "github_oauth": ("gho_",),
+    "gitlab_token": ("glpat-",),
+    "postgres_uri": ("postgres",),
+    "mysql_uri": ("mysql://",),
+    "mongodb_uri": ("mongodb",),
+    "redis_uri": ("redis://:",),
+    "jwt_token": ("eyJ",),
+    "bearer_token": ("bearer",),
+    "private_key_rsa": ("-----BEGIN ",),
+    "private_key_openssh": ("-----BEGIN ",),
+    "private_key_ec": ("-----BEGIN ",),
+    "private_key_pgp": ("-----BEGIN ",),
+    "stripe_secret_key": ("sk_live_",),
+    "stripe_publishable": ("pk_live_",),
+    "slack_token": ("xox",),
+    "slack_webhook": ("https://hooks.slack.com/services/T",),
+    "sendgrid_api_key": ("SG.",),
+    "twilio_api_key": ("SK",),
+    "npm_token": ("npm",),
+    "password_assignment": ("password", "passwd", "pwd", "secret", "token"),
+    "password_in_url": ("://",),
+    "env_secret": ("export", "api", "secret", "auth", "access", "database", "db"),
+}
+
 # Extensions de fichiers à scanner par défaut
 DEFAULT_EXTENSIONS = {
     ".py",
@@ -3,17 +3,279 @@ Moteur de détection des secrets pour l'outil Secret Scan.
 
 Contient la logique métier pure pour la détection, le masquage
 et la gestion des secrets.
+
+Le scan d'un contenu commence par un préfiltrage : les ancres littérales des
+patterns (``SECRET_ANCHORS``) sont cherchées en une seule passe (une alternation
+compilée) dans une copie minuscule du contenu, ce qui donne les positions où une
+correspondance peut commencer. Chaque regex n'est ensuite évaluée qu'à ses
+positions candidates, dans l'ordre, ce qui reproduit exactement ``finditer`` sur
+tout le contenu. Les positions sont converties en ligne/colonne en un seul
+comptage des fins de ligne, dans l'ordre des positions.
+
+Le scan de répertoire filtre les chemins avec un matcher include/exclude
+précompilé, répartit les fichiers sur un pool de process, lit les gros fichiers
+par ``mmap`` et, avec un :class:`~.cache.SecretScanFileCache`, reprend les
+findings des fichiers inchangés. ``changed_since`` le restreint aux fichiers
+modifiés depuis un commit git.
+
+Un fichier plus gros que la taille max peut être scanné par blocs
+(:meth:`SecretDetectionEngine.scan_file_stream`) : fenêtres successives qui se
+recouvrent de ``STREAM_OVERLAP`` caractères, mémoire bornée quelle que soit la
+taille du fichier.
 """
 
 import fnmatch
+import functools
+import hashlib
 import os
 import re
-from typing import List, Optional, Tuple
+import stat
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
-from ...core.file_security import FileSecurityError, safe_read_file
-from .config import DEFAULT_EXCLUDES, DEFAULT_EXTENSIONS, SECRET_PATTERNS, SECRET_RECOMMENDATIONS, SEVERITY_LEVELS
+from ...core.file_security import FileSecurityError, FileTooLargeError, safe_iter_file_chunks, safe_read_file
+from ...core.tool_cache import fingerprint
+from .cache import SecretScanFileCache
+from .config import (
+    DEFAULT_EXCLUDES,
+    DEFAULT_EXTENSIONS,
+    SECRET_ANCHORS,
+    SECRET_PATTERNS,
+    SECRET_RECOMMENDATIONS,
+    SEVERITY_LEVELS,
+)
 from .models import SecretFinding
 
+_DEFAULT_RECOMMENDATION = (
+    "Supprimez ce secret du code et utilisez une méthode sécurisée (variables d'environnement, vault)."
+)
+
+
+# Caractères que ``re.IGNORECASE`` assimile à une lettre ASCII sans que
+# ``str.lower()`` les y ramène (ou en changeant la longueur, pour « İ »).
+_ASCII_FOLDS = (("\u0130", "i"), ("\u0131", "i"), ("\u017f", "s"))
+
+
+def _fold_for_anchors(content: str) -> Optional[str]:
+    """Version minuscule de ``content``, alignée position par position (``None`` si impossible)."""
+    if not content.isascii():
+        for char, ascii_char in _ASCII_FOLDS:
+            if char in content:
+                content = content.replace(char, ascii_char)
+    folded = content.lower()
+    return folded if len(folded) == len(content) else None
+
+
+def _compile_anchor_index(
+    patterns,
+) -> Tuple[Optional["re.Pattern[str]"], Dict[str, List[Tuple[str, List[int]]]], Set[int]]:
+    """Regroupe les ancres de ``SECRET_ANCHORS`` pour le préfiltrage.
+
+    Retourne la regex des ancres « racines » (aucune autre ancre n'en est
+    préfixe, donc au plus une par position), factorisée par premier caractère ;
+    pour chaque racine, la liste ``(ancre, patterns)`` des ancres qui la
+    prolongent (elle comprise) ; enfin les indices des patterns sans ancre.
+    """
+    anchors: Dict[str, List[int]] = {}
+    unanchored: Set[int] = set()
+    for idx, (name, *_rest) in enumerate(patterns):
+        rule_anchors = SECRET_ANCHORS.get(name)
+        if not rule_anchors:
+            unanchored.add(idx)
+            continue
+        for anchor in rule_anchors:
+            rules = anchors.setdefault(anchor.lower(), [])
+            if idx not in rules:
+                rules.append(idx)
+
+    roots = [a for a in anchors if not any(a != other and a.startswith(other) for other in anchors)]
+    index = {
+        root: sorted(((a, anchors[a]) for a in anchors if a.startswith(root)), key=lambda item: len(item[0]))
+        for root in roots
+    }
+    if not roots:
+        return None, index, unanchored
+    by_first: Dict[str, List[str]] = {}
+    for root in roots:
+        by_first.setdefault(root[0], []).append(re.escape(root[1:]))
+    regex = re.compile("|".join(f"{re.escape(c)}(?:{'|'.join(rest)})" for c, rest in by_first.items()))
+    return regex, index, unanchored
+
+
+# Taille (octets) à partir de laquelle un fichier est lu par ``mmap``.
+MMAP_THRESHOLD = 256 * 1024
+# En dessous de ce nombre de fichiers à scanner, le pool de process coûte plus qu'il ne rapporte.
+PARALLEL_MIN_FILES = 32
+# Scan par blocs : taille d'un bloc et recouvrement entre fenêtres (caractères).
+# Le recouvrement borne la longueur d'une correspondance trouvée à coup sûr à
+# cheval sur deux blocs ; les secrets détectés font au plus quelques centaines
+# de caractères (un bloc de clé privée : quelques Ko).
+STREAM_CHUNK_SIZE = 1024 * 1024
+STREAM_OVERLAP = 16 * 1024
+# À incrémenter quand la logique de scan change : invalide le cache de fichiers.
+ENGINE_VERSION = "1"
+
+_ScanResult = Tuple[Optional[str], List[Dict[str, Any]], bool, Optional[str]]
+
+
+def _compile_globs(patterns: Tuple[str, ...]) -> Optional[Callable[[str], Any]]:
+    """Une seule regex pour tous les globs (``None`` si aucun)."""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns)).match
+
+
+class PathMatcher:
+    """Filtre include/exclude précompilé, même sémantique que des ``fnmatch`` successifs.
+
+    Un chemin est exclu si un pattern d'exclusion correspond au chemin entier ou
+    à l'un de ses segments ; sinon, il est retenu s'il correspond à un pattern
+    d'inclusion (chemin ou nom de fichier) ou, sans inclusions, selon son extension.
+    """
+
+    def __init__(self, include_patterns: Tuple[str, ...] = (), exclude_patterns: Tuple[str, ...] = ()):
+        self._include = _compile_globs(tuple(include_patterns))
+        self._exclude = _compile_globs(tuple(exclude_patterns))
+
+    def __call__(self, filepath: str) -> bool:
+        filename = os.path.basename(filepath)
+        exclude = self._exclude
+        if exclude is not None:
+            if exclude(filepath):
+                return False
+            # Le nom de fichier est le dernier segment.
+            for part in filepath.split(os.sep):
+                if exclude(part):
+                    return False
+
+        if self._include is not None:
+            return bool(self._include(filepath) or self._include(filename))
+
+        ext = os.path.splitext(filepath)[1].lower()
+        if not ext and filename.startswith("."):
+            return True
+        return ext in DEFAULT_EXTENSIONS
+
+
+@functools.lru_cache(maxsize=64)
+def _path_matcher(include_patterns: Tuple[str, ...], exclude_patterns: Tuple[str, ...]) -> PathMatcher:
+    return PathMatcher(include_patterns, exclude_patterns)
+
+
+@functools.lru_cache(maxsize=1)
+def _rules_digest() -> str:
+    return fingerprint((SECRET_PATTERNS, SEVERITY_LEVELS, SECRET_RECOMMENDATIONS))
+
+
+def ruleset_fingerprint(severity_threshold: str, max_size: int, stream_large: bool = False) -> str:
+    """Version des résultats d'un fichier : règles, logique de scan, seuil, taille max, mode par blocs."""
+    return fingerprint(
+        {
+            "engine": ENGINE_VERSION,
+            "rules": _rules_digest(),
+            "threshold": severity_threshold,
+            "max_size": max_size,
+            "stream": bool(stream_large),
+        }
+    )
+
+
+def _stream_cut(window: str, overlap: int) -> int:
+    """Coupe d'une fenêtre : un début de ligne si possible, au moins ``overlap`` caractères avant la fin."""
+    limit = len(window) - overlap
+    newline = window.rfind("\n", max(0, limit - overlap), limit)
+    return newline + 1 if newline >= 0 else limit
+
+
+def git_changed_files(dirpath: str, since: str) -> List[str]:
+    """Fichiers de ``dirpath`` (chemins relatifs) modifiés depuis le commit ``since`` ou non suivis.
+
+    L'arbre de travail (modifications indexées ou non) est comparé à ``since`` ;
+    les fichiers supprimés sont ignorés par l'appelant. Lève ``ValueError`` si
+    ``dirpath`` n'est pas dans un dépôt git ou si la référence est inconnue.
+    """
+    if not since or since.startswith("-"):
+        raise ValueError(f"Référence git invalide: {since!r}")
+
+    def _git(*args: str, timeout: int = 30) -> subprocess.CompletedProcess:
+        return subprocess.run(["git", *args], capture_output=True, cwd=dirpath, timeout=timeout)
+
+    try:
+        verify = _git("rev-parse", "--verify", "--quiet", f"{since}^{{commit}}", timeout=10)
+        if verify.returncode != 0:
+            raise ValueError(f"Commit git '{since}' introuvable dans {dirpath}")
+        diff = _git("diff", "--name-only", "-z", "--relative", since, "--")
+        untracked = _git("ls-files", "-z", "--others", "--exclude-standard")
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise ValueError(f"git indisponible pour {dirpath}: {e}") from e
+    if diff.returncode != 0:
+        raise ValueError(f"git diff a échoué: {diff.stderr.decode('utf-8', 'replace').strip()}")
+
+    names = set()
+    for output in (diff.stdout, untracked.stdout if untracked.returncode == 0 else b""):
+        names.update(os.fsdecode(raw) for raw in output.split(b"\0") if raw)
+    return sorted(names)
+
+
+def _scan_file_entry(
+    engine: "SecretDetectionEngine",
+    cache: Optional[SecretScanFileCache],
+    filepath: str,
+    severity_threshold: str,
+    max_size: int,
+    version: str,
+    stream_large: bool = False,
+) -> _ScanResult:
+    """Lit, empreinte et scanne un fichier : ``(empreinte, findings, repris du cache, erreur)``.
+
+    Les findings sont des dicts ``SecretFinding`` sans ``file`` (sérialisables
+    entre process et dans le cache). Avec ``stream_large``, un fichier plus gros
+    que ``max_size`` est scanné par blocs.
+    """
+    try:
+        try:
+            content = safe_read_file(filepath, max_size, mmap_threshold=MMAP_THRESHOLD)
+        except FileTooLargeError:
+            if not stream_large:
+                raise
+            digest, streamed = engine._stream_file(filepath, severity_threshold)
+            return digest, [f.model_dump() for f in streamed], False, None
+    except FileSecurityError as e:
+        return None, [], False, f"Security violation for {filepath}: {e}"
+    except Exception as e:
+        return None, [], False, f"Erreur lecture {filepath}: {e}"
+
+    digest = hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+    if cache is not None:
+        cached = cache.get_findings(digest, version)
+        if cached is not None:
+            return digest, cached, True, None
+    findings = [f.model_dump() for f in engine.scan_content(content, None, severity_threshold)]
+    return digest, findings, False, None
+
+
+# État des process du pool (un moteur et une connexion au cache par process).
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_scan_worker(cache_dir: Optional[str]) -> None:
+    _worker_state["engine"] = SecretDetectionEngine(logger=None)
+    cache = None
+    if cache_dir:
+        try:
+            cache = SecretScanFileCache(cache_dir)
+        except Exception:
+            cache = None
+    _worker_state["cache"] = cache
+
+
+def _scan_file_job(job: Tuple[str, str, int, str, bool]) -> _ScanResult:
+    filepath, severity_threshold, max_size, version, stream_large = job
+    return _scan_file_entry(
+        _worker_state["engine"], _worker_state["cache"], filepath, severity_threshold, max_size, version, stream_large
+    )
+
 
 class SecretDetectionEngine:
     """Moteur de détection des secrets dans le code."""
@@ -23,6 +285,8 @@ class SecretDetectionEngine:
         self.patterns = [
             (name, re.compile(pattern), severity, desc) for name, pattern, severity, desc in SECRET_PATTERNS
         ]
+        self._anchor_regex, self._anchor_index, self._unanchored = _compile_anchor_index(self.patterns)
+        self._recommendations = {name: self.get_recommendation(name) for name, *_rest in self.patterns}
 
     def mask_secret(self, secret: str, visible_chars: int = 4) -> str:
         """Masque un secret en ne montrant que les premiers et derniers caractères."""
@@ -35,85 +299,233 @@ class SecretDetectionEngine:
         for key, rec in SECRET_RECOMMENDATIONS.items():
             if key in secret_type.lower():
                 return rec
-        return "Supprimez ce secret du code et utilisez une méthode sécurisée (variables d'environnement, vault)."
+        return _DEFAULT_RECOMMENDATION
 
     def should_scan_file(self, filepath: str, include_patterns: List[str], exclude_patterns: List[str]) -> bool:
         """Détermine si un fichier doit être scanné."""
-        filename = os.path.basename(filepath)
+        return _path_matcher(tuple(include_patterns or ()), tuple(exclude_patterns or ()))(filepath)
 
-        # Vérifier les exclusions
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(filepath, pattern) or fnmatch.fnmatch(filename, pattern):
-                return False
-            for part in filepath.split(os.sep):
-                if fnmatch.fnmatch(part, pattern):
-                    return False
+    def _candidate_positions(self, content: str) -> Optional[Dict[int, List[int]]]:
+        """Positions croissantes où chaque pattern ancré peut commencer une correspondance.
 
-        # Vérifier les inclusions si spécifiées
-        if include_patterns:
-            for pattern in include_patterns:
-                if fnmatch.fnmatch(filepath, pattern) or fnmatch.fnmatch(filename, pattern):
-                    return True
-            return False
+        ``None`` si le contenu ne se prête pas au préfiltrage (tout est alors
+        scanné par ``finditer``).
+        """
+        candidates: Dict[int, List[int]] = {}
+        if self._anchor_regex is None:
+            return candidates
+        folded = _fold_for_anchors(content)
+        if folded is None:
+            return None
+        search = self._anchor_regex.search
+        index = self._anchor_index
+        match = search(folded)
+        while match is not None:
+            pos = match.start()
+            root = match.group()
+            for anchor, rules in index[root]:
+                if anchor is root or folded.startswith(anchor, pos):
+                    for idx in rules:
+                        positions = candidates.setdefault(idx, [])
+                        if not positions or positions[-1] != pos:
+                            positions.append(pos)
+            # Recherche depuis pos + 1 : une ancre peut commencer à l'intérieur d'une autre.
+            match = search(folded, pos + 1)
+        return candidates
 
-        # Vérifier l'extension
-        ext = os.path.splitext(filepath)[1].lower()
-        if not ext and filename.startswith("."):
-            return True
-        return ext in DEFAULT_EXTENSIONS
+    def _iter_matches(
+        self,
+        idx: int,
+        regex: "re.Pattern[str]",
+        content: str,
+        candidates: Optional[Dict[int, List[int]]],
+        start: int = 0,
+    ):
+        """Équivalent de ``regex.finditer(content, start)`` restreint aux positions candidates."""
+        if candidates is None or idx in self._unanchored:
+            yield from regex.finditer(content, start)
+            return
+        last_end = start
+        for pos in candidates.get(idx, ()):
+            if pos < last_end:
+                continue
+            match = regex.match(content, pos)
+            if match:
+                last_end = match.end()
+                yield match
 
     def scan_content(
         self, content: str, filepath: Optional[str] = None, severity_threshold: str = "low"
     ) -> List[SecretFinding]:
         """Scanne le contenu pour trouver des secrets."""
-        findings = []
+        return self._scan_window(content, filepath, severity_threshold)
+
+    def _scan_window(
+        self,
+        content: str,
+        filepath: Optional[str],
+        severity_threshold: str,
+        *,
+        resume: Optional[Dict[int, int]] = None,
+        offset: int = 0,
+        emit_before: Optional[int] = None,
+        line_base: int = 0,
+        col_base: int = 0,
+    ) -> List[SecretFinding]:
+        """Cœur de :meth:`scan_content`, paramétré pour le scan par blocs.
+
+        ``content`` commence à la position ``offset`` du fichier, ligne
+        ``line_base`` et colonne ``col_base`` (comptées à partir de 0). Seules les
+        correspondances commençant avant ``emit_before`` sont émises.
+        ``resume[idx]`` est la position (dans le fichier) où reprendre le pattern
+        ``idx``, fin de sa dernière correspondance émise, comme ``finditer`` sur
+        le fichier entier ; la table est mise à jour.
+        """
         threshold_level = SEVERITY_LEVELS.get(severity_threshold, 1)
-        lines = content.split("\n")
+        candidates = self._candidate_positions(content)
+        hits: List[Tuple[int, "re.Match[str]"]] = []
 
-        for name, regex, severity, description in self.patterns:
+        for idx, (name, regex, severity, _description) in enumerate(self.patterns):
             if SEVERITY_LEVELS.get(severity, 1) < threshold_level:
                 continue
+            start_at = max(0, resume.get(idx, 0) - offset) if resume is not None else 0
 
             try:
-                for match in regex.finditer(content):
-                    start = match.start()
-                    line_num = content[:start].count("\n") + 1
-                    line_start = content.rfind("\n", 0, start) + 1
-                    col_num = start - line_start + 1
-
-                    # Récupérer le contenu de la ligne
-                    if line_num <= len(lines):
-                        line_content = lines[line_num - 1]
-                    else:
-                        line_content = match.group()
-
-                    matched_text = match.group()
-                    masked_match = self.mask_secret(matched_text)
-                    masked_line = line_content.replace(matched_text, masked_match)
-
-                    findings.append(
-                        SecretFinding(
-                            type=name,
-                            severity=severity,
-                            file=filepath,
-                            line=line_num,
-                            column=col_num,
-                            match=masked_line.strip()[:200],
-                            rule=description,
-                            recommendation=self.get_recommendation(name),
-                        )
-                    )
+                for match in self._iter_matches(idx, regex, content, candidates, start_at):
+                    if emit_before is not None and match.start() >= emit_before:
+                        break
+                    if resume is not None:
+                        resume[idx] = offset + match.end()
+                    hits.append((idx, match))
             except re.error as e:
                 if self.logger:
                     self.logger.warning(f"Erreur regex pour {name}: {e}")
 
+        if not hits:
+            return []
+
+        # Numéros de ligne : fins de ligne comptées une seule fois, de position en position.
+        line_of: Dict[int, int] = {}
+        line_idx = previous = 0
+        for start in sorted({match.start() for _, match in hits}):
+            line_idx += content.count("\n", previous, start)
+            line_of[start] = line_idx
+            previous = start
+
+        findings = []
+        for idx, match in hits:
+            name, _regex, severity, description = self.patterns[idx]
+            start = match.start()
+            line_idx = line_of[start]
+            line_start = content.rfind("\n", 0, start) + 1
+            line_end = content.find("\n", start)
+            line_content = content[line_start : line_end if line_end >= 0 else len(content)]
+
+            matched_text = match.group()
+            masked_match = self.mask_secret(matched_text)
+            masked_line = line_content.replace(matched_text, masked_match)
+
+            findings.append(
+                SecretFinding(
+                    type=name,
+                    severity=severity,
+                    file=filepath,
+                    line=line_base + line_idx + 1,
+                    column=start - line_start + 1 + (col_base if line_idx == 0 else 0),
+                    match=masked_line.strip()[:200],
+                    rule=description,
+                    recommendation=self._recommendations[name],
+                )
+            )
         return findings
 
-    def scan_file(self, filepath: str, severity_threshold: str, max_size: int) -> List[SecretFinding]:
-        """Scanne un fichier pour trouver des secrets."""
+    def scan_file_stream(
+        self,
+        filepath: str,
+        severity_threshold: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        overlap: int = STREAM_OVERLAP,
+    ) -> List[SecretFinding]:
+        """Scanne un fichier de taille quelconque par blocs, à mémoire bornée.
+
+        Protections de ``safe_read_file`` conservées (O_NOFOLLOW, fichier régulier,
+        verrou partagé, taille vérifiée en fin de lecture). Lève ``FileSecurityError``
+        ou ``OSError`` comme elle.
+        """
+        return self._stream_file(filepath, severity_threshold, filepath, chunk_size, overlap)[1]
+
+    def _stream_file(
+        self,
+        filepath: str,
+        severity_threshold: str,
+        label: Optional[str] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        overlap: int = STREAM_OVERLAP,
+    ) -> Tuple[str, List[SecretFinding]]:
+        """Scan par blocs : ``(empreinte SHA-256 du texte, findings)``, findings attribués à ``label``.
+
+        Chaque fenêtre = fin de la précédente (au moins ``overlap`` caractères) +
+        un bloc ; seules les correspondances commençant avant la coupe sont
+        émises, la suite est re-scannée avec le bloc suivant. Toute
+        correspondance d'au plus ``overlap`` caractères est ainsi trouvée, avec
+        ses ligne/colonne, comme par un scan du fichier entier, et dans le même ordre.
+        """
+        overlap = max(1, overlap)
+        digest = hashlib.sha256()
+        by_rule: Dict[str, List[SecretFinding]] = {}
+        resume: Dict[int, int] = {}
+        window = ""
+        offset = line_base = col_base = 0
+
+        def scan(emit_before: Optional[int]) -> None:
+            for finding in self._scan_window(
+                window,
+                label,
+                severity_threshold,
+                resume=resume,
+                offset=offset,
+                emit_before=emit_before,
+                line_base=line_base,
+                col_base=col_base,
+            ):
+                by_rule.setdefault(finding.type, []).append(finding)
+
+        for chunk in safe_iter_file_chunks(filepath, chunk_size):
+            digest.update(chunk.encode("utf-8", "surrogatepass"))
+            window += chunk
+            if len(window) <= 2 * overlap:
+                continue
+            cut = _stream_cut(window, overlap)
+            scan(cut)
+            newlines = window.count("\n", 0, cut)
+            if newlines:
+                line_base += newlines
+                col_base = cut - window.rfind("\n", 0, cut) - 1
+            else:
+                col_base += cut
+            offset += cut
+            window = window[cut:]
+        scan(None)
+
+        findings = [f for name, *_rest in self.patterns for f in by_rule.get(name, ())]
+        return digest.hexdigest(), findings
+
+    def scan_file(
+        self, filepath: str, severity_threshold: str, max_size: int, stream_large: bool = False
+    ) -> List[SecretFinding]:
+        """Scanne un fichier pour trouver des secrets.
+
+        Avec ``stream_large``, un fichier plus gros que ``max_size`` est scanné par
+        blocs (:meth:`scan_file_stream`) au lieu d'être ignoré.
+        """
         try:
             # Utiliser safe_read_file pour éviter les attaques TOCTOU et symlinks
-            content = safe_read_file(filepath, max_size)
+            try:
+                content = safe_read_file(filepath, max_size, mmap_threshold=MMAP_THRESHOLD)
+            except FileTooLargeError:
+                if not stream_large:
+                    raise
+                return self.scan_file_stream(filepath, severity_threshold)
             return self.scan_content(content, filepath, severity_threshold)
         except FileSecurityError as e:
             # Log les violations de sécurité au niveau warning
@@ -132,27 +544,113 @@ class SecretDetectionEngine:
         exclude_patterns: List[str],
         severity_threshold: str,
         max_size: int,
+        *,
+        workers: int = 1,
+        cache: Optional[SecretScanFileCache] = None,
+        changed_since: Optional[str] = None,
+        stream_large: bool = False,
     ) -> Tuple[List[SecretFinding], int]:
-        """Scanne un répertoire récursivement."""
+        """Scanne un répertoire récursivement.
+
+        ``workers`` > 1 répartit les fichiers sur autant de process (à partir de
+        ``PARALLEL_MIN_FILES`` fichiers à scanner) ; ``cache`` reprend les
+        findings des fichiers inchangés ; ``changed_since`` (commit git) limite
+        le scan aux fichiers modifiés depuis ce commit ou non suivis ;
+        ``stream_large`` scanne par blocs les fichiers plus gros que ``max_size``.
+        """
+        accept = _path_matcher(tuple(include_patterns or ()), tuple(exclude_patterns or ()))
+        if changed_since:
+            rel_paths = [
+                rel
+                for rel in git_changed_files(dirpath, changed_since)
+                if not any(part in DEFAULT_EXCLUDES for part in rel.split(os.sep)[:-1])
+                and accept(rel)
+                and os.path.isfile(os.path.join(dirpath, rel))
+            ]
+        else:
+            rel_paths = list(self._walk(dirpath, accept))
+
+        version = ruleset_fingerprint(severity_threshold, max_size, stream_large)
+        filepaths = [os.path.join(dirpath, rel_path) for rel_path in rel_paths]
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(rel_paths)
+        stats: List[Optional[Tuple[str, int, int]]] = [None] * len(rel_paths)
+        if cache is not None:
+            for i, filepath in enumerate(filepaths):
+                # lstat : un lien symbolique, une FIFO ou un device n'a pas d'entrée
+                # de métadonnées (scanné, puis repris au mieux par empreinte).
+                try:
+                    st = os.lstat(filepath)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    stats[i] = (os.path.abspath(filepath), st.st_size, st.st_mtime_ns)
+            known = [i for i, st in enumerate(stats) if st is not None]
+            for i, cached in zip(known, cache.lookup([stats[i] for i in known], version), strict=True):
+                results[i] = cached
+
+        pending = [i for i, found in enumerate(results) if found is None]
+        scanned = self._scan_files(
+            [filepaths[i] for i in pending], severity_threshold, max_size, version, workers, cache, stream_large
+        )
+        to_store = []
+        for i, (digest, found, from_cache, error) in zip(pending, scanned, strict=True):
+            if error and self.logger:
+                self.logger.warning(error)
+            results[i] = found
+            if cache is not None and digest is not None and stats[i] is not None:
+                to_store.append((*stats[i], digest, None if from_cache else found))
+        if to_store:
+            cache.store(to_store, version)
+
+        if self.logger and cache is not None:
+            reused = len(rel_paths) - len(pending)
+            self.logger.debug(f"Scan de secrets: {reused}/{len(rel_paths)} fichier(s) repris du cache")
+
         findings = []
-        files_scanned = 0
+        for rel_path, found in zip(rel_paths, results, strict=True):
+            for data in found:
+                findings.append(SecretFinding(**{**data, "file": rel_path}))
+        return findings, len(rel_paths)
 
+    @staticmethod
+    def _walk(dirpath: str, accept: Callable[[str], bool]) -> Iterator[str]:
+        """Chemins relatifs des fichiers retenus par ``accept`` (hors ``DEFAULT_EXCLUDES``)."""
         for root, dirs, files in os.walk(dirpath):
             # Filtrer les répertoires exclus
             dirs[:] = [d for d in dirs if d not in DEFAULT_EXCLUDES]
-
+            rel_root = os.path.relpath(root, dirpath)
             for filename in files:
-                filepath = os.path.join(root, filename)
-                rel_path = os.path.relpath(filepath, dirpath)
-
-                if self.should_scan_file(rel_path, include_patterns, exclude_patterns):
-                    file_findings = self.scan_file(filepath, severity_threshold, max_size)
-                    for finding in file_findings:
-                        finding.file = rel_path
-                    findings.extend(file_findings)
-                    files_scanned += 1
+                rel_path = filename if rel_root == os.curdir else os.path.join(rel_root, filename)
+                if accept(rel_path):
+                    yield rel_path
 
-        return findings, files_scanned
+    def _scan_files(
+        self,
+        filepaths: List[str],
+        severity_threshold: str,
+        max_size: int,
+        version: str,
+        workers: int,
+        cache: Optional[SecretScanFileCache],
+        stream_large: bool = False,
+    ) -> List[_ScanResult]:
+        """Scanne les fichiers dans l'ordre, en parallèle si ``workers`` > 1 et assez de fichiers."""
+        if workers > 1 and len(filepaths) >= PARALLEL_MIN_FILES:
+            cache_dir = str(cache.path.parent) if cache is not None else None
+            jobs = [(filepath, severity_threshold, max_size, version, stream_large) for filepath in filepaths]
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_scan_worker, initargs=(cache_dir,)
+                ) as pool:
+                    return list(pool.map(_scan_file_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+            except Exception as e:
+                # Pool indisponible (sandbox, ressources) : repli séquentiel
+                if self.logger:
+                    self.logger.warning(f"Scan parallèle indisponible ({e}), repli séquentiel")
+        return [
+            _scan_file_entry(self, cache, filepath, severity_threshold, max_size, version, stream_large)
+            for filepath in filepaths
+        ]
 
     def deduplicate_findings(self, findings: List[SecretFinding]) -> List[SecretFinding]:
         """Déduplique les findings basés sur (type, file, line, match)."""
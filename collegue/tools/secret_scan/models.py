@@ -61,6 +61,14 @@ class SecretScanRequest(BaseModel):
         ge=1024,
         le=10 * 1024 * 1024,
     )
+    stream_large_files: bool = Field(
+        True,
+        description="Scanner par blocs (mémoire bornée) les fichiers plus gros que max_file_size au lieu de les ignorer",
+    )
+    changed_since: Optional[str] = Field(
+        None,
+        description="Scan de répertoire: ne scanner que les fichiers modifiés depuis ce commit git (ou non suivis)",
+    )
 
     @field_validator("scan_type")
     def validate_scan_type(cls, v):
@@ -16,7 +16,10 @@ import os
 from typing import Any, Dict, List
 
 from ...core.shared import aggregate_severities
+from ...core.tool_cache import fingerprint, fingerprint_path
 from ..base import BaseTool, ToolValidationError
+from . import config as scan_config
+from .cache import get_secret_scan_cache
 from .engine import SecretDetectionEngine
 from .models import SecretFinding, SecretScanRequest, SecretScanResponse
 
@@ -44,7 +47,10 @@ class SecretScanTool(BaseTool):
         "- include_patterns: Liste de patterns glob à inclure (ex: ['*.py', '*.ts']).\n"
         "- exclude_patterns: Liste de patterns glob à exclure (ex: ['*.min.js']).\n"
         "- severity_threshold: Seuil minimum. Options: 'low', 'medium', 'high', 'critical'. Défaut: 'low'.\n"
-        "- max_file_size: Taille max des fichiers en octets. Défaut: 1 Mo.\n"
+        "- max_file_size: Taille max des fichiers lus d'un bloc, en octets. Défaut: 1 Mo.\n"
+        "- stream_large_files: Scanner par blocs les fichiers plus gros (mémoire bornée). Défaut: true.\n"
+        "- changed_since: Commit git (ex: 'HEAD~1', 'origin/main'). Scan de répertoire limité aux fichiers "
+        "modifiés depuis ce commit ou non suivis (pré-commit, CI).\n"
         "\n"
         "UTILISATION:\n"
         "Crucial pour auditer du code avant commit/déploiement. Préférez utiliser le paramètre `files` "
@@ -93,11 +99,51 @@ class SecretScanTool(BaseTool):
         "any",
     ]
     long_running = False
+    deterministic = True
 
     def __init__(self, config=None, app_state=None):
         super().__init__(config, app_state)
         self._engine = SecretDetectionEngine(logger=self.logger)
 
+    def get_cache_version(self) -> str:
+        """Version du code + empreinte du jeu de règles (patterns, extensions, exclusions)."""
+        rules = (
+            scan_config.SECRET_PATTERNS,
+            scan_config.DEFAULT_EXTENSIONS,
+            scan_config.DEFAULT_EXCLUDES,
+            scan_config.SEVERITY_LEVELS,
+            scan_config.SECRET_RECOMMENDATIONS,
+        )
+        return f"{self.cache_version}:{fingerprint(rules)}"
+
+    def is_cacheable(self, request: SecretScanRequest) -> bool:
+        """Un scan ``changed_since`` dépend de l'historique git, pas seulement du contenu."""
+        return self.deterministic and not request.changed_since
+
+    def get_cache_inputs(self, request: SecretScanRequest) -> Any:
+        """Empreinte du contenu des fichiers désignés par ``target`` (fichier ou répertoire)."""
+        if request.files or request.content or not request.target or not os.path.exists(request.target):
+            return None
+        include_patterns = request.include_patterns or []
+        exclude_patterns = list(scan_config.DEFAULT_EXCLUDES) + (request.exclude_patterns or [])
+        return fingerprint_path(
+            request.target,
+            accept=lambda rel: self._engine.should_scan_file(rel, include_patterns, exclude_patterns),
+            skip_dirs=scan_config.DEFAULT_EXCLUDES,
+            max_size=request.max_file_size,
+        )
+
+    @staticmethod
+    def _scan_workers() -> int:
+        """Process du scan de répertoire (``SECRET_SCAN_WORKERS``, 1 par défaut = séquentiel, 0 = un par cœur)."""
+        try:
+            from collegue.config import settings
+
+            workers = int(getattr(settings, "SECRET_SCAN_WORKERS", 1))
+        except Exception:
+            workers = 1
+        return workers if workers > 0 else (os.cpu_count() or 1)
+
     def validate_language(self, language: str) -> bool:
         """Accepte n'importe quel langage pour le scan de secrets."""
         return True
@@ -232,7 +278,12 @@ class SecretScanTool(BaseTool):
                     raise ToolValidationError(
                         f"Fichier '{request.target}' inexistant. Utilisez 'content' pour passer du code directement."
                     )
-                findings = self._engine.scan_file(request.target, request.severity_threshold, request.max_file_size)
+                findings = self._engine.scan_file(
+                    request.target,
+                    request.severity_threshold,
+                    request.max_file_size,
+                    stream_large=request.stream_large_files,
+                )
                 files_scanned = 1
 
             elif scan_type == "directory":
@@ -240,13 +291,20 @@ class SecretScanTool(BaseTool):
                     raise ToolValidationError(
                         f"Répertoire '{request.target}' inexistant. Utilisez 'content' pour passer du code directement."
                     )
-                findings, files_scanned = self._engine.scan_directory(
-                    request.target,
-                    include_patterns,
-                    exclude_patterns,
-                    request.severity_threshold,
-                    request.max_file_size,
-                )
+                try:
+                    findings, files_scanned = self._engine.scan_directory(
+                        request.target,
+                        include_patterns,
+                        exclude_patterns,
+                        request.severity_threshold,
+                        request.max_file_size,
+                        workers=self._scan_workers(),
+                        cache=get_secret_scan_cache(),
+                        changed_since=request.changed_since,
+                        stream_large=request.stream_large_files,
+                    )
+                except ValueError as e:
+                    raise ToolValidationError(str(e)) from e
 
             elif scan_type == "content":
                 findings = self._engine.scan_content(request.target, None, request.severity_threshold)
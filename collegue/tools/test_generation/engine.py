@@ -5,10 +5,10 @@ Contient la logique métier pure : analyse de code, extraction d'éléments,
 gestion des templates, génération de fallback.
 """
 
-import ast
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+from ...core.code_facts import get_code_facts
 from .config import DEFAULT_FRAMEWORKS, IMPORT_TEMPLATES, LANGUAGE_TEST_INSTRUCTIONS, TEST_FRAMEWORKS
 
 
@@ -52,44 +52,34 @@ class TestGenerationEngine:
 
     def _extract_python_elements(self, code: str) -> List[Dict[str, Any]]:
         """Extrait les fonctions et classes Python."""
-        elements = []
-
-        try:
-            tree = ast.parse(code)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    # Ignorer les méthodes privées
-                    if node.name.startswith("_"):
-                        continue
-
-                    params = [arg.arg for arg in node.args.args if arg.arg != "self"]
-
-                    elements.append(
-                        {
-                            "type": "function",
-                            "name": node.name,
-                            "params": params,
-                            "line_number": node.lineno,
-                            "complexity": self._estimate_complexity(node),
-                        }
-                    )
-
-                elif isinstance(node, ast.ClassDef):
-                    methods = []
-                    for item in node.body:
-                        if isinstance(item, ast.FunctionDef) and not item.name.startswith("_"):
-                            methods.append(item.name)
-
-                    elements.append(
-                        {"type": "class", "name": node.name, "methods": methods, "line_number": node.lineno}
-                    )
-
-        except SyntaxError as e:
+        facts = get_code_facts(code)
+        if not facts.valid:
             if self.logger:
-                self.logger.warning(f"Erreur syntaxique Python: {e}")
+                self.logger.warning(f"Erreur syntaxique Python: ligne {facts.syntax_error_line}: {facts.syntax_error}")
+            return []
 
-        return elements
+        ranked = []
+        for function in facts.functions:
+            # Ignorer les méthodes privées
+            if function.name.startswith("_"):
+                continue
+            element = {
+                "type": "function",
+                "name": function.name,
+                "params": list(function.params),
+                "line_number": function.line,
+                "complexity": self._complexity_level(function.complexity),
+            }
+            ranked.append((function.scope_depth, function.line, element))
+
+        for cls in facts.classes:
+            methods = [name for name in cls.methods if not name.startswith("_")]
+            element = {"type": "class", "name": cls.name, "methods": methods, "line_number": cls.line}
+            ranked.append((cls.scope_depth, cls.line, element))
+
+        # Éléments de niveau module d'abord (le prompt n'en garde que les premiers), puis méthodes.
+        ranked.sort(key=lambda item: item[:2])
+        return [element for _, _, element in ranked]
 
     def _extract_js_elements(self, code: str) -> List[Dict[str, Any]]:
         """Extrait les fonctions et classes JavaScript/TypeScript."""
@@ -196,16 +186,9 @@ class TestGenerationEngine:
 
         return elements
 
-    def _estimate_complexity(self, node) -> str:
-        """Estime la complexité cyclomatique d'une fonction Python."""
-        complexity = 1
-
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-
+    @staticmethod
+    def _complexity_level(complexity: int) -> str:
+        """Niveau de la complexité cyclomatique d'une fonction Python."""
         if complexity <= 3:
             return "low"
         elif complexity <= 6:
@@ -259,7 +259,7 @@ class TestGenerationTool(AgentLoopMixin, BaseTool):
         )
 
     @staticmethod
-    def _extract_test_code_block(text: str) -> str:
+    def _extract_test_code_block(text: str, require_fence: bool = False) -> str:
         """Return the body of the fenced block that actually contains tests.
 
         Handles three failure modes seen on Gemini 2.5/3 and Gemma 4:
@@ -270,13 +270,14 @@ class TestGenerationTool(AgentLoopMixin, BaseTool):
           and puts tests second; picking the first fence would miss the
           actual tests. We therefore pick the fence whose body contains
           ``def test_`` or ``import pytest``; if none match, fall back to
-          the longest fence; if no fence, return ``text`` unchanged.
+          the longest fence; if no fence, return ``text`` unchanged — or
+          ``""`` with ``require_fence``, so callers can fall back explicitly.
         """
         import re
 
         blocks = re.findall(r"```[^\n]*\n(.*?)```", text, flags=re.DOTALL)
         if not blocks:
-            return text
+            return "" if require_fence else text
         test_shaped = [b for b in blocks if "def test_" in b or "import pytest" in b]
         chosen = test_shaped[0] if test_shaped else max(blocks, key=len)
         return chosen.rstrip()
@@ -383,7 +384,12 @@ class TestGenerationTool(AgentLoopMixin, BaseTool):
                 max_tokens=2000,
             )
 
-            test_code = self._extract_test_code_block(agent_result.best_output)
+            # Sans bloc de code, la sortie brute n'est gardée que si la boucle lui a
+            # trouvé une valeur (score > 0) : de la prose seule donne un code vide,
+            # donc le fallback explicite ci-dessous.
+            test_code = self._extract_test_code_block(
+                agent_result.best_output, require_fence=agent_result.best_score <= 0
+            )
 
             self.track_last_prompt_performance(
                 execution_time=0.0,
@@ -12,8 +12,21 @@ as close to empty as possible — every entry is a silenced red flag.
 
 from __future__ import annotations
 
+import atexit
+import os
+import shutil
+import tempfile
+
 import pytest
 
+# Mémoire, monitoring et versions de prompts écrits par la suite vont dans un
+# COLLEGUE_HOME jetable, pas dans le dépôt. Posé à l'import du conftest, avant
+# celui de collegue (des chemins y sont capturés à l'import).
+_TEST_HOME = tempfile.mkdtemp(prefix="collegue-tests-")
+os.environ["COLLEGUE_HOME"] = _TEST_HOME
+# Enregistré avant les flush ``atexit`` du monitoring, donc exécuté après eux.
+atexit.register(shutil.rmtree, _TEST_HOME, ignore_errors=True)
+
 _KNOWN_FAILURES: frozenset[str] = frozenset()
 
 _SKIP_REASON = "pre-existing failure — document in a tracking issue before adding"
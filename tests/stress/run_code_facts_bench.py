@@ -0,0 +1,91 @@
+"""Benchmark de l'analyse AST partagée (``collegue.core.code_facts``).
+
+Génère un module Python de taille croissante et lui applique les analyses AST
+d'une requête de chaque expert (code_review, performance_analysis, refactoring,
+test_generation), d'abord sans cache (``CODE_FACTS_CACHE_SIZE=0`` : chaque
+analyse re-parse le source, comme avant le partage), puis avec le cache. Les
+colonnes reprennent :class:`~collegue.core.code_facts.ParseStats` : parsings
+effectués, repris du cache et temps de parsing économisé.
+
+    PYTHONPATH=. python tests/stress/run_code_facts_bench.py --functions 50 200 800
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from types import SimpleNamespace
+
+from collegue.core.code_facts import capture_parse_stats, get_code_facts_cache, reset_code_facts_cache
+from collegue.tools.code_review.engine import CodeReviewEngine
+from collegue.tools.performance_analysis.engine import PerformanceEngine
+from collegue.tools.refactoring.engine import RefactoringEngine
+from collegue.tools.test_generation.engine import TestGenerationEngine
+
+
+def generate_module(n_functions: int) -> str:
+    parts = ['"""Module généré."""', "import os", ""]
+    for idx in range(n_functions):
+        parts.append(
+            f"def process_{idx}(items: list, lookup) -> int:\n"
+            f'    """Traite le lot {idx}."""\n'
+            "    total = 0\n"
+            "    for item in items:\n"
+            "        for key in item.keys:\n"
+            "            if key in lookup and item.active:\n"
+            "                total += 1\n"
+            "    try:\n"
+            "        os.stat(str(total))\n"
+            "    except Exception:\n"
+            "        pass\n"
+            "    return total\n"
+        )
+    return "\n".join(parts)
+
+
+def analyse(code: str) -> None:
+    """Analyses AST d'une requête de chaque expert sur le même source."""
+    review = CodeReviewEngine()
+    review.analyze_naming(code, "python")
+    review.analyze_complexity(code, "python")
+    review.analyze_error_handling(code, "python")
+    review.identify_strengths(code, "python")
+    PerformanceEngine().analyze_algorithmic_complexity(code, "python")
+    refactoring = RefactoringEngine()
+    refactoring.validate_code_syntax(code, "python")
+    refactoring.analyze_code_metrics(code, "python")
+    TestGenerationEngine().extract_code_elements(code, "python")
+
+
+def measure(code: str, cache_size: int):
+    reset_code_facts_cache()
+    get_code_facts_cache(SimpleNamespace(CODE_FACTS_CACHE_SIZE=cache_size))
+    with capture_parse_stats() as stats:
+        start = time.perf_counter()
+        analyse(code)
+        elapsed = time.perf_counter() - start
+    return elapsed, stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, nargs="+", default=[50, 200, 800])
+    args = parser.parse_args()
+
+    print(
+        f"{'fonctions':>9} {'lignes':>7} {'sans cache (s)':>15} {'parsings':>9} "
+        f"{'avec cache (s)':>15} {'parsings':>9} {'repris':>7} {'économisé (ms)':>15}"
+    )
+    for n_functions in args.functions:
+        code = generate_module(n_functions)
+        cold, cold_stats = measure(code, 0)
+        warm, warm_stats = measure(code, 256)
+        print(
+            f"{n_functions:>9} {code.count(chr(10)) + 1:>7} {cold:>15.3f} {cold_stats.parses:>9} "
+            f"{warm:>15.3f} {warm_stats.parses:>9} {warm_stats.reuses:>7} {warm_stats.saved_ms:>15.1f}"
+        )
+    reset_code_facts_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Benchmark des requêtes réseau de dependency_guard (``collegue.tools.dependency_guard.registry``).
+
+Démarre un registre local (PyPI + OSV simulés, ``http.server`` multi-thread en
+HTTP/1.1 keep-alive) qui ajoute un délai à chaque nouvelle connexion (coût d'une
+poignée de main TCP+TLS) et à chaque requête (latence réseau), puis vérifie
+l'existence et les vulnérabilités d'un gros lockfile :
+
+- ``urllib`` : l'ancienne implémentation (une connexion par package, dix threads,
+  détails OSV récupérés un par un) ;
+- ``client mutualisé`` : :class:`RegistryClient` sans cache ;
+- ``cache froid`` / ``cache chaud`` : avec :class:`RegistryMetadataCache` vide
+  puis rempli par le passage précédent.
+
+    PYTHONPATH=. python tests/stress/run_dependency_guard_bench.py --packages 200 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from collegue.tools.dependency_guard.cache import RegistryMetadataCache
+from collegue.tools.dependency_guard.engine import DependencyAnalysisEngine
+from collegue.tools.dependency_guard.registry import RegistryClient
+
+# Un package sur VULNERABLE_EVERY a une vulnérabilité, un sur MISSING_EVERY n'existe pas.
+VULNERABLE_EVERY = 20
+MISSING_EVERY = 50
+
+
+class StubRegistry(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connect_delay = 0.0
+    request_delay = 0.0
+    stats = {"connections": 0, "requests": 0}
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with self.lock:
+            self.stats["connections"] += 1
+        time.sleep(self.connect_delay)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload=None, headers=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _count(self):
+        with self.lock:
+            self.stats["requests"] += 1
+        time.sleep(self.request_delay)
+
+    def do_GET(self):
+        self._count()
+        parts = self.path.strip("/").split("/")
+        if parts[0] == "vulns":
+            self._reply(
+                200,
+                {
+                    "id": parts[1],
+                    "summary": f"Vulnérabilité simulée {parts[1]}",
+                    "aliases": [f"CVE-2026-{parts[1][5:]}"],
+                    "database_specific": {"severity": "HIGH"},
+                    "affected": [{"ranges": [{"events": [{"introduced": "0"}, {"fixed": "9.9.9"}]}]}],
+                },
+            )
+            return
+        name = parts[1]
+        if int(name.rsplit("-", 1)[1]) % MISSING_EVERY == 0:
+            self._reply(404)
+        elif self.headers.get("If-None-Match") == '"stub"':
+            self._reply(304)
+        else:
+            self._reply(200, {"info": {"version": "1.0.0"}}, {"ETag": '"stub"'})
+
+    def do_POST(self):
+        self._count()
+        queries = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["queries"]
+        results = []
+        for query in queries:
+            index = int(query["package"]["name"].rsplit("-", 1)[1])
+            results.append({"vulns": [{"id": f"GHSA-{index}"}]} if index % VULNERABLE_EVERY == 0 else {})
+        self._reply(200, {"results": results})
+
+
+def legacy_scan(base: str, names, deps):
+    """Ancienne implémentation : urllib, une connexion par requête."""
+
+    def exists(name):
+        try:
+            with urllib.request.urlopen(f"{base}/pypi/{name}/json", timeout=10) as response:
+                json.loads(response.read())
+            return True
+        except urllib.error.HTTPError:
+            return False
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        list(executor.map(exists, names))
+    queries = [{"package": {"name": d["name"], "ecosystem": "PyPI"}, "version": d["version"][2:]} for d in deps]
+    request = urllib.request.Request(
+        f"{base}/querybatch",
+        data=json.dumps({"queries": queries}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=60) as response:
+        results = json.loads(response.read())["results"]
+    for item in results:
+        for vuln in item.get("vulns", []):
+            with urllib.request.urlopen(f"{base}/vulns/{vuln['id']}", timeout=10) as response:
+                json.loads(response.read())
+
+
+def pooled_scan(client: RegistryClient, names, deps):
+    engine = DependencyAnalysisEngine(registry=client)
+
+    async def scan():
+        await asyncio.gather(
+            engine.check_packages_existence(names, "python"), engine.check_osv_vulnerabilities_async(deps, "PyPI")
+        )
+
+    asyncio.run(scan())
+
+
+def measure(fn, *args):
+    StubRegistry.stats.update(connections=0, requests=0)
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start, dict(StubRegistry.stats)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packages", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--connect-ms", type=float, default=30.0, help="délai par nouvelle connexion")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="délai par requête")
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    StubRegistry.connect_delay = args.connect_ms / 1000
+    StubRegistry.request_delay = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubRegistry)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    def client(cache=None):
+        return RegistryClient(
+            cache,
+            max_concurrency=args.concurrency,
+            registry_urls={"pypi": base + "/pypi/{package}/json"},
+            osv_batch_url=f"{base}/querybatch",
+            osv_vuln_url=f"{base}/vulns/",
+        )
+
+    print(f"{'packages':>8} {'mode':>18} {'durée (s)':>10} {'connexions':>11} {'requêtes':>9}")
+    for count in args.packages:
+        names = [f"pkg-{index}" for index in range(1, count + 1)]
+        deps = [{"name": name, "version": "==1.0.0"} for name in names]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = RegistryMetadataCache(cache_dir)
+            rows = [
+                ("urllib", measure(legacy_scan, base, names, deps)),
+                ("client mutualisé", measure(pooled_scan, client(), names, deps)),
+                ("cache froid", measure(pooled_scan, client(cache), names, deps)),
+                ("cache chaud", measure(pooled_scan, client(cache), names, deps)),
+            ]
+            cache.close()
+        for mode, (elapsed, stats) in rows:
+            print(f"{count:>8} {mode:>18} {elapsed:>10.2f} {stats['connections']:>11} {stats['requests']:>9}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
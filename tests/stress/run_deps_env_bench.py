@@ -0,0 +1,100 @@
+"""Benchmark des environnements de dépendances pré-construits du gate (``collegue.executor.deps_env``).
+
+Rejoue ``--retries`` passes de gate sur un même workspace (``requirements.txt`` +
+front avec ``package-lock.json``), avec installation à la volée puis avec
+:class:`DepsEnvCache`. Un ``docker`` factice simule le coût d'une installation
+(``--install-ms`` par ``pip install`` / ``npm ci``) et des tests (``--tests-ms``)
+sans rien exécuter ; la copie du ``node_modules`` pré-construit est comptée
+comme une installation divisée par ``--copy-ratio``.
+
+    PYTHONPATH=. python tests/stress/run_deps_env_bench.py --retries 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from collegue.executor import DepsEnvCache, FakeReviewer, run_quality_gate
+from collegue.sandbox import DockerSandbox
+
+DIFF = "diff --git a/app.py b/app.py\n+print('x')\n"
+
+
+def fake_docker(directory: str, install_ms: float, tests_ms: float, copy_ratio: float) -> str:
+    path = os.path.join(directory, "docker")
+    install = install_ms / 1000
+    with open(path, "w") as f:
+        f.write(
+            "#!/bin/sh\n"
+            '[ "$1" = image ] && { echo sha256:bench; exit 0; }\n'
+            "for last; do :; done\n"
+            'n=$(printf %s "$last" | grep -o "pip install\\|npm ci" | wc -l)\n'
+            'c=$(printf %s "$last" | grep -o "cp -a /deps_env" | wc -l)\n'
+            f'sleep $(awk "BEGIN {{ print $n * {install} + $c * {install / copy_ratio} + {tests_ms / 1000} }}")\n'
+            "exit 0\n"
+        )
+    os.chmod(path, 0o755)
+    return path
+
+
+def build_workspace(directory: str) -> str:
+    workspace = os.path.join(directory, "ws")
+    front = os.path.join(workspace, "frontend")
+    os.makedirs(front)
+    with open(os.path.join(workspace, "requirements.txt"), "w") as f:
+        f.write("fastapi==0.110.0\nhttpx==0.27.0\n")
+    with open(os.path.join(front, "package.json"), "w") as f:
+        f.write('{"scripts": {"build": "vite build"}}')
+    with open(os.path.join(front, "package-lock.json"), "w") as f:
+        f.write("{}")
+    return workspace
+
+
+async def retries(sandbox, workspace: str, count: int, cache=None):
+    durations = []
+    for _ in range(count):
+        start = time.perf_counter()
+        report = await run_quality_gate(
+            workspace,
+            DIFF,
+            ctx=None,
+            sandbox=sandbox,
+            reviewer=FakeReviewer(),
+            check_installability=True,
+            e2e_gate=False,
+            deps_env_cache=cache,
+        )
+        durations.append((time.perf_counter() - start, report.deps_envs_prebuilt))
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--retries", type=int, default=4)
+    parser.add_argument("--install-ms", type=float, default=1500.0)
+    parser.add_argument("--tests-ms", type=float, default=300.0)
+    parser.add_argument("--copy-ratio", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docker_bin = fake_docker(tmp, args.install_ms, args.tests_ms, args.copy_ratio)
+        workspace = build_workspace(tmp)
+        sandbox = DockerSandbox(image="bench", docker_bin=docker_bin, allow_root=True)
+        cache = DepsEnvCache(os.path.join(tmp, "envs"))
+        rows = [
+            ("à la volée", asyncio.run(retries(sandbox, workspace, args.retries))),
+            ("pré-construit", asyncio.run(retries(sandbox, workspace, args.retries, cache))),
+        ]
+        print(f"{'mode':>14} {'passe':>6} {'durée (s)':>10}  environnements")
+        for mode, durations in rows:
+            for index, (elapsed, prebuilt) in enumerate(durations, 1):
+                print(f"{mode:>14} {index:>6} {elapsed:>10.2f}  {', '.join(prebuilt) or '-'}")
+        print(f"constructions : {cache.builds}, resservies : {cache.hits}")
+
+
+if __name__ == "__main__":
+    main()
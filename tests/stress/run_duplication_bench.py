@@ -0,0 +1,99 @@
+"""Benchmark de la détection de duplication de ``repo_consistency_check``.
+
+Génère des dépôts synthétiques (fichiers Python de ~120 lignes, dont une partie
+recopie des blocs partagés) de taille croissante et mesure
+``ConsistencyAnalysisEngine.analyze_duplication``. Le rapport temps/fichiers doit
+rester à peu près constant : l'index global par empreinte roulante est linéaire
+en nombre de lignes, là où l'ancienne comparaison fichier par fichier était
+quadratique (``--baseline`` la ré-exécute pour comparaison).
+
+    PYTHONPATH=. python tests/stress/run_duplication_bench.py --sizes 250 500 1000 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import random
+import re
+import time
+from typing import Dict, List
+
+from collegue.core.shared import FileInput
+from collegue.tools.repo_consistency_check.engine import ConsistencyAnalysisEngine
+
+LINES_PER_FILE = 120
+SHARED_BLOCKS = 20
+
+
+def generate_repo(n_files: int, seed: int = 0) -> List[FileInput]:
+    rnd = random.Random(seed)
+    shared = [
+        "\n".join(f"shared_{block}_{i} = compute({i}, ratio={block})" for i in range(12))
+        for block in range(SHARED_BLOCKS)
+    ]
+    files = []
+    for idx in range(n_files):
+        lines = [f"value_{idx}_{i} = helper_{rnd.randint(0, 10**6)}({i})" for i in range(LINES_PER_FILE)]
+        if idx % 3 == 0:
+            at = rnd.randint(0, LINES_PER_FILE - 1)
+            lines[at:at] = shared[rnd.randrange(SHARED_BLOCKS)].split("\n")
+        files.append(FileInput(path=f"pkg/module_{idx}.py", content="\n".join(lines)))
+    return files
+
+
+def _pairwise_baseline(files: List[FileInput], block_size: int) -> int:
+    """Ancien algorithme : fenêtres MD5 par fichier puis intersection de chaque paire de fichiers."""
+
+    def normalize(line: str) -> str:
+        return re.sub(r"#.*$", "", re.sub(r"//.*$", "", line.strip()))
+
+    def blocks(content: str) -> Dict[str, int]:
+        lines = content.split("\n")
+        found: Dict[str, int] = {}
+        for i in range(len(lines) - block_size + 1):
+            window = [normalize(line) for line in lines[i : i + block_size]]
+            if all(len(line) < 3 for line in window):
+                continue
+            found.setdefault(hashlib.md5("\n".join(window).encode()).hexdigest(), i + 1)
+        return found
+
+    per_file = {f.path: blocks(f.content) for f in files}
+    seen = set()
+    for path1, blocks1 in per_file.items():
+        for path2, blocks2 in per_file.items():
+            if path1 < path2:
+                seen.update(set(blocks1) & set(blocks2))
+    return len(seen)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    parser.add_argument("--min-lines", type=int, default=5)
+    parser.add_argument("--baseline", action="store_true", help="mesure aussi l'ancien algorithme par paires")
+    parser.add_argument("--baseline-max", type=int, default=1000, help="taille max pour l'ancien algorithme")
+    args = parser.parse_args()
+
+    engine = ConsistencyAnalysisEngine()
+    print(f"{'fichiers':>8} {'lignes':>8} {'issues':>7} {'temps (s)':>10} {'µs/ligne':>9} {'paires (s)':>11}")
+    for n_files in args.sizes:
+        files = generate_repo(n_files)
+        n_lines = sum(f.content.count("\n") + 1 for f in files)
+        start = time.perf_counter()
+        issues = engine.analyze_duplication(files, min_lines=args.min_lines)
+        elapsed = time.perf_counter() - start
+
+        baseline = "-"
+        if args.baseline and n_files <= args.baseline_max:
+            start = time.perf_counter()
+            _pairwise_baseline(files, args.min_lines)
+            baseline = f"{time.perf_counter() - start:.2f}"
+        print(
+            f"{n_files:>8} {n_lines:>8} {len(issues):>7} {elapsed:>10.3f} "
+            f"{elapsed / n_lines * 1e6:>9.2f} {baseline:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark de l'ordonnancement des passes du gate (``run_quality_gate``).
+
+Sandbox, revue et adéquation factices aux latences fixées (``--tests-ms``,
+``--review-ms``, ``--adequacy-ms``) : affiche, pour un gate vert puis rouge, la
+durée totale face à la somme des passes, selon que l'adéquation attend le reste
+du gate (défaut) ou démarre avec les tests (``concurrent_adequacy``), et la
+chronologie de chaque passe (``QualityReport.pass_timings``).
+
+    PYTHONPATH=. python tests/stress/run_gate_scheduler_bench.py --tests-ms 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from collegue.executor import AdequacyOutcome, FakeReviewer, IssueSpec, run_quality_gate
+from collegue.sandbox import SandboxResult
+
+DIFF = "diff --git a/app.py b/app.py\n+print('x')\n"
+ISSUE = IssueSpec(number=1, title="bench")
+
+
+class Sandbox:
+    def __init__(self, seconds: float, ok: bool):
+        self.seconds, self.ok = seconds, ok
+
+    async def run_tests_async(self, workspace, command):
+        await asyncio.sleep(self.seconds)
+        return SandboxResult(exit_code=0 if self.ok else 1, stdout="", stderr="")
+
+
+class Reviewer(FakeReviewer):
+    def __init__(self, seconds: float):
+        super().__init__()
+        self.seconds = seconds
+
+    async def review(self, diff, ctx, *, issue=None):
+        await asyncio.sleep(self.seconds)
+        return await super().review(diff, ctx, issue=issue)
+
+
+class Checker:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    async def check(self, diff, issue, ctx):
+        await asyncio.sleep(self.seconds)
+        return AdequacyOutcome(implemented=True)
+
+
+async def gate(args, *, ok: bool, concurrent: bool):
+    start = time.perf_counter()
+    report = await run_quality_gate(
+        "/ws",
+        DIFF,
+        ctx=None,
+        sandbox=Sandbox(args.tests_ms / 1000, ok),
+        reviewer=Reviewer(args.review_ms / 1000),
+        issue=ISSUE,
+        adequacy_checker=Checker(args.adequacy_ms / 1000),
+        concurrent_adequacy=concurrent,
+        cancel_on_red=args.cancel_on_red,
+        install_deps=False,
+    )
+    return time.perf_counter() - start, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests-ms", type=float, default=3000.0)
+    parser.add_argument("--review-ms", type=float, default=1500.0)
+    parser.add_argument("--adequacy-ms", type=float, default=1200.0)
+    parser.add_argument("--cancel-on-red", default="adequacy", choices=("none", "adequacy", "all"))
+    args = parser.parse_args()
+
+    print(f"{'gate':>6} {'adéquation':>11} {'total (s)':>10} {'Σ passes (s)':>13}  passes (début+durée, s)")
+    for ok in (True, False):
+        for concurrent in (False, True):
+            elapsed, report = asyncio.run(gate(args, ok=ok, concurrent=concurrent))
+            summed = sum(timing.seconds for timing in report.pass_timings)
+            detail = ", ".join(
+                f"{t.name} {t.started:.1f}+{t.seconds:.1f}" + (" annulée" if t.status == "cancelled" else "")
+                for t in report.pass_timings
+            )
+            label = "pendant" if concurrent else "après"
+            print(f"{'vert' if ok else 'rouge':>6} {label:>11} {elapsed:>10.2f} {summed:>13.2f}  {detail}")
+
+
+if __name__ == "__main__":
+    main()
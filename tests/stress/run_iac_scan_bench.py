@@ -0,0 +1,76 @@
+"""Benchmark du scan par lots de ``iac_guardrails_scan``.
+
+Génère quelques centaines de fichiers Terraform, Kubernetes et Dockerfile
+(à partir des fixtures de ``real_cases``), puis mesure le pipeline par fichier
+(:class:`~collegue.tools.iac_guardrails_scan.engine.IacFileScanner` : scanner
+dédié + policies personnalisées compilées) en séquentiel et sur un pool de
+process. Le temps doit décroître avec le nombre de process jusqu'au nombre de
+cœurs.
+
+    PYTHONPATH=. python tests/stress/run_iac_scan_bench.py --files 600 --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from collegue.core.shared import load_rules
+from collegue.tools.iac_guardrails_scan import CustomPolicy, IacGuardrailsScanTool
+from collegue.tools.iac_guardrails_scan.engine import IacAnalysisEngine, IacFileScanner
+from collegue.tools.iac_guardrails_scan.ruleset import compile_custom_policies
+
+FIXTURES = Path(__file__).parent / "real_cases" / "fixtures"
+
+
+def generate_files(n_files: int, repeat: int) -> List[Tuple[str, str]]:
+    terraform = (FIXTURES / "terraform" / "bad.tf").read_text() + (FIXTURES / "terraform" / "good.tf").read_text()
+    manifest = (FIXTURES / "k8s" / "privileged.yaml").read_text()
+    dockerfile = "FROM ubuntu:latest\nRUN apt-get install -y curl\nADD . /app\nENV API_KEY=abc123\n"
+    files = []
+    for idx in range(n_files):
+        kind = idx % 3
+        if kind == 0:
+            files.append((f"infra/module_{idx}/main.tf", terraform * repeat))
+        elif kind == 1:
+            files.append((f"k8s/app_{idx}.yaml", "\n---\n".join([manifest] * repeat)))
+        else:
+            files.append((f"images/svc_{idx}/Dockerfile", dockerfile * repeat))
+    return files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=20, help="taille de chaque fichier (copies de la fixture)")
+    parser.add_argument("--profile", default="strict")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    engine = IacAnalysisEngine(load_rules("k8s.yaml"), load_rules("terraform.yaml"), load_rules("dockerfile.yaml"))
+    policies = [
+        CustomPolicy(id="ORG-001", content=r"0\.0\.0\.0/0", language="regex", severity="high"),
+        CustomPolicy(id="ORG-002", content="pattern: 'privileged:\\s*true'\ntitle: Privileged", severity="high"),
+    ]
+    custom_rules = compile_custom_policies(policies, IacGuardrailsScanTool._regex_looks_dangerous, max_matches=5_000)
+    scanner = IacFileScanner(engine, custom_rules=custom_rules)
+    files = generate_files(args.files, args.repeat)
+    total_lines = sum(content.count("\n") + 1 for _, content in files)
+
+    print(f"{len(files)} fichiers, {total_lines} lignes, profil {args.profile}, {os.cpu_count()} cœur(s)")
+    print(f"{'process':>8} {'temps (s)':>10} {'findings':>9} {'accélération':>13}")
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = scanner.scan_files(files, args.profile, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        findings = sum(len(found) for found, _ in results)
+        print(f"{workers:>8} {elapsed:>10.3f} {findings:>9} {baseline / elapsed:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
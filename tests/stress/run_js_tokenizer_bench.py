@@ -0,0 +1,76 @@
+"""Benchmark du tokenizer de ``JSParser`` (``collegue.parsing.js_tokenizer``).
+
+Construit des sources JS/TS de plusieurs Mo en recopiant les fixtures
+(``tests/typescript_test.ts``, ``real_cases/fixtures/javascript/app.js``) et mesure
+le tokenizer à regex maîtresse face à l'ancien tokenizer caractère par caractère
+(référence figée de ``tests/test_js_tokenizer.py``), flux de tokens vérifié égal,
+ainsi que ``find_imports`` / ``find_declarations`` derrière. Le backend
+tree-sitter est mesuré s'il est installé.
+
+    PYTHONPATH=. python tests/stress/run_js_tokenizer_bench.py --megabytes 1 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import time
+from pathlib import Path
+
+from collegue.parsing import JSParser
+from collegue.parsing.js_tokenizer import tokenize, tree_sitter_available
+
+TESTS = Path(__file__).parent.parent
+SOURCES = {
+    "ts": TESTS / "typescript_test.ts",
+    "js": TESTS / "stress" / "real_cases" / "fixtures" / "javascript" / "app.js",
+}
+
+
+def load_reference():
+    spec = importlib.util.spec_from_file_location("test_js_tokenizer", TESTS / "test_js_tokenizer.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.reference_tokenize
+
+
+def build_source(kind: str, megabytes: float) -> str:
+    chunk = SOURCES[kind].read_text(encoding="utf-8") + "\n"
+    return chunk * max(1, int(megabytes * 1024 * 1024 / len(chunk)))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=float, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+    reference_tokenize = load_reference()
+    with_tree_sitter = tree_sitter_available()
+
+    header = f"{'source':>6} {'Mo':>5} {'tokens':>9} {'référence (s)':>14} {'regex (s)':>10} {'accélération':>13}"
+    print(header + (f" {'tree-sitter (s)':>16}" if with_tree_sitter else "") + f" {'imports+décl. (s)':>18}")
+    for megabytes in args.megabytes:
+        for kind in SOURCES:
+            source = build_source(kind, megabytes)
+            old, expected = timed(reference_tokenize, source)
+            new, tokens = timed(tokenize, source, JSParser.RESERVED_KEYWORDS)
+            assert tokens == expected, "flux de tokens différent de la référence"
+            size = len(source) / 1024 / 1024
+            row = f"{kind:>6} {size:>5.1f} {len(tokens):>9} {old:>14.3f} {new:>10.3f} {old / new:>12.1f}x"
+            if with_tree_sitter:
+                elapsed, _ = timed(JSParser, source, f"bench.{kind}", "tree_sitter")
+                row += f" {elapsed:>16.3f}"
+            js_parser = JSParser(source, f"bench.{kind}", backend="regex")
+            start = time.perf_counter()
+            js_parser.find_imports()
+            js_parser.find_declarations()
+            print(row + f" {time.perf_counter() - start:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark du pool de conteneurs chauds (``collegue.sandbox.pool``).
+
+Enchaîne des passes de gate sur un même workspace, en ``docker run`` éphémère
+puis via :class:`ContainerPool`, et affiche par passe la durée totale et la
+latence de démarrage (``startup_seconds`` : obtention du conteneur). Sans
+``--docker``, un ``docker`` factice simule le coût de création d'un conteneur
+(``--create-ms``) et celui d'un ``docker exec`` (``--exec-ms``) ; avec
+``--docker docker --image python:3.12-slim``, les passes tournent pour de vrai.
+
+    PYTHONPATH=. python tests/stress/run_sandbox_pool_bench.py --passes 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from collegue.sandbox import ContainerPool, DockerSandbox
+
+
+def fake_docker(directory: str, create_ms: float, exec_ms: float) -> str:
+    """``docker`` factice : ``run`` (``-d`` compris) coûte ``create_ms``, ``exec`` coûte ``exec_ms``."""
+    path = os.path.join(directory, "docker")
+    with open(path, "w") as f:
+        f.write(
+            "#!/bin/sh\n"
+            "verb=$1; shift\n"
+            "for last; do :; done\n"
+            "case $verb in\n"
+            f'run) sleep {create_ms / 1000}; [ "$1" = -d ] && exit 0; exec sh -c "$last";;\n'
+            f'exec) sleep {exec_ms / 1000}; case "$last" in ": collegue-pool-reset"*) exit 0;; esac; '
+            'exec sh -c "$last";;\n'
+            "esac\n"
+        )
+    os.chmod(path, 0o755)
+    return path
+
+
+async def run_passes(sandbox: DockerSandbox, workspace: str, command: str, passes: int):
+    rows = []
+    for _ in range(passes):
+        start = time.perf_counter()
+        result = await sandbox.run_tests_async(workspace, command)
+        rows.append((time.perf_counter() - start, result.startup_seconds, result.ok))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--passes", type=int, default=6)
+    parser.add_argument("--create-ms", type=float, default=800.0, help="création d'un conteneur (docker factice)")
+    parser.add_argument("--exec-ms", type=float, default=40.0, help="coût d'un docker exec (docker factice)")
+    parser.add_argument("--command", default="true", help="commande de chaque passe")
+    parser.add_argument("--docker", default=None, help="vrai binaire docker (sinon factice)")
+    parser.add_argument("--image", default="collegue-sandbox:latest")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docker_bin = args.docker or fake_docker(tmp, args.create_ms, args.exec_ms)
+        workspace = os.path.join(tmp, "ws")
+        common = dict(image=args.image, docker_bin=docker_bin, allow_root=args.docker is None)
+        pool = ContainerPool()
+        modes = [
+            ("docker run", DockerSandbox(**common)),
+            ("pool", DockerSandbox(**common, pool=pool)),
+        ]
+        print(f"{'mode':>10} {'passe':>6} {'durée (s)':>10} {'démarrage (s)':>14} {'ok':>4}")
+        try:
+            for mode, sandbox in modes:
+                rows = asyncio.run(run_passes(sandbox, workspace, args.command, args.passes))
+                for index, (elapsed, startup, ok) in enumerate(rows, 1):
+                    shown = "-" if startup is None else f"{startup:.3f}"
+                    print(f"{mode:>10} {index:>6} {elapsed:>10.3f} {shown:>14} {'oui' if ok else 'non':>4}")
+                total = sum(row[0] for row in rows)
+                print(f"{mode:>10} {'total':>6} {total:>10.3f}")
+        finally:
+            pool.close()
+        print(f"pool : {pool.stats()}")
+
+
+if __name__ == "__main__":
+    main()
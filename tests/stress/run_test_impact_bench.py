@@ -0,0 +1,96 @@
+"""Benchmark de la passe rapide des tests impactés (``collegue.executor.test_impact``).
+
+Génère un projet git de ``--modules`` modules, chacun couvert par un fichier de
+test qui coûte ``--test-ms``, casse l'un d'eux puis mesure le temps de rejet du
+gate sans et avec :class:`TestImpactIndex` (``--attempts`` tentatives, comme les
+retries du pilote). Les tests tournent en local (``sh -c``) avec le pytest de
+l'interpréteur courant : la différence mesurée est celle de la suite évitée.
+
+    PYTHONPATH=. python tests/stress/run_test_impact_bench.py --modules 20 --test-ms 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from collegue.executor import FakeReviewer, TestImpactIndex, run_quality_gate
+from collegue.executor.command import LocalCommandRunner
+
+
+class LocalSandbox:
+    def run_tests(self, workspace, command="pytest -q"):
+        return LocalCommandRunner(timeout=600.0).run_command(command, workspace)
+
+
+def build_project(directory: str, modules: int, test_ms: float) -> str:
+    workspace = os.path.join(directory, "ws")
+    os.makedirs(os.path.join(workspace, "app"))
+    os.makedirs(os.path.join(workspace, "tests"))
+    open(os.path.join(workspace, "app", "__init__.py"), "w").close()
+    for index in range(modules):
+        with open(os.path.join(workspace, "app", f"mod{index}.py"), "w") as f:
+            f.write(f"def value():\n    return {index}\n")
+        with open(os.path.join(workspace, "tests", f"test_mod{index}.py"), "w") as f:
+            f.write(
+                f"import time\n\nfrom app.mod{index} import value\n\n\n"
+                f"def test_value():\n    time.sleep({test_ms / 1000})\n    assert value() == {index}\n"
+            )
+    for argv in (["init", "-q"], ["add", "-A"], ["-c", "user.name=b", "-c", "user.email=b@b", "commit", "-qm", "b"]):
+        subprocess.run(["git", *argv], cwd=workspace, check=True, capture_output=True)
+    # Tentative cassée : le dernier module renvoie une mauvaise valeur.
+    with open(os.path.join(workspace, "app", f"mod{modules - 1}.py"), "w") as f:
+        f.write("def value():\n    return -1\n")
+    return workspace
+
+
+async def attempts(workspace: str, diff: str, count: int, index=None):
+    rows = []
+    for _ in range(count):
+        start = time.perf_counter()
+        report = await run_quality_gate(
+            workspace,
+            diff,
+            ctx=None,
+            sandbox=LocalSandbox(),
+            reviewer=FakeReviewer(),
+            test_command=f"{sys.executable} -m pytest -q",
+            install_deps=False,
+            frontend_gate=False,
+            e2e_gate=False,
+            test_impact=index,
+        )
+        rows.append((time.perf_counter() - start, report.passed, len(report.impacted_tests)))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", type=int, default=20)
+    parser.add_argument("--test-ms", type=float, default=200.0)
+    parser.add_argument("--attempts", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = build_project(tmp, args.modules, args.test_ms)
+        broken = f"app/mod{args.modules - 1}.py"
+        diff = f"diff --git a/{broken} b/{broken}\n+    return -1\n"
+        index = TestImpactIndex(os.path.join(tmp, "impact"))
+        rows = [
+            ("suite complète", asyncio.run(attempts(workspace, diff, args.attempts))),
+            ("tests impactés", asyncio.run(attempts(workspace, diff, args.attempts, index))),
+        ]
+        print(f"{'mode':>15} {'tentative':>10} {'durée (s)':>10} {'passé':>6} {'sélectionnés':>13}")
+        for mode, durations in rows:
+            for number, (elapsed, passed, selected) in enumerate(durations, 1):
+                print(f"{mode:>15} {number:>10} {elapsed:>10.2f} {'oui' if passed else 'non':>6} {selected:>13}")
+        print(f"graphes construits : {index.builds}, resservis : {index.hits}")
+
+
+if __name__ == "__main__":
+    main()
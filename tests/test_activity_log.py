@@ -0,0 +1,141 @@
+"""
+Tests for collegue.monitoring.activity_log — segments, sidecar index, tail reads.
+"""
+
+import json
+import threading
+
+import pytest
+
+from collegue.monitoring.activity_log import ActivityLog
+
+
+@pytest.fixture
+def log(tmp_path):
+    return ActivityLog(base_dir=tmp_path)
+
+
+def _result(log, expert, i):
+    log.log_expert_result(expert=expert, status="ok", duration_s=0.1, summary=f"run {i}")
+
+
+class TestWriteAndRead:
+    def test_round_trip(self, log):
+        log.log_llm_call(expert="code_review", prompt_preview="p", response_preview="r", duration_s=1.234)
+        events = log.read_events(event_type="llm_call")
+        assert len(events) == 1
+        assert events[0]["expert"] == "code_review"
+        assert events[0]["duration_s"] == 1.23
+
+    def test_appends_are_batched(self, log, tmp_path):
+        log.FLUSH_INTERVAL = 60.0
+        _result(log, "a", 0)
+        # L'événement attend dans la file du writer : aucun segment encore écrit.
+        assert not list(tmp_path.glob("activity-*.jsonl"))
+        log.flush()
+        assert len(list(tmp_path.glob("activity-*.jsonl"))) == 1
+
+    def test_filters_by_type_and_expert(self, log):
+        for i in range(10):
+            _result(log, "alpha" if i % 2 else "beta", i)
+            log.log_llm_call(expert="alpha", prompt_preview="p", response_preview="r", duration_s=0.1)
+        results = log.read_events(event_type="expert_result", expert="alpha")
+        assert [ev["summary"] for ev in results] == ["run 1", "run 3", "run 5", "run 7", "run 9"]
+        assert len(log.read_events(expert="alpha")) == 15
+
+    def test_tail_limit_keeps_latest_in_order(self, log):
+        log.SEGMENT_MAX_EVENTS = 7
+        for i in range(30):
+            _result(log, "x", i)
+        events = log.read_events(limit=10)
+        assert [ev["summary"] for ev in events] == [f"run {i}" for i in range(20, 30)]
+
+    def test_since_skips_old_segments(self, log):
+        log.SEGMENT_MAX_EVENTS = 5
+        for i in range(12):
+            log._append({"type": "expert_result", "expert": "x", "summary": f"run {i}", "ts": float(i)})
+        events = log.read_events(since=8.0)
+        assert [ev["summary"] for ev in events] == ["run 8", "run 9", "run 10", "run 11"]
+
+    def test_other_instance_sees_flushed_events(self, log, tmp_path):
+        _result(log, "x", 1)
+        log.flush()
+        reader = ActivityLog(base_dir=tmp_path)
+        assert [ev["summary"] for ev in reader.read_events()] == ["run 1"]
+        _result(log, "x", 2)
+        log.flush()
+        assert [ev["summary"] for ev in reader.read_events()] == ["run 1", "run 2"]
+
+    def test_reads_during_writes_see_consistent_offsets(self, log):
+        stop = threading.Event()
+
+        def _writer():
+            i = 0
+            while not stop.is_set():
+                _result(log, "w", i)
+                log.flush()
+                i += 1
+
+        writer = threading.Thread(target=_writer)
+        writer.start()
+        try:
+            for _ in range(200):
+                events = log.read_events(event_type="expert_result", expert="w", limit=50)
+                assert all(ev["type"] == "expert_result" for ev in events)
+                assert [ev["ts"] for ev in events] == sorted(ev["ts"] for ev in events)
+        finally:
+            stop.set()
+            writer.join()
+
+
+class TestSegmentsAndRetention:
+    def test_rotation_writes_sidecar_index(self, log, tmp_path):
+        log.SEGMENT_MAX_EVENTS = 4
+        for i in range(10):
+            _result(log, "x", i)
+        log.flush()
+        segments = sorted(tmp_path.glob("activity-*.jsonl"))
+        assert len(segments) == 3
+        index = json.loads(segments[0].with_suffix(".idx.json").read_text())
+        assert index["count"] == 4
+        assert len(index["types"]["expert_result"]) == 4
+        assert index["experts"]["x"] == index["offsets"]
+        assert index["ts_min"] <= index["ts_max"]
+
+    def test_retention_deletes_whole_segments(self, log, tmp_path):
+        log.SEGMENT_MAX_EVENTS = 10
+        log.MAX_EVENTS = 25
+        for i in range(100):
+            _result(log, "x", i)
+            if i % 10 == 9:
+                log.flush()
+        log.prune()
+        events = log.read_events(limit=1000)
+        assert 25 <= len(events) < 40
+        assert events[-1]["summary"] == "run 99"
+        # Les segments restants sont intacts (jamais réécrits).
+        for segment in tmp_path.glob("activity-*.jsonl"):
+            assert len(segment.read_text().splitlines()) == 10
+
+    def test_missing_index_is_rebuilt(self, log, tmp_path):
+        for i in range(3):
+            _result(log, "x", i)
+        log.flush()
+        for idx in tmp_path.glob("*.idx.json"):
+            idx.unlink()
+        reader = ActivityLog(base_dir=tmp_path)
+        assert len(reader.read_events(event_type="expert_result")) == 3
+
+    def test_legacy_file_is_migrated(self, tmp_path):
+        legacy = tmp_path / "activity.jsonl"
+        legacy.write_text(json.dumps({"type": "delegation", "source": "a", "target": "b", "ts": 1.0}) + "\n")
+        log = ActivityLog(base_dir=tmp_path)
+        assert not legacy.exists()
+        assert log.read_events(event_type="delegation")[0]["target"] == "b"
+
+    def test_clear_removes_segments(self, log, tmp_path):
+        _result(log, "x", 0)
+        log.flush()
+        log.clear()
+        assert log.read_events() == []
+        assert not list(tmp_path.glob("activity-*"))
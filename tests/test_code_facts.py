@@ -0,0 +1,175 @@
+"""Tests de l'analyse AST partagée entre experts (collegue/core/code_facts.py)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from collegue.core.code_facts import (
+    CodeFactsCache,
+    capture_parse_stats,
+    extract_code_facts,
+    get_code_facts_cache,
+    reset_code_facts_cache,
+)
+from collegue.tools.code_review.engine import CodeReviewEngine
+from collegue.tools.performance_analysis.engine import PerformanceEngine
+from collegue.tools.refactoring.engine import RefactoringEngine
+from collegue.tools.test_generation.engine import TestGenerationEngine
+
+SAMPLE = '''"""Module de facturation."""
+import os.path
+from .models import Invoice as Inv
+
+
+class Billing:
+    """Calcule les totaux."""
+
+    def total(self, items: list, vat) -> float:
+        for item in items:
+            for tax in item.taxes:
+                if tax in vat and item.active or tax.forced:
+                    pass
+        try:
+            save()
+        except:
+            pass
+        except ValueError as e:
+            log(e)
+        return 0.0
+
+    async def _refresh(self):
+        def inner():
+            while True:
+                pass
+
+
+if os.path.exists("x"):
+    pass
+elif Inv:
+    pass
+else:
+    if True:
+        pass
+'''
+
+
+@pytest.fixture(autouse=True)
+def _reset_singleton():
+    reset_code_facts_cache()
+    yield
+    reset_code_facts_cache()
+
+
+class TestExtractCodeFacts:
+    def test_functions_and_classes(self):
+        facts = extract_code_facts(SAMPLE)
+        assert facts.valid and facts.module_docstring
+        total, refresh, inner = facts.functions
+        assert (total.name, total.line, total.params, total.is_method) == ("total", 9, ["items", "vat"], True)
+        assert total.annotated and not refresh.annotated
+        assert refresh.is_async and inner.scope_depth == 2 and not inner.is_method
+        assert facts.classes[0].methods == ["total", "_refresh"] and facts.classes[0].has_docstring
+
+    def test_loops_complexity_and_membership(self):
+        total, refresh, inner = extract_code_facts(SAMPLE).functions
+        assert total.max_loop_depth == 2
+        # for, for, if, and/or (+2), deux except → 1 + 7
+        assert total.complexity == 8
+        assert total.loop_membership_line == 12
+        # Les boucles d'une fonction interne comptent aussi pour la fonction englobante.
+        assert refresh.max_loop_depth == inner.max_loop_depth == 1
+
+    def test_error_handling_and_imports(self):
+        facts = extract_code_facts(SAMPLE)
+        bare, specific = facts.except_handlers
+        assert bare.is_broad and bare.silent_line == 17
+        assert not specific.is_broad and specific.bound and specific.silent_line is None
+        assert [(i.name, i.module) for i in facts.imports] == [("os", "os.path"), ("Inv", ".models")]
+
+    def test_nesting_follows_blocks_not_elif_chains(self):
+        facts = extract_code_facts(SAMPLE)
+        assert facts.statement_depths[13] == 5  # pass dans class > def > for > for > if
+        assert facts.statement_depths[30] == 0  # elif au niveau du if
+        assert facts.statement_depths[34] == 2  # pass dans else > if
+        assert facts.max_nesting == 5
+
+    def test_syntax_error(self):
+        facts = extract_code_facts("def broken(:\n    pass\n")
+        assert not facts.valid
+        assert facts.syntax_error_line == 1 and facts.functions == []
+
+
+class TestCodeFactsCache:
+    def test_same_content_parsed_once(self):
+        cache = CodeFactsCache(max_entries=8)
+        with capture_parse_stats() as stats:
+            first = cache.get(SAMPLE)
+            assert cache.get(SAMPLE) is first
+        assert (stats.parses, stats.reuses) == (1, 1)
+        assert stats.saved_ms == pytest.approx(first.parse_ms)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_eviction_and_disabled_cache(self):
+        cache = CodeFactsCache(max_entries=1)
+        cache.get("a = 1")
+        cache.get("b = 2")
+        assert len(cache) == 1
+        with capture_parse_stats() as stats:
+            cache.get("a = 1")
+        assert stats.parses == 1
+
+        disabled = CodeFactsCache(max_entries=0)
+        with capture_parse_stats() as stats:
+            disabled.get(SAMPLE)
+            disabled.get(SAMPLE)
+        assert (stats.parses, len(disabled)) == (2, 0)
+
+    def test_singleton_size_from_settings(self):
+        assert get_code_facts_cache(SimpleNamespace(CODE_FACTS_CACHE_SIZE=3)).max_entries == 3
+        assert get_code_facts_cache() is get_code_facts_cache()
+
+    def test_engines_share_one_parse(self):
+        with capture_parse_stats() as stats:
+            review = CodeReviewEngine()
+            review.analyze_naming(SAMPLE, "python")
+            review.analyze_complexity(SAMPLE, "python")
+            review.analyze_error_handling(SAMPLE, "python")
+            review.identify_strengths(SAMPLE, "python")
+            PerformanceEngine().analyze_algorithmic_complexity(SAMPLE, "python")
+            RefactoringEngine().validate_code_syntax(SAMPLE, "python")
+            RefactoringEngine().analyze_code_metrics(SAMPLE, "python")
+            TestGenerationEngine().extract_code_elements(SAMPLE, "python")
+        assert (stats.parses, stats.reuses) == (1, 7)
+
+
+class TestEnginesOnCodeFacts:
+    def test_review_error_handling_from_ast(self):
+        findings = CodeReviewEngine().analyze_error_handling(SAMPLE, "python")
+        assert [(f.title, f.line) for f in findings] == [("Except trop large", 16), ("Exception silencieuse", 17)]
+
+    def test_review_diff_falls_back_to_line_heuristics(self):
+        diff = "@@ -1,4 +1,4 @@\ntry:\n    x()\nexcept:\n    pass\n"
+        findings = CodeReviewEngine().analyze_error_handling(diff, "python")
+        assert [(f.title, f.line) for f in findings] == [("Except trop large", 4), ("Exception silencieuse", 5)]
+
+    def test_performance_reports_nested_loops_and_membership(self):
+        issues = PerformanceEngine().analyze_algorithmic_complexity(SAMPLE, "python")
+        assert [(i.line, i.estimated_complexity) for i in issues] == [(9, "O(n²)"), (12, "O(n²) → O(n)")]
+
+    def test_test_generation_lists_module_level_first(self):
+        elements = TestGenerationEngine().extract_code_elements(
+            "class A:\n    def run(self, x):\n        pass\n\ndef helper(y):\n    return y\n", "python"
+        )
+        assert [(e["type"], e["name"]) for e in elements] == [
+            ("class", "A"),
+            ("function", "helper"),
+            ("function", "run"),
+        ]
+        assert elements[2]["params"] == ["x"] and elements[2]["complexity"] == "low"
+
+    def test_refactoring_metrics_and_syntax(self):
+        engine = RefactoringEngine()
+        metrics = engine.analyze_code_metrics(SAMPLE, "python")
+        assert (metrics["function_count"], metrics["class_count"]) == (3, 1)
+        valid, error = engine.validate_code_syntax("def f(:\n", "python")
+        assert not valid and error.startswith("Ligne 1: ")
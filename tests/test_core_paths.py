@@ -8,7 +8,7 @@ persistance et le plafond dur repartirait de zéro, silencieusement.
 
 from pathlib import Path
 
-from collegue.core.paths import collegue_home, memory_dir, monitoring_dir
+from collegue.core.paths import collegue_home, memory_dir, monitoring_dir, prompts_dir
 
 
 def test_collegue_home_default_is_absolute(monkeypatch, tmp_path):
@@ -36,6 +36,20 @@ def test_subdirs_under_home(monkeypatch, tmp_path):
     assert memory_dir() == tmp_path / "memory"
 
 
+def test_prompt_storage_under_home_only_when_configured(monkeypatch, tmp_path):
+    from collegue.prompts.engine.prompt_engine import PromptEngine
+    from collegue.prompts.engine.versioning import PromptVersionManager
+
+    monkeypatch.delenv("COLLEGUE_HOME", raising=False)
+    assert prompts_dir() is None
+    monkeypatch.setenv("COLLEGUE_HOME", str(tmp_path))
+    assert prompts_dir() == tmp_path / "prompts"
+    engine = PromptEngine()
+    assert engine.storage_path == str(tmp_path / "prompts" / "templates")
+    assert engine.library.categories  # catégories livrées reprises du package
+    assert PromptVersionManager().versions_file == str(tmp_path / "prompts" / "versions" / "versions.json")
+
+
 def test_captured_path_survives_cwd_change(monkeypatch, tmp_path):
     """#406 (critère d'acceptation) : un consommateur qui capture le chemin une
     fois (façon ``MetricsCollector._PERSIST_DIR`` à l'import) obtient un chemin
@@ -3,7 +3,7 @@ Tests unitaires pour l'outil Dependency Guard refactorisé.
 """
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -11,6 +11,15 @@ from collegue.tools.dependency_guard import DependencyGuardRequest, DependencyGu
 from collegue.tools.dependency_guard.engine import DependencyAnalysisEngine
 
 
+def existence(result):
+    """Effet de ``check_packages_existence`` : ``result`` pour chaque package demandé."""
+
+    async def check(names, language):
+        return {name: dict(result) for name in names}
+
+    return check
+
+
 class TestDependencyAnalysisEngine:
     """Tests pour le moteur d'analyse."""
 
@@ -99,8 +108,8 @@ class TestDependencyGuardTool:
 
     def test_scan_no_issues(self, tool):
         """Test le scan sans problèmes (mock)."""
-        with patch.object(tool._engine, "check_package_existence") as mock_check:
-            mock_check.return_value = {"exists": True, "latest_version": "1.0.0"}
+        with patch.object(tool._engine, "check_packages_existence", new_callable=AsyncMock) as mock_check:
+            mock_check.side_effect = existence({"exists": True, "latest_version": "1.0.0"})
 
             request = DependencyGuardRequest(
                 content="django>=4.0\nrequests>=2.28", language="python", check_vulnerabilities=False
@@ -112,8 +121,8 @@ class TestDependencyGuardTool:
 
     def test_scan_malicious_package(self, tool):
         """Test la détection de package malveillant."""
-        with patch.object(tool._engine, "check_package_existence") as mock_check:
-            mock_check.return_value = {"exists": True}
+        with patch.object(tool._engine, "check_packages_existence", new_callable=AsyncMock) as mock_check:
+            mock_check.side_effect = existence({"exists": True})
 
             request = DependencyGuardRequest(
                 content="request>=2.28",  # Package malveillant
@@ -127,8 +136,8 @@ class TestDependencyGuardTool:
 
     def test_scan_deprecated_package(self, tool):
         """Test la détection de package déprécié."""
-        with patch.object(tool._engine, "check_package_existence") as mock_check:
-            mock_check.return_value = {"exists": True}
+        with patch.object(tool._engine, "check_packages_existence", new_callable=AsyncMock) as mock_check:
+            mock_check.side_effect = existence({"exists": True})
 
             request = DependencyGuardRequest(
                 content="pycrypto>=2.6",  # Déprécié
@@ -141,8 +150,8 @@ class TestDependencyGuardTool:
 
     def test_scan_blocklist(self, tool):
         """Test la blocklist."""
-        with patch.object(tool._engine, "check_package_existence") as mock_check:
-            mock_check.return_value = {"exists": True}
+        with patch.object(tool._engine, "check_packages_existence", new_callable=AsyncMock) as mock_check:
+            mock_check.side_effect = existence({"exists": True})
 
             request = DependencyGuardRequest(
                 content="suspicious-package>=1.0",
@@ -171,8 +180,8 @@ class TestDependencyGuardTool:
 
     def test_scan_nonexistent_package(self, tool):
         """Test la détection de package inexistant."""
-        with patch.object(tool._engine, "check_package_existence") as mock_check:
-            mock_check.return_value = {"exists": False}
+        with patch.object(tool._engine, "check_packages_existence", new_callable=AsyncMock) as mock_check:
+            mock_check.side_effect = existence({"exists": False})
 
             request = DependencyGuardRequest(
                 content="fake-package-12345>=1.0", language="python", check_vulnerabilities=False
@@ -218,3 +227,132 @@ class TestDependencyGuardRequest:
         """Test la validation d'un langage invalide."""
         with pytest.raises(ValueError):
             DependencyGuardRequest(content="{}", language="ruby")
+
+
+class FakeRegistry:
+    """Registre et OSV simulés pour ``httpx.MockTransport`` : compte les requêtes reçues."""
+
+    def __init__(self, known=("django", "requests"), etag='"v1"'):
+        self.known = set(known)
+        self.etag = etag
+        self.requests = []
+
+    def __call__(self, request):
+        import httpx
+
+        self.requests.append(request)
+        path = request.url.path
+        if path == "/v1/querybatch":
+            queries = json.loads(request.content)["queries"]
+            results = [{"vulns": [{"id": "GHSA-1"}]} if q["package"]["name"] == "django" else {} for q in queries]
+            return httpx.Response(200, json={"results": results})
+        if path.startswith("/v1/vulns/"):
+            return httpx.Response(
+                200,
+                json={
+                    "id": "GHSA-1",
+                    "summary": "Injection SQL",
+                    "aliases": ["CVE-2024-0001"],
+                    "database_specific": {"severity": "HIGH", "cwe_ids": ["CWE-89"]},
+                    "affected": [{"ranges": [{"events": [{"introduced": "0"}, {"fixed": "4.2.1"}]}]}],
+                },
+            )
+        name = path.split("/")[2]
+        if name not in self.known:
+            return httpx.Response(404)
+        if request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(200, json={"info": {"version": "1.0.0"}}, headers={"ETag": self.etag})
+
+
+class TestRegistryClient:
+    """Tests du client HTTP mutualisé et du cache disque des registres."""
+
+    @pytest.fixture
+    def fake(self):
+        return FakeRegistry()
+
+    def make_client(self, fake, cache=None):
+        import httpx
+
+        from collegue.tools.dependency_guard.registry import RegistryClient
+
+        return RegistryClient(
+            cache,
+            max_concurrency=4,
+            transport=httpx.MockTransport(fake),
+            registry_urls={"pypi": "https://registry.test/pypi/{package}/json"},
+            osv_batch_url="https://osv.test/v1/querybatch",
+            osv_vuln_url="https://osv.test/v1/vulns/",
+        )
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        from collegue.tools.dependency_guard.cache import RegistryMetadataCache
+
+        cache = RegistryMetadataCache(str(tmp_path))
+        yield cache
+        cache.close()
+
+    async def test_existence_batch(self, fake):
+        client = self.make_client(fake)
+        results = await client.check_existence(["django", "fake-pkg", "django"], "pypi")
+        assert results == {"django": {"exists": True, "latest_version": "1.0.0"}, "fake-pkg": {"exists": False}}
+        assert len(fake.requests) == 2
+
+    async def test_existence_cache_and_revalidation(self, fake, cache):
+        client = self.make_client(fake, cache)
+        first = await client.check_existence(["django", "fake-pkg"], "pypi")
+        assert await client.check_existence(["django", "fake-pkg"], "pypi") == first
+        assert len(fake.requests) == 2
+
+        cache.ttl = 0
+        assert await client.check_existence(["django"], "pypi") == {"django": first["django"]}
+        assert fake.requests[-1].headers["if-none-match"] == '"v1"'
+        cache.ttl = 3600
+        await client.check_existence(["django"], "pypi")
+        assert len(fake.requests) == 3
+
+    async def test_network_errors_are_not_cached(self, cache):
+        import httpx
+
+        def unreachable(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        client = self.make_client(unreachable, cache)
+        result = await client.check_existence(["django"], "pypi")
+        assert result["django"]["exists"] is None
+        assert cache.lookup_metadata("pypi", ["django"]) == {}
+
+    async def test_osv_cache(self, fake, cache):
+        from collegue.tools.dependency_guard.engine import DependencyAnalysisEngine
+
+        engine = DependencyAnalysisEngine(registry=self.make_client(fake, cache))
+        deps = [{"name": "django", "version": "==4.0"}, {"name": "requests", "version": "==2.28"}]
+        vulns = await engine.check_osv_vulnerabilities_async(deps, "PyPI")
+        assert vulns == [
+            {
+                "package": "django",
+                "version": "4.0",
+                "vulnerability_id": "CVE-2024-0001",
+                "severity": "high",
+                "description": "Injection SQL",
+                "fix_versions": ["4.2.1"],
+            }
+        ]
+        assert len(fake.requests) == 2
+        assert await engine.check_osv_vulnerabilities_async(deps, "PyPI") == vulns
+        assert len(fake.requests) == 2
+
+    def test_tool_sync_entry_point(self, fake):
+        from collegue.tools.dependency_guard.engine import DependencyAnalysisEngine
+
+        tool = DependencyGuardTool(app_state={})
+        tool._engine = DependencyAnalysisEngine(registry=self.make_client(fake))
+        request = DependencyGuardRequest(content="django==4.0\nfake-pkg==1.0", language="python")
+        response = tool._execute_core_logic(request)
+
+        assert {(i.package, i.issue_type) for i in response.issues} == {
+            ("django", "vulnerable"),
+            ("fake-pkg", "not_found"),
+        }
@@ -0,0 +1,227 @@
+"""Tests des environnements de dépendances pré-construits du gate (``collegue.executor.deps_env``).
+
+Sans Docker : le sandbox factice « construit » un environnement en écrivant un
+fichier dans le dossier hôte monté en écriture, et journalise chaque passe avec
+ses montages.
+"""
+
+import asyncio
+import copy
+import os
+
+import pytest
+
+import collegue.executor.deps_env as deps_env
+from collegue.executor import (
+    DepsEnvCache,
+    FakeReviewer,
+    deps_env_specs,
+    frontend_gate_command,
+    get_deps_env_cache,
+    installability_command,
+    reset_deps_env_cache,
+    run_quality_gate,
+)
+from collegue.sandbox import SandboxResult
+
+DIFF = "diff --git a/x.py b/x.py\n+print('x')\n"
+
+
+class _EnvSandbox:
+    def __init__(self, *, image_id="sha256:img", build_ok=True):
+        self.image_id = image_id
+        self.build_ok = build_ok
+        self.deps_mounts = ()
+        self.pool = None
+        self.calls = []
+
+    def with_options(self, **changes):
+        clone = copy.copy(self)
+        for key, value in changes.items():
+            setattr(clone, key, value)
+        return clone
+
+    async def image_id_async(self):
+        return self.image_id
+
+    def run_tests(self, workspace, command="pytest -q"):
+        self.calls.append((command, self.deps_mounts))
+        for host_dir, _entry, writable in self.deps_mounts:
+            if writable:
+                if not self.build_ok:
+                    return SandboxResult(exit_code=1, stdout="", stderr="ERROR: No matching distribution")
+                with open(os.path.join(host_dir, "installed.txt"), "w") as handle:
+                    handle.write(command)
+        return SandboxResult(exit_code=0, stdout="2 passed", stderr="")
+
+
+def _spec(workspace, image_id="sha256:img"):
+    (specs,) = deps_env_specs(str(workspace), image_id)
+    return specs
+
+
+@pytest.fixture
+def python_ws(tmp_path):
+    ws = tmp_path / "ws"
+    ws.mkdir()
+    (ws / "requirements.txt").write_text("fastapi==0.110.0\n", encoding="utf-8")
+    return ws
+
+
+# --- clés et commandes -----------------------------------------------------------
+
+
+def test_specs_keyed_by_lockfile_content_and_image(python_ws):
+    first = _spec(python_ws)
+    assert first.kind == "user" and first.container_path == f"/deps_env/{first.entry}"
+    assert f"export PYTHONUSERBASE={first.container_path} && " in first.build_command
+    assert "pip install --user" in first.build_command
+    assert _spec(python_ws).key == first.key
+    assert _spec(python_ws, "sha256:other").key != first.key
+    (python_ws / "requirements.txt").write_text("fastapi==0.111.0\n", encoding="utf-8")
+    assert _spec(python_ws).key != first.key
+
+
+def test_user_env_key_covers_local_dependencies_and_project_layout(python_ws):
+    (python_ws / "lib").mkdir()
+    (python_ws / "lib" / "setup.py").write_text("VERSION = 1\n", encoding="utf-8")
+    (python_ws / "requirements.txt").write_text("-r base.txt\n-e ./lib\n", encoding="utf-8")
+    (python_ws / "base.txt").write_text("fastapi==0.110.0\n", encoding="utf-8")
+    (python_ws / "pyproject.toml").write_text("[project]\nname = 'app'\n", encoding="utf-8")
+    (python_ws / "app").mkdir()
+    (python_ws / "app" / "__init__.py").write_text("", encoding="utf-8")
+    first = _spec(python_ws)
+    assert "pip install --user" in first.build_command and "-e ." in first.build_command
+
+    (python_ws / "app" / "__init__.py").write_text("VALUE = 2\n", encoding="utf-8")
+    assert _spec(python_ws).key == first.key  # source éditable : pas de reconstruction
+    (python_ws / "base.txt").write_text("fastapi==0.111.0\n", encoding="utf-8")
+    second = _spec(python_ws)
+    assert second.key != first.key
+    (python_ws / "lib" / "setup.py").write_text("VERSION = 2\n", encoding="utf-8")
+    third = _spec(python_ws)
+    assert third.key != second.key
+    (python_ws / "src" / "extra").mkdir(parents=True)
+    (python_ws / "src" / "extra" / "__init__.py").write_text("", encoding="utf-8")
+    assert _spec(python_ws).key != third.key
+
+
+def test_specs_cover_installability_venv_and_locked_fronts(python_ws):
+    for front in ("front", "loose"):
+        (python_ws / front).mkdir()
+        (python_ws / front / "package.json").write_text('{"scripts": {"build": "vite build"}}', encoding="utf-8")
+    (python_ws / "front" / "package-lock.json").write_text("{}", encoding="utf-8")
+    specs = deps_env_specs(str(python_ws), "sha256:img", check_installability=True)
+    assert [(spec.kind, spec.subdir) for spec in specs] == [("user", "."), ("venv", "."), ("node", "front")]
+    venv = specs[1]
+    assert venv.build_command.startswith(f"python -m venv --clear {venv.container_path}")
+    assert f"cp -a node_modules/. {specs[2].container_path}/" in specs[2].build_command
+
+
+def test_commands_use_prebuilt_paths(tmp_path):
+    (tmp_path / "requirements.txt").write_text("fastapi\n", encoding="utf-8")
+    (tmp_path / "package.json").write_text('{"scripts": {"build": "vite build"}}', encoding="utf-8")
+    collect = installability_command(str(tmp_path), venv="/deps_env/venv-x")
+    assert collect.startswith("COLUMNS=220 /deps_env/venv-x/bin/python -m pytest --collect-only")
+    assert "pip install" not in collect
+    front = frontend_gate_command(str(tmp_path), node_modules="/deps_env/node-x")
+    assert "rm -rf node_modules && cp -a /deps_env/node-x node_modules && npm run build" in front
+    assert "npm ci" not in front
+
+
+# --- cache ---------------------------------------------------------------------
+
+
+async def test_environment_built_once_then_served(tmp_path, python_ws):
+    cache = DepsEnvCache(str(tmp_path / "envs"))
+    sandbox = _EnvSandbox()
+    spec = _spec(python_ws)
+    first = await cache.ensure(sandbox, str(python_ws), spec)
+    second = await cache.ensure(sandbox, str(python_ws), spec)
+    assert first == second == tmp_path / "envs" / spec.entry
+    assert (first / "installed.txt").read_text() == spec.build_command
+    assert (cache.builds, cache.hits) == (1, 1)
+    ((_command, mounts),) = sandbox.calls
+    assert mounts[0][1:] == (spec.entry, True)
+    assert cache.entries() == [spec.entry]
+
+
+async def test_concurrent_gates_build_once(tmp_path, python_ws):
+    cache = DepsEnvCache(str(tmp_path / "envs"))
+    sandbox = _EnvSandbox()
+    spec = _spec(python_ws)
+    paths = await asyncio.gather(*(cache.ensure(sandbox, str(python_ws), spec) for _ in range(3)))
+    assert len(set(paths)) == 1 and paths[0] is not None
+    assert cache.builds == 1 and len(sandbox.calls) == 1
+
+
+async def test_failed_build_falls_back_and_is_not_retried(tmp_path, python_ws):
+    cache = DepsEnvCache(str(tmp_path / "envs"))
+    sandbox = _EnvSandbox(build_ok=False)
+    spec = _spec(python_ws)
+    assert await cache.ensure(sandbox, str(python_ws), spec) is None
+    assert await cache.ensure(sandbox, str(python_ws), spec) is None
+    assert len(sandbox.calls) == 1
+    assert os.listdir(tmp_path / "envs") == [f".{spec.entry}.lock"]
+
+
+async def test_lru_eviction(tmp_path, python_ws, monkeypatch):
+    monkeypatch.setattr(deps_env, "EVICTION_GRACE_SECONDS", 0)
+    cache = DepsEnvCache(str(tmp_path / "envs"), max_entries=2)
+    sandbox = _EnvSandbox()
+    entries = []
+    for index in range(3):
+        (python_ws / "requirements.txt").write_text(f"pkg=={index}\n", encoding="utf-8")
+        spec = _spec(python_ws)
+        await cache.ensure(sandbox, str(python_ws), spec)
+        entries.append(spec.entry)
+        # Horodatages d'usage distincts (résolution du système de fichiers).
+        os.utime(cache.root / f"{spec.entry}.json", (1000 + index, 1000 + index))
+    assert cache.entries() == entries[1:]
+    assert not (cache.root / entries[0]).exists()
+
+
+def test_get_deps_env_cache_opt_in(tmp_path):
+    class _Settings:
+        GATE_DEPS_ENV_CACHE = False
+        GATE_DEPS_ENV_DIR = str(tmp_path / "envs")
+
+    reset_deps_env_cache()
+    assert get_deps_env_cache(_Settings()) is None
+    _Settings.GATE_DEPS_ENV_CACHE = True
+    try:
+        cache = get_deps_env_cache(_Settings())
+        assert cache is get_deps_env_cache(_Settings())
+        assert cache.root == tmp_path / "envs"
+    finally:
+        reset_deps_env_cache()
+
+
+# --- intégration au gate ---------------------------------------------------------
+
+
+async def test_gate_mounts_prebuilt_user_site(tmp_path, python_ws):
+    cache = DepsEnvCache(str(tmp_path / "envs"))
+    spec = _spec(python_ws)
+    for _retry in range(2):
+        sandbox = _EnvSandbox()
+        report = await run_quality_gate(
+            str(python_ws), DIFF, ctx=None, sandbox=sandbox, reviewer=FakeReviewer(), deps_env_cache=cache
+        )
+        assert report.passed and report.deps_envs_prebuilt == ("user",)
+        command, mounts = sandbox.calls[-1]
+        assert command.startswith(f"export PYTHONUSERBASE={spec.container_path} ")
+        assert "pip install" not in command
+        assert mounts == ((str(cache.root / spec.entry), spec.entry, False),)
+    assert cache.builds == 1 and len(sandbox.calls) == 1  # retry : aucune construction
+
+
+async def test_gate_falls_back_to_live_install_without_image(tmp_path, python_ws):
+    cache = DepsEnvCache(str(tmp_path / "envs"))
+    sandbox = _EnvSandbox(image_id=None)
+    report = await run_quality_gate(
+        str(python_ws), DIFF, ctx=None, sandbox=sandbox, reviewer=FakeReviewer(), deps_env_cache=cache
+    )
+    ((command, mounts),) = sandbox.calls
+    assert "pip install --user" in command and mounts == ()
+    assert report.deps_envs_prebuilt == ()
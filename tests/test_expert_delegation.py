@@ -11,6 +11,7 @@ Couvre :
 - Règles par défaut
 """
 
+import asyncio
 import time
 from typing import Any, Dict, List
 
@@ -92,6 +93,33 @@ def _make_fake_tool_class(response_data: Dict[str, Any]):
     return _FakeTool
 
 
+def _make_slow_tool_class(response_data: Dict[str, Any], delay: float, log: List[str] = None):
+    """Tool factice dont l'exécution dure ``delay`` secondes (trace début/annulation dans ``log``)."""
+
+    class _SlowTool:
+        def __init__(self, config=None):
+            self._resp = response_data
+
+        def get_request_model(self):
+            return FakeRequestModel
+
+        async def execute_async(self, req, **kwargs):
+            if log is not None:
+                log.append("start")
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                if log is not None:
+                    log.append("cancelled")
+                raise
+            return FakeResponse(self._resp)
+
+        def cleanup(self):
+            pass
+
+    return _SlowTool
+
+
 def make_tool_registry(tools: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
     """Crée un registre de tools factice."""
     registry = {}
@@ -586,6 +614,85 @@ class TestDelegationChainIntegration:
         assert len(tasks) == 0
 
 
+class TestConcurrentDelegations:
+    @staticmethod
+    def _tasks(*targets):
+        return [
+            DelegationTask(
+                rule=DelegationRule(source_tool="src", target_tool=t, condition_name="test"),
+                target_tool=t,
+                params={},
+            )
+            for t in targets
+        ]
+
+    @pytest.mark.asyncio
+    async def test_siblings_run_concurrently_in_task_order(self):
+        engine = ExpertDelegationEngine()
+        registry = {
+            "slow": {"class": _make_slow_tool_class({"n": 1}, 0.3)},
+            "fast": {"class": _make_slow_tool_class({"n": 2}, 0.1)},
+        }
+
+        start = time.time()
+        results = await engine.execute_delegation_chain(self._tasks("slow", "fast"), registry)
+        elapsed = time.time() - start
+
+        assert [r.target_tool for r in results] == ["slow", "fast"]
+        assert all(r.success for r in results)
+        assert elapsed < 0.35
+        assert [r.target_tool for r in engine.get_chain_history()] == ["slow", "fast"]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_siblings(self):
+        engine = ExpertDelegationEngine(max_concurrency=1)
+        registry = {name: {"class": _make_slow_tool_class({}, 0.1)} for name in ("a", "b", "c")}
+
+        start = time.time()
+        results = await engine.execute_delegation_chain(self._tasks("a", "b", "c"), registry)
+
+        assert time.time() - start >= 0.3
+        assert [r.target_tool for r in results] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_chain_timeout_cancels_running_delegation(self):
+        engine = ExpertDelegationEngine(chain_timeout=0.1)
+        log: List[str] = []
+        registry = {"hang": {"class": _make_slow_tool_class({}, 5.0, log)}}
+
+        start = time.time()
+        results = await engine.execute_delegation_chain(self._tasks("hang"), registry)
+
+        assert time.time() - start < 1.0
+        assert results[0].success is False
+        assert "Timeout" in results[0].error
+        assert log == ["start", "cancelled"]
+
+    @pytest.mark.asyncio
+    async def test_report_exposes_critical_path(self):
+        engine = ExpertDelegationEngine()
+        engine.register_rule(
+            source_tool="slow",
+            target_tool="leaf",
+            condition=lambda r: True,
+            params_builder=lambda s, r: {},
+            condition_name="follow_up",
+        )
+        registry = {
+            "slow": {"class": _make_slow_tool_class({"ok": True}, 0.1)},
+            "fast": {"class": _make_slow_tool_class({"ok": True}, 0.05)},
+            "leaf": {"class": _make_slow_tool_class({}, 0.1)},
+        }
+
+        results = await engine.execute_delegation_chain(self._tasks("fast", "slow"), registry)
+        report = engine.build_chain_report("src", results=results)
+
+        assert report.critical_path == ["src → slow", "slow → leaf"]
+        assert report.wall_time == pytest.approx(0.2, abs=0.1)
+        assert report.total_time == pytest.approx(0.15, abs=0.1)
+        assert results[1].branch_time >= results[1].execution_time
+
+
 # ---------------------------------------------------------------------------
 # Helper
 # ---------------------------------------------------------------------------
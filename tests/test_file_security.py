@@ -9,7 +9,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from collegue.core.file_security import FileSecurityError, safe_getsize, safe_read_file
+from collegue.core.file_security import (
+    FileSecurityError,
+    FileTooLargeError,
+    safe_getsize,
+    safe_iter_file_chunks,
+    safe_read_file,
+)
 
 
 class TestFileSecurity:
@@ -25,6 +31,47 @@ class TestFileSecurity:
         finally:
             os.unlink(temp_path)
 
+    def test_safe_read_file_mmap_matches_buffered_read(self):
+        """La lecture par mmap donne exactement le même texte (fins de ligne, octets invalides)."""
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as f:
+            f.write("héllo\r\nwor\rld\n".encode() + b"\xff\xfe" + b"x" * 5000)
+            temp_path = f.name
+
+        try:
+            expected = safe_read_file(temp_path, max_size=10_000)
+            assert safe_read_file(temp_path, max_size=10_000, mmap_threshold=1) == expected
+            assert "\r" not in expected
+        finally:
+            os.unlink(temp_path)
+
+    def test_safe_iter_file_chunks(self):
+        """La lecture par blocs reconstitue le texte, sans limite de taille."""
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as f:
+            f.write(b"ab\r\ncd\n" * 1000)
+            temp_path = f.name
+
+        try:
+            chunks = list(safe_iter_file_chunks(temp_path, chunk_size=64))
+            assert all(len(chunk) <= 64 for chunk in chunks)
+            assert "".join(chunks) == safe_read_file(temp_path, max_size=10_000) == "ab\ncd\n" * 1000
+        finally:
+            os.unlink(temp_path)
+
+    def test_safe_iter_file_chunks_symlink_blocked(self):
+        """Les protections de safe_read_file s'appliquent à la lecture par blocs."""
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+            f.write("secret")
+            real_file = f.name
+        symlink_path = real_file + ".link"
+        os.symlink(real_file, symlink_path)
+
+        try:
+            with pytest.raises(FileSecurityError, match="Symlink"):
+                list(safe_iter_file_chunks(symlink_path, chunk_size=64))
+        finally:
+            os.unlink(symlink_path)
+            os.unlink(real_file)
+
     def test_safe_read_file_size_limit(self):
         """Test que les fichiers trop grands sont rejetés."""
         with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
@@ -32,7 +79,7 @@ class TestFileSecurity:
             temp_path = f.name
 
         try:
-            with pytest.raises(FileSecurityError, match="File too large"):
+            with pytest.raises(FileTooLargeError, match="File too large"):
                 safe_read_file(temp_path, max_size=100)
         finally:
             os.unlink(temp_path)
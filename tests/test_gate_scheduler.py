@@ -0,0 +1,200 @@
+"""Tests de l'ordonnancement des passes du gate qualité (revue/adéquation pendant les tests).
+
+Sandbox, reviewer et checker factices synchronisés par des ``asyncio.Event`` :
+un enchaînement séquentiel ferait expirer les attentes.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from collegue.executor import FakeAdequacyChecker, FakeReviewer, IssueSpec, run_quality_gate
+from collegue.pilot import runtime
+from collegue.sandbox import SandboxResult
+from collegue.tools.quotas import BudgetExceeded
+
+ISSUE = IssueSpec(number=7, title="T")
+DIFF = "diff --git a/x.py b/x.py\n+print('x')\n"
+_WAIT = 2.0
+
+
+class _SlowSandbox:
+    """Les tests ne se terminent qu'une fois ``release`` posé (ou aussitôt si ``release`` est None)."""
+
+    def __init__(self, *, ok=True, release=None):
+        self.ok = ok
+        self.release = release
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def run_tests_async(self, workspace, command):
+        self.started.set()
+        try:
+            if self.release is not None:
+                await asyncio.wait_for(self.release.wait(), _WAIT)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return SandboxResult(exit_code=0 if self.ok else 1, stdout="2 passed" if self.ok else "1 failed", stderr="")
+
+
+class _SignallingReviewer(FakeReviewer):
+    def __init__(self, done, *, wait=None, **kwargs):
+        super().__init__(**kwargs)
+        self.done = done
+        self.wait = wait
+
+    async def review(self, diff, ctx, *, issue=None):
+        if self.wait is not None:
+            await asyncio.wait_for(self.wait.wait(), _WAIT)
+        outcome = await super().review(diff, ctx, issue=issue)
+        self.done.set()
+        return outcome
+
+
+class _BlockingChecker(FakeAdequacyChecker):
+    """Adéquation qui ne répond jamais d'elle-même : seule une annulation la termine."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def check(self, diff, issue, ctx):
+        self.calls.append(issue.number)
+        self.started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+def _timings(report):
+    return {timing.name: timing.status for timing in report.pass_timings}
+
+
+async def test_review_runs_while_tests_are_running():
+    review_done = asyncio.Event()
+    sandbox = _SlowSandbox(release=review_done)  # les tests attendent la fin de la revue
+    report = await run_quality_gate(
+        "/ws", DIFF, ctx=None, sandbox=sandbox, reviewer=_SignallingReviewer(review_done), install_deps=False
+    )
+    assert report.passed is True
+    assert _timings(report) == {"tests": "done", "review": "done"}
+    tests, review = sorted(report.pass_timings, key=lambda timing: timing.name, reverse=True)
+    assert review.started < tests.started + tests.seconds  # chevauchement
+    assert "_Passes_ : " in report.to_markdown()
+
+
+async def test_concurrent_adequacy_overlaps_tests_and_counts_when_green():
+    checker_done = asyncio.Event()
+
+    class _Checker(FakeAdequacyChecker):
+        async def check(self, diff, issue, ctx):
+            outcome = await super().check(diff, issue, ctx)
+            checker_done.set()
+            return outcome
+
+    checker = _Checker(implemented=False, justification="route absente")
+    report = await run_quality_gate(
+        "/ws",
+        DIFF,
+        ctx=None,
+        sandbox=_SlowSandbox(release=checker_done),
+        reviewer=FakeReviewer(),
+        issue=ISSUE,
+        adequacy_checker=checker,
+        concurrent_adequacy=True,
+        install_deps=False,
+    )
+    assert checker.calls == [ISSUE.number]
+    assert report.adequacy_implemented is False and report.passed is False
+    assert _timings(report)["adequacy"] == "done"
+
+
+async def test_red_tests_cancel_speculative_adequacy_by_default():
+    checker = _BlockingChecker()
+    release = asyncio.Event()
+    sandbox = _SlowSandbox(ok=False, release=release)
+
+    async def _release_once_checking():
+        await checker.started.wait()
+        release.set()
+
+    releaser = asyncio.ensure_future(_release_once_checking())
+    report = await run_quality_gate(
+        "/ws",
+        DIFF,
+        ctx=None,
+        sandbox=sandbox,
+        reviewer=FakeReviewer(),
+        issue=ISSUE,
+        adequacy_checker=checker,
+        concurrent_adequacy=True,
+        install_deps=False,
+    )
+    await releaser
+    assert checker.cancelled is True
+    assert report.passed is False and report.tests_passed is False
+    assert report.adequacy_implemented is None and report.adequacy_error is None
+    assert _timings(report) == {"tests": "done", "review": "done", "adequacy": "cancelled"}
+
+
+async def test_cancel_all_also_cancels_review_when_tests_red():
+    never = asyncio.Event()
+
+    class _Hanging(FakeReviewer):
+        async def review(self, diff, ctx, *, issue=None):
+            await never.wait()
+
+    report = await run_quality_gate(
+        "/ws", DIFF, ctx=None, sandbox=_SlowSandbox(ok=False), reviewer=_Hanging(), cancel_on_red="all"
+    )
+    assert report.passed is False
+    assert report.review_summary == "revue annulée : tests en échec"
+    assert report.review_blocking is False and report.review_error is None
+    assert _timings(report)["review"] == "cancelled"
+
+
+async def test_cancel_none_keeps_adequacy_but_discards_it_on_red_gate():
+    checker = FakeAdequacyChecker(implemented=False)
+    report = await run_quality_gate(
+        "/ws",
+        DIFF,
+        ctx=None,
+        sandbox=_SlowSandbox(ok=False),
+        reviewer=FakeReviewer(),
+        issue=ISSUE,
+        adequacy_checker=checker,
+        concurrent_adequacy=True,
+        cancel_on_red="none",
+        install_deps=False,
+    )
+    assert checker.calls == [ISSUE.number]
+    assert report.adequacy_implemented is None  # champs inchangés : gate déjà rouge
+    assert _timings(report)["adequacy"] == "done"
+
+
+async def test_budget_from_review_stops_running_tests():
+    release = asyncio.Event()  # jamais posé : seuls l'annulation ou le délai terminent les tests
+    sandbox = _SlowSandbox(release=release)
+    reviewer = FakeReviewer(raises=BudgetExceeded("cost", 10.0, 5.0))
+    with pytest.raises(BudgetExceeded):
+        await asyncio.wait_for(run_quality_gate("/ws", DIFF, ctx=None, sandbox=sandbox, reviewer=reviewer), 1.0)
+    assert sandbox.cancelled is True
+
+
+async def test_unknown_cancel_policy_rejected():
+    with pytest.raises(ValueError, match="cancel_on_red"):
+        await run_quality_gate("/ws", DIFF, ctx=None, sandbox=_SlowSandbox(), cancel_on_red="sometimes")
+
+
+def test_gate_options_emit_scheduling_only_when_overridden():
+    assert "concurrent_adequacy" not in runtime._gate_options(SimpleNamespace())
+    assert "cancel_on_red" not in runtime._gate_options(SimpleNamespace(GATE_LLM_CANCEL_ON_RED="adequacy"))
+    opts = runtime._gate_options(SimpleNamespace(GATE_CONCURRENT_ADEQUACY=True, GATE_LLM_CANCEL_ON_RED="all"))
+    assert opts["concurrent_adequacy"] is True and opts["cancel_on_red"] == "all"
+    with pytest.raises(ValueError):
+        runtime._gate_options(SimpleNamespace(GATE_LLM_CANCEL_ON_RED="jamais"))
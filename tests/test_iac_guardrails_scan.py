@@ -8,7 +8,9 @@ import pytest
 
 from collegue.core.shared import FileInput
 from collegue.tools.iac_guardrails_scan import CustomPolicy, IacFinding, IacGuardrailsRequest, IacGuardrailsScanTool
-from collegue.tools.iac_guardrails_scan.engine import IacAnalysisEngine
+from collegue.tools.iac_guardrails_scan.engine import IacAnalysisEngine, IacFileScanner
+from collegue.tools.iac_guardrails_scan.ruleset import compile_custom_policies
+from collegue.tools.scanners.kubernetes import KubernetesScanner, parse_manifest
 
 
 class TestIacAnalysisEngine:
@@ -208,6 +210,173 @@ spec:
         assert actions[0].priority == "critical"
 
 
+MULTI_DOC_MANIFEST = """\
+apiVersion: v1
+kind: Service
+metadata:
+  name: web
+spec:
+  type: NodePort
+  ports:
+    - port: 80
+      nodePort: 30080
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+spec:
+  template:
+    spec:
+      containers:
+        - name: sidecar
+          image: envoy:1.29
+          securityContext:
+            privileged: false
+        - name: app
+          image: nginx:1.25
+          securityContext:
+            privileged: true
+          resources:
+            limits:
+              cpu: "1"
+"""
+
+
+class TestKubernetesManifestPositions:
+    """Positions YAML : lignes exactes des findings du scanner Kubernetes."""
+
+    def test_line_of_key_paths(self):
+        manifest = parse_manifest(MULTI_DOC_MANIFEST)
+        assert len(manifest.documents) == 2
+        assert manifest.line_of(0, "spec", "ports", 0, "nodePort") == 9
+        assert manifest.line_of(1, "spec", "template", "spec", "containers", 1) == 23
+        # Chemin absent : ligne de l'ancêtre connu le plus proche.
+        assert manifest.line_of(1, "spec", "template", "spec", "containers", 0, "resources") == 19
+        assert manifest.line_at(MULTI_DOC_MANIFEST.index("kind: Deployment")) == 12
+
+    def test_findings_point_at_the_offending_container(self):
+        findings = KubernetesScanner().scan(MULTI_DOC_MANIFEST, "web.yaml", "baseline")
+        lines = {(f.rule_id, f.line) for f in findings}
+        # Le premier « privileged: » du fichier (ligne 22) est à false.
+        assert ("K8S-001", 26) in lines
+        assert ("K8S-009", 9) in lines
+        # Seul le sidecar n'a pas de limites.
+        assert ("K8S-007", 19) in lines
+        assert not any(f.rule_id == "K8S-007" and f.line == 23 for f in findings)
+
+    def test_engine_shares_parsed_manifest(self):
+        engine = IacAnalysisEngine(
+            k8s_rules={
+                "baseline": [
+                    {
+                        "id": "K8S-001",
+                        "title": "Privileged",
+                        "severity": "critical",
+                        "pattern": r"privileged:\s*true",
+                        "description": "",
+                        "remediation": "",
+                    }
+                ],
+                "strict": [],
+            },
+            tf_rules={},
+            dockerfile_rules={},
+        )
+        manifest = parse_manifest(MULTI_DOC_MANIFEST)
+        findings = engine.scan_kubernetes(MULTI_DOC_MANIFEST, "web.yaml", "baseline", manifest=manifest)
+        assert [f.line for f in findings] == [26]
+
+    def test_invalid_yaml_yields_no_structural_findings(self):
+        assert KubernetesScanner().scan("kind: Pod\nspec: [unclosed", "bad.yaml", "baseline") == []
+
+
+TF_RULES = {
+    "baseline": [
+        {
+            "id": "TF-001",
+            "title": "Open CIDR",
+            "severity": "critical",
+            "pattern": r'cidr_blocks\s*=\s*\[\s*"0\.0\.0\.0/0"\s*\]',
+            "description": "",
+            "remediation": "",
+        },
+        {
+            "id": "TF-003",
+            "title": "Public RDS",
+            "severity": "critical",
+            "pattern": r"publicly_accessible\s*=\s*true",
+            "description": "",
+            "remediation": "",
+        },
+        {
+            "id": "TF-099",
+            "title": "Repeated word",
+            "severity": "low",
+            "pattern": r"(\b\w+\b) \1",
+            "description": "",
+            "remediation": "",
+        },
+    ],
+    "strict": [],
+}
+
+
+class TestCompiledRuleset:
+    """Règles compilées une fois, passe combinée et index de lignes partagé."""
+
+    @pytest.fixture
+    def engine(self):
+        return IacAnalysisEngine(k8s_rules={}, tf_rules=TF_RULES, dockerfile_rules={}, logger=None)
+
+    def test_ruleset_compiled_once(self, engine):
+        assert engine.ruleset("terraform", "baseline") is engine.ruleset("terraform", "baseline")
+        assert len(engine.ruleset("terraform", "baseline", exclude=("TF-003",))) == 2
+
+    def test_matches_rule_by_rule_application(self, engine):
+        content = (
+            'resource "aws_db_instance" "db" {\n  publicly_accessible = true\n}\n'
+            'ingress {\n  cidr_blocks = ["0.0.0.0/0"]\n}\nthe the end\n'
+        )
+        expected = []
+        for rule in TF_RULES["baseline"]:
+            expected.extend(engine.apply_regex_rule(rule, content, "main.tf", content.split("\n")))
+        findings = engine.scan_terraform(content, "main.tf", "baseline")
+        assert [(f.rule_id, f.line) for f in findings] == [(f.rule_id, f.line) for f in expected]
+        assert [(f.rule_id, f.line) for f in findings] == [("TF-001", 5), ("TF-003", 2), ("TF-099", 7)]
+        # Aucun pattern ne correspond : la passe combinée suffit, backreference comprise.
+        assert engine.scan_terraform('variable "region" {}\n', "vars.tf", "baseline") == []
+
+    def test_custom_policies_compiled_for_all_files(self):
+        policies = [
+            CustomPolicy(id="C-1", content=r"ubuntu", language="regex", severity="low"),
+            CustomPolicy(id="C-2", content="pattern: 'privileged: true'\ntitle: Privileged", severity="high"),
+            CustomPolicy(id="C-3", content=r"(a+)+$", language="regex"),
+            CustomPolicy(id="C-4", content="[unclosed", language="regex"),
+        ]
+        rules = compile_custom_policies(policies, IacGuardrailsScanTool._regex_looks_dangerous, max_matches=2)
+        assert [rule.rule_id for rule in rules.rules] == ["C-1", "C-2"]
+
+        findings = rules.scan("FROM ubuntu\nRUN ubuntu\nRUN ubuntu\n", "Dockerfile")
+        assert [(f.rule_id, f.line) for f in findings] == [("C-1", 1), ("C-1", 2)]
+        findings = rules.scan("spec:\n  privileged: true\n", "pod.yaml")
+        assert [(f.rule_id, f.line, f.title) for f in findings] == [("C-2", 1, "Privileged")]
+
+    def test_parallel_scan_matches_sequential(self, engine, monkeypatch):
+        monkeypatch.setattr("collegue.tools.iac_guardrails_scan.engine.PARALLEL_MIN_FILES", 2)
+        rds = 'resource "aws_db_instance" "db" {\n  publicly_accessible = true\n}\n'
+        files = [(f"m{i}.tf", rds) for i in range(4)]
+        files.append(("deploy.yaml", MULTI_DOC_MANIFEST))
+        scanner = IacFileScanner(engine)
+
+        sequential = scanner.scan_files(files, "baseline", workers=1)
+        parallel = scanner.scan_files(files, "baseline", workers=2)
+        assert [[(f.rule_id, f.path, f.line) for f in found] for found, _ in parallel] == [
+            [(f.rule_id, f.path, f.line) for f in found] for found, _ in sequential
+        ]
+        assert [count for _, count in parallel] == [count for _, count in sequential]
+
+
 class TestIacFinding:
     """Tests pour le modèle IacFinding."""
 
@@ -0,0 +1,267 @@
+"""Tests différentiels du tokenizer JS (collegue/parsing/js_tokenizer.py).
+
+Le tokenizer à regex maîtresse doit produire exactement le flux de l'ancien
+tokenizer caractère par caractère, reproduit ci-dessous comme référence.
+"""
+
+import random
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from collegue.parsing import JSParser
+from collegue.parsing.js_tokenizer import tokenize, tree_sitter_available
+
+FIXTURES = [
+    Path(__file__).parent / "typescript_test.ts",
+    Path(__file__).parent / "stress" / "real_cases" / "fixtures" / "javascript" / "app.js",
+]
+
+
+def reference_tokenize(content: str) -> List[Tuple[str, int, int, str]]:
+    """Tokenizer caractère par caractère d'origine, figé comme référence."""
+    tokens = []
+    line = 1
+    col = 1
+    i = 0
+    while i < len(content):
+        char = content[i]
+        if char in " \t":
+            col += 1
+            i += 1
+            continue
+        if char == "\n":
+            line += 1
+            col = 1
+            i += 1
+            continue
+        if char == "/":
+            if i + 1 < len(content) and content[i + 1] == "/":
+                while i < len(content) and content[i] != "\n":
+                    i += 1
+                continue
+            if i + 1 < len(content) and content[i + 1] == "*":
+                i += 2
+                while i < len(content) - 1 and not (content[i] == "*" and content[i + 1] == "/"):
+                    if content[i] == "\n":
+                        line += 1
+                        col = 1
+                    else:
+                        col += 1
+                    i += 1
+                i += 2
+                continue
+            is_regex = True
+            if tokens:
+                prev_type = tokens[-1][0]
+                if prev_type in ("IDENT", "NUMBER", ")", "]"):
+                    is_regex = False
+            if is_regex and i + 1 < len(content) and content[i + 1] not in ("=", " ", "\n", "\t"):
+                start_line, start_col = line, col
+                value = char
+                i += 1
+                col += 1
+                while i < len(content) and content[i] != "/":
+                    if content[i] == "\\":
+                        value += content[i : i + 2]
+                        i += 2
+                        col += 2
+                    elif content[i] == "\n":
+                        break
+                    else:
+                        value += content[i]
+                        i += 1
+                        col += 1
+                if i < len(content) and content[i] == "/":
+                    value += content[i]
+                    i += 1
+                    col += 1
+                    while i < len(content) and content[i].isalpha():
+                        value += content[i]
+                        i += 1
+                        col += 1
+                    tokens.append(("STRING", start_line, start_col, value))
+                    continue
+            start_line, start_col = line, col
+            value = "/"
+            i += 1
+            col += 1
+            if i < len(content) and content[i] == "=":
+                value += "="
+                i += 1
+                col += 1
+            tokens.append(("OP", start_line, start_col, value))
+            continue
+        if char in "\"'":
+            quote = char
+            start_line, start_col = line, col
+            value = char
+            i += 1
+            col += 1
+            while i < len(content) and content[i] != quote:
+                if content[i] == "\\":
+                    value += content[i : i + 2]
+                    i += 2
+                    col += 2
+                elif content[i] == "\n":
+                    value += content[i]
+                    line += 1
+                    col = 1
+                    i += 1
+                else:
+                    value += content[i]
+                    i += 1
+                    col += 1
+            if i < len(content):
+                value += content[i]
+                i += 1
+                col += 1
+            tokens.append(("STRING", start_line, start_col, value))
+            continue
+        if char == "`":
+            start_line, start_col = line, col
+            value = char
+            i += 1
+            col += 1
+            depth = 0
+            while i < len(content):
+                c = content[i]
+                if c == "\\":
+                    value += content[i : i + 2]
+                    i += 2
+                    col += 2
+                elif c == "$" and i + 1 < len(content) and content[i + 1] == "{":
+                    value += "${"
+                    i += 2
+                    col += 2
+                    depth += 1
+                elif c == "{" and depth > 0:
+                    value += c
+                    i += 1
+                    col += 1
+                    depth += 1
+                elif c == "}" and depth > 0:
+                    value += c
+                    i += 1
+                    col += 1
+                    depth -= 1
+                elif c == "`" and depth == 0:
+                    value += c
+                    i += 1
+                    col += 1
+                    break
+                elif c == "\n":
+                    value += c
+                    line += 1
+                    col = 1
+                    i += 1
+                else:
+                    value += c
+                    i += 1
+                    col += 1
+            tokens.append(("STRING", start_line, start_col, value))
+            continue
+        if char.isalpha() or char == "_" or char == "$":
+            start_line, start_col = line, col
+            value = ""
+            while i < len(content) and (content[i].isalnum() or content[i] in "_$"):
+                value += content[i]
+                i += 1
+                col += 1
+            if value in JSParser.RESERVED_KEYWORDS:
+                tokens.append(("KEYWORD", start_line, start_col, value))
+            else:
+                tokens.append(("IDENT", start_line, start_col, value))
+            continue
+        start_line, start_col = line, col
+        if char in "{}[](),;:":
+            tokens.append((char, start_line, start_col, char))
+            i += 1
+            col += 1
+        elif char in "+-*/%=!<>&|^~":
+            value = char
+            i += 1
+            col += 1
+            if i < len(content) and content[i] in "=+-":
+                value += content[i]
+                i += 1
+                col += 1
+            tokens.append(("OP", start_line, start_col, value))
+        else:
+            i += 1
+            col += 1
+    return tokens
+
+
+def new_tokens(content: str):
+    return tokenize(content, JSParser.RESERVED_KEYWORDS)
+
+
+EDGE_CASES = [
+    "",
+    "const a = 1;",
+    "import { a as b, c } from './mod';\nimport * as ns from \"pkg\";",
+    "const re = /ab+c/gi; x = a / b; y = (a) / 2; z = arr[0] /= 3;",
+    "const half = 1/2;\nconst next = foo;",
+    "x = /unterminated \\/ regex\nlet after = 1;",
+    "s = 'multi\\\nline' + \"a\\\\\nb\";\nlet y;",
+    "t = `a ${b + `nested ${c}`} { } d`;\nlet z = `\\`${ {a: 1} }`;",
+    "/* bloc */ let a; /* multi\nligne */ let b;\n// ligne\nlet c; /* non terminé",
+    "a.b?.c ?? d; #priv @deco 0x1F 1e10 .5",
+    "café = ²x + Ⅻ + naïve; x = /é+/uñ",
+    "const {a, b: [c]} = obj; const [d, ...e] = list;",
+    "x = a /\n/ b",
+    "x = /abc\\",
+    "x = /abc\\\\",
+    "unterminated 'string",
+    "unterminated `template ${ {",
+    "a\r\nb\tc\fd\u00a0e",
+    "/=/ ; x /= 2; (/=/)",
+    "type X = { a: string };\ninterface Y extends Z<T> {}\nenum E { A }\nexport default class K {}",
+]
+
+
+@pytest.mark.parametrize("source", EDGE_CASES)
+def test_edge_cases_match_reference(source):
+    assert new_tokens(source) == reference_tokenize(source)
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.name)
+def test_fixtures_match_reference(path):
+    source = path.read_text(encoding="utf-8")
+    assert new_tokens(source) == reference_tokenize(source)
+
+
+def test_random_sources_match_reference():
+    alphabet = list("abc_$ \t\n\r/*\\'\"`${}[]();,:.+-=!<>&|^~%?#@019") + ["é", "²", "//", "/*", "*/", "${"]
+    rng = random.Random(2024)
+    for _ in range(2000):
+        source = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 60)))
+        assert new_tokens(source) == reference_tokenize(source), repr(source)
+
+
+def test_parser_results_unchanged_on_fixture():
+    source = FIXTURES[1].read_text(encoding="utf-8")
+    parser = JSParser(source, "app.js", backend="regex")
+    assert parser.tokens == reference_tokenize(source)
+    assert parser.find_imports() or parser.find_declarations()
+
+
+@pytest.mark.skipif(tree_sitter_available(), reason="tree-sitter installé")
+def test_tree_sitter_backend_falls_back_to_regex_when_missing():
+    source = "import x from './x';"
+    assert JSParser(source, "a.js", backend="tree_sitter").tokens == reference_tokenize(source)
+
+
+@pytest.mark.skipif(not tree_sitter_available(), reason="tree-sitter non installé")
+def test_tree_sitter_backend_finds_same_imports_and_declarations():
+    source = (
+        "import React, { useState as useS } from 'react';\n"
+        "const re = /a\\/b/; const half = 1/2;\n"
+        "export function App() { return `${half}`; }\n"
+    )
+    regex_parser = JSParser(source, "app.js", backend="regex")
+    ts_parser = JSParser(source, "app.js", backend="tree_sitter")
+    assert [i.source for i in ts_parser.find_imports()] == [i.source for i in regex_parser.find_imports()]
+    assert set(ts_parser.find_declarations()) == set(regex_parser.find_declarations())
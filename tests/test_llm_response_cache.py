@@ -0,0 +1,157 @@
+"""Tests du cache disque des réponses LLM (collegue/core/llm/response_cache.py)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from collegue.core.llm.client import sample_with_timeout
+from collegue.core.llm.response_cache import LLMResponseCache, request_key, reset_response_cache
+from collegue.core.llm.sampling_ctx import LocalSamplingContext
+from collegue.monitoring.sampling_usage import capture_usage
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = LLMResponseCache(str(tmp_path / "cache"), max_entries=3, max_bytes=1000)
+    yield c
+    c.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_singleton():
+    reset_response_cache()
+    yield
+    reset_response_cache()
+
+
+def _msgs(text):
+    return [{"role": "user", "content": text}]
+
+
+class _CountingCtx:
+    def __init__(self, text="réponse"):
+        self.text = text
+        self.calls = []
+
+    async def sample(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(text=self.text, result=None)
+
+
+# --- clé et stockage ------------------------------------------------------------
+
+
+def test_request_key_is_canonical():
+    a = request_key("m", _msgs("x"), 0.0, 100)
+    assert a == request_key("m", _msgs("x"), 0, 100)
+    assert a != request_key("m", _msgs("x"), 0.0, 200)
+    assert a != request_key("other", _msgs("x"), 0.0, 100)
+    assert a != request_key("m", _msgs("x"), 0.0, 100, result_type="pkg.Model")
+
+
+def test_get_put_roundtrip_and_persistence(tmp_path):
+    first = LLMResponseCache(str(tmp_path / "c"))
+    key = request_key("m", _msgs("x"), 0.0, None)
+    assert first.get(key) is None
+    first.put(key, "bonjour", "m-1")
+    first.close()
+
+    second = LLMResponseCache(str(tmp_path / "c"))
+    assert second.get(key) == {"text": "bonjour", "model": "m-1"}
+    second.close()
+
+
+def test_get_many_put_many(cache):
+    cache.put_many([("a", "1", "m"), ("b", "2", "m")])
+    assert cache.get_many(["a", "b", "z"]) == {"a": {"text": "1", "tag": "m"}, "b": {"text": "2", "tag": "m"}}
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_lru_eviction_by_entry_count(cache):
+    keys = [request_key("m", _msgs(str(i)), 0.0, None) for i in range(4)]
+    for k in keys[:3]:
+        cache.put(k, "r", "m")
+    cache.get(keys[0])  # keys[1] devient le moins récemment lu
+    cache.put(keys[3], "r", "m")
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats()["entries"] == 3
+
+
+def test_eviction_by_size(cache):
+    cache.put("a", "x" * 600, "m")
+    cache.put("b", "y" * 600, "m")
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    cache.put("huge", "z" * 2000, "m")  # plus grand que le cache : ignoré
+    assert cache.get("huge") is None
+
+
+def test_temperature_threshold(cache):
+    cache.max_temperature = 0.2
+    assert cache.accepts(0.0)
+    assert cache.accepts(0.2)
+    assert not cache.accepts(0.7)
+    assert not cache.accepts(None)
+
+
+# --- chokepoints de sampling ----------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_sample_with_timeout_serves_identical_request_from_cache(tmp_path, monkeypatch):
+    settings_obj = SimpleNamespace(
+        LLM_CALL_TIMEOUT=0.0,
+        LLM_MODEL="m",
+        LLM_RESPONSE_CACHE_ENABLED=True,
+        LLM_RESPONSE_CACHE_MAX_TEMPERATURE=0.2,
+    )
+    monkeypatch.setenv("COLLEGUE_HOME", str(tmp_path))
+    ctx = _CountingCtx()
+
+    first = await sample_with_timeout(ctx, settings_obj=settings_obj, messages="x", temperature=0.0)
+    with capture_usage() as captured:
+        second = await sample_with_timeout(ctx, settings_obj=settings_obj, messages="x", temperature=0.0)
+
+    assert first.text == second.text == "réponse"
+    assert len(ctx.calls) == 1
+    assert captured.usage == (0, 0, "m")
+    assert captured.cache_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_sample_with_timeout_bypasses_cache_above_threshold(tmp_path, monkeypatch):
+    settings_obj = SimpleNamespace(LLM_CALL_TIMEOUT=0.0, LLM_MODEL="m", LLM_RESPONSE_CACHE_ENABLED=True)
+    monkeypatch.setenv("COLLEGUE_HOME", str(tmp_path))
+    ctx = _CountingCtx()
+
+    for _ in range(2):
+        await sample_with_timeout(ctx, settings_obj=settings_obj, messages="x", temperature=0.9)
+    assert len(ctx.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_local_ctx_create_uses_its_cache(cache, monkeypatch):
+    monkeypatch.setattr("collegue.monitoring.metrics.enforce_budget", lambda: None)
+    calls = []
+
+    async def _create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))],
+            model="m",
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+        )
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=_create)))
+    ctx = LocalSamplingContext(default_model="m", client=client, response_cache=cache)
+
+    with capture_usage() as miss:
+        assert (await ctx.sample("x", temperature=0.0)).text == "ok"
+    with capture_usage() as hit:
+        assert (await ctx.sample("x", temperature=0.0)).text == "ok"
+
+    assert len(calls) == 1
+    assert miss.usage == (10, 5, "m") and miss.cache_hits == 0
+    assert hit.usage == (0, 0, "m") and hit.cache_hits == 1
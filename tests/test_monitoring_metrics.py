@@ -2,6 +2,7 @@
 Tests for collegue.monitoring.metrics — latency, costs, errors per expert.
 """
 
+import json
 import threading
 import time
 
@@ -13,6 +14,7 @@ from collegue.monitoring.metrics import (
     MetricsSummary,
     get_metrics_collector,
 )
+from collegue.monitoring.sketch import LatencySketch
 
 
 class TestMetricsCollector:
@@ -190,6 +192,15 @@ class TestMetricsCollector:
         assert summary.total_cost_usd > 0
         assert len(summary.experts) == 3
 
+    def test_record_code_facts(self):
+        self.collector.record_code_facts("code_review", parses=1, reuses=3, parse_ms=4.0, saved_ms=12.0)
+        self.collector.record_code_facts("code_review", parses=1, reuses=0, parse_ms=2.0)
+        metrics = self.collector.get_expert_metrics("code_review")
+        assert (metrics["code_facts_parses"], metrics["code_facts_reuses"]) == (2, 3)
+        assert (metrics["code_facts_parse_ms"], metrics["code_facts_saved_ms"]) == (6.0, 12.0)
+        restored = ExpertMetrics.from_dict("code_review", metrics)
+        assert restored.code_facts_saved_ms == 12.0
+
     def test_reset(self):
         self.collector.record_execution("test", 100.0, True)
         assert self.collector.get_expert_metrics("test") is not None
@@ -295,3 +306,142 @@ class TestExpertMetrics:
         assert d["avg_latency_ms"] == 500.0
         assert d["success_rate"] == 0.8
         assert d["error_rate"] == 0.2
+
+
+class TestWriteBehindPersistence:
+    """metrics.json est écrit en tâche de fond, pas à chaque exécution."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(MetricsCollector, "_PERSIST_DIR", tmp_path)
+        self.path = tmp_path / MetricsCollector._PERSIST_FILE
+
+    def test_record_does_not_write_synchronously(self):
+        collector = MetricsCollector(flush_interval=60.0, max_staleness=120.0)
+        collector.record_execution("lazy", 10.0, True)
+        assert not self.path.exists()
+        assert collector.flush() is True
+        assert json.loads(self.path.read_text())["lazy"]["total_executions"] == 1
+        # Rien de nouveau : pas de réécriture.
+        assert collector.flush() is False
+        collector.close()
+
+    def test_background_flusher_persists_after_interval(self):
+        collector = MetricsCollector(flush_interval=0.05, max_staleness=0.2)
+        collector.record_execution("bg", 10.0, True)
+        deadline = time.time() + 5.0
+        while not self.path.exists() and time.time() < deadline:
+            time.sleep(0.01)
+        assert json.loads(self.path.read_text())["bg"]["total_executions"] == 1
+        collector.close()
+
+    def test_max_staleness_bounds_delay_under_continuous_load(self):
+        collector = MetricsCollector(flush_interval=0.2, max_staleness=0.3)
+        start = time.time()
+        # Trafic continu plus rapide que flush_interval : seul max_staleness déclenche.
+        while not self.path.exists() and time.time() - start < 5.0:
+            collector.record_execution("busy", 1.0, True)
+            time.sleep(0.02)
+        assert self.path.exists()
+        assert time.time() - start < 2.0
+        collector.close()
+
+    def test_close_flushes_pending_metrics(self):
+        collector = MetricsCollector(flush_interval=60.0, max_staleness=120.0)
+        collector.record_execution("shutdown", 10.0, True)
+        collector.close()
+        reloaded = MetricsCollector(flush_interval=60.0, max_staleness=120.0)
+        assert reloaded.get_expert_metrics("shutdown")["total_executions"] == 1
+
+    def test_atomic_write_leaves_no_temp_files(self):
+        collector = MetricsCollector(flush_interval=0)
+        for i in range(5):
+            collector.record_execution("sync", float(i), True)
+        assert json.loads(self.path.read_text())["sync"]["total_executions"] == 5
+        assert [p.name for p in self.path.parent.iterdir()] == [self.path.name]
+
+
+class TestLatencySketch:
+    """Sketch de quantiles : précision relative, fusion, sérialisation compacte."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        import random
+
+        rng = random.Random(42)
+        values = [rng.lognormvariate(5, 1) for _ in range(20000)]
+        sketch = LatencySketch()
+        sketch.update(values)
+        values.sort()
+        for q in (0.5, 0.9, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert abs(sketch.quantile(q) - exact) / exact <= 0.03
+
+    def test_memory_is_bounded(self):
+        sketch = LatencySketch(max_buckets=64)
+        for i in range(1, 100_000, 7):
+            sketch.add(float(i))
+        assert len(sketch.to_dict()["b"]) <= 64
+        assert sketch.count == len(range(1, 100_000, 7))
+        # Les seaux fusionnés sont les plus bas : la queue haute reste précise.
+        assert abs(sketch.quantile(0.99) - 99_000) / 99_000 <= 0.02
+
+    def test_merge_equals_single_sketch(self):
+        a, b, both = LatencySketch(), LatencySketch(), LatencySketch()
+        for i in range(1000):
+            (a if i % 2 else b).add(float(i))
+            both.add(float(i))
+        a.merge(b)
+        assert a.count == both.count
+        for q in (0.5, 0.95, 0.99):
+            assert a.quantile(q) == both.quantile(q)
+
+    def test_round_trip_serialisation(self):
+        sketch = LatencySketch()
+        sketch.update([0.0, 1.0, 10.0, 100.0, 1000.0])
+        restored = LatencySketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        assert restored.count == 5
+        assert restored.quantiles((0.0, 0.5, 1.0)) == sketch.quantiles((0.0, 0.5, 1.0))
+
+    def test_incompatible_alpha_rejected(self):
+        with pytest.raises(ValueError):
+            LatencySketch(alpha=0.01).merge(LatencySketch.from_dict({"a": 0.05, "b": {"1": 1}}))
+
+
+class TestExpertMetricsSketch:
+    def test_percentiles_exposed(self):
+        m = ExpertMetrics(expert_name="x")
+        for i in range(1, 101):
+            m.record_latency(float(i))
+        d = m.to_dict()
+        assert d["p50_latency_ms"] <= d["p90_latency_ms"] <= d["p95_latency_ms"] <= d["p99_latency_ms"]
+        assert abs(d["p50_latency_ms"] - 50.0) <= 1.5
+        assert "latency_samples" not in d
+
+    def test_windows_are_bounded(self):
+        m = ExpertMetrics(expert_name="x")
+        for hour in range(ExpertMetrics.MAX_LATENCY_WINDOWS + 5):
+            m.record_latency(10.0, timestamp=hour * ExpertMetrics.LATENCY_WINDOW_SECONDS)
+        histogram = m.latency_histogram()
+        assert len(histogram) == ExpertMetrics.MAX_LATENCY_WINDOWS
+        assert histogram[-1]["window_start"] == (ExpertMetrics.MAX_LATENCY_WINDOWS + 4) * 3600
+
+    def test_legacy_latency_samples_are_loaded(self):
+        m = ExpertMetrics.from_dict("legacy", {"total_executions": 3, "latency_samples": [10.0, 20.0, 30.0]})
+        assert m.latency_sketch.count == 3
+        assert 19.0 <= m.p50_latency_ms <= 21.0
+
+    def test_merge_snapshot_combines_replicas(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(MetricsCollector, "_PERSIST_DIR", tmp_path)
+        replica_a = MetricsCollector(flush_interval=60.0, max_staleness=120.0)
+        replica_b = MetricsCollector(flush_interval=60.0, max_staleness=120.0)
+        for i in range(100):
+            replica_a.record_execution("review", float(i), True, input_tokens=1)
+            replica_b.record_execution("review", float(i + 100), False, error_type="Boom")
+        replica_a.merge_snapshot(replica_b.get_all_metrics())
+        merged = replica_a.get_expert_metrics("review")
+        assert merged["total_executions"] == 200
+        assert merged["errors_by_type"] == {"Boom": 100}
+        assert merged["max_latency_ms"] == 199.0
+        assert abs(merged["p50_latency_ms"] - 99.5) <= 2.0
+        replica_a.close()
+        replica_b.close()
@@ -322,3 +322,102 @@ def test_parse_plan_normalizes_field_aliases():
     plan = _parse_plan_from_text('{"steps": [{"tool": "code_review", "reason": "R", "params": {}}]}')
     assert plan is not None
     assert plan.steps[0].tool == "code_review"
+
+
+def test_parse_plan_normalizes_dependency_aliases():
+    from collegue.core.meta_orchestrator import _parse_plan_from_text
+
+    plan = _parse_plan_from_text(
+        '{"steps": [{"tool": "a", "reason": "R", "params": {}},'
+        ' {"tool": "b", "reason": "R", "params": {}, "dependencies": 1}]}'
+    )
+    assert plan is not None
+    assert plan.steps[0].depends_on == []
+    assert plan.steps[1].depends_on == [1]
+
+
+def _steps(*specs):
+    return [OrchestratorStep(tool=name, reason="r", params={}, depends_on=deps) for name, deps in specs]
+
+
+@pytest.mark.asyncio
+async def test_plan_dag_runs_independent_steps_concurrently():
+    import asyncio
+    import time
+
+    from collegue.core.meta_orchestrator import _run_plan_dag
+
+    async def run_step(i, step):
+        await asyncio.sleep(0.2)
+        return {"step": i + 1, "tool": step.tool, "result": {}}
+
+    progress = []
+
+    async def on_progress(done, total):
+        progress.append((done, total))
+
+    start = time.time()
+    results = await _run_plan_dag(
+        _steps(("secret_scan", []), ("dependency_guard", []), ("architecture_analysis", [])),
+        run_step,
+        on_progress=on_progress,
+    )
+
+    assert time.time() - start < 0.4
+    assert [r["tool"] for r in results] == ["secret_scan", "dependency_guard", "architecture_analysis"]
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+@pytest.mark.asyncio
+async def test_plan_dag_respects_dependencies_and_cancels_dependents():
+    from collegue.core.meta_orchestrator import _run_plan_dag
+
+    order = []
+
+    async def run_step(i, step):
+        order.append(step.tool)
+        if step.tool == "broken":
+            return {"step": i + 1, "error": "boom"}
+        return {"step": i + 1, "tool": step.tool, "result": {}}
+
+    results = await _run_plan_dag(
+        _steps(("first", []), ("second", [1]), ("broken", []), ("after_broken", [3]), ("transitive", [4])),
+        run_step,
+        max_concurrency=1,
+    )
+
+    assert order.index("first") < order.index("second")
+    assert "after_broken" not in order and "transitive" not in order
+    assert results[3]["skipped"] is True and "[3]" in results[3]["error"]
+    assert results[4]["skipped"] is True
+    assert "result" in results[1]
+
+
+@pytest.mark.asyncio
+async def test_plan_dag_step_timeout_cancels_step():
+    import asyncio
+
+    from collegue.core.meta_orchestrator import _run_plan_dag
+
+    cancelled = []
+
+    async def run_step(i, step):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(step.tool)
+            raise
+        return {"step": i + 1, "tool": step.tool, "result": {}}
+
+    results = await _run_plan_dag(_steps(("hang", []), ("next", [1])), run_step, step_timeout=0.05)
+
+    assert cancelled == ["hang"]
+    assert results[0]["timed_out"] is True
+    assert results[1]["skipped"] is True
+
+
+def test_plan_dependencies_ignore_forward_and_self_references():
+    from collegue.core.meta_orchestrator import _plan_dependencies
+
+    deps = _plan_dependencies(_steps(("a", [1, 2]), ("b", [1, 1, 9]), ("c", [2, 0])))
+    assert deps == [[], [0], [1]]
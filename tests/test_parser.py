@@ -147,5 +147,55 @@ def broken_function(
         self.assertIn("non supporté", result["error"])
 
 
+class TestCodeParserCache(unittest.TestCase):
+    """Mémoïsation des résultats par empreinte du contenu"""
+
+    CODE = "import os\n\ndef hello(name=b'x', *args):\n    return name\n"
+
+    def test_same_content_parsed_once(self):
+        parser = CodeParser(max_entries=8, max_bytes=1 << 20)
+        first = parser.parse(self.CODE, "python")
+        second = parser.parse(self.CODE, "python")
+        self.assertEqual(first, second)
+        self.assertNotIn("raw", second)
+        stats = parser.cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+        self.assertGreater(stats["bytes"], 0)
+
+    def test_detected_language_shares_entry(self):
+        parser = CodeParser(max_entries=8, max_bytes=1 << 20)
+        parser.parse(self.CODE, "python")
+        self.assertEqual(parser.parse(self.CODE)["language"], "python")
+        self.assertEqual(parser.cache_stats()["hits"], 1)
+
+    def test_results_are_copies(self):
+        parser = CodeParser(max_entries=8, max_bytes=1 << 20)
+        parser.parse(self.CODE, "python")["functions"].clear()
+        cached = parser.parse(self.CODE, "python")
+        cached["functions"].append({"name": "intrus"})
+        self.assertEqual([f["name"] for f in parser.parse(self.CODE, "python")["functions"]], ["hello"])
+
+    def test_eviction_by_entries_and_bytes(self):
+        parser = CodeParser(max_entries=2, max_bytes=1 << 20)
+        for idx in range(3):
+            parser.parse(f"x_{idx} = {idx}\n", "python")
+        self.assertEqual(parser.cache_stats()["entries"], 2)
+        parser.parse("x_0 = 0\n", "python")
+        self.assertEqual(parser.cache_stats()["misses"], 4)
+
+        small = CodeParser(max_entries=100, max_bytes=600)
+        for idx in range(10):
+            small.parse(f"def f_{idx}():\n    pass\n", "python")
+        stats = small.cache_stats()
+        self.assertLessEqual(stats["bytes"], 600)
+        self.assertLess(stats["entries"], 10)
+
+    def test_disabled_cache(self):
+        parser = CodeParser(max_entries=0, max_bytes=1 << 20)
+        parser.parse(self.CODE, "python")
+        parser.parse(self.CODE, "python")
+        self.assertEqual((parser.cache_stats()["misses"], parser.cache_stats()["entries"]), (2, 0))
+
+
 if __name__ == "__main__":
     unittest.main()
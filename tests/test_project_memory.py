@@ -253,6 +253,68 @@ class TestProjectMemorySearch:
         results = memory.search("nonexistent term xyz")
         assert len(results) == 0
 
+    def test_search_ranks_title_above_data(self, memory):
+        memory.store(expert="test", entry_type="issue_found", category="a", title="Misc", data={"note": "cache miss"})
+        memory.store(expert="test", entry_type="issue_found", category="a", title="Cache invalidation", data={})
+
+        results = memory.search("cache")
+        assert [e.title for e in results] == ["Cache invalidation", "Misc"]
+
+    def test_search_matches_prefix(self, memory):
+        memory.store(expert="test", entry_type="issue_found", category="a", title="Injection SQL", data={})
+        assert [e.title for e in memory.search("inject")] == ["Injection SQL"]
+
+    def test_search_index_follows_prune(self, tmp_path):
+        memory = ProjectMemory(memory_dir=str(tmp_path / "mem"), max_total=3)
+        for i in range(6):
+            memory.store(expert="test", entry_type="issue_found", category="a", title=f"Leak {i}", data={})
+
+        titles = {e.title for e in memory.search("leak")}
+        assert titles == {"Leak 3", "Leak 4", "Leak 5"}
+
+    def test_search_skips_expired(self, memory):
+        memory.store(expert="test", entry_type="issue_found", category="a", title="Stale", data={}, ttl_seconds=1)
+        for entry in memory._entries.values():
+            entry.timestamp -= 10
+        assert memory.search("stale") == []
+
+    def test_search_passes_limit_to_index(self, memory, monkeypatch):
+        for i in range(5):
+            memory.store(expert="test", entry_type="issue_found", category="a", title=f"Leak {i}", data={})
+        calls = []
+        original = memory._search_index.search
+
+        def spy(query, limit=None):
+            calls.append(limit)
+            return original(query, limit=limit)
+
+        monkeypatch.setattr(memory._search_index, "search", spy)
+        assert [e.title for e in memory.search("leak", limit=2)] == ["Leak 4", "Leak 3"]
+        assert calls == [2]
+
+    def test_search_widens_window_past_expired(self, memory):
+        memory.store(expert="test", entry_type="issue_found", category="a", title="Leak fresh", data={})
+        for i in range(3):
+            memory.store(
+                expert="test", entry_type="issue_found", category="a", title=f"Leak {i}", data={}, ttl_seconds=1
+            )
+        for entry in memory._entries.values():
+            if entry.ttl_seconds:
+                entry.timestamp -= 10
+        assert [e.title for e in memory.search("leak", limit=1)] == ["Leak fresh"]
+
+    def test_search_sqlite_backend(self, tmp_path):
+        from collegue.core.memory_search import SqliteMemorySearchIndex
+
+        if not SqliteMemorySearchIndex.is_available():
+            pytest.skip("SQLite sans FTS5")
+        memory = ProjectMemory(memory_dir=str(tmp_path / "mem"), search_backend="sqlite")
+        memory.store(expert="test", entry_type="issue_found", category="a", title="Misc", data={"note": "cache miss"})
+        memory.store(expert="test", entry_type="issue_found", category="a", title="Cache invalidation", data={})
+
+        assert [e.title for e in memory.search("cache")] == ["Cache invalidation", "Misc"]
+        assert [e.title for e in memory.search("invalid")] == ["Cache invalidation"]
+
 
 class TestProjectMemoryPersistence:
     def test_save_and_load(self, tmp_path):
@@ -281,6 +343,132 @@ class TestProjectMemoryPersistence:
         assert len(memory) == 0
 
 
+class TestProjectMemoryJournal:
+    def test_store_appends_to_journal_only(self, tmp_path):
+        memory_dir = tmp_path / "mem"
+        memory = ProjectMemory(memory_dir=str(memory_dir))
+        for i in range(3):
+            memory.store(expert="test", entry_type="issue_found", category="a", title=f"Item {i}", data={})
+
+        assert not (memory_dir / "project_memory.json").exists()
+        lines = (memory_dir / "project_memory.journal.jsonl").read_text().splitlines()
+        assert [json.loads(line)["op"] for line in lines] == ["put", "put", "put"]
+
+    def test_reload_replays_puts_and_deletes(self, tmp_path):
+        memory_dir = str(tmp_path / "mem")
+        memory1 = ProjectMemory(memory_dir=memory_dir, max_total=3)
+        for i in range(5):
+            memory1.store(expert="test", entry_type="issue_found", category="a", title=f"Item {i}", data={"i": i})
+
+        memory2 = ProjectMemory(memory_dir=memory_dir, max_total=3)
+        assert sorted(e.title for e in memory2.recall()) == ["Item 2", "Item 3", "Item 4"]
+
+    def test_compaction_rewrites_snapshot_and_truncates_journal(self, tmp_path):
+        memory_dir = tmp_path / "mem"
+        memory = ProjectMemory(memory_dir=str(memory_dir))
+        for i in range(4):
+            memory.store(expert="test", entry_type="issue_found", category="a", title=f"Item {i}", data={})
+        memory.compact()
+        assert not (memory_dir / "project_memory.journal.jsonl").exists()
+        assert len(json.loads((memory_dir / "project_memory.json").read_text())["entries"]) == 4
+
+        # Les identifiants renumérotés restent cohérents avec le journal suivant.
+        memory.store(expert="test", entry_type="issue_found", category="a", title="After", data={})
+        memory.prune()
+        reloaded = ProjectMemory(memory_dir=str(memory_dir))
+        assert len(reloaded) == 5
+
+    def test_compaction_triggers_when_journal_outgrows_store(self, tmp_path, monkeypatch):
+        import collegue.core.project_memory as pm
+
+        monkeypatch.setattr(pm, "COMPACT_MIN_RECORDS", 5)
+        memory_dir = tmp_path / "mem"
+        memory = ProjectMemory(memory_dir=str(memory_dir), max_total=2)
+        for i in range(10):
+            memory.store(expert="test", entry_type="issue_found", category="a", title=f"Item {i}", data={})
+        journal = memory_dir / "project_memory.journal.jsonl"
+        assert not journal.exists() or len(journal.read_text().splitlines()) <= 6
+        assert [e.title for e in ProjectMemory(memory_dir=str(memory_dir)).recall()] == ["Item 9", "Item 8"]
+
+    def test_journal_left_by_interrupted_compaction_is_not_replayed(self, tmp_path):
+        memory_dir = tmp_path / "mem"
+        memory = ProjectMemory(memory_dir=str(memory_dir), max_total=2)
+        memory.store(expert="test", entry_type="issue_found", category="a", title="A", data={})
+        memory.store(expert="test", entry_type="issue_found", category="a", title="B", data={})
+        memory.compact()
+        memory.store(expert="test", entry_type="issue_found", category="a", title="C", data={})  # évince A
+        journal = memory_dir / "project_memory.journal.jsonl"
+        stale = journal.read_text()
+        memory.compact()
+        # Arrêt simulé entre le remplacement de l'instantané et la suppression du journal :
+        # rejoués sur les identifiants renumérotés, ces enregistrements supprimeraient B.
+        journal.write_text(stale)
+        reloaded = ProjectMemory(memory_dir=str(memory_dir), max_total=2)
+        assert sorted(e.title for e in reloaded.recall()) == ["B", "C"]
+
+        reloaded.store(expert="test", entry_type="issue_found", category="a", title="D", data={})
+        assert sorted(e.title for e in ProjectMemory(memory_dir=str(memory_dir), max_total=2).recall()) == ["C", "D"]
+
+    def test_legacy_list_snapshot_still_loads(self, tmp_path):
+        memory_dir = tmp_path / "mem"
+        memory_dir.mkdir()
+        entry = MemoryEntry(expert="test", entry_type="issue_found", category="a", title="Old", data={})
+        (memory_dir / "project_memory.json").write_text(json.dumps([entry.to_dict()]))
+        assert [e.title for e in ProjectMemory(memory_dir=str(memory_dir)).recall()] == ["Old"]
+
+    def test_rewritten_id_leaves_no_stale_index_entries(self, tmp_path):
+        memory_dir = tmp_path / "mem"
+        memory = ProjectMemory(memory_dir=str(memory_dir))
+        memory.store(expert="old", entry_type="issue_found", category="a", title="Before", data={}, language="go")
+        with open(memory_dir / "project_memory.journal.jsonl", "a") as f:
+            replaced = MemoryEntry(expert="new", entry_type="fix_applied", category="b", title="After", data={})
+            f.write(json.dumps({"op": "put", "id": 0, "entry": replaced.to_dict()}) + "\n")
+
+        reloaded = ProjectMemory(memory_dir=str(memory_dir))
+        assert [e.title for e in reloaded.recall()] == ["After"]
+        assert reloaded.recall(expert="old") == []
+        assert reloaded.recall(language="go") == []
+        assert reloaded.search("before") == []
+        assert len(reloaded._by_time) == len(reloaded._ranked) == 1
+
+    def test_truncated_journal_line_is_ignored(self, tmp_path):
+        memory_dir = tmp_path / "mem"
+        memory = ProjectMemory(memory_dir=str(memory_dir))
+        memory.store(expert="test", entry_type="issue_found", category="a", title="Kept", data={})
+        with open(memory_dir / "project_memory.journal.jsonl", "a") as f:
+            f.write('{"op": "put", "id": 9, "entry": {"exp')
+        assert [e.title for e in ProjectMemory(memory_dir=str(memory_dir)).recall()] == ["Kept"]
+
+
+class TestProjectMemoryIndexes:
+    def test_recall_uses_rank_order_with_combined_filters(self, memory):
+        for i in range(30):
+            memory.store(
+                expert="review" if i % 3 else "perf",
+                entry_type="issue_found",
+                category="security" if i % 2 else "naming",
+                title=f"Item {i}",
+                data={},
+                score=float(i % 5),
+                file_path=f"f{i % 4}.py",
+            )
+        results = memory.recall(expert="review", category="security", limit=4)
+        expected = sorted(
+            (e for e in memory.recall(limit=100) if e.expert == "review" and e.category == "security"),
+            key=lambda e: (e.score, e.timestamp),
+            reverse=True,
+        )[:4]
+        assert results == expected
+        assert all(e.file_path == "f1.py" for e in memory.recall(file_path="f1.py", limit=100))
+
+    def test_indexes_follow_prune(self, tmp_path):
+        memory = ProjectMemory(memory_dir=str(tmp_path / "mem"), max_total=3)
+        for i in range(6):
+            memory.store(expert="e", entry_type="issue_found", category=f"c{i}", title=f"Item {i}", data={})
+        assert memory.recall(category="c0") == []
+        assert [e.title for e in memory.recall(category="c5")] == ["Item 5"]
+
+
 class TestProjectMemoryPrune:
     def test_prune_expired(self, memory):
         memory.store(expert="test", entry_type="issue_found", category="a", title="Old", data={}, ttl_seconds=0.001)
@@ -49,6 +49,44 @@ class TestConsistencyAnalysisEngine:
         # Devrait détecter la duplication de "return 1" et "return 2"
         assert len(issues) > 0
 
+    def test_clone_groups_report_all_locations(self, engine):
+        """Un bloc présent dans trois fichiers donne un seul groupe à trois emplacements."""
+        block = "total = 0\nfor item in items:\n    total += item.price\nreturn total\n"
+        files = [
+            FileInput(path="a.py", content="import os\n" + block),
+            FileInput(path="b.py", content=block),
+            FileInput(path="c.py", content="x = 1\ny = 2\n" + block),
+        ]
+        groups = engine.find_clone_groups(files, min_lines=3)
+        assert len(groups) == 1
+        assert groups[0].locations == [("a.py", 2), ("b.py", 1), ("c.py", 3)]
+
+        issues = engine.analyze_duplication(files, min_lines=3)
+        assert len(issues) == 1
+        assert (issues[0].path, issues[0].line) == ("a.py", 2)
+        assert "b.py:1" in issues[0].message and "c.py:3" in issues[0].message
+
+    def test_clone_groups_extended_to_maximal_length(self, engine):
+        """Un clone de 10 lignes est rapporté une fois, avec sa longueur réelle."""
+        body = "\n".join(f"value_{i} = compute({i})" for i in range(10))
+        files = [
+            FileInput(path="a.py", content=f"def a():\n{body}\n"),
+            FileInput(path="b.py", content=f"class B:\n    pass\n{body}\nprint('fin')\n"),
+        ]
+        groups = engine.find_clone_groups(files, min_lines=3)
+        assert [(g.length, g.locations) for g in groups] == [(10, [("a.py", 2), ("b.py", 3)])]
+        assert "(10 lignes)" in engine.analyze_duplication(files, min_lines=3)[0].message
+
+    def test_clone_groups_ignore_single_file_and_trivial_blocks(self, engine):
+        """Duplication interne à un fichier et blocs sans ligne significative ignorés."""
+        block = "alpha = 1\nbeta = 2\ngamma = 3\n"
+        files = [
+            FileInput(path="a.py", content=block + "\n" + block),
+            FileInput(path="b.py", content="}\n}\n}\n)\n"),
+            FileInput(path="c.py", content="}\n}\n}\n)\n"),
+        ]
+        assert engine.find_clone_groups(files, min_lines=3) == []
+
     def test_extract_defined_symbols_python(self, engine):
         """Test l'extraction des symboles Python."""
         file = FileInput(path="test.py", content="def my_func():\n    pass\n\nclass MyClass:\n    pass\n\nMY_VAR = 1")
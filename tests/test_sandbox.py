@@ -231,6 +231,120 @@ def test_result_ok_property():
     assert not SandboxResult(0, "", "", timed_out=True).ok
 
 
+# --- API async (faux binaire docker : vrai sous-process, sans Docker) -----------
+
+
+def _fake_docker(tmp_path):
+    """Script ``docker`` : ``run`` exécute la commande interne sur l'hôte, ``kill`` est journalisé."""
+    kills = tmp_path / "kills.log"
+    script = tmp_path / "docker"
+    script.write_text(
+        "#!/bin/sh\n"
+        f'if [ "$1" = kill ]; then echo "$2" >> {kills}; exit 0; fi\n'
+        'for last; do :; done\nexec sh -c "$last"\n'
+    )
+    script.chmod(0o755)
+    return str(script), kills
+
+
+def _async_sandbox(tmp_path, **kw):
+    docker, kills = _fake_docker(tmp_path)
+    return DockerSandbox(image="img", allow_root=True, docker_bin=docker, **kw), kills
+
+
+async def test_run_command_async_parses_result(tmp_path):
+    sb, _ = _async_sandbox(tmp_path)
+    res = await sb.run_command_async("echo hello; echo warn >&2; exit 3", str(tmp_path / "ws"))
+    assert (res.exit_code, res.stdout, res.stderr, res.timed_out) == (3, "hello\n", "warn\n", False)
+    assert (tmp_path / "ws").is_dir()
+
+
+async def test_run_command_async_output_capped(tmp_path):
+    sb, _ = _async_sandbox(tmp_path, max_output_bytes=5)
+    res = await sb.run_command_async("printf abcdefghij", str(tmp_path))
+    assert res.stdout.startswith("abcde")
+    assert "tronquée" in res.stdout
+
+
+async def test_run_command_async_timeout_kills_container(tmp_path):
+    sb, kills = _async_sandbox(tmp_path, timeout=0.5)
+    res = await sb.run_command_async("sleep 30", str(tmp_path))
+    assert res.timed_out and res.exit_code == ex.TIMEOUT_EXIT_CODE
+    assert ex.TIMEOUT_NOTE in res.stderr
+    assert kills.read_text().startswith("collegue-sbx-")
+
+
+async def test_run_command_async_cancel_kills_container(tmp_path):
+    import asyncio
+
+    sb, kills = _async_sandbox(tmp_path)
+    task = asyncio.create_task(sb.run_command_async("sleep 30", str(tmp_path)))
+    await asyncio.sleep(0.3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert kills.read_text().startswith("collegue-sbx-")
+    assert sb.limiter.active == 0
+
+
+async def test_run_command_async_docker_missing_raises(tmp_path):
+    sb = DockerSandbox(image="img", allow_root=True, docker_bin=str(tmp_path / "absent"))
+    with pytest.raises(SandboxUnavailable):
+        await sb.run_command_async("echo hi", str(tmp_path))
+
+
+async def test_container_limiter_caps_concurrency(tmp_path):
+    import asyncio
+
+    limiter = ex.ContainerLimiter(2)
+    sb, _ = _async_sandbox(tmp_path, limiter=limiter)
+    peak = 0
+
+    async def watch():
+        nonlocal peak
+        while True:
+            peak = max(peak, limiter.active)
+            await asyncio.sleep(0.01)
+
+    watcher = asyncio.create_task(watch())
+    results = await asyncio.gather(*(sb.run_command_async("sleep 0.2", str(tmp_path)) for _ in range(5)))
+    watcher.cancel()
+    assert all(res.ok for res in results)
+    assert peak == 2
+    assert limiter.active == 0
+
+
+async def test_container_limiter_cancelled_waiter_frees_nothing():
+    import asyncio
+
+    limiter = ex.ContainerLimiter(1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release()
+    assert limiter.active == 0
+    async with limiter.slot():
+        assert limiter.active == 1
+
+
+async def test_run_sandbox_tests_falls_back_to_sync_api(tmp_path):
+    import threading
+
+    seen = {}
+
+    class _SyncOnly:
+        def run_tests(self, workspace, command="pytest -q"):
+            seen["thread"] = threading.current_thread()
+            return SandboxResult(0, command, "")
+
+    res = await ex.run_sandbox_tests(_SyncOnly(), str(tmp_path), "pytest -x")
+    assert res.stdout == "pytest -x"
+    assert seen["thread"] is not threading.main_thread()
+
+
 # --- intégration Docker réelle (skippée en CI) ----------------------------------
 
 _SANDBOX_TEST_IMAGE = os.getenv("SANDBOX_TEST_IMAGE", "python:3.12-slim")
@@ -320,6 +434,19 @@ def test_build_argv_pip_cache_validated(tmp_path):
         sb._build_run_argv("x", str(tmp_path))
 
 
+def test_build_argv_deps_env_mounts(tmp_path):
+    """Environnements de dépendances du gate : lecture seule sauf à la construction, entrée validée."""
+    env = os.path.realpath(str(tmp_path))
+    sb = DockerSandbox(image="img").with_options(deps_mounts=((env, "user-ab12", False), (env, "venv-cd34", True)))
+    mounts = _mounts(sb._build_run_argv("x", str(tmp_path / "ws")))
+    assert f"{env}:/deps_env/user-ab12:ro" in mounts
+    assert f"{env}:/deps_env/venv-cd34" in mounts
+    with pytest.raises(ValueError):
+        sb.with_options(deps_mounts=((env, "../etc", False),))._build_run_argv("x", str(tmp_path))
+    with pytest.raises(AttributeError):
+        sb.with_options(network_mode="host")
+
+
 def test_build_argv_subscription_auth_mount(tmp_path):
     """Creds d'abonnement opt-in → montage RW sur $HOME/.openhands (HOME dérivé de env)."""
     auth = tmp_path / "openhands"
@@ -0,0 +1,169 @@
+"""Tests du pool de conteneurs chauds (``collegue.sandbox.pool``).
+
+Sans Docker : un script ``docker`` factice garde l'état des conteneurs de pool
+(un fichier par conteneur vivant), exécute sur l'hôte les commandes de ``run``
+éphémère et d'``exec``, ignore la remise à zéro et journalise chaque appel.
+"""
+
+import asyncio
+
+import pytest
+
+import collegue.sandbox.executor as ex
+from collegue.sandbox import ContainerPool, DockerSandbox, get_container_pool, reset_container_pool
+from collegue.sandbox.pool import POOL_LABEL
+
+
+def _fake_docker(tmp_path):
+    state = tmp_path / "containers"
+    state.mkdir()
+    log = tmp_path / "docker.log"
+    script = tmp_path / "docker"
+    script.write_text(
+        "#!/bin/sh\n"
+        f"state={state}\n"
+        "verb=$1; shift\n"
+        "for last; do :; done\n"
+        "case $verb in\n"
+        "run)\n"
+        '  name=""; prev=""; for a; do [ "$prev" = --name ] && name=$a; prev=$a; done\n'
+        f'  if [ "$1" = -d ]; then echo "start $name" >> {log}; touch "$state/$name"; exit 0; fi\n'
+        f'  echo "run $name" >> {log}; exec sh -c "$last";;\n'
+        "exec)\n"
+        '  [ -e "$state/$1" ] || { echo "No such container: $1" >&2; exit 1; }\n'
+        f'  case "$last" in ": collegue-pool-reset"*) echo "reset $1" >> {log}; exit 0;; esac\n'
+        f'  echo "exec $1" >> {log}; exec sh -c "$last";;\n'
+        "kill)\n"
+        f'  for n; do rm -f "$state/$n"; echo "kill $n" >> {log}; done; exit 0;;\n'
+        "esac\n"
+    )
+    script.chmod(0o755)
+    return str(script), state, log
+
+
+def _pooled_sandbox(tmp_path, pool=None, **kw):
+    docker, state, log = _fake_docker(tmp_path)
+    pool = pool or ContainerPool()
+    sandbox = DockerSandbox(image="img", allow_root=True, docker_bin=docker, pool=pool, **kw)
+    return sandbox, pool, state, log
+
+
+def _verbs(log):
+    return [line.split()[0] for line in log.read_text().splitlines()]
+
+
+def test_pool_argv_keeps_hardened_run_argv(tmp_path):
+    sb = DockerSandbox(image="img", pids_limit=64, memory="256m")
+    argv = sb._build_pool_argv(str(tmp_path), "c1", POOL_LABEL)
+    assert argv[:5] == ["docker", "run", "-d", "--label", POOL_LABEL]
+    assert argv[5:] == sb._build_run_argv(list(ex.POOL_KEEPALIVE_CMD), str(tmp_path), name="c1")[2:]
+    for flag in ("--read-only", "--network", "--pids-limit", "--memory", "--cap-drop"):
+        assert flag in argv
+    assert sb._build_exec_argv("c1", "pytest -q") == ["docker", "exec", "c1", "sh", "-c", "pytest -q"]
+
+
+def test_pool_profile_distinguishes_workspace_and_limits(tmp_path):
+    sb = DockerSandbox(image="img")
+    assert sb.pool_profile(str(tmp_path / "a")) == sb.pool_profile(str(tmp_path / "a"))
+    assert sb.pool_profile(str(tmp_path / "a")) != sb.pool_profile(str(tmp_path / "b"))
+    assert sb.pool_profile(str(tmp_path / "a")) != DockerSandbox(image="img", memory="1g").pool_profile(
+        str(tmp_path / "a")
+    )
+
+
+async def test_pool_reuses_warm_container(tmp_path):
+    sb, pool, state, log = _pooled_sandbox(tmp_path)
+    ws = str(tmp_path / "ws")
+    first = await sb.run_command_async("echo one; exit 2", ws)
+    second = await sb.run_command_async("echo two", ws)
+    assert (first.exit_code, first.stdout, second.exit_code, second.stdout) == (2, "one\n", 0, "two\n")
+    assert first.startup_seconds is not None and second.startup_seconds is not None
+    assert _verbs(log) == ["start", "exec", "reset", "exec", "reset"]
+    assert pool.stats()["started"] == 1 and pool.stats()["reused"] == 1
+    assert len(list(state.iterdir())) == 1
+
+
+async def test_pool_separates_workspaces(tmp_path):
+    sb, pool, _, _ = _pooled_sandbox(tmp_path)
+    await sb.run_command_async("true", str(tmp_path / "a"))
+    await sb.run_command_async("true", str(tmp_path / "b"))
+    assert pool.stats()["started"] == 2 and pool.stats()["idle"] == 2
+
+
+async def test_pool_recycles_after_max_uses(tmp_path):
+    sb, pool, state, log = _pooled_sandbox(tmp_path, ContainerPool(max_uses=2))
+    for _ in range(3):
+        assert (await sb.run_command_async("true", str(tmp_path))).ok
+    assert _verbs(log) == ["start", "exec", "reset", "exec", "kill", "start", "exec", "reset"]
+    assert pool.stats()["recycled"] == 1
+    assert len(list(state.iterdir())) == 1
+
+
+async def test_pool_timeout_discards_container(tmp_path):
+    sb, pool, state, log = _pooled_sandbox(tmp_path, timeout=0.5)
+    res = await sb.run_command_async("sleep 30", str(tmp_path))
+    assert res.timed_out and res.exit_code == ex.TIMEOUT_EXIT_CODE
+    assert "kill collegue-pool-" in log.read_text()
+    assert pool.stats()["live"] == 0 and not list(state.iterdir())
+
+
+async def test_pool_cancel_kills_container(tmp_path):
+    sb, pool, state, _ = _pooled_sandbox(tmp_path)
+    task = asyncio.create_task(sb.run_command_async("sleep 30", str(tmp_path)))
+    await asyncio.sleep(0.3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert pool.stats()["live"] == 0 and not list(state.iterdir())
+    assert sb.limiter.active == 0
+
+
+async def test_pool_health_check_replaces_dead_container(tmp_path):
+    sb, pool, state, _ = _pooled_sandbox(tmp_path, ContainerPool(health_interval=0))
+    await sb.run_command_async("true", str(tmp_path))
+    for dead in state.iterdir():
+        dead.unlink()
+    res = await sb.run_command_async("echo ok", str(tmp_path))
+    assert res.stdout == "ok\n"
+    assert pool.stats()["started"] == 2 and pool.stats()["discarded"] == 1
+
+
+async def test_pool_size_cap_evicts_idle_then_falls_back(tmp_path):
+    sb, pool, _, log = _pooled_sandbox(tmp_path, ContainerPool(max_containers=1))
+    await sb.run_command_async("true", str(tmp_path / "a"))
+    await sb.run_command_async("true", str(tmp_path / "b"))
+    assert pool.stats()["recycled"] == 1 and pool.stats()["live"] == 1
+
+    results = await asyncio.gather(*(sb.run_command_async("sleep 0.2", str(tmp_path / "b")) for _ in range(2)))
+    assert all(res.ok for res in results)
+    assert pool.stats()["fallback"] == 1
+    assert [res.startup_seconds is None for res in results].count(True) == 1
+    assert "run collegue-sbx-" in log.read_text()
+
+
+async def test_pool_close_kills_live_containers(tmp_path):
+    sb, pool, state, _ = _pooled_sandbox(tmp_path)
+    await sb.run_command_async("true", str(tmp_path / "a"))
+    await sb.run_command_async("true", str(tmp_path / "b"))
+    pool.close()
+    assert not list(state.iterdir())
+    assert pool.stats()["live"] == 0
+    # Pool fermé : les passes suivantes repartent en docker run éphémère.
+    assert (await sb.run_command_async("echo late", str(tmp_path / "a"))).stdout == "late\n"
+    assert pool.stats()["fallback"] == 1
+
+
+def test_get_container_pool_opt_in():
+    class _Settings:
+        SANDBOX_POOL_ENABLED = False
+
+    reset_container_pool()
+    assert get_container_pool(_Settings()) is None
+    _Settings.SANDBOX_POOL_ENABLED = True
+    _Settings.SANDBOX_POOL_MAX_USES = 7
+    try:
+        pool = get_container_pool(_Settings())
+        assert pool is get_container_pool(_Settings())
+        assert pool.max_uses == 7
+    finally:
+        reset_container_pool()
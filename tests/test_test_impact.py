@@ -0,0 +1,188 @@
+"""Tests de la sélection des tests impactés par un diff (``collegue.executor.test_impact``).
+
+Graphe d'imports sur de petits workspaces git ; le gate est exercé avec un
+sandbox local (``sh -c``) pour vérifier le rejet rapide réel de la commande.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from collegue.executor import (
+    FakeReviewer,
+    ImportGraph,
+    TestImpactIndex,
+    get_test_impact_index,
+    impact_test_command,
+    reset_test_impact_index,
+    run_quality_gate,
+)
+from collegue.executor.command import LocalCommandRunner
+from collegue.executor.test_impact import module_names, python_imports
+
+
+def _write(root, files):
+    for path, text in files.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(text, encoding="utf-8")
+
+
+def _git(root, *args):
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+@pytest.fixture
+def project(tmp_path):
+    ws = tmp_path / "ws"
+    _write(
+        ws,
+        {
+            "app/__init__.py": "",
+            "app/models.py": "VALUE = 1\n",
+            "app/service.py": "from .models import VALUE\n\ndef value():\n    return VALUE\n",
+            "app/views.py": "def view():\n    return 'ok'\n",
+            "tests/test_service.py": "from app.service import value\n\ndef test_value():\n    assert value() == 1\n",
+            "tests/test_views.py": "from app import views\n\ndef test_view():\n    assert views.view() == 'ok'\n",
+            "tests/test_misc.py": "def test_misc():\n    assert True\n",
+        },
+    )
+    _git(ws, "init", "-q")
+    _git(ws, "add", "-A")
+    _git(ws, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "base")
+    return ws
+
+
+# --- analyse -------------------------------------------------------------------
+
+
+def test_imports_resolve_relative_and_submodules():
+    source = "import os\nfrom . import models\nfrom ..core.db import Session\n\ndef f():\n    import json\n"
+    assert python_imports(source, "pkg/app/service.py") == (
+        "json",
+        "os",
+        "pkg.app",
+        "pkg.app.models",
+        "pkg.core.db",
+        "pkg.core.db.Session",
+    )
+    assert python_imports("def broken(:\n", "x.py") == ()
+    assert module_names("src/pkg/__init__.py") == ("src.pkg", "pkg")
+
+
+def test_impacted_tests_follow_transitive_imports_and_conftest():
+    graph = ImportGraph(
+        {
+            "app/models.py": (),
+            "app/service.py": ("app.models",),
+            "tests/conftest.py": (),
+            "tests/test_service.py": ("app.service",),
+            "tests/test_other.py": ("os",),
+        }
+    )
+    assert graph.impacted_tests(["app/models.py"]) == ("tests/test_service.py",)
+    assert graph.impacted_tests(["README.md"]) == ()
+    assert graph.impacted_tests(["tests/conftest.py"]) == ("tests/test_other.py", "tests/test_service.py")
+
+
+# --- index ---------------------------------------------------------------------
+
+
+def test_graph_cached_per_base_commit_without_attempt_edges(tmp_path, project):
+    index = TestImpactIndex(str(tmp_path / "cache"), max_ratio=1.0)
+    # La tentative fait importer models par views : visible pour CE diff, pas dans le graphe de base.
+    (project / "app/views.py").write_text("from app.models import VALUE\n", encoding="utf-8")
+    selection = index.select(str(project), ["app/views.py", "app/models.py"])
+    assert selection.tests == ("tests/test_service.py", "tests/test_views.py")
+    assert selection.total == 3 and selection.base_commit
+    assert "app.models" not in index._load(selection.base_commit).files["app/views.py"]
+
+    again = TestImpactIndex(str(tmp_path / "cache"))
+    assert again.select(str(project), ["app/models.py"]).tests == ("tests/test_service.py",)
+    assert (again.builds, again.hits) == (0, 1)
+
+
+def test_selection_dropped_above_max_ratio(tmp_path, project):
+    index = TestImpactIndex(str(tmp_path / "cache"), max_ratio=0.3)
+    assert index.select(str(project), ["app/models.py"]).tests == ()
+
+
+def test_impact_command_needs_plain_pytest():
+    command = impact_test_command("python -m pytest -q", ["tests/test_a.py"])
+    assert command.startswith("(echo ") and "python -m pytest -q -x tests/test_a.py;" in command
+    assert command.endswith("; python -m pytest -q)")
+    assert impact_test_command("python -m pytest -q tests/unit", ["tests/test_a.py"]) is None
+    assert impact_test_command("npm test", ["tests/test_a.py"]) is None
+    assert impact_test_command("python -m pytest -q", []) is None
+
+
+def test_get_test_impact_index_opt_in(tmp_path):
+    class _Settings:
+        GATE_TEST_IMPACT = False
+        GATE_TEST_IMPACT_DIR = str(tmp_path / "impact")
+
+    reset_test_impact_index()
+    assert get_test_impact_index(_Settings()) is None
+    _Settings.GATE_TEST_IMPACT = True
+    try:
+        index = get_test_impact_index(_Settings())
+        assert index is get_test_impact_index(_Settings())
+        assert index.root == tmp_path / "impact"
+    finally:
+        reset_test_impact_index()
+
+
+# --- intégration au gate ---------------------------------------------------------
+
+
+class _LocalSandbox:
+    def __init__(self):
+        self.commands = []
+
+    def run_tests(self, workspace, command="pytest -q"):
+        self.commands.append(command)
+        return LocalCommandRunner().run_command(command, workspace)
+
+
+_PYTEST = f"{sys.executable} -m pytest -q"
+
+
+async def test_gate_rejects_on_impacted_failure_without_full_suite(tmp_path, project):
+    (project / "app/models.py").write_text("VALUE = 2\n", encoding="utf-8")
+    (project / "tests/test_misc.py").write_text("def test_misc():\n    raise SystemExit('suite')\n")
+    diff = "diff --git a/app/models.py b/app/models.py\n+VALUE = 2\n"
+    sandbox = _LocalSandbox()
+    report = await run_quality_gate(
+        str(project),
+        diff,
+        ctx=None,
+        sandbox=sandbox,
+        reviewer=FakeReviewer(),
+        test_command=_PYTEST,
+        install_deps=False,
+        test_impact=TestImpactIndex(str(tmp_path / "cache")),
+    )
+    assert report.passed is False and report.tests_passed is False
+    assert report.impacted_tests == ("tests/test_service.py",)
+    assert report.impacted_tests_failed is True
+    assert "suite complète non lancée" in report.test_output and "test_misc" not in report.test_output
+    assert "rejet rapide" in report.to_markdown()
+
+
+async def test_gate_runs_full_suite_after_green_impacted_tests(tmp_path, project):
+    (project / "app/views.py").write_text("def view():\n    return 'ok'  # x\n", encoding="utf-8")
+    diff = "diff --git a/app/views.py b/app/views.py\n+    return 'ok'  # x\n"
+    report = await run_quality_gate(
+        str(project),
+        diff,
+        ctx=None,
+        sandbox=_LocalSandbox(),
+        reviewer=FakeReviewer(),
+        test_command=_PYTEST,
+        install_deps=False,
+        test_impact=TestImpactIndex(str(tmp_path / "cache")),
+    )
+    assert report.passed is True and report.impacted_tests == ("tests/test_views.py",)
+    assert report.impacted_tests_failed is False
+    assert "1 passed" in report.test_output and "3 passed" in report.test_output
@@ -0,0 +1,131 @@
+"""Tests du pool d'instances d'outils et de l'isolation de l'état par appel."""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from collegue.core.tool_pool import ToolInstancePool, get_tool_pool, reset_tool_pool
+from collegue.monitoring.metrics import get_metrics_collector
+from collegue.tools.base import BaseTool
+
+
+class _Request(BaseModel):
+    code: str
+    delay: float = 0.0
+
+
+class _Response(BaseModel):
+    input_tokens: int
+
+
+class _CountingTool(BaseTool):
+    tool_name = "pool_counting_tool"
+    tool_description = "Outil de test du pool"
+    request_model = _Request
+    response_model = _Response
+    rate_limit_enabled = False
+    quota_enabled = False
+
+    instances = 0
+    cleanups = 0
+
+    def __init__(self, config=None, app_state=None):
+        super().__init__(config, app_state)
+        type(self).instances += 1
+
+    def cleanup(self, force_gc: bool = False) -> None:
+        type(self).cleanups += 1
+        super().cleanup(force_gc)
+
+    async def _execute_core_logic_async(self, request: _Request, **kwargs) -> _Response:
+        self._last_input_tokens += len(request.code)
+        await asyncio.sleep(request.delay)
+        self._last_input_tokens += len(request.code)
+        self._memory_written = True
+        return _Response(input_tokens=self._last_input_tokens)
+
+    def _execute_core_logic(self, request: _Request, **kwargs) -> _Response:
+        raise NotImplementedError
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tool_class():
+    _CountingTool.instances = 0
+    _CountingTool.cleanups = 0
+    reset_tool_pool()
+    yield
+    reset_tool_pool()
+
+
+def test_pool_reuses_released_instances():
+    pool = ToolInstancePool(max_idle=2)
+    first = pool.acquire("pool_counting_tool", _CountingTool)
+    pool.release("pool_counting_tool", _CountingTool, first)
+
+    second = pool.acquire("pool_counting_tool", _CountingTool)
+    assert second is first
+    assert _CountingTool.instances == 1
+    assert pool.stats()["reuses"] == 1 and pool.stats()["creations"] == 1
+
+
+def test_pool_lends_distinct_instances_and_caps_idle():
+    pool = ToolInstancePool(max_idle=1)
+    a = pool.acquire("pool_counting_tool", _CountingTool)
+    b = pool.acquire("pool_counting_tool", _CountingTool)
+    assert a is not b
+
+    pool.release("pool_counting_tool", _CountingTool, a)
+    pool.release("pool_counting_tool", _CountingTool, b)
+    assert _CountingTool.cleanups == 1
+    assert pool.stats()["idle"] == {"pool_counting_tool": 1}
+
+
+def test_failed_or_disabled_release_cleans_up():
+    pool = ToolInstancePool(max_idle=2)
+    inst = pool.acquire("pool_counting_tool", _CountingTool)
+    pool.release("pool_counting_tool", _CountingTool, inst, reusable=False)
+    assert _CountingTool.cleanups == 1
+
+    disabled = ToolInstancePool(max_idle=0)
+    inst = disabled.acquire("pool_counting_tool", _CountingTool)
+    disabled.release("pool_counting_tool", _CountingTool, inst)
+    assert _CountingTool.cleanups == 2
+    assert disabled.acquire("pool_counting_tool", _CountingTool) is not inst
+
+
+def test_checkouts_are_recorded_in_metrics():
+    collector = get_metrics_collector()
+    before = collector.get_expert_metrics("pool_counting_tool") or {"pool_reuses": 0, "pool_creations": 0}
+    pool = ToolInstancePool()
+    inst = pool.acquire("pool_counting_tool", _CountingTool)
+    pool.release("pool_counting_tool", _CountingTool, inst)
+    pool.acquire("pool_counting_tool", _CountingTool)
+
+    after = collector.get_expert_metrics("pool_counting_tool")
+    assert after["pool_creations"] == before["pool_creations"] + 1
+    assert after["pool_reuses"] == before["pool_reuses"] + 1
+
+
+def test_singleton_respects_max_idle_setting():
+    class _Settings:
+        TOOL_POOL_MAX_IDLE = 0
+
+    assert get_tool_pool(_Settings()).max_idle == 0
+    assert get_tool_pool() is get_tool_pool()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_on_shared_instance_keep_their_own_state():
+    tool = _CountingTool()
+
+    slow, fast = await asyncio.gather(
+        tool.execute_async(_Request(code="x" * 10, delay=0.05), session_id="s1"),
+        tool.execute_async(_Request(code="y", delay=0.0), session_id="s2"),
+    )
+
+    assert slow.input_tokens == 20
+    assert fast.input_tokens == 2
+    # Hors appel, l'instance expose l'état du dernier appel terminé.
+    assert tool._last_input_tokens == 20
+    assert tool._memory_written is True